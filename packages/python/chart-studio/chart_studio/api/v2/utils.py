@@ -1,9 +1,15 @@
 from __future__ import absolute_import
 
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
 import requests
 import json as _json
+from requests.adapters import HTTPAdapter
 from requests.exceptions import RequestException
 from retrying import retry
+from urllib3.util.retry import Retry
 
 import _plotly_utils.exceptions
 from chart_studio import config, exceptions
@@ -11,6 +17,94 @@ from chart_studio.api.utils import basic_auth
 from _plotly_utils.utils import PlotlyJSONEncoder
 
 
+# Options of the connection pool of the shared session. `max_retries` and
+# `backoff_factor` apply to connection errors, and to read errors of
+# idempotent requests, see `urllib3.util.retry.Retry`.
+DEFAULT_SESSION_OPTIONS = {"pool_maxsize": 10, "max_retries": 2, "backoff_factor": 0.25}
+
+# Default number of threads of `bulk`
+DEFAULT_BULK_WORKERS = 8
+
+_session = None
+_session_pid = None
+_session_options = dict(DEFAULT_SESSION_OPTIONS)
+_session_lock = threading.Lock()
+
+
+def configure_session(**options):
+    """
+    Set the options of the session shared by api v2 requests.
+
+    The current session is closed, and the next request opens a new one.
+
+    :param (int) pool_maxsize: Number of connections kept alive per host,
+        which should not be less than the number of concurrent requests.
+    :param (int) max_retries: Number of retries of failed connections.
+    :param (float) backoff_factor: The retries wait for backoff_factor
+        times 2 ** (number of previous retries) seconds.
+
+    """
+    global _session
+    unknown = set(options) - set(DEFAULT_SESSION_OPTIONS)
+    if unknown:
+        raise _plotly_utils.exceptions.PlotlyError(
+            "Unknown session options: {}".format(", ".join(sorted(unknown)))
+        )
+    with _session_lock:
+        _session_options.update(options)
+        if _session is not None:
+            _session.close()
+            _session = None
+
+
+def get_session():
+    """
+    Get the session shared by api v2 requests, which keeps their connections
+    alive. A new session is created in forked processes.
+
+    :returns: (requests.Session)
+
+    """
+    global _session, _session_pid
+    with _session_lock:
+        if _session is None or _session_pid != os.getpid():
+            retries = Retry(
+                total=_session_options["max_retries"],
+                backoff_factor=_session_options["backoff_factor"],
+            )
+            adapter = HTTPAdapter(
+                pool_maxsize=_session_options["pool_maxsize"], max_retries=retries
+            )
+            _session = requests.Session()
+            _session.mount("https://", adapter)
+            _session.mount("http://", adapter)
+            _session_pid = os.getpid()
+        return _session
+
+
+def bulk(func, *iterables, max_workers=None):
+    """
+    Concurrently call an api v2 function for each of the given arguments.
+
+    E.g., `bulk(grids.trash, ["foo:88", "foo:89"])` or
+    `bulk(plots.update, fids, bodies)`. The requests share the connections of
+    the session.
+
+    :param (function) func: E.g., `plots.create`, `grids.retrieve`,
+        `files.update`, etc.
+    :param iterables: Arguments of the calls, as for `map`.
+    :param (int) max_workers: Number of concurrent requests. Defaults to
+        DEFAULT_BULK_WORKERS.
+    :returns: (list) The results of the calls, in the order of the arguments.
+    :raises: (PlotlyRequestError) The error of the first failed call, after
+        all the calls have finished.
+
+    """
+    with ThreadPoolExecutor(max_workers or DEFAULT_BULK_WORKERS) as executor:
+        futures = [executor.submit(func, *args) for args in zip(*iterables)]
+    return [future.result() for future in futures]
+
+
 def make_params(**kwargs):
     """
     Helper to create a params dict, skipping undefined entries.
@@ -169,7 +263,7 @@ def request(method, url, **kwargs):
     kwargs["verify"] = config.get_config()["plotly_ssl_verification"]
 
     try:
-        response = requests.request(method, url, **kwargs)
+        response = get_session().request(method, url, **kwargs)
     except RequestException as e:
         # The message can be an exception. E.g., MaxRetryError.
         message = str(getattr(e, "message", "No message"))
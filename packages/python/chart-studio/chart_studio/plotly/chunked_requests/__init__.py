@@ -1 +1 @@
-from .chunked_request import Stream
+from .chunked_request import BufferedWriter, Stream
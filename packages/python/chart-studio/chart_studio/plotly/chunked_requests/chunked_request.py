@@ -1,7 +1,9 @@
 import http.client
 import os
 import ssl
+import threading
 import time
+from collections import deque
 from io import StringIO
 
 from urllib.parse import urlparse, unquote
@@ -345,6 +347,132 @@ class Stream:
         self._delay = 1
 
 
+class BufferedWriter:
+    """Coalesce the lines written to a `Stream` into one chunk per
+    `flush_interval` seconds, sent by a background thread.
+
+    At most `max_pending` lines are buffered while the stream is busy. When
+    the buffer is full, `write` waits for it to be sent if `on_full` is
+    'block', or drops the oldest ('drop_oldest') or the new ('drop_newest')
+    lines.
+    """
+
+    ON_FULL = ("block", "drop_oldest", "drop_newest")
+
+    def __init__(
+        self,
+        stream,
+        flush_interval=0.1,
+        max_pending=10000,
+        on_full="block",
+        reconnect_on=("", 200, 502),
+    ):
+        if on_full not in self.ON_FULL:
+            raise ValueError(
+                "on_full must be one of {}, not {!r}".format(self.ON_FULL, on_full)
+            )
+        self._stream = stream
+        self._flush_interval = flush_interval
+        self._max_pending = max(1, max_pending)
+        self._on_full = on_full
+        self._reconnect_on = reconnect_on
+        self._pending = deque()
+        self._condition = threading.Condition()
+        self._send_lock = threading.Lock()
+        self._closed = False
+        self._error = None
+        self._stats = {"lines": 0, "dropped": 0, "sent": 0, "chunks": 0, "bytes": 0}
+        self._thread = threading.Thread(target=self._run)
+        self._thread.daemon = True
+        self._thread.start()
+
+    @property
+    def stats(self):
+        """Return the number of lines written, dropped and sent, and the
+        number of chunks and bytes sent.
+        """
+        with self._condition:
+            return dict(self._stats)
+
+    def write(self, lines):
+        """Buffer newline-terminated `lines` to be sent with the next chunk."""
+        with self._condition:
+            self._check()
+            for line in lines:
+                if len(self._pending) >= self._max_pending:
+                    if self._on_full == "drop_newest":
+                        self._stats["dropped"] += 1
+                        continue
+                    elif self._on_full == "drop_oldest":
+                        self._pending.popleft()
+                        self._stats["dropped"] += 1
+                    else:
+                        # Wake up the sending thread and wait for it
+                        self._condition.notify_all()
+                        while len(self._pending) >= self._max_pending:
+                            self._check()
+                            self._condition.wait()
+                self._pending.append(line)
+                self._stats["lines"] += 1
+
+    def send(self, data):
+        """Send `data` right away, after the buffered lines."""
+        self._check()
+        self._flush(data)
+
+    def flush(self):
+        """Send the buffered lines right away."""
+        self.send("")
+
+    def close(self):
+        """Send the buffered lines and stop the sending thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+        if self._error is not None:
+            raise self._error
+
+    def _check(self):
+        if self._error is not None:
+            raise self._error
+        if self._closed:
+            raise Exception("Attempted to write to a closed writer.")
+
+    def _flush(self, data=""):
+        # The lines are taken and sent under the same lock, which keeps the
+        # chunks of the sending thread and of `flush` in order
+        with self._send_lock:
+            with self._condition:
+                lines = list(self._pending)
+                self._pending.clear()
+                self._condition.notify_all()
+            data = "".join(lines) + data
+            if not data:
+                return
+            self._stream.write(data, reconnect_on=self._reconnect_on)
+            with self._condition:
+                self._stats["sent"] += len(lines)
+                self._stats["chunks"] += 1
+                self._stats["bytes"] += len(data.encode("utf-8"))
+
+    def _run(self):
+        while True:
+            with self._condition:
+                if not self._closed and len(self._pending) < self._max_pending:
+                    self._condition.wait(self._flush_interval)
+                closed = self._closed
+            try:
+                self._flush()
+            except Exception as e:
+                with self._condition:
+                    self._error = e
+                    self._condition.notify_all()
+                return
+            if closed:
+                return
+
+
 class _FakeSocket(StringIO):
     # Used to construct a http.client.HTTPResponse object
     # from a string.
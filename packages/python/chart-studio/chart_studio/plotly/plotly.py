@@ -27,6 +27,10 @@ import webbrowser
 
 import json as _json
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
 import _plotly_utils.utils
 import _plotly_utils.exceptions
 from _plotly_utils.basevalidators import CompoundValidator, is_array
@@ -54,6 +58,10 @@ SHARING_ERROR_MSG = (
     "Whoops, sharing can only be set to either 'public', 'private', or " "'secret'."
 )
 
+# Grids, rows and columns of more cells are sent in chunks of about as many
+# cells, see `grid_ops.upload`
+DEFAULT_GRID_CHUNK_SIZE = 100000
+
 
 # don't break backwards compatibility
 def sign_in(username, api_key, **kwargs):
@@ -604,6 +612,7 @@ class Stream:
         """
         self.stream_id = stream_id
         self._stream = None
+        self._writer = None
 
     def get_streaming_specs(self):
         """
@@ -639,6 +648,10 @@ class Stream:
         >>> stream.heartbeat()
 
         """
+        if self._writer is not None:
+            self._writer.send("\n")
+            return
+
         try:
             self._stream.write("\n", reconnect_on=reconnect_on)
         except AttributeError:
@@ -655,17 +668,67 @@ class Stream:
 
         return self._stream._isconnected()
 
-    def open(self):
+    @property
+    def stats(self):
+        """
+        Throughput counters of a stream opened with a `flush_interval`: the
+        number of points written, dropped and sent, and the number of chunks
+        and bytes sent. None for unbuffered streams.
+
+        """
+        if self._writer is None:
+            return None
+        return self._writer.stats
+
+    def open(
+        self,
+        flush_interval=None,
+        max_pending=10000,
+        on_full="block",
+        reconnect_on=(200, "", 408, 502),
+    ):
         """
         Open streaming connection to plotly.
 
+        keyword arguments:
+        flush_interval (default=None) - If set, `write` and `write_batch`
+                                        only buffer the points, and a
+                                        background thread sends the buffered
+                                        points as one chunk every
+                                        `flush_interval` seconds.
+        max_pending (default=10000) - The maximum number of buffered points.
+        on_full (default='block') - What `write` does when the buffer is
+                                    full because the connection is slow:
+                                    'block' waits for the points to be
+                                    sent, 'drop_oldest' and 'drop_newest'
+                                    drop the oldest or the new points.
+        reconnect_on (default=(200, '', 408, 502)) - The response status
+                                                     codes on which buffered
+                                                     writes reconnect, see
+                                                     `write`.
+
         For more help, see: `help(plotly.plotly.Stream)`
         or see examples and tutorials here:
         https://plotly.com/python/streaming/
 
         """
+        if on_full not in chunked_requests.BufferedWriter.ON_FULL:
+            raise _plotly_utils.exceptions.PlotlyError(
+                "Whoops, on_full can only be set to either 'block', "
+                "'drop_oldest', or 'drop_newest'."
+            )
+
         streaming_specs = self.get_streaming_specs()
         self._stream = chunked_requests.Stream(**streaming_specs)
+        self._writer = None
+        if flush_interval is not None:
+            self._writer = chunked_requests.BufferedWriter(
+                self._stream,
+                flush_interval=flush_interval,
+                max_pending=max_pending,
+                on_full=on_full,
+                reconnect_on=reconnect_on,
+            )
 
     def write(self, trace, layout=None, reconnect_on=(200, "", 408, 502)):
         """
@@ -716,7 +779,8 @@ class Stream:
         if isinstance(trace, BaseTraceType):
             stream_object = trace.to_plotly_json()
         else:
-            stream_object = copy.deepcopy(trace)
+            # Only the top-level keys are changed, the values are just encoded
+            stream_object = dict(trace)
 
         # Remove 'type' if present since this trace type cannot be changed
         stream_object.pop("type", None)
@@ -728,8 +792,47 @@ class Stream:
         jdata = _json.dumps(stream_object, cls=PlotlyJSONEncoder)
         jdata += "\n"
 
+        self._write_lines([jdata], reconnect_on)
+
+    def write_batch(self, columns, reconnect_on=(200, "", 408, 502)):
+        """
+        Write a batch of points to an open stream.
+
+        This is equivalent to writing each point with `write`, but the
+        points are encoded together and sent as one chunk.
+
+        positional arguments:
+        columns - A dict of properties to stream, with one value per point,
+                  as lists, numpy arrays or pandas series of the same length
+
+        Examples:
+
+        Append 1000 points to a scatter trace
+        >>> write_batch(dict(x=np.arange(1000), y=np.random.randn(1000)))
+
+        """
+        names = list(columns)
+        values = [_to_list(columns[name]) for name in names]
+        if len({len(value) for value in values}) > 1:
+            raise _plotly_utils.exceptions.PlotlyError(
+                "The properties of a batch must have the same number of values."
+            )
+
+        encode = PlotlyJSONEncoder().encode
+        lines = [encode(dict(zip(names, point))) + "\n" for point in zip(*values)]
+        self._write_lines(lines, reconnect_on)
+
+    def _write_lines(self, lines, reconnect_on):
+        """
+        Buffer or send newline-delimited points.
+
+        """
+        if self._writer is not None:
+            self._writer.write(lines)
+            return
+
         try:
-            self._stream.write(jdata, reconnect_on=reconnect_on)
+            self._stream.write("".join(lines), reconnect_on=reconnect_on)
         except AttributeError:
             raise _plotly_utils.exceptions.PlotlyError(
                 "Stream has not been opened yet, "
@@ -746,6 +849,15 @@ class Stream:
         https://plotly.com/python/streaming/
 
         """
+        if self._writer is not None:
+            # Send the buffered points first
+            writer, self._writer = self._writer, None
+            try:
+                writer.close()
+            finally:
+                self._stream.close()
+            return
+
         try:
             self._stream.close()
         except AttributeError:
@@ -997,7 +1109,14 @@ class grid_ops:
 
     @classmethod
     def upload(
-        cls, grid, filename=None, world_readable=True, auto_open=True, meta=None
+        cls,
+        grid,
+        filename=None,
+        world_readable=True,
+        auto_open=True,
+        meta=None,
+        chunk_size=DEFAULT_GRID_CHUNK_SIZE,
+        max_workers=2,
     ):
         """
         Upload a grid to your Plotly account with the specified filename.
@@ -1024,6 +1143,18 @@ class grid_ops:
                                    Metadata is any arbitrary
                                    JSON-encodable object, for example:
                                    `{"experiment name": "GaAs"}`
+            - chunk_size (default=100000): Grids of more cells, whose columns
+                                           have the same length, are
+                                           created with their first rows and
+                                           the other rows are appended in
+                                           chunks of about `chunk_size`
+                                           cells. If None, the grid is
+                                           always uploaded at once.
+            - max_workers (default=2): Number of chunks encoded
+                                       concurrently, ahead of their upload.
+
+        If the upload of a chunk fails, `grid_ops.resume_upload` resumes the
+        upload of the grid after its last uploaded chunk.
 
         Filenames must be unique. To overwrite a grid with the same filename,
         you'll first have to delete the grid with the blocking name. See
@@ -1063,6 +1194,16 @@ class grid_ops:
         if meta is not None:
             grid_json["metadata"] = meta
 
+        # Large grids are created with their first rows only
+        n_rows = _grid_row_count(grid)
+        rows_per_chunk = None
+        if chunk_size and len(grid):
+            rows_per_chunk = max(1, chunk_size // len(grid))
+        chunked = n_rows is not None and rows_per_chunk and n_rows > rows_per_chunk
+        if chunked:
+            for column in grid_json["cols"].values():
+                column["data"] = column["data"][:rows_per_chunk]
+
         payload = {"data": grid_json, "world_readable": world_readable}
 
         # Make a folder path
@@ -1092,6 +1233,16 @@ class grid_ops:
 
         grid.id = fid
 
+        if chunked:
+            grid._upload_progress = {
+                "web_url": web_url,
+                "meta": meta,
+                "auto_open": auto_open,
+                "rows": rows_per_chunk,
+                "rows_per_chunk": rows_per_chunk,
+            }
+            return cls.resume_upload(grid, max_workers=max_workers)
+
         if meta is not None:
             meta_ops.upload(meta, grid=grid)
 
@@ -1101,7 +1252,69 @@ class grid_ops:
         return web_url
 
     @classmethod
-    def append_columns(cls, columns, grid=None, grid_url=None):
+    def resume_upload(cls, grid, max_workers=2):
+        """
+        Resume the chunked upload of a grid after its last uploaded chunk.
+
+        `grid` is a plotly.grid_objs.Grid object whose upload with
+        `grid_ops.upload` failed while appending its rows.
+
+        Usage example:
+        ```
+        from chart_studio.exceptions import PlotlyRequestError
+        try:
+            py.grid_ops.upload(grid, 'large grid')
+        except PlotlyRequestError:
+            py.grid_ops.resume_upload(grid)
+        ```
+
+        """
+        progress = getattr(grid, "_upload_progress", None)
+        if progress is None:
+            raise _plotly_utils.exceptions.PlotlyError(
+                "This grid has no interrupted upload to resume."
+            )
+
+        n_rows = _grid_row_count(grid)
+        step = progress["rows_per_chunk"]
+        url = v2.utils.build_url("grids", id=grid.id, route="row")
+
+        def encode(start):
+            rows = zip(
+                *[_to_list(column.data[start : start + step]) for column in grid]
+            )
+            return _json.dumps(
+                {"rows": list(rows)}, sort_keys=True, cls=PlotlyJSONEncoder
+            )
+
+        # The rows are appended in order, while the next chunks are encoded
+        starts = iter(range(progress["rows"], n_rows, step))
+        with ThreadPoolExecutor(max_workers) as executor:
+            pending = deque(
+                (start, executor.submit(encode, start))
+                for start in islice(starts, max_workers)
+            )
+            while pending:
+                start, chunk = pending.popleft()
+                for next_start in islice(starts, 1):
+                    pending.append((next_start, executor.submit(encode, next_start)))
+                v2.utils.request("post", url, data=chunk.result())
+                progress["rows"] = min(start + step, n_rows)
+
+        del grid._upload_progress
+
+        if progress["meta"] is not None:
+            meta_ops.upload(progress["meta"], grid=grid)
+
+        if progress["auto_open"]:
+            _open_url(progress["web_url"])
+
+        return progress["web_url"]
+
+    @classmethod
+    def append_columns(
+        cls, columns, grid=None, grid_url=None, chunk_size=DEFAULT_GRID_CHUNK_SIZE
+    ):
         """
         Append columns to a Plotly grid.
 
@@ -1113,6 +1326,9 @@ class grid_ops:
 
         `grid_url` is a unique URL of a `grid` in your plotly account.
 
+        The columns are sent in chunks of about `chunk_size` cells (or
+        at once if `chunk_size` is None).
+
         Usage example 1: Upload a grid to Plotly, and then append a column
         ```
         from plotly.grid_objs import Grid, Column
@@ -1152,19 +1368,22 @@ class grid_ops:
             err = exceptions.NON_UNIQUE_COLUMN_MESSAGE.format(duplicate_name)
             raise exceptions.InputError(err)
 
-        # This is sorta gross, we need to double-encode this.
-        body = {"cols": _json.dumps(columns, cls=PlotlyJSONEncoder)}
         fid = grid_id
-        response = v2.grids.col_create(fid, body)
-        parsed_content = response.json()
+        for chunk in _chunk_columns(columns, chunk_size):
+            # This is sorta gross, we need to double-encode this.
+            body = {"cols": _json.dumps(chunk, cls=PlotlyJSONEncoder)}
+            response = v2.grids.col_create(fid, body)
+            parsed_content = response.json()
 
-        cls._fill_in_response_column_ids(columns, parsed_content["cols"], fid)
+            cls._fill_in_response_column_ids(chunk, parsed_content["cols"], fid)
 
         if grid:
             grid.extend(columns)
 
     @classmethod
-    def append_rows(cls, rows, grid=None, grid_url=None):
+    def append_rows(
+        cls, rows, grid=None, grid_url=None, chunk_size=DEFAULT_GRID_CHUNK_SIZE
+    ):
         """
         Append rows to a Plotly grid.
 
@@ -1182,6 +1401,9 @@ class grid_ops:
 
         `grid_url` is a unique URL of a `grid` in your plotly account.
 
+        The rows are sent in chunks of about `chunk_size` cells (or at
+        once if `chunk_size` is None).
+
         Usage example 1: Upload a grid to Plotly, and then append rows
         ```
         from plotly.grid_objs import Grid, Column
@@ -1230,7 +1452,12 @@ class grid_ops:
                     )
 
         fid = grid_id
-        v2.grids.row(fid, {"rows": rows})
+        rows = list(rows)
+        step = len(rows)
+        if chunk_size and rows:
+            step = max(1, chunk_size // max(1, len(rows[0])))
+        for start in range(0, len(rows) or 1, step or 1):
+            v2.grids.row(fid, {"rows": rows[start : start + step]})
 
         if grid:
             longest_column_length = max([len(col.data) for col in grid])
@@ -1343,6 +1570,43 @@ class meta_ops:
         return v2.grids.update(fid, {"metadata": meta}).json()
 
 
+def _to_list(values):
+    """
+    Return the values of a column as a list, which is faster to encode.
+
+    """
+    return values.tolist() if hasattr(values, "tolist") else list(values)
+
+
+def _grid_row_count(grid):
+    """
+    Return the length of the columns of a grid, or None if they differ.
+
+    """
+    lengths = {len(column.data) for column in grid}
+    return lengths.pop() if len(lengths) == 1 else None
+
+
+def _chunk_columns(columns, chunk_size):
+    """
+    Split columns into lists of consecutive columns of at most `chunk_size`
+    cells, or of a single column.
+
+    """
+    columns = list(columns)
+    if not chunk_size:
+        return [columns]
+    chunks = [[]]
+    cells = 0
+    for column in columns:
+        if chunks[-1] and cells + len(column.data) > chunk_size:
+            chunks.append([])
+            cells = 0
+        chunks[-1].append(column)
+        cells += len(column.data)
+    return chunks
+
+
 def parse_grid_id_args(grid, grid_url):
     """
     Return the grid_id from the non-None input argument.
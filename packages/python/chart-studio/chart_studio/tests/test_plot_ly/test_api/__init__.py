@@ -1,7 +1,12 @@
 from __future__ import absolute_import
 
+import json as _json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
 from requests import Response
 
+from chart_studio.api.v2 import utils
 from chart_studio.session import sign_in
 from chart_studio.tests.utils import PlotlyTestCase
 
@@ -63,3 +68,68 @@ class PlotlyApiTestCase(PlotlyTestCase):
         response._content = content
         response.encoding = "utf-8"
         return response
+
+
+class LocalApiTestCase(PlotlyApiTestCase):
+    """
+    Runs api requests against a local stand-in server.
+
+    Subclasses implement `respond(method, path, body)`, which returns the
+    status code and the json content of the response, or None to drop the
+    connection. The server records the `(method, path, body, client_port)`
+    of each request in `self.requests`.
+    """
+
+    def setUp(self):
+        super(LocalApiTestCase, self).setUp()
+        self.requests = []
+        self.requests_lock = threading.Lock()
+        test_case = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def handle_request(self):
+                length = int(self.headers.get("content-length") or 0)
+                body = self.rfile.read(length).decode("utf-8")
+                body = _json.loads(body) if body else None
+                with test_case.requests_lock:
+                    test_case.requests.append(
+                        (self.command, self.path, body, self.client_address[1])
+                    )
+                result = test_case.respond(self.command, self.path, body)
+                if result is None:
+                    self.close_connection = True
+                    return
+                status_code, content = result
+                content = _json.dumps(content).encode("utf-8")
+                self.send_response(status_code)
+                self.send_header("content-type", "application/json")
+                self.send_header("content-length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_POST = do_PUT = do_DELETE = handle_request
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.server.daemon_threads = True
+        thread = threading.Thread(target=self.server.serve_forever)
+        thread.daemon = True
+        thread.start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        # Start each test with a new session, without retry delays
+        utils.configure_session(backoff_factor=0)
+        self.addCleanup(utils.configure_session, **utils.DEFAULT_SESSION_OPTIONS)
+
+        self.plotly_api_domain = "http://127.0.0.1:{}".format(
+            self.server.server_address[1]
+        )
+        sign_in(self.username, self.api_key, plotly_api_domain=self.plotly_api_domain)
+
+    def respond(self, method, path, body):
+        raise NotImplementedError
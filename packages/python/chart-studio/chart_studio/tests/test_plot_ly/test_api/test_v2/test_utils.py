@@ -3,12 +3,16 @@ from __future__ import absolute_import
 import json as _json
 from requests.exceptions import ConnectionError
 
+from _plotly_utils.exceptions import PlotlyError
 from plotly import version
 from chart_studio.api.utils import to_native_utf8_string
-from chart_studio.api.v2 import utils
+from chart_studio.api.v2 import grids, utils
 from chart_studio.exceptions import PlotlyRequestError
 from chart_studio.session import sign_in
-from chart_studio.tests.test_plot_ly.test_api import PlotlyApiTestCase
+from chart_studio.tests.test_plot_ly.test_api import (
+    LocalApiTestCase,
+    PlotlyApiTestCase,
+)
 
 
 class MakeParamsTest(PlotlyApiTestCase):
@@ -180,7 +184,9 @@ class RequestTest(PlotlyApiTestCase):
         super(RequestTest, self).setUp()
 
         # Mock the actual api call, we don't want to do network tests here.
-        self.request_mock = self.mock("chart_studio.api.v2.utils.requests.request")
+        self.request_mock = self.mock(
+            "chart_studio.api.v2.utils.requests.Session.request"
+        )
         self.request_mock.return_value = self.get_response()
 
         # Mock the validation function since we can test that elsewhere.
@@ -238,3 +244,49 @@ class RequestTest(PlotlyApiTestCase):
 
         utils.request(self.method, self.url)
         assert self.request_mock.call_count == 1
+
+
+class SessionTest(LocalApiTestCase):
+    def respond(self, method, path, body):
+        fid = path.rsplit("/", 1)[-1]
+        if fid == "foo:404":
+            return 404, {"errors": [{"message": "Not found."}]}
+        if fid == "foo:flaky" and len(self.requests) == 1:
+            return None
+        return 200, {"fid": fid}
+
+    def test_connections_kept_alive(self):
+        for i in range(5):
+            grids.retrieve("foo:{}".format(i))
+        self.assertEqual(len(self.requests), 5)
+        self.assertEqual(len({port for _, _, _, port in self.requests}), 1)
+
+    def test_retry_dropped_connection(self):
+        response = grids.retrieve("foo:flaky")
+        self.assertEqual(response.json(), {"fid": "foo:flaky"})
+        self.assertEqual(len(self.requests), 2)
+
+    def test_bulk(self):
+        fids = ["foo:{}".format(i) for i in range(20)]
+        responses = utils.bulk(grids.retrieve, fids, max_workers=4)
+        self.assertEqual([response.json()["fid"] for response in responses], fids)
+        self.assertLessEqual(len({port for _, _, _, port in self.requests}), 4)
+
+        fids = ["foo:1", "foo:404", "foo:2"]
+        with self.assertRaises(PlotlyRequestError) as context:
+            utils.bulk(grids.retrieve, fids)
+        self.assertEqual(context.exception.status_code, 404)
+        self.assertEqual(len(self.requests), 23)
+
+    def test_configure_session(self):
+        session = utils.get_session()
+        self.assertIs(utils.get_session(), session)
+        utils.configure_session(pool_maxsize=2)
+        self.assertIsNot(utils.get_session(), session)
+        self.assertEqual(
+            utils.get_session()
+            .get_adapter("http://")
+            .poolmanager.connection_pool_kw["maxsize"],
+            2,
+        )
+        self.assertRaises(PlotlyError, utils.configure_session, pool_size=2)
@@ -0,0 +1,113 @@
+from __future__ import absolute_import
+
+import json as _json
+
+from chart_studio import plotly as py
+from chart_studio.exceptions import PlotlyRequestError
+from chart_studio.grid_objs import Column, Grid
+from chart_studio.tests.test_plot_ly.test_api import LocalApiTestCase
+from _plotly_utils.exceptions import PlotlyError
+
+
+class ChunkedUploadTest(LocalApiTestCase):
+    def setUp(self):
+        super(ChunkedUploadTest, self).setUp()
+        self.failing_chunks = set()
+        self.chunks = 0
+        self.grid = Grid(
+            [Column(list(range(25)), "x"), Column([str(i) for i in range(25)], "y")]
+        )
+
+    def respond(self, method, path, body):
+        if path == "/v2/grids":
+            cols = [
+                {"name": name, "uid": "u{}".format(col["order"])}
+                for name, col in body["data"]["cols"].items()
+            ]
+            return 201, {
+                "file": {
+                    "fid": "foo:1",
+                    "web_url": "https://who.am.i/~foo/1",
+                    "cols": cols,
+                }
+            }
+        if path == "/v2/grids/foo:1/row":
+            self.chunks += 1
+            if self.chunks in self.failing_chunks:
+                return 400, {"errors": [{"message": "bad chunk"}]}
+            return 200, {}
+        if path == "/v2/grids/foo:1/col":
+            cols = [
+                {"name": col["name"], "uid": "c{}".format(len(self.requests))}
+                for col in _json.loads(body["cols"])
+            ]
+            return 200, {"cols": cols}
+        return 404, {"errors": [{"message": "not found"}]}
+
+    def uploaded_rows(self):
+        created = [
+            body for method, path, body, _ in self.requests if path == "/v2/grids"
+        ]
+        cols = created[0]["data"]["cols"]
+        rows = [list(row) for row in zip(cols["x"]["data"], cols["y"]["data"])]
+        for method, path, body, _ in self.requests:
+            if path == "/v2/grids/foo:1/row":
+                rows.extend(body["rows"])
+        return rows
+
+    def test_upload_in_chunks(self):
+        url = py.grid_ops.upload(self.grid, auto_open=False, chunk_size=20)
+        self.assertEqual(url, "https://who.am.i/~foo/1")
+        self.assertEqual(self.grid.id, "foo:1")
+        self.assertEqual(self.grid[0].id, "foo:1:u0")
+
+        # The grid is created with 10 rows, the other 15 are appended in order
+        paths = [path for method, path, body, _ in self.requests]
+        self.assertEqual(paths, ["/v2/grids"] + ["/v2/grids/foo:1/row"] * 2)
+        expected = [[i, str(i)] for i in range(25)]
+        self.assertEqual(self.uploaded_rows(), expected)
+        self.assertFalse(hasattr(self.grid, "_upload_progress"))
+
+    def test_small_grid_is_uploaded_at_once(self):
+        py.grid_ops.upload(self.grid, auto_open=False)
+        paths = [path for method, path, body, _ in self.requests]
+        self.assertEqual(paths, ["/v2/grids"])
+        self.assertEqual(
+            self.requests[0][2]["data"]["cols"]["x"]["data"], list(range(25))
+        )
+
+    def test_resume_upload(self):
+        # The second row chunk fails
+        self.failing_chunks = {2}
+        with self.assertRaises(PlotlyRequestError):
+            py.grid_ops.upload(self.grid, auto_open=False, chunk_size=20)
+        self.assertEqual(self.grid._upload_progress["rows"], 20)
+
+        failed = len(self.requests)
+        url = py.grid_ops.resume_upload(self.grid)
+        self.assertEqual(url, "https://who.am.i/~foo/1")
+        self.assertEqual(
+            self.requests[failed][2], {"rows": [[i, str(i)] for i in range(20, 25)]}
+        )
+        self.assertFalse(hasattr(self.grid, "_upload_progress"))
+
+        with self.assertRaises(PlotlyError):
+            py.grid_ops.resume_upload(self.grid)
+
+    def test_append_in_chunks(self):
+        self.grid.id = "foo:1"
+        py.grid_ops.append_rows(
+            [[i, str(i)] for i in range(25, 30)], grid=self.grid, chunk_size=4
+        )
+        bodies = [body for method, path, body, _ in self.requests]
+        self.assertEqual([len(body["rows"]) for body in bodies], [2, 2, 1])
+        self.assertEqual(self.grid[0].data[-1], 29)
+
+        del self.requests[:]
+        columns = [Column(list(range(25)), name) for name in "abc"]
+        py.grid_ops.append_columns(columns, grid=self.grid, chunk_size=50)
+        self.assertEqual(
+            [len(_json.loads(body["cols"])) for method, path, body, _ in self.requests],
+            [2, 1],
+        )
+        self.assertTrue(all(column.id for column in columns))
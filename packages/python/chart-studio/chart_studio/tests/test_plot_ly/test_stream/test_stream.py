@@ -0,0 +1,173 @@
+from __future__ import absolute_import
+
+import json as _json
+import socket
+import threading
+import time
+from unittest import TestCase
+
+import numpy as np
+
+from chart_studio import plotly as py
+from chart_studio.plotly.chunked_requests import BufferedWriter
+from chart_studio.session import sign_in
+from chart_studio.tests.utils import PlotlyTestCase
+
+
+class LocalStreamServer(object):
+    """
+    Accepts one chunked POST request and records the chunks of its body.
+    """
+
+    def __init__(self):
+        self.socket = socket.socket()
+        self.socket.bind(("127.0.0.1", 0))
+        self.socket.listen(1)
+        self.port = self.socket.getsockname()[1]
+        self.data = b""
+        self.thread = threading.Thread(target=self.serve)
+        self.thread.daemon = True
+        self.thread.start()
+
+    def serve(self):
+        connection, _ = self.socket.accept()
+        with connection:
+            while not self.data.endswith(b"\r\n0\r\n\r\n"):
+                received = connection.recv(65536)
+                if not received:
+                    break
+                self.data += received
+            connection.sendall(b"HTTP/1.1 200 OK\r\ncontent-length: 0\r\n\r\n")
+        self.socket.close()
+
+    def chunks(self):
+        self.thread.join(5)
+        body = self.data.split(b"\r\n\r\n", 1)[1]
+        chunks = []
+        while True:
+            body = body.lstrip(b"\r\n")
+            size, body = body.split(b"\r\n", 1)
+            size = int(size, 16)
+            if size == 0:
+                return chunks
+            chunks.append(body[:size].decode("utf-8"))
+            body = body[size:]
+
+
+class StreamTest(PlotlyTestCase):
+    def setUp(self):
+        super(StreamTest, self).setUp()
+        self.server = LocalStreamServer()
+        sign_in("foo", "bar", plotly_streaming_domain="127.0.0.1")
+        self.stream = py.Stream("token")
+        self.stream.HTTP_PORT = self.server.port
+
+    def lines(self, chunks):
+        return [_json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+
+    def test_buffered_write(self):
+        self.stream.open(flush_interval=0.05)
+        for i in range(1000):
+            self.stream.write(dict(x=i, y=2 * i, type="scatter"))
+        self.stream.write_batch(dict(x=np.arange(1000, 2000), y=np.arange(1000.0)))
+        self.assertEqual(self.stream.stats["lines"], 2000)
+        self.stream.close()
+
+        chunks = self.server.chunks()
+        self.assertLess(len(chunks), 100)
+        points = self.lines(chunks)
+        self.assertEqual(points[:1000], [dict(x=i, y=2 * i) for i in range(1000)])
+        self.assertEqual(
+            points[1000:], [dict(x=1000 + i, y=float(i)) for i in range(1000)]
+        )
+
+    def test_unbuffered_write_batch(self):
+        self.stream.open()
+        self.assertIsNone(self.stream.stats)
+        self.stream.write_batch(dict(x=[1, 2, 3], y=np.array([np.nan, 1.5, 2.5])))
+        self.stream.write(dict(x=4, y=3.5))
+        self.stream.close()
+
+        chunks = self.server.chunks()
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(
+            self.lines(chunks),
+            [
+                dict(x=1, y=None),
+                dict(x=2, y=1.5),
+                dict(x=3, y=2.5),
+                dict(x=4, y=3.5),
+            ],
+        )
+
+
+class SlowStream(object):
+    """
+    Stands in for a chunked_requests.Stream whose socket is slow: the
+    first write waits for `release`.
+    """
+
+    def __init__(self):
+        self.chunks = []
+        self.sending = threading.Event()
+        self.release = threading.Event()
+
+    def write(self, data, reconnect_on=()):
+        self.sending.set()
+        self.release.wait(5)
+        self.chunks.append(data)
+
+    def lines(self):
+        return "".join(self.chunks).splitlines()
+
+
+class BufferedWriterTest(TestCase):
+    def start(self, on_full):
+        stream = SlowStream()
+        writer = BufferedWriter(stream, 0.01, max_pending=2, on_full=on_full)
+        writer.write(["0\n"])
+        stream.sending.wait(5)
+        return stream, writer
+
+    def test_drop_oldest(self):
+        stream, writer = self.start("drop_oldest")
+        writer.write(["{}\n".format(i) for i in range(1, 6)])
+        stream.release.set()
+        writer.close()
+        self.assertEqual(stream.lines(), ["0", "4", "5"])
+        self.assertEqual(
+            writer.stats, {"lines": 6, "dropped": 3, "sent": 3, "chunks": 2, "bytes": 6}
+        )
+
+    def test_drop_newest(self):
+        stream, writer = self.start("drop_newest")
+        writer.write(["{}\n".format(i) for i in range(1, 6)])
+        stream.release.set()
+        writer.close()
+        self.assertEqual(stream.lines(), ["0", "1", "2"])
+        self.assertEqual(writer.stats["dropped"], 3)
+
+    def test_block(self):
+        stream, writer = self.start("block")
+        thread = threading.Thread(
+            target=writer.write, args=(["{}\n".format(i) for i in range(1, 6)],)
+        )
+        thread.start()
+        time.sleep(0.1)
+        self.assertTrue(thread.is_alive())
+
+        stream.release.set()
+        thread.join(5)
+        writer.close()
+        self.assertEqual(stream.lines(), [str(i) for i in range(6)])
+        self.assertEqual(writer.stats["dropped"], 0)
+
+    def test_errors_are_raised(self):
+        class FailingStream(object):
+            def write(self, data, reconnect_on=()):
+                raise IOError("broken pipe")
+
+        writer = BufferedWriter(FailingStream(), 0.01)
+        writer.write(["0\n"])
+        with self.assertRaises(IOError):
+            writer.close()
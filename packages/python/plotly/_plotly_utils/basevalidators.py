@@ -25,6 +25,11 @@ def fullmatch(regex, string, flags=0):
 
 # Utility functions
 # -----------------
+# Types of the values which to_scalar_or_list returns unchanged, checked with
+# `type(v) in` so that subclasses such as numpy.float64 are still converted
+_native_scalar_types = frozenset([int, float, str, bool, type(None)])
+
+
 def to_scalar_or_list(v):
     # Handle the case where 'v' is a non-native scalar-like type,
     # such as numpy.float32. Without this case, the object might be
@@ -38,7 +43,9 @@ def to_scalar_or_list(v):
     if np and np.isscalar(v) and hasattr(v, "item"):
         return v.item()
     if isinstance(v, (list, tuple)):
-        return [to_scalar_or_list(e) for e in v]
+        return [
+            e if type(e) in _native_scalar_types else to_scalar_or_list(e) for e in v
+        ]
     elif np and isinstance(v, np.ndarray):
         if v.ndim == 0:
             return v.item()
@@ -223,6 +230,38 @@ def type_str(v):
     return "'{module}.{name}'".format(module=v.__module__, name=v.__name__)
 
 
+def map_unique(fn, v):
+    """
+    Return a list of fn(e) for each element e of the one-dimensional array
+    v, calling fn only once per distinct element
+
+    Arrays of colors, symbols, or flags usually contain only a handful of
+    distinct values, so validating each distinct value once and reusing the
+    result is much cheaper than validating every element. Elements are keyed
+    by type as well as value (so that 1, 1.0 and True are validated
+    separately), and nested arrays or unhashable elements are passed to fn
+    individually.
+    """
+    cache = {}
+    results = []
+    append = results.append
+    for e in v:
+        if isinstance(e, (list, tuple)):
+            append(fn(e))
+            continue
+
+        key = (e.__class__, e)
+        try:
+            res = cache[key]
+        except KeyError:
+            res = cache[key] = fn(e)
+        except TypeError:
+            # Unhashable element
+            res = fn(e)
+        append(res)
+    return results
+
+
 # Validators
 # ----------
 class BaseValidator(object):
@@ -590,14 +629,23 @@ class EnumeratedValidator(BaseValidator):
 
         return False
 
+    def _check_element(self, e):
+        """
+        Return a tuple of an array element, with any regex replacements
+        applied, and whether it matches one of the enumeration options
+        """
+        e = self.perform_replacemenet(e)
+        return e, self.in_values(e)
+
     def validate_coerce(self, v):
         if v is None:
             # Pass None through
             pass
         elif self.array_ok and is_array(v):
-            v_replaced = [self.perform_replacemenet(v_el) for v_el in v]
+            # Validate each distinct element once
+            checked = map_unique(self._check_element, v)
 
-            invalid_els = [e for e in v_replaced if (not self.in_values(e))]
+            invalid_els = [e for e, is_valid in checked if not is_valid]
             if invalid_els:
                 self.raise_invalid_elements(invalid_els[:10])
 
@@ -1096,17 +1144,19 @@ class StringValidator(BaseValidator):
                 if not self.strict:
                     v = [StringValidator.to_str_or_unicode_or_none(e) for e in v]
 
-                # Check no_blank
-                if self.no_blank:
-                    invalid_els = [e for e in v if e == ""]
-                    if invalid_els:
-                        self.raise_invalid_elements(invalid_els)
+                # Check no_blank and values against each distinct element
+                if self.no_blank or self.values:
+                    unique_els = list(dict.fromkeys(v))
 
-                # Check values
-                if self.values:
-                    invalid_els = [e for e in v if v not in self.values]
-                    if invalid_els:
-                        self.raise_invalid_elements(invalid_els)
+                    if self.no_blank:
+                        invalid_els = [e for e in unique_els if e == ""]
+                        if invalid_els:
+                            self.raise_invalid_elements(invalid_els)
+
+                    if self.values:
+                        invalid_els = [e for e in unique_els if e not in self.values]
+                        if invalid_els:
+                            self.raise_invalid_elements(invalid_els[:10])
 
                 v = to_scalar_or_list(v)
 
@@ -1375,7 +1425,7 @@ class ColorValidator(BaseValidator):
                 # All good
                 pass
             else:
-                validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
+                validated_v = map_unique(self._validate_coerce_element, v)
 
                 invalid_els = self.find_invalid_els(v, validated_v)
 
@@ -1388,7 +1438,7 @@ class ColorValidator(BaseValidator):
                 else:
                     v = copy_to_readonly_numpy_array(validated_v, kind="U")
         elif self.array_ok and is_simple_array(v):
-            validated_v = [self.validate_coerce(e, should_raise=False) for e in v]
+            validated_v = map_unique(self._validate_coerce_element, v)
 
             invalid_els = self.find_invalid_els(v, validated_v)
 
@@ -1406,6 +1456,10 @@ class ColorValidator(BaseValidator):
 
         return v
 
+    def _validate_coerce_element(self, e):
+        """Helper to validate/coerce an element of a color array"""
+        return self.validate_coerce(e, should_raise=False)
+
     def find_invalid_els(self, orig, validated, invalid_els=None):
         """
         Helper method to find invalid elements in orig array.
@@ -1418,11 +1472,13 @@ class ColorValidator(BaseValidator):
             invalid_els = []
 
         for orig_el, validated_el in zip(orig, validated):
-            if is_array(orig_el):
+            if isinstance(validated_el, (str, numbers.Number)):
+                # Valid scalar color
+                continue
+            elif is_array(orig_el):
                 self.find_invalid_els(orig_el, validated_el, invalid_els)
-            else:
-                if validated_el is None:
-                    invalid_els.append(orig_el)
+            elif validated_el is None:
+                invalid_els.append(orig_el)
 
         return invalid_els
 
@@ -1514,9 +1570,10 @@ class ColorlistValidator(BaseValidator):
             # Pass None through
             pass
         elif is_array(v):
-            validated_v = [
-                ColorValidator.perform_validate_coerce(e, allow_number=False) for e in v
-            ]
+            validated_v = map_unique(
+                lambda e: ColorValidator.perform_validate_coerce(e, allow_number=False),
+                v,
+            )
 
             invalid_els = [
                 el for el, validated_el in zip(v, validated_v) if validated_el is None
@@ -1907,8 +1964,8 @@ class FlaglistValidator(BaseValidator):
             pass
         elif self.array_ok and is_array(v):
 
-            # Coerce individual strings
-            validated_v = [self.vc_scalar(e) for e in v]
+            # Coerce each distinct string once
+            validated_v = map_unique(self.vc_scalar, v)
 
             invalid_els = [
                 el for el, validated_el in zip(v, validated_v) if validated_el is None
@@ -2672,7 +2729,24 @@ class BaseDataValidator(BaseValidator):
 
         return self._class_map[trace_name]
 
-    def validate_coerce(self, v, skip_invalid=False, _validate=True):
+    @staticmethod
+    def _can_adopt(v_el, _validate=True):
+        """
+        Return whether a trace object can be used as-is, without being
+        copied or revalidated. This is the case for trace objects that
+        don't belong to a figure and were validated on construction.
+        """
+        from plotly.basedatatypes import BaseTraceType
+        from plotly.graph_objs import Histogram2dcontour
+
+        return (
+            isinstance(v_el, BaseTraceType)
+            and not isinstance(v_el, Histogram2dcontour)
+            and v_el._parent is None
+            and (v_el._validate or not _validate)
+        )
+
+    def validate_coerce(self, v, skip_invalid=False, _validate=True, _adopt=False):
         from plotly.basedatatypes import BaseTraceType
 
         # Import Histogram2dcontour, this is the deprecated name of the
@@ -2687,8 +2761,21 @@ class BaseDataValidator(BaseValidator):
 
             res = []
             invalid_els = []
+            adopted_ids = set()
             for v_el in v:
 
+                if (
+                    _adopt
+                    and self._can_adopt(v_el, _validate)
+                    and id(v_el) not in adopted_ids
+                ):
+                    # Orphan trace that was already validated, the caller
+                    # takes ownership of it as-is rather than of a
+                    # validated copy of it
+                    adopted_ids.add(id(v_el))
+                    res.append(v_el)
+                    continue
+
                 if isinstance(v_el, BaseTraceType):
                     if isinstance(v_el, Histogram2dcontour):
                         v_el = dict(type="histogram2dcontour", **v_el._props)
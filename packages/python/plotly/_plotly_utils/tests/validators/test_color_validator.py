@@ -196,6 +196,26 @@ def test_rejection_aok_2D(val, validator_aok):
     assert "Invalid element(s)" in str(validation_failure.value)
 
 
+def test_acceptance_aok_repeated_elements(validator_aok, validator_aok_colorscale):
+    val = ["red", "rgb(0, 0, 255)", 1, 1.0, "red"] * 1000
+    coerce_val = validator_aok_colorscale.validate_coerce(val)
+    assert coerce_val == val
+    assert [type(v) for v in coerce_val[:4]] == [str, str, int, float]
+
+    val = np.array(["red", "blue", "rgb(0, 0, 255)"] * 1000)
+    coerce_val = validator_aok.validate_coerce(val)
+    np.testing.assert_array_equal(coerce_val, val)
+
+
+def test_rejection_aok_repeated_elements(validator_aok):
+    val = ["red", "redd", 23, "blue"] * 1000
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+
+    assert "Invalid element(s)" in str(validation_failure.value)
+    assert "'redd'" in str(validation_failure.value)
+
+
 # Array ok, numbers ok
 # --------------------
 # ### Acceptance ###
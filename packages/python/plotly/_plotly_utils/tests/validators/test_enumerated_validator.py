@@ -114,6 +114,21 @@ def test_rejection_by_element_aok(val, validator_aok):
     assert "Invalid element(s)" in str(validation_failure.value)
 
 
+def test_acceptance_aok_repeated_elements(validator_aok):
+    val = ["first", "second", 4, 4.0, "first"] * 1000
+    assert validator_aok.validate_coerce(val) == val
+
+
+def test_rejection_aok_repeated_elements(validator_aok):
+    val = ["first", 1, "ffirstt", "first"] * 1000
+    with pytest.raises(ValueError) as validation_failure:
+        validator_aok.validate_coerce(val)
+
+    assert "Invalid elements include: [1, 'ffirstt', 1," in str(
+        validation_failure.value
+    )
+
+
 # Array ok, regular expression
 # ----------------------------
 # ### Acceptance ###
@@ -155,6 +155,14 @@ def test_rejection_aok(val, validator_aok_strict):
     assert "Invalid element(s)" in str(validation_failure.value)
 
 
+# ### Acceptance by value ###
+@pytest.mark.parametrize(
+    "val", [["foo", "BAR"], ["baz", "", "baz"], ["foo", "BAR", "foo", "BAR"] * 1000]
+)
+def test_acceptance_aok_values(val, validator_aok_values):
+    assert validator_aok_values.validate_coerce(val) == val
+
+
 # ### Rejection by value ###
 @pytest.mark.parametrize(
     "val", [["foo", "bar"], ["3", "4"], ["BAR", "BAR", "hello!"], ["foo", None]]
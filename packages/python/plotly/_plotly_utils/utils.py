@@ -126,6 +126,134 @@ def cumsum(x):
     return ret
 
 
+class RingBuffer(object):
+    """
+    Growable 1D array supporting amortized O(1) appends at either end.
+
+    Values are stored in a numpy array with free space before and after
+    the occupied window, so extending or prepending only copies the new
+    values. When a `max_points` limit is passed, values are dropped from
+    the opposite end of the window and the buffer behaves as a ring buffer.
+
+    The read-only arrays returned by `values` are views into the storage
+    array that are never written to again, so they remain valid snapshots
+    while the buffer keeps growing.
+    """
+
+    _min_capacity = 16
+
+    def __init__(self, values):
+        np = get_module("numpy")
+        values = np.asarray(values)
+        if values.ndim != 1:
+            raise ValueError(
+                "RingBuffer values must be one dimensional, received array "
+                "with shape {shape}".format(shape=values.shape)
+            )
+
+        n = len(values)
+        capacity = max(2 * n, self._min_capacity)
+        self._data = np.empty(capacity, dtype=values.dtype)
+        self._lo = (capacity - n) // 2
+        self._hi = self._lo + n
+        self._data[self._lo : self._hi] = values
+
+        # Bounds of the region that may be referenced by previously
+        # returned views. Writes are only allowed outside of it.
+        self._lo_min = self._lo
+        self._hi_max = self._hi
+        self._values = None
+
+    def __len__(self):
+        return self._hi - self._lo
+
+    @property
+    def dtype(self):
+        return self._data.dtype
+
+    @property
+    def values(self):
+        """
+        Read-only view of the values currently held by the buffer
+        """
+        if self._values is None:
+            values = self._data[self._lo : self._hi]
+            values.flags.writeable = False
+            self._values = values
+        return self._values
+
+    def extend(self, values, max_points=None):
+        """
+        Append values to the end of the buffer, keeping only the last
+        `max_points` values if specified
+        """
+        np = get_module("numpy")
+        values = np.asarray(values)
+        if max_points is not None and len(values) > max_points:
+            values = values[len(values) - max_points :]
+
+        k = len(values)
+        self._reserve(k, values.dtype, at_end=True)
+        self._data[self._hi : self._hi + k] = values
+        self._hi += k
+        self._hi_max = self._hi
+        if max_points is not None and len(self) > max_points:
+            self._lo = self._hi - max_points
+        self._values = None
+
+    def prepend(self, values, max_points=None):
+        """
+        Insert values at the start of the buffer, keeping only the first
+        `max_points` values if specified
+        """
+        np = get_module("numpy")
+        values = np.asarray(values)
+        if max_points is not None and len(values) > max_points:
+            values = values[:max_points]
+
+        k = len(values)
+        self._reserve(k, values.dtype, at_end=False)
+        self._data[self._lo - k : self._lo] = values
+        self._lo -= k
+        self._lo_min = self._lo
+        if max_points is not None and len(self) > max_points:
+            self._hi = self._lo + max_points
+        self._values = None
+
+    def _reserve(self, k, dtype, at_end):
+        """
+        Make room for k values of the given dtype at one end of the window,
+        reallocating the storage array when needed
+        """
+        np = get_module("numpy")
+        data = self._data
+        try:
+            dtype = np.result_type(data.dtype, dtype)
+        except TypeError:
+            dtype = np.dtype(object)
+
+        if at_end:
+            fits = self._hi == self._hi_max and self._hi + k <= len(data)
+        else:
+            fits = self._lo == self._lo_min and self._lo - k >= 0
+
+        if fits and dtype == data.dtype:
+            return
+
+        # Double the capacity and leave most of the free space on the side
+        # that is growing
+        n = len(self)
+        capacity = max(2 * (n + k), self._min_capacity)
+        slack = capacity - n - k
+        lo = slack // 4 if at_end else k + slack - slack // 4
+
+        new_data = np.empty(capacity, dtype=dtype)
+        new_data[lo : lo + n] = data[self._lo : self._hi]
+        self._data = new_data
+        self._lo = self._lo_min = lo
+        self._hi = self._hi_max = lo + n
+
+
 class PlotlyJSONEncoder(_json.JSONEncoder):
     """
     Meant to be passed as the `cls` kwarg to json.dumps(obj, cls=..)
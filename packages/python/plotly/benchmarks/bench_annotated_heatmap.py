@@ -0,0 +1,48 @@
+"""
+Benchmark building and serializing annotated heatmaps and tables with the
+text of their cells as layout annotations and as traces.
+
+Run with `python benchmarks/bench_annotated_heatmap.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+
+import plotly.figure_factory as ff
+
+
+def main():
+    rng = np.random.default_rng(0)
+    # Import the trace types before timing
+    ff.create_annotated_heatmap(rng.random((2, 2)))
+    for n in [30, 100, 300]:
+        z = rng.random((n, n)).round(2)
+        for text_mode in ["annotations", "trace"]:
+            if text_mode == "annotations" and n > 100:
+                continue
+            seconds = timeit.timeit(
+                lambda: ff.create_annotated_heatmap(z, text_mode=text_mode).to_json(),
+                number=1,
+            )
+            print(
+                "create_annotated_heatmap %dx%d with %r: %.3fs"
+                % (n, n, text_mode, seconds)
+            )
+
+    for n_rows in [250, 2500]:
+        table = [["name", "value", "count"]] + [
+            ["row %d" % i, i / 7, i] for i in range(n_rows)
+        ]
+        for text_mode in ["annotations", "trace"]:
+            seconds = timeit.timeit(
+                lambda: ff.create_table(table, text_mode=text_mode).to_json(),
+                number=1,
+            )
+            print(
+                "create_table with %d rows with %r: %.3fs"
+                % (n_rows, text_mode, seconds)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""
+Benchmark building quiver figures of 100 thousand vectors (a 316x316 wind
+field), and streamline figures, which are dominated by the computation of
+the barbs and arrowheads.
+
+Run with `python benchmarks/bench_arrows.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+
+import plotly.figure_factory as ff
+
+
+def make_field(n):
+    x, y = np.meshgrid(np.linspace(-3, 3, n), np.linspace(-3, 3, n))
+    return x, y, np.cos(x) * y, np.sin(x) * y
+
+
+def main():
+    # Import the trace types before timing
+    ff.create_quiver(*make_field(10))
+    for n in [100, 316]:
+        x, y, u, v = make_field(n)
+        seconds = timeit.timeit(lambda: ff.create_quiver(x, y, u, v), number=1)
+        print("create_quiver with %d vectors: %.3fs" % (n * n, seconds))
+
+    for n in [50, 200]:
+        x, y, u, v = make_field(n)
+        seconds = timeit.timeit(
+            lambda: ff.create_streamline(x[0], y[:, 0], u, v, density=2), number=1
+        )
+        print("create_streamline with a %dx%d grid: %.3fs" % (n, n, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""
+Benchmark committing many trace property edits with batch_update.
+
+Run with `python benchmarks/bench_batch_update.py` from packages/python/plotly.
+"""
+import time
+
+import plotly.graph_objects as go
+
+
+def main():
+    for n_traces in [1000, 5000]:
+        fig = go.Figure([go.Scatter(y=[1, 2, 3]) for _ in range(n_traces)])
+
+        start = time.perf_counter()
+        with fig.batch_update():
+            for i, trace in enumerate(fig.data):
+                trace.name = "trace %d" % i
+                trace.opacity = 0.5
+                trace.marker.color = "red" if i % 2 else "blue"
+                trace.marker.size = i % 10 + 1
+                trace.line.width = i % 5 + 1
+                trace.mode = "lines"
+                trace.hoverinfo = "x"
+                trace.showlegend = False
+                trace.text = "a"
+                trace.error_x.thickness = 2
+            edits_done = time.perf_counter()
+        committed = time.perf_counter()
+
+        print(
+            "batch_update(%d traces, %d edits): record %.3fs, commit %.3fs"
+            % (n_traces, 10 * n_traces, edits_done - start, committed - edits_done)
+        )
+
+
+if __name__ == "__main__":
+    main()
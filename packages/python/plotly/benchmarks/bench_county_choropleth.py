@@ -0,0 +1,35 @@
+"""
+Benchmark repeated calls of create_choropleth, which parse and simplify the
+county and state geometries on the first call only.
+
+Requires geopandas, pyshp, shapely and plotly-geo.
+
+Run with `python benchmarks/bench_county_choropleth.py` from packages/python/plotly.
+"""
+import timeit
+import warnings
+
+import plotly.figure_factory as ff
+
+
+def main():
+    warnings.simplefilter("ignore")
+    fips = list(range(1001, 1200, 2)) + list(range(6001, 6116, 2))
+    values = [f % 7 for f in fips]
+    for call in ["first", "second", "third"]:
+        seconds = timeit.timeit(
+            lambda: ff.create_choropleth(fips=fips, values=values).to_json(),
+            number=1,
+        )
+        print("%s create_choropleth call: %.3fs" % (call, seconds))
+    seconds = timeit.timeit(
+        lambda: ff.create_choropleth(
+            fips=fips, values=values, simplify_county=0.05
+        ).to_json(),
+        number=1,
+    )
+    print("create_choropleth call with a new simplify_county: %.3fs" % seconds)
+
+
+if __name__ == "__main__":
+    main()
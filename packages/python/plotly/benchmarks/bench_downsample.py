@@ -0,0 +1,36 @@
+"""
+Benchmark downsampling a line of 10 million points to 10 thousand points
+with each method, and serializing the figure before and after.
+
+Run with `python benchmarks/bench_downsample.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+
+import plotly.graph_objects as go
+
+
+def make_figure(n):
+    rng = np.random.default_rng(0)
+    return go.Figure(go.Scattergl(x=np.arange(n), y=np.cumsum(rng.normal(size=n))))
+
+
+def main():
+    n = 10000000
+    fig = make_figure(n)
+    seconds = timeit.timeit(fig.to_json, number=1)
+    print("to_json with %d points: %.3fs" % (n, seconds))
+
+    for method in ["lttb", "minmax"]:
+        fig = make_figure(n)
+        seconds = timeit.timeit(
+            lambda: fig.downsample(max_points=10000, method=method), number=1
+        )
+        print("downsample with %r: %.3fs" % (method, seconds))
+        seconds = timeit.timeit(fig.to_json, number=1)
+        print("to_json with %d points: %.3fs" % (len(fig.data[0].x), seconds))
+
+
+if __name__ == "__main__":
+    main()
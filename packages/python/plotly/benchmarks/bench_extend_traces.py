@@ -0,0 +1,41 @@
+"""
+Benchmark streaming points into a trace with extend_traces, compared to
+reassigning the full array.
+
+Run with `python benchmarks/bench_extend_traces.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+
+import plotly.graph_objects as go
+
+
+def stream_reassign(n_batches, batch_size):
+    fig = go.Figure(go.Scatter(x=np.empty(0), y=np.empty(0)))
+    trace = fig.data[0]
+    for i in range(n_batches):
+        x = np.arange(i * batch_size, (i + 1) * batch_size, dtype=float)
+        trace.x = np.concatenate([trace.x, x])
+        trace.y = np.concatenate([trace.y, np.sin(x)])
+
+
+def stream_extend(n_batches, batch_size):
+    fig = go.Figure(go.Scatter(x=np.empty(0), y=np.empty(0)))
+    for i in range(n_batches):
+        x = np.arange(i * batch_size, (i + 1) * batch_size, dtype=float)
+        fig.extend_traces({"x": [x], "y": [np.sin(x)]}, 0)
+
+
+def main():
+    for n_batches, batch_size in [(1000, 100), (2000, 1000)]:
+        for fn in [stream_reassign, stream_extend]:
+            seconds = timeit.timeit(lambda: fn(n_batches, batch_size), number=1)
+            print(
+                "%s(%d batches of %d points): %.3fs"
+                % (fn.__name__, n_batches, batch_size, seconds)
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Benchmark constructing figures from trace objects, copying them (the
+default) or taking ownership of them without revalidating or copying them
+(as plotly express does with the traces it builds).
+
+Run with `python benchmarks/bench_figure_construction.py` from
+packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+
+import plotly.graph_objects as go
+
+
+def make_traces(n_traces, n_points):
+    x = np.arange(n_points)
+    return [
+        go.Scatter(
+            x=x,
+            y=np.random.rand(n_points),
+            mode="markers",
+            name="trace %d" % i,
+            marker=dict(color="rgb(%d, 0, 0)" % (i % 256), size=6),
+            hovertemplate="%{x}: %{y}",
+        )
+        for i in range(n_traces)
+    ]
+
+
+def main():
+    for n_traces, n_points in [(1000, 10), (100, 10000)]:
+        traces_seconds = timeit.timeit(
+            lambda: make_traces(n_traces, n_points), number=5
+        )
+        traces = make_traces(n_traces, n_points)
+        copy_seconds = timeit.timeit(lambda: go.Figure(data=traces), number=5)
+
+        # Adopted traces belong to the figure, so build fresh ones for each run
+        traces = [make_traces(n_traces, n_points) for _ in range(5)]
+        adopt_seconds = timeit.timeit(
+            lambda: go.Figure(data=traces.pop(), _adopt=True), number=5
+        )
+        print(
+            "%d traces of %d points: build traces %.3fs, build figure %.3fs "
+            "(copying traces), %.3fs (adopting traces)"
+            % (
+                n_traces,
+                n_points,
+                traces_seconds / 5,
+                copy_seconds / 5,
+                adopt_seconds / 5,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+"""
+Benchmark building and serializing gantt charts of many tasks.
+
+Run with `python benchmarks/bench_gantt.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import plotly.figure_factory as ff
+
+
+def main():
+    rng = np.random.default_rng(0)
+    # Import the trace types before timing
+    ff.create_gantt([dict(Task="A", Start="2020-01-01", Finish="2020-01-02")])
+    for n in [2000, 20000]:
+        start = pd.Timestamp("2020-01-01") + pd.to_timedelta(
+            rng.integers(0, 10000, n), "h"
+        )
+        df = pd.DataFrame(
+            dict(
+                Task=["Job %d" % i for i in rng.integers(0, n // 10, n)],
+                Start=start,
+                Finish=start + pd.to_timedelta(rng.integers(1, 100, n), "h"),
+                Complete=rng.integers(0, 100, n),
+                Resource=rng.choice(["A", "B", "C", "D"], n),
+            )
+        )
+        for kwargs in [
+            dict(group_tasks=True),
+            dict(index_col="Complete", group_tasks=True),
+            dict(index_col="Resource", group_tasks=True),
+        ]:
+            seconds = timeit.timeit(
+                lambda: ff.create_gantt(df, **kwargs).to_json(), number=1
+            )
+            print("create_gantt with %d tasks, %r: %.3fs" % (n, kwargs, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""
+Benchmark building animated hexbin maps of many points.
+
+Run with `python benchmarks/bench_hexbin_mapbox.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import plotly.figure_factory as ff
+
+
+def main():
+    rng = np.random.default_rng(0)
+    # Import the trace types before timing
+    ff.create_hexbin_mapbox(lat=[0, 1], lon=[0, 1], animation_frame=[0, 1])
+    for n in [100000, 1000000]:
+        df = pd.DataFrame(
+            dict(
+                lat=rng.normal(45, 5, n),
+                lon=rng.normal(0, 10, n),
+                metric=rng.integers(0, 100, n),
+                frame=rng.integers(0, 20, n),
+            )
+        )
+        for kwargs in [
+            dict(),
+            dict(color="metric", agg_func=np.sum),
+            dict(color="metric", agg_func=np.median),
+        ]:
+            seconds = timeit.timeit(
+                lambda: ff.create_hexbin_mapbox(
+                    df,
+                    lat="lat",
+                    lon="lon",
+                    nx_hexagon=50,
+                    animation_frame="frame",
+                    **kwargs,
+                ),
+                number=1,
+            )
+            print(
+                "create_hexbin_mapbox of %d points in 20 frames, %r: %.3fs"
+                % (n, kwargs, seconds)
+            )
+
+
+if __name__ == "__main__":
+    main()
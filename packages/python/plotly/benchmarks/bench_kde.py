@@ -0,0 +1,73 @@
+"""
+Benchmark the kernel density estimations of create_distplot and create_violin
+against the scipy.stats.gaussian_kde path they used to take.
+
+Run with `python benchmarks/bench_kde.py` from packages/python/plotly.
+"""
+import os
+import timeit
+
+import numpy as np
+import pandas as pd
+from scipy import stats
+
+import plotly.figure_factory as ff
+from plotly.figure_factory._kde import gaussian_kdes
+
+
+def main():
+    rng = np.random.default_rng(0)
+    workers = os.cpu_count()
+    for groups, n in [(20, 10000), (20, 100000), (4, 1000000)]:
+        datasets = [rng.standard_normal(n) + i for i in range(groups)]
+        grids = [np.linspace(values.min(), values.max(), 500) for values in datasets]
+        gaussian_kdes(datasets[:1], grids[:1])
+        for label, compute in [
+            (
+                "scipy",
+                lambda: [stats.gaussian_kde(v)(g) for v, g in zip(datasets, grids)],
+            ),
+            ("numpy", lambda: gaussian_kdes(datasets, grids)),
+            (
+                "numpy, %d threads" % workers,
+                lambda: gaussian_kdes(datasets, grids, workers),
+            ),
+        ]:
+            if label == "scipy" and n > 100000:
+                continue
+            seconds = timeit.timeit(compute, number=1)
+            print("%d kdes of %d samples, %s: %.3fs" % (groups, n, label, seconds))
+
+        labels = ["group %d" % i for i in range(groups)]
+        seconds = timeit.timeit(
+            lambda: ff.create_distplot(
+                datasets,
+                labels,
+                show_hist=False,
+                max_rug_points=1000,
+                max_workers=workers,
+            ),
+            number=1,
+        )
+        print(
+            "create_distplot of %d groups of %d samples: %.3fs" % (groups, n, seconds)
+        )
+
+        df = pd.DataFrame(
+            dict(Score=np.concatenate(datasets), Group=np.repeat(labels, n))
+        )
+        seconds = timeit.timeit(
+            lambda: ff.create_violin(
+                df,
+                data_header="Score",
+                group_header="Group",
+                max_rug_points=1000,
+                max_workers=workers,
+            ),
+            number=1,
+        )
+        print("create_violin of %d groups of %d samples: %.3fs" % (groups, n, seconds))
+
+
+if __name__ == "__main__":
+    main()
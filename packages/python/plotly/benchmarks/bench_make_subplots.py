@@ -0,0 +1,37 @@
+"""
+Benchmark make_subplots on large small-multiples grids.
+
+Run with `python benchmarks/bench_make_subplots.py` from packages/python/plotly.
+"""
+import timeit
+
+from plotly.subplots import make_subplots
+
+
+def main():
+    # Load the default template before timing anything
+    make_subplots()
+
+    for rows, cols, kwargs in [
+        (10, 10, {}),
+        (60, 60, {}),
+        (100, 100, {}),
+        (100, 100, dict(shared_xaxes=True, shared_yaxes=True)),
+    ]:
+        number = 3
+        seconds = timeit.timeit(
+            lambda: make_subplots(rows, cols, **kwargs), number=number
+        )
+        print(
+            "make_subplots(%d, %d, %s): %.3fs"
+            % (
+                rows,
+                cols,
+                ", ".join("%s=%r" % kv for kv in kwargs.items()),
+                seconds / number,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,40 @@
+"""
+Benchmark building and serializing OHLC and candlestick charts of a year of
+one-minute bars.
+
+Run with `python benchmarks/bench_ohlc.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+
+import plotly.figure_factory as ff
+
+
+def main():
+    rng = np.random.default_rng(0)
+    n = 100000
+    open_data = 100 + np.cumsum(rng.normal(size=n))
+    close_data = open_data + rng.normal(size=n)
+    high_data = np.maximum(open_data, close_data) + rng.random(n)
+    low_data = np.minimum(open_data, close_data) - rng.random(n)
+    dates = np.datetime64("2020-01-01") + np.arange(n) * np.timedelta64(1, "m")
+    arrays = [open_data, high_data, low_data, close_data]
+    lists = [a.tolist() for a in arrays]
+
+    # Import the trace types before timing
+    ff.create_ohlc(*lists[:1] * 4)
+    ff.create_candlestick(*lists[:1] * 4)
+    for create in [ff.create_ohlc, ff.create_candlestick]:
+        for kind, prices, x in [
+            ("lists", lists, dates.tolist()),
+            ("arrays", arrays, dates),
+        ]:
+            seconds = timeit.timeit(
+                lambda: create(*prices, dates=x).to_json(), number=1
+            )
+            print("%s with %d bars as %s: %.3fs" % (create.__name__, n, kind, seconds))
+
+
+if __name__ == "__main__":
+    main()
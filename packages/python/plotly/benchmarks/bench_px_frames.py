@@ -0,0 +1,53 @@
+"""
+Benchmark building and serializing a gapminder-style px.scatter animation
+with many frames, with frames storing all the properties of their traces
+(`frame_encoding="full"`) or only the properties which change from frame
+to frame (`frame_encoding="delta"`).
+
+Run with `python benchmarks/bench_px_frames.py` from packages/python/plotly.
+"""
+import timeit
+
+import pandas as pd
+
+import plotly.express as px
+
+
+def make_dataframe(n_frames):
+    df = px.data.gapminder()
+    # Repeat the 12 years of the gapminder dataset as later years
+    return pd.concat(
+        [df.assign(year=df["year"] + 100 * i) for i in range(n_frames // 12)]
+    )
+
+
+def make_figure(df, frame_encoding):
+    return px.scatter(
+        df,
+        x="gdpPercap",
+        y="lifeExp",
+        size="pop",
+        color="continent",
+        hover_name="country",
+        animation_frame="year",
+        animation_group="country",
+        log_x=True,
+        frame_encoding=frame_encoding,
+    )
+
+
+def main():
+    df = make_dataframe(1200)
+    make_figure(df.head(100), "full")
+    for frame_encoding in ["full", "delta"]:
+        build = timeit.timeit(lambda: make_figure(df, frame_encoding), number=1)
+        fig = make_figure(df, frame_encoding)
+        serialize = timeit.timeit(fig.to_json, number=1)
+        print(
+            "%s: %d frames, build %.3fs, to_json %.3fs, %d bytes"
+            % (frame_encoding, len(fig.frames), build, serialize, len(fig.to_json()))
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Benchmark building px.line figures with one trace per device, for an
+increasing number of devices, which is dominated by the cost of splitting
+the data frame into groups and assembling one trace per group.
+
+Run with `python benchmarks/bench_px_groups.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import plotly.express as px
+
+
+def make_dataframe(n_groups, n_points=20):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "time": np.tile(np.arange(n_points), n_groups),
+            "value": rng.normal(size=n_groups * n_points),
+            "device": np.repeat(np.arange(n_groups), n_points).astype(str),
+            "site": np.repeat(rng.choice(["a", "b", "c"], n_groups), n_points),
+        }
+    )
+
+
+def main():
+    # Import the trace types before timing
+    px.line(make_dataframe(10), x="time", y="value", color="site")
+    for n_groups in [100, 1000, 5000]:
+        df = make_dataframe(n_groups)
+        seconds = timeit.timeit(
+            lambda: px.line(df, x="time", y="value", line_group="device", color="site"),
+            number=1,
+        )
+        print("px.line with %d groups: %.3fs" % (n_groups, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Benchmark building px.sunburst figures from a 4-level path over an increasing
+number of rows, which is dominated by the aggregation of the rows into the
+nodes of each level, with and without `max_children`.
+
+Run with `python benchmarks/bench_px_hierarchy.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+import polars as pl
+
+import plotly.express as px
+
+
+def make_dataframe(n_rows):
+    rng = np.random.default_rng(0)
+    leaf = rng.integers(0, 5000, n_rows)
+    return pd.DataFrame(
+        {
+            "continent": (leaf % 5).astype(str),
+            "country": (leaf % 50).astype(str),
+            "city": (leaf % 500).astype(str),
+            "store": leaf.astype(str),
+            "sales": rng.random(n_rows),
+            "segment": rng.choice(["retail", "wholesale"], n_rows),
+        }
+    )
+
+
+def main():
+    path = ["continent", "country", "city", "store"]
+    # Import the trace types before timing
+    px.sunburst(make_dataframe(100), path=path)
+    for n_rows in [100_000, 1_000_000]:
+        df = make_dataframe(n_rows)
+        for name, data_frame in [("pandas", df), ("polars", pl.from_pandas(df))]:
+            for kwargs in [{}, {"max_children": 10}]:
+                seconds = timeit.timeit(
+                    lambda: px.sunburst(
+                        data_frame, path=path, values="sales", color="segment", **kwargs
+                    ),
+                    number=1,
+                )
+                print(
+                    "px.sunburst with %d %s rows %s: %.3fs"
+                    % (n_rows, name, kwargs or "", seconds)
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Benchmark building and serializing px.scatter figures whose hover_data
+holds many distinct numbers, with and without a string column, which
+makes customdata an object array.
+
+Run with `python benchmarks/bench_px_hover.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+import pandas as pd
+
+import plotly.express as px
+
+
+def make_dataframe(n):
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "x": rng.normal(size=n),
+            "y": rng.normal(size=n),
+            "id": np.arange(n) % 50000,
+            "score": rng.random(n).astype("float32"),
+            "user": rng.choice(["user%d" % i for i in range(1000)], n),
+        }
+    )
+
+
+def main():
+    df = make_dataframe(300000)
+    px.scatter(df.head(10), x="x", y="y", hover_data=["id", "user"])
+    for hover_data in [["id", "score"], ["id", "score", "user"]]:
+        build = timeit.timeit(
+            lambda: px.scatter(df, x="x", y="y", hover_data=hover_data), number=1
+        )
+        fig = px.scatter(df, x="x", y="y", hover_data=hover_data)
+        serialize = timeit.timeit(fig.to_json, number=1)
+        print(
+            "hover_data=%s: customdata %s, build %.3fs, to_json %.3fs, %d bytes"
+            % (
+                hover_data,
+                fig.data[0].customdata.dtype,
+                build,
+                serialize,
+                len(fig.to_json()),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Benchmark building and serializing px.histogram figures from a Polars
+LazyFrame, whose selection of columns and aggregation are pushed down to
+Polars, compared to collecting the frame first.
+
+Run with `python benchmarks/bench_px_lazy.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+import polars as pl
+
+import plotly.express as px
+import plotly.io as pio
+
+
+def make_lazyframe(n):
+    rng = np.random.default_rng(0)
+    return pl.LazyFrame(
+        {
+            "day": rng.choice(["Mon", "Tue", "Wed", "Thu", "Fri"], n),
+            "shop": rng.integers(0, 50, n),
+            "amount": rng.exponential(20, n),
+            "unused": rng.normal(size=n),
+        }
+    )
+
+
+def histogram_collected(lf):
+    fig = px.histogram(lf.collect(), x="shop", y="amount", color="day")
+    return pio.to_json(fig)
+
+
+def histogram_lazy(lf):
+    fig = px.histogram(lf, x="shop", y="amount", color="day")
+    return pio.to_json(fig)
+
+
+def main():
+    # warm up imports
+    histogram_lazy(make_lazyframe(10))
+    for n in [100_000, 5_000_000]:
+        lf = make_lazyframe(n)
+        for fn in [histogram_collected, histogram_lazy]:
+            seconds = timeit.timeit(lambda: fn(lf), number=1)
+            print(
+                "%s(%d rows): %.3fs, %d bytes" % (fn.__name__, n, seconds, len(fn(lf)))
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark the cost of the default template when building many small
+figures, the cost of templates merged from several registered names,
+and the size of an HTML report that includes the template once per page
+rather than once per figure.
+
+Run with `python benchmarks/bench_templates.py` from packages/python/plotly.
+"""
+import timeit
+
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+
+
+def make_figure():
+    return go.Figure(go.Scatter(x=[1, 2, 3], y=[3, 1, 2]))
+
+
+def report_per_figure(figs):
+    return "\n".join(
+        pio.to_html(fig, include_plotlyjs=False, full_html=False) for fig in figs
+    )
+
+
+def report_per_page(figs):
+    # The first figure registers the template with the page, the others
+    # reference it
+    return "\n".join(
+        pio.to_html(
+            fig,
+            include_plotlyjs=False,
+            full_html=False,
+            include_template="shared" if i == 0 else False,
+        )
+        for i, fig in enumerate(figs)
+    )
+
+
+def main():
+    n = 1000
+    seconds = timeit.timeit(make_figure, number=n)
+    print("build %d figures: %.3fs" % (n, seconds))
+
+    figs = [make_figure() for _ in range(100)]
+    for fn in [report_per_figure, report_per_page]:
+        seconds = timeit.timeit(lambda: fn(figs), number=1)
+        print(
+            "%s(%d figures): %.3fs, %d bytes"
+            % (fn.__name__, len(figs), seconds, len(fn(figs)))
+        )
+
+    # Load the registered templates before timing the merge
+    pio.templates["plotly_white"], pio.templates["presentation"]
+    seconds = timeit.timeit(
+        lambda: pio.templates["plotly_white+presentation"], number=1
+    )
+    print("merge template: %.3fs" % seconds)
+
+    n = 100
+    seconds = timeit.timeit(
+        lambda: pio.templates["plotly_white+presentation"], number=n
+    )
+    print("look up merged template %d times: %.3fs" % (n, seconds))
+
+    df = px.data.iris()
+    for template in ["plotly", "plotly_white+presentation"]:
+        seconds = timeit.timeit(
+            lambda: px.scatter(
+                df,
+                x="sepal_width",
+                y="sepal_length",
+                color="species",
+                template=template,
+            ),
+            number=n,
+        )
+        print("px.scatter x%d with template %r: %.3fs" % (n, template, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,36 @@
+"""
+Benchmark validating large arrays of repeated colors, symbols and flags.
+
+Run with `python benchmarks/bench_validators.py` from packages/python/plotly.
+"""
+import timeit
+
+import numpy as np
+
+import plotly.graph_objects as go
+
+
+def main():
+    n = 1000000
+    rng = np.random.default_rng(0)
+    colors = np.array(["red", "#00ff00", "rgb(0,0,255)", "hsl(0,100%,50%)"])
+    symbols = np.array(["circle", "square", "diamond", "x", "cross-open"])
+    hoverinfos = np.array(["x+y", "x", "all"])
+
+    colors = colors[rng.integers(0, len(colors), n)]
+    symbols = symbols[rng.integers(0, len(symbols), n)]
+    hoverinfos = hoverinfos[rng.integers(0, len(hoverinfos), n)].tolist()
+
+    cases = [
+        ("marker.color (ndarray)", lambda: go.scatter.Marker(color=colors)),
+        ("marker.color (list)", lambda: go.scatter.Marker(color=colors.tolist())),
+        ("marker.symbol (ndarray)", lambda: go.scatter.Marker(symbol=symbols)),
+        ("hoverinfo (list)", lambda: go.Scatter(hoverinfo=hoverinfos)),
+    ]
+    for name, fn in cases:
+        seconds = timeit.timeit(fn, number=1)
+        print("%s, %d points: %.3fs" % (name, n, seconds))
+
+
+if __name__ == "__main__":
+    main()
@@ -78,6 +78,13 @@ type Py2JsDeleteTracesMsg = Py2JsMsg & {
   delete_inds: number[];
 };
 
+type Py2JsExtendTracesMsg = Py2JsMsg & {
+  extend_data: any;
+  extend_traces: number[];
+  max_points?: null | any;
+  prepend?: boolean;
+};
+
 type Py2JsMoveTracesMsg = {
   current_trace_inds: number[];
   new_trace_inds: number[];
@@ -250,6 +257,28 @@ export class FigureModel {
        */
       _py2js_restyle: null,
 
+      /**
+       * @typedef {null|Object} Py2JsExtendTracesMsg
+       * @property {Object} extend_data
+       *  Update data as accepted by Plotly.extendTraces, mapping property
+       *  paths to arrays of new values, one array per trace index
+       * @property {Array.<Number>} extend_traces
+       *  Array of indexes of the traces to extend
+       * @property {null|Object} max_points
+       *  Maximum number of points to keep, as accepted by
+       *  Plotly.extendTraces, or null for no limit
+       * @property {Boolean} prepend
+       *  If true, new values are inserted at the start of the arrays
+       *  using Plotly.prependTraces
+       * @property {Number} trace_edit_id
+       *  Edit ID to use when returning trace deltas using
+       *  the _js2py_traceDeltas message
+       * @property {Number} layout_edit_id
+       *  Edit ID to use when returning layout deltas using
+       *  the _js2py_layoutDelta message
+       */
+      _py2js_extendTraces: null,
+
       /**
        * @typedef {null|Object} Py2JsRelayoutMsg
        * @property {Object} relayout_data
@@ -534,6 +563,7 @@ export class FigureModel {
     this.model.on("change:_py2js_deleteTraces", () => this.do_deleteTraces());
     this.model.on("change:_py2js_moveTraces", () => this.do_moveTraces());
     this.model.on("change:_py2js_restyle", () => this.do_restyle());
+    this.model.on("change:_py2js_extendTraces", () => this.do_extendTraces());
     this.model.on("change:_py2js_relayout", () => this.do_relayout());
     this.model.on("change:_py2js_update", () => this.do_update());
     this.model.on("change:_py2js_animate", () => this.do_animate());
@@ -650,6 +680,23 @@ export class FigureModel {
     }
   }
 
+  /**
+   * Handle extendTraces message
+   */
+  do_extendTraces() {
+    /** @type {Py2JsExtendTracesMsg} */
+    var msgData: Py2JsExtendTracesMsg = this.model.get("_py2js_extendTraces");
+    if (msgData !== null) {
+      performExtendTracesLike(
+        this.model.get("_data"),
+        msgData.extend_data,
+        msgData.extend_traces,
+        msgData.max_points,
+        msgData.prepend
+      );
+    }
+  }
+
   /**
    * Handle relayout message
    */
@@ -757,6 +804,9 @@ const serializers: Record<string, Serializer> = {
     deserialize: py2js_deserializer,
     serialize: js2py_serializer,
   },
+  _py2js_extendTraces: {
+    deserialize: py2js_deserializer,
+  },
   _py2js_relayout: {
     deserialize: py2js_deserializer,
     serialize: js2py_serializer,
@@ -843,6 +893,7 @@ export class FigureView {
     this.model.on("change:_py2js_deleteTraces", () => this.do_deleteTraces());
     this.model.on("change:_py2js_moveTraces", () => this.do_moveTraces());
     this.model.on("change:_py2js_restyle", () => this.do_restyle());
+    this.model.on("change:_py2js_extendTraces", () => this.do_extendTraces());
     this.model.on("change:_py2js_relayout", () => this.do_relayout());
     this.model.on("change:_py2js_update", () => this.do_update());
     this.model.on("change:_py2js_animate", () => this.do_animate());
@@ -1430,6 +1481,32 @@ export class FigureView {
     }
   }
 
+  /**
+   * Handle Plotly.extendTraces / Plotly.prependTraces request
+   */
+  do_extendTraces() {
+    /** @type {Py2JsExtendTracesMsg} */
+    var msgData: Py2JsExtendTracesMsg = this.model.get("_py2js_extendTraces");
+    if (msgData !== null) {
+      var update = msgData.extend_data;
+      var traceIndexes = msgData.extend_traces;
+      var maxPoints =
+        msgData.max_points === null ? undefined : msgData.max_points;
+
+      var that = this;
+      var extendFn = msgData.prepend ? Plotly.prependTraces : Plotly.extendTraces;
+      // @ts-ignore
+      extendFn(this.el, update, traceIndexes, maxPoints).then(function () {
+        // ### Send trace deltas ###
+        that._sendTraceDeltas(msgData.trace_edit_id);
+
+        // ### Send layout delta ###
+        var layout_edit_id = msgData.layout_edit_id;
+        that._sendLayoutDelta(layout_edit_id);
+      });
+    }
+  }
+
   /**
    * Handle Plotly.relayout request
    */
@@ -1835,6 +1912,63 @@ function performRestyleLike(
   }
 }
 
+/**
+ * Perform a Plotly.extendTraces (or Plotly.prependTraces) like operation on
+ * an input object array
+ *
+ * @param {Array.<Object>} parentArray
+ *  The object that the operation should be applied to
+ * @param {Object} extendData
+ *  Object from property paths to arrays of new values, one per trace
+ * @param {Array.<Number>} extendTraces
+ *  Array of indexes of the traces to extend
+ * @param {null|Object} maxPoints
+ *  Object from property paths to arrays of the maximum number of points to
+ *  keep for each trace (null entries for no limit), or null
+ * @param {Boolean} prepend
+ *  Whether to insert the new values at the start of the arrays
+ *
+ *  Examples:
+ *      var d = [{x: [1, 2]}]
+ *      performExtendTracesLike(d, {x: [[3, 4]]}, [0], {x: [3]}, false)
+ *      d -> [{x: [2, 3, 4]}]
+ */
+function performExtendTracesLike(
+  parentArray: any[],
+  extendData: any,
+  extendTraces: number[],
+  maxPoints: any,
+  prepend: boolean
+) {
+  for (var rawKey in extendData) {
+    if (!extendData.hasOwnProperty(rawKey)) {
+      continue;
+    }
+
+    var valArray = extendData[rawKey];
+    for (var i = 0; i < extendTraces.length; i++) {
+      var trace = parentArray[extendTraces[i]];
+      var current = _.get(trace, rawKey);
+      current = current === undefined || current === null ? [] : Array.from(current);
+      var newVals = Array.from(valArray[i]);
+
+      var result = prepend ? newVals.concat(current) : current.concat(newVals);
+
+      var maxp =
+        maxPoints !== null && maxPoints !== undefined && maxPoints[rawKey]
+          ? maxPoints[rawKey][i]
+          : null;
+      if (maxp !== null && maxp !== undefined && result.length > maxp) {
+        result = prepend
+          ? result.slice(0, maxp)
+          : result.slice(result.length - maxp);
+      }
+
+      _.set(trace, rawKey, result);
+    }
+  }
+}
+
 /**
  * Perform a Plotly.moveTraces like operation on an input object array
  * @param parentArray
@@ -0,0 +1,218 @@
+"""
+Downsampling of the points of scatter traces, used by `Figure.downsample`
+and by the `downsample` argument of plotly.express functions.
+
+The points are split into buckets of consecutive points, from which the
+points which preserve the shape of the trace are selected:
+
+  * `'lttb'`: the Largest-Triangle-Three-Buckets algorithm, which selects
+    the point of each bucket forming the largest triangle with the point
+    selected in the previous bucket and the average of the next bucket.
+  * `'minmax'`: the points with the minimum and maximum values of each
+    bucket, which preserves the extrema of the trace.
+
+The first and last points are always selected.
+"""
+import numbers
+
+from _plotly_utils.basevalidators import CompoundValidator, DataArrayValidator
+from plotly.optional_imports import get_module
+
+downsample_methods = ("lttb", "minmax")
+
+# Types of the traces whose points can be downsampled
+downsample_trace_types = ("scatter", "scattergl")
+
+
+def validate_downsample_args(max_points, method):
+    if method not in downsample_methods:
+        raise ValueError(
+            "Invalid downsample method %r, must be one of %s"
+            % (method, ", ".join(repr(m) for m in downsample_methods))
+        )
+    if not isinstance(max_points, int) or max_points < 4:
+        raise ValueError(
+            "Invalid max_points %r, must be an integer of at least 4" % (max_points,)
+        )
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Returns the sorted indices of the `n_out` points of `x` and `y` (float
+    arrays of more than `n_out` values) selected by the
+    Largest-Triangle-Three-Buckets algorithm
+    """
+    np = get_module("numpy")
+    n = len(y)
+
+    # The points between the first and the last are split in n_out - 2 buckets
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[1:-1], edges[:-1] - 1) / counts
+    avg_y = np.add.reduceat(y[1:-1], edges[:-1] - 1) / counts
+    # The last point is the "next bucket" of the last bucket
+    avg_x = np.append(avg_x, x[-1])
+    avg_y = np.append(avg_y, y[-1])
+    has_nan = bool(np.isnan(y).any())
+
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+    selected = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        ax, ay = x[selected], y[selected]
+        # Twice the area of the triangles formed with the selected point of the
+        # previous bucket and the average of the next bucket
+        areas = np.abs(
+            (ax - avg_x[i + 1]) * (y[start:end] - ay)
+            - (ax - x[start:end]) * (avg_y[i + 1] - ay)
+        )
+        if has_nan:
+            # Points with missing values are only selected when the bucket has
+            # no other point, which keeps the gap in the trace
+            areas = np.nan_to_num(areas, nan=-1.0)
+        selected = start + int(np.argmax(areas))
+        indices[i + 1] = selected
+    return indices
+
+
+def minmax_indices(y, n_out):
+    """
+    Returns the sorted indices of at most `n_out` points of `y` (a float array
+    of more than `n_out` values) with the minimum and maximum values of their
+    bucket. One point with a missing value is also selected in each bucket
+    which has some, to keep the gaps in the trace.
+    """
+    np = get_module("numpy")
+    n = len(y)
+
+    # The points between the first and the last are split in buckets of two
+    # points each
+    n_buckets = (n_out - 2) // 2
+    edges = np.linspace(1, n - 1, n_buckets + 1).astype(np.int64)
+    starts = edges[:-1]
+    inner = y[1:-1]
+    bucket = np.repeat(np.arange(n_buckets), np.diff(edges))
+
+    # fmin and fmax ignore missing values
+    mins = np.fmin.reduceat(inner, starts - 1)
+    maxs = np.fmax.reduceat(inner, starts - 1)
+    selected = [
+        [0, n - 1],
+        # the first point of each bucket with its min, max or a missing value
+        _first_in_bucket(inner == mins[bucket], bucket) + 1,
+        _first_in_bucket(inner == maxs[bucket], bucket) + 1,
+        _first_in_bucket(np.isnan(inner), bucket) + 1,
+    ]
+    return np.unique(np.concatenate(selected))
+
+
+def _first_in_bucket(mask, bucket):
+    np = get_module("numpy")
+    positions = np.flatnonzero(mask)
+    _, first = np.unique(bucket[positions], return_index=True)
+    return positions[first]
+
+
+def downsample_trace(trace, max_points, method="lttb"):
+    """
+    Keeps at most `max_points` points of `trace` (plus the points with missing
+    values kept by `'minmax'`), slicing all of its arrays of per-point values,
+    and records the number of points of the trace in `trace.meta.downsample`
+
+    Returns True if the trace was downsampled, and False if it has no more
+    than `max_points` points or can't be downsampled (e.g. traces which are not
+    scatter traces, stacked traces or traces with categorical values)
+    """
+    np = get_module("numpy")
+    if trace.type not in downsample_trace_types:
+        return False
+    if trace.type == "scatter" and trace.stackgroup is not None:
+        # the stacked traces must keep the same positions
+        return False
+
+    # The points are downsampled according to their values along y, or along x
+    # when the trace has no y
+    value_name, position_name = ("y", "x") if trace.y is not None else ("x", "y")
+    values = trace[value_name]
+    positions = trace[position_name]
+    if values is None or len(values) <= max_points:
+        return False
+    n = len(values)
+    if positions is not None and len(positions) != n:
+        return False
+    try:
+        values = np.asarray(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        # e.g. categories
+        return False
+
+    position0 = trace[position_name + "0"]
+    dposition = trace["d" + position_name]
+    if positions is None and not all(
+        isinstance(v, numbers.Number) for v in [position0 or 0, dposition or 1]
+    ):
+        # e.g. dates as x0
+        return False
+
+    if method == "lttb":
+        indices = lttb_indices(_numeric_positions(positions, n), values, max_points)
+    else:
+        indices = minmax_indices(values, max_points)
+
+    patch = _slice_point_arrays(trace, n, indices)
+    if positions is None:
+        patch[position_name] = (position0 or 0) + (dposition or 1) * indices
+
+    if trace.selectedpoints is not None:
+        patch["selectedpoints"] = np.flatnonzero(
+            np.isin(indices, np.asarray(trace.selectedpoints))
+        )
+
+    meta = trace.meta
+    if meta is None or isinstance(meta, dict):
+        meta = dict(meta or {})
+        original_points = meta.get("downsample", {}).get("original_points", n)
+        meta["downsample"] = dict(method=method, original_points=original_points)
+        patch["meta"] = meta
+
+    trace.update(patch)
+    return True
+
+
+def _numeric_positions(positions, n):
+    np = get_module("numpy")
+    if positions is not None:
+        positions = np.asarray(positions)
+        if positions.dtype.kind == "M":
+            return positions.astype("datetime64[ns]").astype(np.int64).astype(float)
+        elif positions.dtype.kind in "iuf":
+            return positions.astype(np.float64)
+    # e.g. categories or dates as strings are downsampled by their index
+    return np.arange(n, dtype=np.float64)
+
+
+def _slice_point_arrays(obj, n, indices):
+    """
+    Returns a dict with the values of the arrays of `n` per-point values of
+    `obj` (a trace or one of its compound properties) at `indices`
+    """
+    np = get_module("numpy")
+    patch = {}
+    for name in list(obj._props or {}):
+        validator = obj._get_validator(name)
+        value = obj[name]
+        if isinstance(validator, CompoundValidator):
+            nested = _slice_point_arrays(value, n, indices)
+            if nested:
+                patch[name] = nested
+        elif (
+            isinstance(validator, DataArrayValidator)
+            or getattr(validator, "array_ok", False)
+        ) and (isinstance(value, (np.ndarray, list, tuple)) and len(value) == n):
+            if isinstance(value, np.ndarray):
+                patch[name] = value[indices]
+            else:
+                patch[name] = [value[i] for i in indices.tolist()]
+    return patch
@@ -7,6 +7,8 @@
 # Note that this set does not contain `xaxis`/`yaxis` because these behave a
 # little differently.
 import collections
+import functools
+import itertools
 
 _single_subplot_types = {"scene", "geo", "polar", "ternary", "map", "mapbox"}
 _subplot_types = set.union(_single_subplot_types, {"xy", "domain"})
@@ -636,7 +638,9 @@ The row_titles argument to make_subplots must be a list or tuple
 
     # Init layout
     # -----------
-    layout = go.Layout()
+    # The layout is built as a plain dict of subplot containers and
+    # annotations, which is imported into the figure all at once below
+    layout = {}
 
     # Build grid reference
     # --------------------
@@ -645,17 +649,12 @@ The row_titles argument to make_subplots must be a list or tuple
     row_seq = range(rows)[::row_dir]
 
     # Build 2D array of tuples of the start x and start y coordinate of each
-    # subplot
-    grid = [
-        [
-            (
-                (sum(widths[:c]) + c * horizontal_spacing),
-                (sum(heights[:r]) + r * vertical_spacing),
-            )
-            for c in col_seq
-        ]
-        for r in row_seq
-    ]
+    # subplot. The start coordinates only depend on the column and on the
+    # row respectively, so they are computed once per column and per row
+    # from running sums of the widths and heights
+    col_starts = _grid_starts(widths, horizontal_spacing)
+    row_starts = _grid_starts(heights, vertical_spacing)
+    grid = [[(col_starts[c], row_starts[r]) for c in col_seq] for r in row_seq]
 
     domains_grid = [[None for _ in range(cols)] for _ in range(rows)]
 
@@ -806,8 +805,11 @@ The row_titles argument to make_subplots must be a list or tuple
             insets_ref[i_inset] = subplot_refs
 
     # Build grid_str
-    # This is the message printed when print_grid=True
-    grid_str = _build_grid_str(specs, grid_ref, insets, insets_ref, row_seq)
+    # This is the message printed when print_grid=True. It is only built
+    # when it is first needed as it isn't cheap for large grids.
+    grid_str = functools.partial(
+        _build_grid_str, specs, grid_ref, insets, insets_ref, row_seq
+    )
 
     # Add subplot titles
     plot_title_annotations = _build_subplot_title_annotations(
@@ -873,12 +875,29 @@ The row_titles argument to make_subplots must be a list or tuple
 
     # Handle displaying grid information
     if print_grid:
+        grid_str = grid_str()
         print(grid_str)
 
     # Build resulting figure
     if figure is None:
         figure = go.Figure()
-    figure.update_layout(layout)
+
+        # The subplot containers generated above only hold valid domain,
+        # anchor and axis-matching properties, and nothing to merge with yet,
+        # so they are imported without validating them one axis at a time
+        subplot_layout = {k: layout.pop(k) for k in list(layout) if k != "annotations"}
+        layout_obj = figure._layout_obj
+        layout_obj._validate = False
+        try:
+            for k, v in subplot_layout.items():
+                layout_obj[k] = v
+        finally:
+            layout_obj._validate = figure._validate
+
+        if not layout["annotations"]:
+            layout.pop("annotations")
+    if layout:
+        figure.update_layout(layout)
 
     # Attach subplot grid info to the figure
     figure.__dict__["_grid_ref"] = grid_ref
@@ -887,6 +906,15 @@ The row_titles argument to make_subplots must be a list or tuple
     return figure
 
 
+def _grid_starts(sizes, spacing):
+    # Start coordinate of each row or column of the grid, i.e. the sum of the
+    # sizes of the preceding rows/columns and of the spacing between them
+    return [
+        start + i * spacing
+        for i, start in enumerate(itertools.accumulate([0] + list(sizes[:-1])))
+    ]
+
+
 def _configure_shared_axes(layout, grid_ref, specs, x_or_y, shared, row_dir):
     rows = len(grid_ref)
     cols = len(grid_ref[0])
@@ -914,9 +942,9 @@ def _configure_shared_axes(layout, grid_ref, specs, x_or_y, shared, row_dir):
             else:
                 axis_name = subplot_ref.layout_keys[layout_key_ind]
                 axis_to_match = layout[axis_name]
-                axis_to_match.matches = first_axis_id
+                axis_to_match["matches"] = first_axis_id
                 if remove_label:
-                    axis_to_match.showticklabels = False
+                    axis_to_match["showticklabels"] = False
 
         return first_axis_id
 
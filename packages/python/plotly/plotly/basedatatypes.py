@@ -5,7 +5,7 @@ import warnings
 from contextlib import contextmanager
 from copy import deepcopy, copy
 import itertools
-from functools import reduce
+from functools import lru_cache, reduce
 
 from _plotly_utils.utils import (
     _natural_sort_strings,
@@ -47,12 +47,22 @@ def _len_dict_item(item):
     return l
 
 
+# Number of distinct key path strings whose parsed form is cached by
+# _str_to_dict_path_full
+_STR_TO_DICT_PATH_CACHE_SIZE = 2**14
+
+
+@lru_cache(maxsize=_STR_TO_DICT_PATH_CACHE_SIZE)
 def _str_to_dict_path_full(key_path_str):
     """
     Convert a key path string into a tuple of key path elements and also
     return a tuple of indices marking the beginning of each element in the
     string.
 
+    Results are memoized in a bounded LRU cache, since the same key path
+    strings are parsed over and over by property access, restyle, relayout
+    and batch operations.
+
     Parameters
     ----------
     key_path_str : str
@@ -115,7 +125,7 @@ def _str_to_dict_path_full(key_path_str):
         # remove empty strings, and indices pointing to them
         key_elem_pairs = list(filter(lambda t: len(t[1]), enumerate(key_path2d)))
         key_path3 = [x for _, x in key_elem_pairs]
-        elem_idcs = [all_elem_idcs[i] for i, _ in key_elem_pairs]
+        elem_idcs = tuple(all_elem_idcs[i] for i, _ in key_elem_pairs)
 
         # Convert elements to ints if possible.
         # e.g. ['foo', 'bar', '0'] -> ['foo', 'bar', 0]
@@ -126,7 +136,7 @@ def _str_to_dict_path_full(key_path_str):
                 pass
     else:
         key_path3 = []
-        elem_idcs = []
+        elem_idcs = ()
 
     return (tuple(key_path3), elem_idcs)
 
@@ -462,6 +472,11 @@ class BaseFigure(object):
         # Initialize validation
         self._validate = kwargs.pop("_validate", True)
 
+        # Internal option of figures built from trace objects that the
+        # caller no longer uses (e.g. by plotly express), see
+        # `_take_orphan_props`
+        adopt = kwargs.pop("_adopt", False)
+
         # Assign layout_plotly to layout
         # ------------------------------
         # See docstring note for explanation
@@ -511,16 +526,16 @@ class BaseFigure(object):
 
         # ### Import traces ###
         data = self._data_validator.validate_coerce(
-            data, skip_invalid=skip_invalid, _validate=self._validate
+            data, skip_invalid=skip_invalid, _validate=self._validate, _adopt=adopt
         )
 
         # ### Save tuple of trace objects ###
         self._data_objs = data
 
-        # ### Import clone of trace properties ###
+        # ### Import trace properties ###
         # The _data property is a list of dicts containing the properties
         # explicitly set by the user for each trace.
-        self._data = [deepcopy(trace._props) for trace in data]
+        self._data = [BaseFigure._take_orphan_props(trace, adopt) for trace in data]
 
         # ### Create data defaults ###
         # _data_defaults is a tuple of dicts, one for each trace. When
@@ -540,9 +555,6 @@ class BaseFigure(object):
             # object's internal _orphan_props dict.
             trace._parent = self
 
-            # We clear the orphan props since the trace no longer needs then
-            trace._orphan_props.clear()
-
             # Set trace index
             trace._trace_ind = trace_ind
 
@@ -563,6 +575,12 @@ class BaseFigure(object):
         # ### Initialize layout defaults dict ###
         self._layout_defaults = {}
 
+        # ### Initialize shared template ###
+        # Properties dict of a default template that is shared by reference
+        # with other figures, and copied before it is modified. See
+        # _share_layout_template
+        self._shared_template_props = None
+
         # ### Reparent layout object ###
         self._layout_obj._orphan_props.clear()
         self._layout_obj._parent = self
@@ -609,7 +627,7 @@ class BaseFigure(object):
         # ### Batch trace edits ###
         # Dict from trace indexes to trace edit dicts. These trace edit dicts
         # are suitable as `data` elements of Plotly.animate, but not
-        # the Plotly.update (See `_build_update_params_from_batch`)
+        # the Plotly.update (See `_perform_batch_update`)
         self._batch_trace_edits = OrderedDict()
 
         # ### Batch layout edits ###
@@ -1365,6 +1383,89 @@ class BaseFigure(object):
             trace.update(patch, overwrite=overwrite, **kwargs)
         return self
 
+    def downsample(
+        self,
+        max_points=10000,
+        method="lttb",
+        selector=None,
+        row=None,
+        col=None,
+        secondary_y=None,
+    ):
+        """
+        Reduce the number of points of the scatter and scattergl traces that
+        satisfy the specified selection criteria, keeping the points which
+        preserve the shape of each trace
+
+        All the arrays of per-point values of a trace (e.g. `x`, `y`,
+        `customdata`, `text` or `marker.color`) are reduced to the kept
+        points, and the number of points of the trace before it was
+        downsampled is recorded in `meta.downsample.original_points` (unless
+        `meta` is set to a value which is not a dict). Stacked traces and
+        traces whose values are not numbers are left unchanged.
+
+        Parameters
+        ----------
+        max_points: int (default 10000)
+            Maximum number of points to keep in each trace. Traces with
+            fewer points are left unchanged.
+        method: str (default 'lttb')
+            One of:
+              - 'lttb': Keep the points selected by the
+                Largest-Triangle-Three-Buckets algorithm, which preserves
+                the shape of lines
+              - 'minmax': Keep the points with the minimum and maximum value
+                of consecutive buckets of points, which preserves the
+                extrema of the trace. A point with a missing value is also
+                kept in each bucket that has some, to keep gaps in lines.
+        selector: dict, function, int, str or None (default None)
+            Dict to use as selection criteria.
+            Traces will be selected if they contain properties corresponding
+            to all of the dictionary's keys, with values that exactly match
+            the supplied values. If None (the default), all traces are
+            selected. If a function, it must be a function accepting a single
+            argument and returning a boolean. The function will be called on
+            each trace and those for which the function returned True
+            will be in the selection. If an int N, the Nth trace matching row
+            and col will be selected (N can be negative). If a string S, the selector
+            is equivalent to dict(type=S).
+        row, col: int or None (default None)
+            Subplot row and column index of traces to select.
+            To select traces by row and column, the Figure must have been
+            created using plotly.subplots.make_subplots.  If None
+            (the default), all traces are selected.
+        secondary_y: boolean or None (default None)
+            * If True, only select traces associated with the secondary
+              y-axis of the subplot.
+            * If False, only select traces associated with the primary
+              y-axis of the subplot.
+            * If None (the default), do not filter traces based on secondary
+              y-axis.
+
+            To select traces by secondary y-axis, the Figure must have been
+            created using plotly.subplots.make_subplots. See the docstring
+            for the specs argument to make_subplots for more info on
+            creating subplots with secondary y-axes.
+
+        Returns
+        -------
+        self
+            Returns the Figure object that the method was called on
+        """
+        from plotly._downsample import downsample_trace, validate_downsample_args
+        from plotly.optional_imports import get_module
+
+        if get_module("numpy") is None:
+            raise ImportError("Please install numpy to use `Figure.downsample`")
+
+        validate_downsample_args(max_points, method)
+        with self.batch_update():
+            for trace in self.select_traces(
+                selector=selector, row=row, col=col, secondary_y=secondary_y
+            ):
+                downsample_trace(trace, max_points, method)
+        return self
+
     def update_layout(self, dict1=None, overwrite=False, **kwargs):
         """
         Update the properties of the figure's layout with a dict and/or with
@@ -1727,7 +1828,7 @@ is of type {subplot_type}.""".format(
                 if trace_v is not Undefined:
 
                     # Get trace being updated
-                    trace_obj = self.data[trace_ind]
+                    trace_obj = self._data_objs[trace_ind]
 
                     # Validate key_path_str
                     if not BaseFigure._is_key_path_compatible(key_path_str, trace_obj):
@@ -1798,6 +1899,292 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
                 self._batch_trace_edits[trace_index] = OrderedDict()
             self._batch_trace_edits[trace_index][key_path_str] = val
 
+    def extend_traces(self, data, trace_indexes, max_points=None):
+        """
+        Append new points to array properties of the figure's traces
+
+        Only the new points are validated, and when the figure is
+        displayed as a FigureWidget only the new points are sent to the
+        frontend (using Plotly.extendTraces). Numeric arrays are stored in
+        growable buffers, so repeatedly extending a trace does not copy
+        the points that were added previously.
+
+        Parameters
+        ----------
+        data : dict
+            Dict from property path strings (e.g. 'x', 'y', or
+            'marker.color') to lists of arrays, one array per trace in
+            `trace_indexes`.
+
+            For example, the following command appends two points to the
+            'x' and 'y' properties of the first trace
+
+            >>> import plotly.graph_objects as go
+            >>> fig = go.Figure(go.Scatter(x=[1, 2], y=[3, 4]))
+            >>> fig.extend_traces({'x': [[3, 4]], 'y': [[5, 6]]}, 0)
+
+        trace_indexes : int or list of int
+            Trace index, or list of trace indexes, to extend
+        max_points : int or dict or None
+            Maximum number of points to keep in each extended array. Older
+            points are dropped once the limit is reached. May be a single
+            int, or a dict from the keys of `data` to either an int or a
+            list of ints, one per trace in `trace_indexes`. If None
+            (default), arrays grow without limit.
+
+        Returns
+        -------
+        BaseFigure
+            The Figure object that extend_traces was called on
+        """
+        self._perform_extend_traces(data, trace_indexes, max_points, prepend=False)
+        return self
+
+    def prepend_traces(self, data, trace_indexes, max_points=None):
+        """
+        Insert new points at the start of array properties of the figure's
+        traces
+
+        This is the counterpart of `extend_traces` that maps to
+        Plotly.prependTraces. When `max_points` is specified, points are
+        dropped from the end of each array.
+
+        Parameters
+        ----------
+        data : dict
+            Dict from property path strings to lists of arrays, one array
+            per trace in `trace_indexes`. See `extend_traces`.
+        trace_indexes : int or list of int
+            Trace index, or list of trace indexes, to prepend to
+        max_points : int or dict or None
+            Maximum number of points to keep in each array. See
+            `extend_traces`.
+
+        Returns
+        -------
+        BaseFigure
+            The Figure object that prepend_traces was called on
+        """
+        self._perform_extend_traces(data, trace_indexes, max_points, prepend=True)
+        return self
+
+    def _perform_extend_traces(self, data, trace_indexes, max_points, prepend):
+        """
+        Validate and apply an extend_traces / prepend_traces operation, then
+        send the corresponding message and dispatch change callbacks
+
+        All the new values are validated before any of them is applied, so
+        that an invalid value leaves the figure (and the frontend)
+        unchanged
+        """
+        func_name = "prepend_traces" if prepend else "extend_traces"
+        if self._in_batch_mode:
+            raise ValueError(
+                "{func_name} may not be called inside a batch_update or "
+                "batch_animate context".format(func_name=func_name)
+            )
+
+        if not isinstance(data, dict):
+            raise ValueError(
+                "The data argument to {func_name} must be a dict\n"
+                "    Received value of type {typ}".format(
+                    func_name=func_name, typ=type(data)
+                )
+            )
+
+        trace_indexes = self._normalize_trace_indexes(trace_indexes)
+        for trace_ind in trace_indexes:
+            if trace_ind >= len(self._data):
+                raise ValueError(
+                    "Trace index {trace_ind} out of range".format(trace_ind=trace_ind)
+                )
+
+        extensions = []
+        extend_data = {}
+        extend_max_points = {} if max_points is not None else None
+        for key_path_str, vals in data.items():
+            if not isinstance(vals, (list, tuple)) or len(vals) != len(trace_indexes):
+                raise ValueError(
+                    """
+The value of '{key_path_str}' passed to {func_name} must be a list containing
+one array for each of the {n} trace indexes""".format(
+                        key_path_str=key_path_str,
+                        func_name=func_name,
+                        n=len(trace_indexes),
+                    )
+                )
+
+            # Normalize max_points to one value per trace
+            if isinstance(max_points, dict):
+                key_max_points = max_points.get(key_path_str, None)
+            else:
+                key_max_points = max_points
+
+            if isinstance(key_max_points, (list, tuple)):
+                trace_max_points = list(key_max_points)
+            else:
+                trace_max_points = [key_max_points] * len(trace_indexes)
+
+            key_deltas = []
+            for trace_ind, val, trace_max in zip(trace_indexes, vals, trace_max_points):
+                parent, prop, delta = self._validate_trace_extension(
+                    self.data[trace_ind], key_path_str, val, trace_max
+                )
+                extensions.append((parent, prop, delta, trace_max))
+                key_deltas.append(delta)
+
+            extend_data[key_path_str] = key_deltas
+            if extend_max_points is not None:
+                extend_max_points[key_path_str] = trace_max_points
+
+        for parent, prop, delta, trace_max in extensions:
+            self._apply_trace_extension(parent, prop, delta, trace_max, prepend)
+
+        if extend_data:
+            self._send_extendTraces_msg(
+                extend_data,
+                trace_indexes,
+                max_points=extend_max_points,
+                prepend=prepend,
+            )
+            self._dispatch_trace_change_callbacks(extend_data, trace_indexes)
+
+    @staticmethod
+    def _validate_trace_extension(trace, key_path_str, val, max_points):
+        """
+        Validate the new values of a single array property of a trace,
+        without changing the trace
+
+        Parameters
+        ----------
+        trace : BaseTraceType
+            Trace to extend
+        key_path_str : str
+            Path to an array property of the trace (e.g. 'marker.color')
+        val
+            Array of new values
+        max_points : int or None
+            Maximum number of values to keep
+
+        Returns
+        -------
+        (BasePlotlyType, str, list or numpy.ndarray)
+            The object holding the property, the property name, and the
+            validated new values
+        """
+        from _plotly_utils.basevalidators import is_homogeneous_array
+
+        key_path = BaseFigure._str_to_dict_path(key_path_str)
+        if not isinstance(key_path[-1], str) or key_path not in trace:
+            raise ValueError(
+                """
+Invalid property path '{key_path_str}' for trace class {trace_class}
+""".format(
+                    key_path_str=key_path_str, trace_class=trace.__class__.__name__
+                )
+            )
+
+        parent = trace[key_path[:-1]] if len(key_path) > 1 else trace
+        prop = key_path[-1]
+        validator = parent._get_validator(prop)
+        if not getattr(validator, "array_ok", False):
+            raise ValueError(
+                "The '{key_path_str}' property of {trace_class} is not an array "
+                "property and may not be extended".format(
+                    key_path_str=key_path_str, trace_class=trace.__class__.__name__
+                )
+            )
+
+        # Only the new values are validated
+        delta = validator.validate_coerce(val)
+        if not isinstance(delta, list) and not is_homogeneous_array(delta):
+            raise ValueError(
+                "Expected an array of values to extend '{key_path_str}' with\n"
+                "    Received value: {val}".format(
+                    key_path_str=key_path_str, val=repr(val)
+                )
+            )
+
+        if max_points is not None and max_points < 0:
+            raise ValueError(
+                "max_points must be a non-negative integer, received {max_points}".format(
+                    max_points=max_points
+                )
+            )
+
+        parent._init_props()
+        current = parent._props.get(prop, None)
+        if not (
+            current is None
+            or isinstance(current, list)
+            or is_homogeneous_array(current)
+        ):
+            raise ValueError(
+                "The '{key_path_str}' property of {trace_class} is not currently "
+                "an array and may not be extended\n"
+                "    Current value: {current}".format(
+                    key_path_str=key_path_str,
+                    trace_class=trace.__class__.__name__,
+                    current=repr(current),
+                )
+            )
+
+        return parent, prop, delta
+
+    @staticmethod
+    def _apply_trace_extension(parent, prop, delta, max_points, prepend):
+        """
+        Extend (or prepend to) a single array property with values validated
+        by `_validate_trace_extension`
+
+        Parameters
+        ----------
+        parent : BasePlotlyType
+            Object holding the property
+        prop : str
+            Property name
+        delta : list or numpy.ndarray
+            Validated new values
+        max_points : int or None
+            Maximum number of values to keep
+        prepend : bool
+            Whether to insert values at the start rather than the end
+        """
+        from _plotly_utils.utils import RingBuffer
+
+        parent._init_props()
+        props = parent._props
+        current = props.get(prop, None)
+
+        if isinstance(current, list) or (current is None and isinstance(delta, list)):
+            # Plain lists (e.g. of strings) are extended in place
+            if current is None:
+                current = props[prop] = []
+            new_vals = delta if isinstance(delta, list) else delta.tolist()
+            if prepend:
+                current[:0] = new_vals
+                if max_points is not None:
+                    del current[max_points:]
+            else:
+                current.extend(new_vals)
+                if max_points is not None and len(current) > max_points:
+                    del current[: len(current) - max_points]
+        else:
+            # Numeric arrays are backed by a ring buffer that is kept as long
+            # as the property isn't reassigned
+            if parent._array_buffers is None:
+                parent._array_buffers = {}
+            buffer = parent._array_buffers.get(prop, None)
+            if buffer is None or buffer.values is not current:
+                buffer = RingBuffer(current if current is not None else delta[:0])
+                parent._array_buffers[prop] = buffer
+
+            if prepend:
+                buffer.prepend(delta, max_points)
+            else:
+                buffer.extend(delta, max_points)
+            props[prop] = buffer.values
+
     def _normalize_trace_indexes(self, trace_indexes):
         """
         Input trace index specification and return list of the specified trace
@@ -2186,9 +2573,33 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
         ...                 rows=[1, 2], cols=[1, 1]) # doctest: +ELLIPSIS
         Figure(...)
         """
+        return self._add_traces(
+            data,
+            rows=rows,
+            cols=cols,
+            secondary_ys=secondary_ys,
+            exclude_empty_subplots=exclude_empty_subplots,
+        )
 
+    def _add_traces(
+        self,
+        data,
+        rows=None,
+        cols=None,
+        secondary_ys=None,
+        exclude_empty_subplots=False,
+        adopt=False,
+    ):
+        """
+        Add traces to the figure, see `add_traces`.
+
+        If `adopt` is True, the figure takes ownership of the trace objects
+        that don't belong to a figure instead of copying them. This is only
+        meant for traces that the caller built for this figure and no
+        longer uses, like the traces of plotly express figures.
+        """
         # Validate traces
-        data = self._data_validator.validate_coerce(data)
+        data = self._data_validator.validate_coerce(data, _adopt=adopt)
 
         # Set trace indexes
         for ind, new_trace in enumerate(data):
@@ -2246,13 +2657,14 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
                 )
             )
 
-        # Make deep copy of trace data (Optimize later if needed)
-        new_traces_data = [deepcopy(trace._props) for trace in data]
+        # Copy (or take ownership of) trace data
+        new_traces_data = [
+            BaseFigure._take_orphan_props(trace, adopt) for trace in data
+        ]
 
         # Update trace parent
         for trace in data:
             trace._parent = self
-            trace._orphan_props.clear()
 
         # Update python side
         #  Use extend instead of assignment so we don't trigger serialization
@@ -2265,6 +2677,36 @@ Invalid property path '{key_path_str}' for trace class {trace_class}
 
         return self
 
+    @staticmethod
+    def _take_orphan_props(trace, adopt=False):
+        """
+        Return the properties of an orphan trace for a figure, and clear
+        them from the trace.
+
+        The properties are deep copied, since they may be shared with
+        objects of the caller, unless `adopt` is True and the trace was
+        validated on construction. The figure then takes ownership of the
+        properties dict without copying it.
+
+        Parameters
+        ----------
+        trace: BaseTraceType
+            Trace object without a parent
+        adopt: bool
+            Whether the caller hands the trace over to the figure
+
+        Returns
+        -------
+        dict
+        """
+        if adopt and trace._validate:
+            props = trace._orphan_props
+            trace._orphan_props = {}
+        else:
+            props = deepcopy(trace._orphan_props)
+            trace._orphan_props.clear()
+        return props
+
     # Subplots
     # --------
     def print_grid(self):
@@ -2330,6 +2772,19 @@ Please use the add_trace method with the row and col parameters.
             trace, self.layout, grid_ref, row, col, secondary_y
         )
 
+    @property
+    def _grid_str(self):
+        grid_str = self.__dict__.get("_grid_str", None)
+        if callable(grid_str):
+            # make_subplots stores a function that builds the grid string,
+            # which is only called the first time the string is needed
+            grid_str = self.__dict__["_grid_str"] = grid_str()
+        return grid_str
+
+    @_grid_str.setter
+    def _grid_str(self, grid_str):
+        self.__dict__["_grid_str"] = grid_str
+
     def _validate_get_grid_ref(self):
         try:
             grid_ref = self._grid_ref
@@ -2518,20 +2973,64 @@ Please use the add_trace method with the row and col parameters.
 
         if self._layout_obj._props.get("template", None) is None:
             if pio.templates.default is not None:
-                # Assume default template is already validated
+                if isinstance(pio.templates.default, BasePlotlyType):
+                    # Template object. Don't want to actually import `Template`
+                    # here for performance so we check against `BasePlotlyType`
+                    template_object = pio.templates.default
+                else:
+                    # Name of registered template object
+                    template_object = pio.templates[pio.templates.default]
+
                 if self._allow_disable_validation:
-                    self._layout_obj._validate = False
-                try:
-                    if isinstance(pio.templates.default, BasePlotlyType):
-                        # Template object. Don't want to actually import `Template`
-                        # here for performance so we check against `BasePlotlyType`
-                        template_object = pio.templates.default
-                    else:
-                        # Name of registered template object
-                        template_object = pio.templates[pio.templates.default]
+                    # Assume default template is already validated
+                    self._share_layout_template(template_object)
+                else:
                     self._layout_obj.template = template_object
-                finally:
-                    self._layout_obj._validate = self._validate
+
+    def _share_layout_template(self, template):
+        """
+        Set layout.template to a snapshot of the template's properties that
+        is shared by reference with other figures, rather than to a copy of
+        them. The snapshot is treated as read-only, and the figure makes a
+        private copy of it the first time layout.template is accessed
+        through the object hierarchy or modified through a relayout
+        operation (see _unshare_layout_template).
+
+        Parameters
+        ----------
+        template: plotly.graph_objs.layout.Template
+            Template object, assumed to be valid
+
+        Returns
+        -------
+        None
+        """
+        import plotly.io as pio
+
+        shared_props = pio.templates._get_shared_props(template)
+        if not shared_props:
+            # Store an empty template the way BaseTemplateValidator does, so
+            # that it is distinguishable from an uninitialized template
+            shared_props = {"data": {"scatter": [{"type": "scatter"}]}}
+
+        self._layout["template"] = shared_props
+        self._layout_obj._compound_props.pop("template", None)
+        self._shared_template_props = shared_props
+
+    def _unshare_layout_template(self):
+        """
+        Replace a layout.template that is shared with other figures by a
+        private copy of it, so that it may be safely modified
+
+        Returns
+        -------
+        None
+        """
+        shared_props = self._shared_template_props
+        if shared_props is not None:
+            self._shared_template_props = None
+            if self._layout.get("template", None) is shared_props:
+                self._layout["template"] = deepcopy(shared_props)
 
     @property
     def layout(self):
@@ -2652,6 +3151,10 @@ Invalid property path '{key_path_str}' for layout
                     )
                 )
 
+            # Copy shared template before modifying it
+            if BaseFigure._str_to_dict_path(key_path_str)[0] == "template":
+                self._unshare_layout_template()
+
             # Apply set operation on the layout dict
             val_changed = BaseFigure._set_in(self._layout, key_path_str, v)
 
@@ -2836,7 +3339,7 @@ Invalid property path '{key_path_str}' for layout
         # ---------------------------------------------
         for path_tuple, changed_paths in dispatch_plan.items():
             for trace_ind in trace_indexes:
-                trace = self.data[trace_ind]
+                trace = self._data_objs[trace_ind]
                 if path_tuple in trace:
                     dispatch_obj = trace[path_tuple]
                     if isinstance(dispatch_obj, BasePlotlyType):
@@ -2986,6 +3489,11 @@ Invalid property path '{key_path_str}' for layout
     def _send_restyle_msg(self, style, trace_indexes=None, source_view_id=None):
         pass
 
+    def _send_extendTraces_msg(
+        self, extend_data, trace_indexes, max_points=None, prepend=False
+    ):
+        pass
+
     def _send_relayout_msg(self, layout, source_view_id=None):
         pass
 
@@ -3052,68 +3560,115 @@ Invalid property path '{key_path_str}' for layout
                 # ### Disable batch mode ###
                 self._in_batch_mode = False
 
-                # ### Build plotly_update params ###
+                # ### Apply batched edits ###
                 (
-                    restyle_data,
-                    relayout_data,
+                    restyle_changes,
+                    relayout_changes,
                     trace_indexes,
-                ) = self._build_update_params_from_batch()
-
-                # ### Call plotly_update ###
-                self.plotly_update(
-                    restyle_data=restyle_data,
-                    relayout_data=relayout_data,
-                    trace_indexes=trace_indexes,
-                )
+                    trace_changes,
+                ) = self._perform_batch_update()
 
                 # ### Clear out saved batch edits ###
                 self._batch_layout_edits.clear()
                 self._batch_trace_edits.clear()
 
-    def _build_update_params_from_batch(self):
+                # ### Send update message ###
+                if restyle_changes or relayout_changes:
+                    self._send_update_msg(
+                        restyle_data=restyle_changes,
+                        relayout_data=relayout_changes,
+                        trace_indexes=trace_indexes,
+                    )
+
+                # ### Dispatch changes ###
+                self._dispatch_batch_change_callbacks(trace_changes, relayout_changes)
+
+    def _perform_batch_update(self):
         """
-        Convert `_batch_trace_edits` and `_batch_layout_edits` into the
-        `restyle_data`, `relayout_data`, and `trace_indexes` params accepted
-        by the `plotly_update` method.
+        Apply `_batch_trace_edits` and `_batch_layout_edits` to the figure's
+        trace and layout dicts and return the changes that were applied.
+
+        Batched edits were validated when they were recorded, so their key
+        paths are not checked again, and each trace only visits its own
+        edits. This keeps the cost linear in the number of edits.
 
         Returns
         -------
-        (dict, dict, list[int])
+        restyle_changes : dict[str, list]
+            Restyle data, in the form accepted by `plotly_update`, for the
+            properties that changed in at least one trace. Traces that didn't
+            edit a property have an Undefined entry.
+        relayout_changes : dict[str, any]
+            Subset of the layout edits that resulted in a change
+        trace_indexes : list[int]
+            Sorted indexes of the traces with batched edits
+        trace_changes : dict[int, list[str]]
+            Dict from trace indexes to the key path strings that changed
         """
+        # Apply layout edits
+        # ------------------
+        relayout_changes = {}
+        for key_path_str, v in self._batch_layout_edits.items():
+            if BaseFigure._str_to_dict_path(key_path_str)[0] == "template":
+                self._unshare_layout_template()
+            if BaseFigure._set_in(self._layout, key_path_str, v):
+                relayout_changes[key_path_str] = v
 
-        # Handle Style / Trace Indexes
-        # ----------------------------
-        batch_style_commands = self._batch_trace_edits
-        trace_indexes = sorted(set([trace_ind for trace_ind in batch_style_commands]))
-
-        all_props = sorted(
-            set(
-                [
-                    prop
-                    for trace_style in self._batch_trace_edits.values()
-                    for prop in trace_style
-                ]
-            )
-        )
+        # Apply trace edits
+        # -----------------
+        # Edits of each trace are applied in sorted order so that parent
+        # properties (e.g. 'marker') are set before their children
+        # (e.g. 'marker.color')
+        trace_indexes = sorted(self._batch_trace_edits)
+        trace_changes = {}
+        changed_props = set()
+        for trace_ind in trace_indexes:
+            trace_dict = self._data[trace_ind]
+            trace_edits = self._batch_trace_edits[trace_ind]
+            changed = [
+                key_path_str
+                for key_path_str in sorted(trace_edits)
+                if BaseFigure._set_in(
+                    trace_dict, key_path_str, trace_edits[key_path_str]
+                )
+            ]
+            if changed:
+                trace_changes[trace_ind] = changed
+                changed_props.update(changed)
 
-        # Initialize restyle_data dict with all values undefined
-        restyle_data = {
-            prop: [Undefined for _ in range(len(trace_indexes))] for prop in all_props
+        # Build restyle data
+        # ------------------
+        restyle_changes = {
+            prop: [Undefined] * len(trace_indexes) for prop in sorted(changed_props)
         }
+        for i, trace_ind in enumerate(trace_indexes):
+            for trace_prop, trace_val in self._batch_trace_edits[trace_ind].items():
+                if trace_prop in restyle_changes:
+                    restyle_changes[trace_prop][i] = trace_val
 
-        # Fill in values
-        for trace_ind, trace_style in batch_style_commands.items():
-            for trace_prop, trace_val in trace_style.items():
-                restyle_trace_index = trace_indexes.index(trace_ind)
-                restyle_data[trace_prop][restyle_trace_index] = trace_val
+        return restyle_changes, relayout_changes, trace_indexes, trace_changes
 
-        # Handle Layout
-        # -------------
-        relayout_data = self._batch_layout_edits
+    def _dispatch_batch_change_callbacks(self, trace_changes, relayout_changes):
+        """
+        Dispatch property change callbacks for the changes applied by
+        `_perform_batch_update`
 
-        # Return plotly_update params
-        # ---------------------------
-        return restyle_data, relayout_data, trace_indexes
+        Parameters
+        ----------
+        trace_changes : dict[int, list[str]]
+            Dict from trace indexes to the key path strings that changed
+        relayout_changes : dict[str, any]
+            Layout changes
+
+        Returns
+        -------
+        None
+        """
+        for trace_ind, changed in trace_changes.items():
+            self._dispatch_trace_change_callbacks(dict.fromkeys(changed), [trace_ind])
+
+        if relayout_changes:
+            self._dispatch_layout_change_callbacks(relayout_changes)
 
     @contextmanager
     def batch_animate(self, duration=500, easing="cubic-in-out"):
@@ -3230,17 +3785,12 @@ Invalid property path '{key_path_str}' for layout
         """
         # Apply commands to internal dictionaries as an update
         # ----------------------------------------------------
-        (
-            restyle_data,
-            relayout_data,
-            trace_indexes,
-        ) = self._build_update_params_from_batch()
-
         (
             restyle_changes,
             relayout_changes,
             trace_indexes,
-        ) = self._perform_plotly_update(restyle_data, relayout_data, trace_indexes)
+            trace_changes,
+        ) = self._perform_batch_update()
 
         # Convert style / trace_indexes into animate form
         # -----------------------------------------------
@@ -3273,13 +3823,7 @@ Invalid property path '{key_path_str}' for layout
 
         # Dispatch callbacks
         # ------------------
-        # ### Dispatch restyle changes ###
-        if restyle_changes:
-            self._dispatch_trace_change_callbacks(restyle_changes, trace_indexes)
-
-        # ### Dispatch relayout changes ###
-        if relayout_changes:
-            self._dispatch_layout_change_callbacks(relayout_changes)
+        self._dispatch_batch_change_callbacks(trace_changes, relayout_changes)
 
     # Exports
     # -------
@@ -3589,6 +4133,24 @@ Invalid property path '{key_path_str}' for layout
         div_id: str (default None)
             If provided, this is the value of the id attribute of the div tag. If None, the
             id attribute is a UUID.
+        include_template: bool or string (default True)
+            Specifies how the figure's template (layout.template) is included
+            in the output.
+
+            If True, the template is included in the figure's JSON
+            specification like any other layout property.
+
+            If 'shared', the template is included in a script that registers it
+            with the page, under a key computed from its contents, and the
+            figure references it by that key.
+
+            If False, the template is not included in the output, and the figure
+            references a template registered by an earlier figure on the same
+            page that was written with include_template='shared'. If there is
+            none, the figure is displayed without a template. This is useful
+            when many figures that share a template are placed in the same HTML
+            document, because the template is included only once per page
+            rather than once per figure.
 
         Returns
         -------
@@ -3696,6 +4258,24 @@ Invalid property path '{key_path_str}' for layout
         div_id: str (default None)
             If provided, this is the value of the id attribute of the div tag. If None, the
             id attribute is a UUID.
+        include_template: bool or string (default True)
+            Specifies how the figure's template (layout.template) is included
+            in the output.
+
+            If True, the template is included in the figure's JSON
+            specification like any other layout property.
+
+            If 'shared', the template is included in a script that registers it
+            with the page, under a key computed from its contents, and the
+            figure references it by that key.
+
+            If False, the template is not included in the output, and the figure
+            references a template registered by an earlier figure on the same
+            page that was written with include_template='shared'. If there is
+            none, the figure is displayed without a template. This is useful
+            when many figures that share a template are placed in the same HTML
+            document, because the template is included only once per page
+            rather than once per figure.
 
         Returns
         -------
@@ -4313,6 +4893,11 @@ class BasePlotlyType(object):
         # properties is modified
         self._change_callbacks = {}
 
+        # ### _array_buffers ###
+        # A dict from array property names to the RingBuffer objects that
+        # back them after extend_traces / prepend_traces. Initialized lazily.
+        self._array_buffers = None
+
         # ### Backing property for backward compatible _validator property ##
         self.__validators = None
 
@@ -5714,6 +6299,14 @@ class BaseLayoutType(BaseLayoutHierarchyType):
     def _subplot_re_match(self, prop):
         raise NotImplementedError()
 
+    def _get_child_props(self, child):
+        # The template of a figure's layout may be shared with other figures,
+        # so make sure the figure has its own copy before handing it out
+        if child.plotly_name == "template" and isinstance(self._parent, BaseFigure):
+            self._parent._unshare_layout_template()
+
+        return super(BaseLayoutType, self)._get_child_props(child)
+
     def __init__(self, plotly_name, **kwargs):
         """
         Construct a new BaseLayoutType object
@@ -5802,7 +6395,11 @@ class BaseLayoutType(BaseLayoutHierarchyType):
         # Use the standard _set_compound_prop method to
         # validate/coerce/import subplot value. This must be called AFTER
         # the validator instance is added to self._validators above.
-        self._set_compound_prop(prop, value)
+        if self._validate:
+            self._set_compound_prop(prop, value)
+        else:
+            # Set value as-is, the subplot object is constructed on access
+            super(BaseLayoutHierarchyType, self).__setitem__(prop, value)
         self._subplotid_props.add(prop)
 
     def _strip_subplot_suffix_of_1(self, prop):
@@ -5856,8 +6453,7 @@ class BaseLayoutType(BaseLayoutHierarchyType):
         """
         prop = self._strip_subplot_suffix_of_1(prop)
         if prop != "_subplotid_props" and prop in self._subplotid_props:
-            validator = self._get_validator(prop)
-            return validator.present(self._compound_props[prop])
+            return self[prop]
         else:
             return super(BaseLayoutHierarchyType, self).__getattribute__(prop)
 
@@ -1,8 +1,11 @@
+import asyncio
 import pathlib
+import threading
+import time
 from traitlets import List, Dict, observe, Integer
 from plotly.io._renderers import display_jupyter_version_warnings
 
-from .basedatatypes import BaseFigure, BasePlotlyType
+from .basedatatypes import BaseFigure, BasePlotlyType, Undefined
 from .callbacks import BoxSelector, LassoSelector, InputDeviceState, Points
 from .serializers import custom_serializers
 from .version import __frontend_version__
@@ -41,6 +44,7 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
     # detailed descriptions of the messages.
     _py2js_addTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_restyle = Dict(allow_none=True).tag(sync=True, **custom_serializers)
+    _py2js_extendTraces = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_relayout = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_update = Dict(allow_none=True).tag(sync=True, **custom_serializers)
     _py2js_animate = Dict(allow_none=True).tag(sync=True, **custom_serializers)
@@ -85,6 +89,12 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
     _set_trace_uid = True
     _allow_disable_validation = False
 
+    # ### Update coalescing ###
+    # Interval in seconds over which restyle/relayout/update messages are
+    # merged into a single update message. None if coalescing is disabled.
+    # See `coalesce_updates`.
+    _coalesce_interval = None
+
     # Constructor
     # -----------
     def __init__(
@@ -142,9 +152,247 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
         # views of this widget
         self._view_count = 0
 
+        # Update coalescing
+        # -----------------
+        # Pending trace edits (dict from trace index to a dict from key path
+        # strings to values) and layout edits (dict from key path strings to
+        # values) that will be sent in the next coalesced update message.
+        # Flushes may run on a timer thread, so the pending edits, the
+        # timer, the counts and the _flushing_updates flag are only
+        # accessed while holding _coalesce_lock
+        self._pending_trace_edits = {}
+        self._pending_layout_edits = {}
+        self._coalesce_lock = threading.RLock()
+        self._coalesce_timer = None
+        self._last_coalesced_flush = 0.0
+        self._flushing_updates = False
+        self._coalesce_counts = {
+            "messages_buffered": 0,
+            "messages_sent": 0,
+            "edits_merged": 0,
+        }
+
     def show(self, *args, **kwargs):
         return self
 
+    # Update coalescing
+    # -----------------
+    def coalesce_updates(self, interval=0.1):
+        """
+        Automatically coalesce property updates into at most one frontend
+        message per `interval` seconds
+
+        Each property assignment made outside of a `batch_update` context
+        normally sends its own restyle or relayout message to the frontend.
+        With coalescing enabled, restyle, relayout and update messages are
+        buffered instead, repeated updates to the same property path are
+        merged, and all pending changes are sent as a single update
+        message once per interval. The figure's properties (and on_change
+        callbacks) are still updated immediately.
+
+        Pending changes are flushed by a timer on the running asyncio event
+        loop (or on a background thread if there is no running loop), and
+        before any message that adds, moves or deletes traces.
+
+        Parameters
+        ----------
+        interval : float or None
+            Minimum number of seconds between coalesced update messages.
+            If None, pending changes are flushed and coalescing is
+            disabled.
+
+        Returns
+        -------
+        BaseFigureWidget
+            The Figure object that coalesce_updates was called on
+
+        Examples
+        --------
+        >>> import plotly.graph_objects as go
+        >>> fig = go.FigureWidget(data=[go.Scatter(y=[1, 2, 3])])
+        >>> fig = fig.coalesce_updates(0.1)  # at most 10 messages per second
+        >>> for i in range(100):
+        ...     fig.data[0].y = [i, i + 1, i + 2]
+        >>> fig.coalesce_stats["messages_saved"]  # doctest: +SKIP
+        99
+        """
+        if interval is not None and interval < 0:
+            raise ValueError(
+                "The interval argument to coalesce_updates must be a "
+                "non-negative number or None\n"
+                "    Received value: {val}".format(val=repr(interval))
+            )
+
+        with self._coalesce_lock:
+            self.flush_updates()
+            self._coalesce_interval = interval
+            self._last_coalesced_flush = time.monotonic()
+        return self
+
+    def flush_updates(self):
+        """
+        Immediately send any property updates that are pending because of
+        `coalesce_updates`
+
+        Returns
+        -------
+        None
+        """
+        if self._coalesce_interval is None:
+            # Nothing can be pending when coalescing is disabled
+            return
+
+        with self._coalesce_lock:
+            if self._coalesce_interval is None:
+                return
+
+            if self._coalesce_timer is not None:
+                self._coalesce_timer.cancel()
+                self._coalesce_timer = None
+
+            self._last_coalesced_flush = time.monotonic()
+            if not self._pending_trace_edits and not self._pending_layout_edits:
+                return
+
+            # ### Build update params ###
+            # Each trace may only have edits for some of the properties, so
+            # the other entries are left Undefined
+            trace_indexes = sorted(self._pending_trace_edits)
+            restyle_data = {}
+            for i, trace_ind in enumerate(trace_indexes):
+                for key_path_str, val in self._pending_trace_edits[trace_ind].items():
+                    if key_path_str not in restyle_data:
+                        restyle_data[key_path_str] = [Undefined] * len(trace_indexes)
+                    restyle_data[key_path_str][i] = val
+
+            # Parent properties (e.g. 'marker') must be applied before their
+            # children (e.g. 'marker.color') for every trace
+            restyle_data = dict(
+                sorted(
+                    restyle_data.items(),
+                    key=lambda item: len(BaseFigure._str_to_dict_path(item[0])),
+                )
+            )
+            relayout_data = self._pending_layout_edits
+
+            self._pending_trace_edits = {}
+            self._pending_layout_edits = {}
+
+            # ### Send message ###
+            # The lock is held while sending, so that other threads wait for
+            # the message to be sent before buffering or sending theirs
+            self._flushing_updates = True
+            try:
+                self._send_update_msg(restyle_data, relayout_data, trace_indexes)
+            finally:
+                self._flushing_updates = False
+            self._coalesce_counts["messages_sent"] += 1
+
+    @property
+    def coalesce_stats(self):
+        """
+        Statistics about the messages handled by `coalesce_updates`
+
+        Returns
+        -------
+        dict
+            Dict with the following keys:
+              - messages_buffered: number of restyle/relayout/update
+                messages that were buffered instead of being sent
+              - messages_sent: number of coalesced update messages sent
+              - messages_saved: messages_buffered - messages_sent
+              - edits_merged: number of property updates that replaced a
+                pending update to the same (or a parent) property path
+        """
+        with self._coalesce_lock:
+            stats = dict(self._coalesce_counts)
+        stats["messages_saved"] = stats["messages_buffered"] - stats["messages_sent"]
+        return stats
+
+    def _coalesce_msg(
+        self,
+        restyle_data=None,
+        relayout_data=None,
+        trace_indexes=None,
+        source_view_id=None,
+    ):
+        """
+        Buffer a restyle/relayout/update message if coalescing is enabled
+
+        Returns
+        -------
+        bool
+            True if the message was buffered, False if it should be sent
+        """
+        if self._coalesce_interval is None:
+            return False
+
+        with self._coalesce_lock:
+            # _flushing_updates is only set by the thread holding the lock,
+            # while it sends the coalesced message
+            if self._coalesce_interval is None or self._flushing_updates:
+                return False
+
+            if source_view_id is not None:
+                # Messages triggered by a frontend view are sent as-is, after
+                # everything that precedes them
+                self.flush_updates()
+                return False
+
+            # ### Merge trace edits ###
+            if restyle_data:
+                trace_indexes = self._normalize_trace_indexes(trace_indexes)
+                for key_path_str, v in restyle_data.items():
+                    for i, trace_ind in enumerate(trace_indexes):
+                        trace_v = v[i % len(v)] if isinstance(v, list) else v
+                        if trace_v is not Undefined:
+                            self._merge_pending_edit(
+                                self._pending_trace_edits.setdefault(trace_ind, {}),
+                                key_path_str,
+                                trace_v,
+                            )
+
+            # ### Merge layout edits ###
+            if relayout_data:
+                for key_path_str, v in relayout_data.items():
+                    self._merge_pending_edit(
+                        self._pending_layout_edits, key_path_str, v
+                    )
+
+            self._coalesce_counts["messages_buffered"] += 1
+
+            # ### Flush or schedule flush ###
+            elapsed = time.monotonic() - self._last_coalesced_flush
+            if elapsed >= self._coalesce_interval:
+                # Keeps messages flowing when the code making the updates
+                # blocks the event loop
+                self.flush_updates()
+            elif self._coalesce_timer is None:
+                delay = self._coalesce_interval - elapsed
+                try:
+                    loop = asyncio.get_running_loop()
+                except RuntimeError:
+                    timer = threading.Timer(delay, self.flush_updates)
+                    timer.daemon = True
+                    timer.start()
+                    self._coalesce_timer = timer
+                else:
+                    self._coalesce_timer = loop.call_later(delay, self.flush_updates)
+
+        return True
+
+    def _merge_pending_edit(self, edits, key_path_str, val):
+        """
+        Add a key path / value pair to a dict of pending edits, replacing
+        pending edits to the same path and to its child paths
+        """
+        prefixes = (key_path_str + ".", key_path_str + "[")
+        replaced = [k for k in edits if k == key_path_str or k.startswith(prefixes)]
+        for k in replaced:
+            del edits[k]
+        self._coalesce_counts["edits_merged"] += len(replaced)
+        edits[key_path_str] = val
+
     # Python -> JavaScript Messages
     # -----------------------------
     def _send_relayout_msg(self, layout_data, source_view_id=None):
@@ -160,6 +408,11 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
             (e.g. By the user clicking 'zoom' in the toolbar). None if the
             operation was not triggered by a frontend view
         """
+        # Coalesce message
+        # ----------------
+        if self._coalesce_msg(relayout_data=layout_data, source_view_id=source_view_id):
+            return
+
         # Increment layout edit messages IDs
         # ----------------------------------
         layout_edit_id = self._last_layout_edit_id + 1
@@ -200,6 +453,15 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
         # ---------------------------
         trace_indexes = self._normalize_trace_indexes(trace_indexes)
 
+        # Coalesce message
+        # ----------------
+        if self._coalesce_msg(
+            restyle_data=restyle_data,
+            trace_indexes=trace_indexes,
+            source_view_id=source_view_id,
+        ):
+            return
+
         # Increment layout/trace edit message IDs
         # ---------------------------------------
         layout_edit_id = self._last_layout_edit_id + 1
@@ -225,6 +487,58 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
         self._py2js_restyle = restyle_msg
         self._py2js_restyle = None
 
+    def _send_extendTraces_msg(
+        self, extend_data, trace_indexes, max_points=None, prepend=False
+    ):
+        """
+        Send Plotly.extendTraces (or Plotly.prependTraces) message to the
+        frontend
+
+        Parameters
+        ----------
+        extend_data : dict
+            Dict from property path strings to lists of arrays of new
+            values, one array per trace index
+        trace_indexes : list[int]
+            List of trace indexes that the operation applies to
+        max_points : dict or None
+            Dict from property path strings to lists of the maximum number
+            of points to keep for each trace index (None for no limit)
+        prepend : bool
+            If True, values are inserted at the start of the arrays
+            (Plotly.prependTraces) rather than appended to the end
+        """
+
+        # Send pending coalesced updates first
+        # ------------------------------------
+        self.flush_updates()
+
+        # Increment layout/trace edit message IDs
+        # ---------------------------------------
+        layout_edit_id = self._last_layout_edit_id + 1
+        self._last_layout_edit_id = layout_edit_id
+        self._layout_edit_in_process = True
+
+        trace_edit_id = self._last_trace_edit_id + 1
+        self._last_trace_edit_id = trace_edit_id
+        self._trace_edit_in_process = True
+
+        # Build message
+        # -------------
+        extend_msg = {
+            "extend_data": extend_data,
+            "extend_traces": trace_indexes,
+            "max_points": max_points,
+            "prepend": prepend,
+            "trace_edit_id": trace_edit_id,
+            "layout_edit_id": layout_edit_id,
+        }
+
+        # Send message
+        # ------------
+        self._py2js_extendTraces = extend_msg
+        self._py2js_extendTraces = None
+
     def _send_addTraces_msg(self, new_traces_data):
         """
         Send Plotly.addTraces message to the frontend
@@ -235,6 +549,10 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
             List of trace data for new traces as accepted by Plotly.addTraces
         """
 
+        # Send pending coalesced updates first
+        # ------------------------------------
+        self.flush_updates()
+
         # Increment layout/trace edit message IDs
         # ---------------------------------------
         layout_edit_id = self._last_layout_edit_id + 1
@@ -270,6 +588,10 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
             List of new trace indexes
         """
 
+        # Send pending coalesced updates first
+        # ------------------------------------
+        self.flush_updates()
+
         # Build message
         # -------------
         move_msg = {"current_trace_inds": current_inds, "new_trace_inds": new_inds}
@@ -303,6 +625,16 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
         # ---------------------------
         trace_indexes = self._normalize_trace_indexes(trace_indexes)
 
+        # Coalesce message
+        # ----------------
+        if self._coalesce_msg(
+            restyle_data=restyle_data,
+            relayout_data=relayout_data,
+            trace_indexes=trace_indexes,
+            source_view_id=source_view_id,
+        ):
+            return
+
         # Increment layout/trace edit message IDs
         # ---------------------------------------
         trace_edit_id = self._last_trace_edit_id + 1
@@ -352,6 +684,10 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
         # ---------------------------
         trace_indexes = self._normalize_trace_indexes(trace_indexes)
 
+        # Send pending coalesced updates first
+        # ------------------------------------
+        self.flush_updates()
+
         # Increment layout/trace edit message IDs
         # ---------------------------------------
         trace_edit_id = self._last_trace_edit_id + 1
@@ -389,6 +725,10 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
             List of trace indexes of traces to delete
         """
 
+        # Send pending coalesced updates first
+        # ------------------------------------
+        self.flush_updates()
+
         # Increment layout/trace edit message IDs
         # ---------------------------------------
         trace_edit_id = self._last_trace_edit_id + 1
@@ -759,6 +1099,7 @@ class BaseFigureWidget(BaseFigure, anywidget.AnyWidget):
             Function of zero arguments to be called when all pending edit
             operations have completed
         """
+        self.flush_updates()
         if self._layout_edit_in_process or self._trace_edit_in_process:
             self._waiting_edit_callbacks.append(fn)
         else:
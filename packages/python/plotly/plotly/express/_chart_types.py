@@ -33,6 +33,7 @@ def scatter(
     error_y_minus=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     orientation=None,
@@ -56,6 +57,8 @@ def scatter(
     range_x=None,
     range_y=None,
     render_mode="auto",
+    downsample=None,
+    max_points=None,
     title=None,
     subtitle=None,
     template=None,
@@ -87,6 +90,7 @@ def density_contour(
     hover_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     orientation=None,
@@ -160,6 +164,7 @@ def density_heatmap(
     hover_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     orientation=None,
@@ -241,6 +246,7 @@ def line(
     error_y_minus=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     orientation=None,
@@ -257,6 +263,8 @@ def line(
     range_y=None,
     line_shape=None,
     render_mode="auto",
+    downsample=None,
+    max_points=None,
     title=None,
     subtitle=None,
     template=None,
@@ -292,6 +300,7 @@ def area(
     facet_col_spacing=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -351,6 +360,7 @@ def bar(
     error_y_minus=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -407,6 +417,7 @@ def timeline(
     text=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -455,6 +466,7 @@ def histogram(
     hover_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -530,6 +542,7 @@ def ecdf(
     hover_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     markers=False,
     lines=True,
     category_orders=None,
@@ -595,6 +608,7 @@ def violin(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -649,6 +663,7 @@ def box(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -702,6 +717,7 @@ def strip(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -761,6 +777,7 @@ def scatter_3d(
     error_z_minus=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     size_max=None,
@@ -815,6 +832,7 @@ def line_3d(
     error_z_minus=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -860,6 +878,7 @@ def scatter_ternary(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -902,6 +921,7 @@ def line_ternary(
     text=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -941,6 +961,7 @@ def scatter_polar(
     text=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -988,6 +1009,7 @@ def line_polar(
     symbol=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1033,6 +1055,7 @@ def bar_polar(
     base=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1088,6 +1111,7 @@ def choropleth(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1142,6 +1166,7 @@ def scatter_geo(
     size=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1201,6 +1226,7 @@ def line_geo(
     symbol=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1247,6 +1273,7 @@ def scatter_map(
     size=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1286,6 +1313,7 @@ def choropleth_map(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1323,6 +1351,7 @@ def density_map(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_continuous_scale=None,
@@ -1363,6 +1392,7 @@ def line_map(
     line_group=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1398,6 +1428,7 @@ def scatter_mapbox(
     size=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1446,6 +1477,7 @@ def choropleth_mapbox(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1492,6 +1524,7 @@ def density_mapbox(
     custom_data=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_continuous_scale=None,
@@ -1541,6 +1574,7 @@ def line_mapbox(
     line_group=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -1742,6 +1776,7 @@ def sunburst(
     height=None,
     branchvalues=None,
     maxdepth=None,
+    max_children=None,
 ) -> go.Figure:
     """
     A sunburst plot represents hierarchial data as sectors laid out over
@@ -1793,6 +1828,7 @@ def treemap(
     height=None,
     branchvalues=None,
     maxdepth=None,
+    max_children=None,
 ) -> go.Figure:
     """
     A treemap plot represents hierarchial data as nested rectangular
@@ -1844,6 +1880,7 @@ def icicle(
     height=None,
     branchvalues=None,
     maxdepth=None,
+    max_children=None,
 ) -> go.Figure:
     """
     An icicle plot represents hierarchial data with adjoined rectangular
@@ -1887,6 +1924,7 @@ def funnel(
     text=None,
     animation_frame=None,
     animation_group=None,
+    frame_encoding=None,
     category_orders=None,
     labels=None,
     color_discrete_sequence=None,
@@ -8,6 +8,7 @@ from _plotly_utils.basevalidators import ColorscaleValidator
 from plotly.colors import qualitative, sequential
 import math
 
+from plotly._downsample import downsample_trace, validate_downsample_args
 from plotly._subplots import (
     make_subplots,
     _set_trace_grid_reference,
@@ -117,11 +118,21 @@ def get_trendline_results(fig):
     Arguments:
         fig: the output of a `plotly.express` charting call
     Returns:
-        A `pandas.DataFrame` with a column "px_fit_results" containing the `statsmodels`
+        A `pandas.DataFrame` with a column "px_fit_results" containing the fit
         results objects, along with columns identifying the subset of the data the
         trendline was fit on.
     """
-    return fig._px_trendlines
+    trendlines = fig._px_trendlines
+    if isinstance(trendlines, list) and trendlines:
+        # The DataFrame is only built on request, so that figures which never
+        # call this function don't pay for it
+        try:
+            import pandas as pd
+        except ImportError:
+            msg = "Trendlines require pandas to be installed."
+            raise NotImplementedError(msg)
+        trendlines = fig._px_trendlines = pd.DataFrame(trendlines)
+    return trendlines
 
 
 Mapping = namedtuple(
@@ -139,6 +150,39 @@ Mapping = namedtuple(
 TraceSpec = namedtuple("TraceSpec", ["constructor", "attrs", "trace_patch", "marginal"])
 
 
+class ColumnArrays(object):
+    """
+    Numpy arrays holding the values of the columns of a data frame, which are
+    converted once and then sliced by the rows of each group without copying.
+
+    Columns whose values can't be represented by slices of a single numpy array
+    the way they would be when converted group by group (e.g. because they hold
+    null values or dates) are not converted, and `get` returns None for them.
+    """
+
+    def __init__(self, df, rows=slice(None), arrays=None):
+        self.df = df
+        self.rows = rows
+        self.arrays = {} if arrays is None else arrays
+
+    def slice(self, rows):
+        """Returns the ColumnArrays of the rows of the data frame in `rows`"""
+        return ColumnArrays(self.df, rows, self.arrays)
+
+    def get(self, name):
+        if name not in self.arrays:
+            self.arrays[name] = None
+            if isinstance(name, str) and name in self.df.columns:
+                series = self.df.get_column(name)
+                dtype = series.dtype
+                if (
+                    dtype.is_numeric() or dtype == nw.String or dtype == nw.Boolean
+                ) and series.null_count() == 0:
+                    self.arrays[name] = series.to_numpy()
+        array = self.arrays[name]
+        return None if array is None else array[self.rows]
+
+
 def get_label(args, column):
     try:
         return args["labels"][column]
@@ -299,7 +343,136 @@ def make_mapping(args, variable):
     )
 
 
-def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
+def make_mapping_update(trace_spec, trace_specs, mapping, val, group_length):
+    """Returns the update to the properties of a trace of `trace_spec` which maps the
+    value `val` of the grouping column of `mapping` to a property of the trace, and
+    whether it only depends on `val` (and may be reused for other traces of
+    `trace_spec` in groups with the same value)
+    """
+    trace = trace_spec.constructor()
+    cacheable = True
+    try:
+        mapping.updater(trace, mapping.val_map[val])  # covers most cases
+    except ValueError:
+        # this catches some odd cases like marginals
+        if (
+            trace_spec != trace_specs[0]
+            and (
+                trace_spec.constructor in [go.Violin, go.Box]
+                and mapping.variable in ["symbol", "pattern", "dash"]
+            )
+            or (
+                trace_spec.constructor in [go.Histogram]
+                and mapping.variable in ["symbol", "dash"]
+            )
+        ):
+            pass
+        elif (
+            trace_spec != trace_specs[0]
+            and trace_spec.constructor in [go.Histogram]
+            and mapping.variable == "color"
+        ):
+            trace.update(marker=dict(color=mapping.val_map[val]))
+        elif (
+            trace_spec.constructor
+            in [go.Choropleth, go.Choroplethmap, go.Choroplethmapbox]
+            and mapping.variable == "color"
+        ):
+            trace.update(
+                z=[1] * group_length,
+                colorscale=[mapping.val_map[val]] * 2,
+                showscale=False,
+                showlegend=True,
+            )
+            cacheable = False
+        else:
+            raise
+    update = trace.to_plotly_json()
+    update.pop("type")
+    return update, cacheable
+
+
+def merge_trace_updates(updates):
+    """Merges a list of updates to the properties of a trace into a single update
+    with the same effect as applying them in turn with `trace.update`
+    """
+    merged = {}
+    for update in updates:
+        merged = _merge_update(merged, update)
+    return merged
+
+
+def _merge_update(base, update):
+    merged = dict(base)
+    for key, val in update.items():
+        if isinstance(val, dict) and isinstance(merged.get(key), dict):
+            merged[key] = _merge_update(merged[key], val)
+        else:
+            merged[key] = val
+    return merged
+
+
+def make_customdata(trace_data, columns, column_arrays=None):
+    """
+    Returns the values of the `columns` of `trace_data` as a 2-D numpy array with
+    one column per column, which is serialized as a list of row lists.
+
+    When all the columns are float columns or integer columns without missing
+    values, the array has a numeric dtype, with integer columns narrowed to the
+    smallest integer dtype which holds their values, so that it is serialized as
+    a compact typed array. Otherwise it is an object array of the Python values
+    of each column.
+    """
+    import numpy as np
+
+    arrays = []
+    for name in columns:
+        values = column_arrays.get(name) if column_arrays is not None else None
+        if values is None:
+            series = trace_data.get_column(name)
+            if series.dtype == nw.Float64 or series.dtype == nw.Float32:
+                # missing values are NaN in the typed array
+                values = series.to_numpy()
+            elif series.dtype.is_numeric() and series.null_count() == 0:
+                values = series.to_numpy()
+            elif series.dtype == nw.Datetime and series.dtype.time_zone is not None:
+                # Remove time zone so that local time is displayed
+                values = series.dt.replace_time_zone(None).to_list()
+            else:
+                values = series.to_list()
+        arrays.append(values)
+
+    if all(
+        isinstance(values, np.ndarray) and values.dtype.kind in "iuf"
+        for values in arrays
+    ):
+        arrays = [_narrow_int_array(values) for values in arrays]
+        customdata = np.empty(
+            (len(trace_data), len(arrays)), dtype=np.result_type(*arrays)
+        )
+    else:
+        customdata = np.empty((len(trace_data), len(arrays)), dtype=object)
+    for i, values in enumerate(arrays):
+        # numpy values are converted to Python values in object arrays
+        customdata[:, i] = values
+    return customdata
+
+
+def _narrow_int_array(values):
+    """Returns `values` with the narrowest dtype which holds them if they're ints"""
+    import numpy as np
+
+    if values.dtype.kind not in "iu" or len(values) == 0:
+        return values
+    dtype = np.result_type(
+        np.min_scalar_type(values.min()), np.min_scalar_type(values.max())
+    )
+    return values.astype(dtype, copy=False)
+
+
+def make_trace_kwargs(
+    args, trace_spec, trace_data, mapping_labels, sizeref, column_arrays=None
+):
     """Populates a dict with arguments to update trace
 
     Parameters
@@ -315,6 +488,9 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
         to be used for hovertemplate
     sizeref : float
         marker sizeref
+    column_arrays : ColumnArrays
+        numpy arrays of the columns of trace_data, used instead of its columns
+        when available
 
     Returns
     -------
@@ -328,6 +504,14 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
 
     if "line_close" in args and args["line_close"]:
         trace_data = nw.concat([trace_data, trace_data.head(1)], how="vertical")
+        column_arrays = None
+
+    def get_column(name):
+        if column_arrays is not None:
+            values = column_arrays.get(name)
+            if values is not None:
+                return values
+        return trace_data.get_column(name)
 
     trace_patch = trace_spec.trace_patch.copy() or {}
     fit_results = None
@@ -362,7 +546,7 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
             if attr_name == "size":
                 if "marker" not in trace_patch:
                     trace_patch["marker"] = dict()
-                trace_patch["marker"]["size"] = trace_data.get_column(attr_value)
+                trace_patch["marker"]["size"] = get_column(attr_value)
                 trace_patch["marker"]["sizemode"] = "area"
                 trace_patch["marker"]["sizeref"] = sizeref
                 mapping_labels[attr_label] = "%{marker.size}"
@@ -447,19 +631,19 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                 arr = "arrayminus" if attr_name.endswith("minus") else "array"
                 if error_xy not in trace_patch:
                     trace_patch[error_xy] = {}
-                trace_patch[error_xy][arr] = trace_data.get_column(attr_value)
+                trace_patch[error_xy][arr] = get_column(attr_value)
             elif attr_name == "custom_data":
                 if len(attr_value) > 0:
-                    # here we store a data frame in customdata, and it's serialized
-                    # as a list of row lists, which is what we want
-                    trace_patch["customdata"] = trace_data.select(nw.col(attr_value))
+                    trace_patch["customdata"] = make_customdata(
+                        trace_data, attr_value, column_arrays
+                    )
             elif attr_name == "hover_name":
                 if trace_spec.constructor not in [
                     go.Histogram,
                     go.Histogram2d,
                     go.Histogram2dContour,
                 ]:
-                    trace_patch["hovertext"] = trace_data.get_column(attr_value)
+                    trace_patch["hovertext"] = get_column(attr_value)
                     if hover_header == "":
                         hover_header = "<b>%{hovertext}</b><br><br>"
             elif attr_name == "hover_data":
@@ -491,13 +675,12 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                         )
 
                     if len(customdata_cols) > 0:
-                        # here we store a data frame in customdata, and it's serialized
-                        # as a list of row lists, which is what we want
-
                         # dict.fromkeys(customdata_cols) allows to deduplicate column
                         # names, yet maintaining the original order.
-                        trace_patch["customdata"] = trace_data.select(
-                            *[nw.col(c) for c in dict.fromkeys(customdata_cols)]
+                        trace_patch["customdata"] = make_customdata(
+                            trace_data,
+                            list(dict.fromkeys(customdata_cols)),
+                            column_arrays,
                         )
             elif attr_name == "color":
                 if trace_spec.constructor in [
@@ -505,7 +688,7 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                     go.Choroplethmap,
                     go.Choroplethmapbox,
                 ]:
-                    trace_patch["z"] = trace_data.get_column(attr_value)
+                    trace_patch["z"] = get_column(attr_value)
                     trace_patch["coloraxis"] = "coloraxis1"
                     mapping_labels[attr_label] = "%{z}"
                 elif trace_spec.constructor in [
@@ -547,24 +730,24 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                         colorable = "line"
                     if colorable not in trace_patch:
                         trace_patch[colorable] = dict()
-                    trace_patch[colorable]["color"] = trace_data.get_column(attr_value)
+                    trace_patch[colorable]["color"] = get_column(attr_value)
                     trace_patch[colorable]["coloraxis"] = "coloraxis1"
                     mapping_labels[attr_label] = "%%{%s.color}" % colorable
             elif attr_name == "animation_group":
-                trace_patch["ids"] = trace_data.get_column(attr_value)
+                trace_patch["ids"] = get_column(attr_value)
             elif attr_name == "locations":
-                trace_patch[attr_name] = trace_data.get_column(attr_value)
+                trace_patch[attr_name] = get_column(attr_value)
                 mapping_labels[attr_label] = "%{location}"
             elif attr_name == "values":
-                trace_patch[attr_name] = trace_data.get_column(attr_value)
+                trace_patch[attr_name] = get_column(attr_value)
                 _label = "value" if attr_label == "values" else attr_label
                 mapping_labels[_label] = "%{value}"
             elif attr_name == "parents":
-                trace_patch[attr_name] = trace_data.get_column(attr_value)
+                trace_patch[attr_name] = get_column(attr_value)
                 _label = "parent" if attr_label == "parents" else attr_label
                 mapping_labels[_label] = "%{parent}"
             elif attr_name == "ids":
-                trace_patch[attr_name] = trace_data.get_column(attr_value)
+                trace_patch[attr_name] = get_column(attr_value)
                 _label = "id" if attr_label == "ids" else attr_label
                 mapping_labels[_label] = "%{id}"
             elif attr_name == "names":
@@ -575,13 +758,13 @@ def make_trace_kwargs(args, trace_spec, trace_data, mapping_labels, sizeref):
                     go.Pie,
                     go.Funnelarea,
                 ]:
-                    trace_patch["labels"] = trace_data.get_column(attr_value)
+                    trace_patch["labels"] = get_column(attr_value)
                     _label = "label" if attr_label == "names" else attr_label
                     mapping_labels[_label] = "%{label}"
                 else:
-                    trace_patch[attr_name] = trace_data.get_column(attr_value)
+                    trace_patch[attr_name] = get_column(attr_value)
             else:
-                trace_patch[attr_name] = trace_data.get_column(attr_value)
+                trace_patch[attr_name] = get_column(attr_value)
                 mapping_labels[attr_label] = "%%{%s}" % attr_name
         elif (trace_spec.constructor == go.Histogram and attr_name in ["x", "y"]) or (
             trace_spec.constructor in [go.Histogram2d, go.Histogram2dContour]
@@ -664,22 +847,23 @@ def configure_cartesian_marginal_axes(args, fig, orders):
         set_cartesian_axis_opts(args, xaxis, "x", orders)
 
     # Configure axis ticks on marginal subplots
+    template_defaults = pio.templates._get_flat_defaults(args["template"])
     if args["marginal_x"]:
         fig.update_yaxes(
             showticklabels=False, showline=False, ticks="", range=None, row=nrows
         )
-        if args["template"].layout.yaxis.showgrid is None:
+        if template_defaults.get("layout.yaxis.showgrid") is None:
             fig.update_yaxes(showgrid=args["marginal_x"] == "histogram", row=nrows)
-        if args["template"].layout.xaxis.showgrid is None:
+        if template_defaults.get("layout.xaxis.showgrid") is None:
             fig.update_xaxes(showgrid=True, row=nrows)
 
     if args["marginal_y"]:
         fig.update_xaxes(
             showticklabels=False, showline=False, ticks="", range=None, col=ncols
         )
-        if args["template"].layout.xaxis.showgrid is None:
+        if template_defaults.get("layout.xaxis.showgrid") is None:
             fig.update_xaxes(showgrid=args["marginal_y"] == "histogram", col=ncols)
-        if args["template"].layout.yaxis.showgrid is None:
+        if template_defaults.get("layout.yaxis.showgrid") is None:
             fig.update_yaxes(showgrid=True, col=ncols)
 
     # Add axis titles to non-marginal subplots
@@ -906,6 +1090,74 @@ def configure_animation_controls(args, constructor, fig):
         ]
 
 
+def encode_frame_deltas(frame_list):
+    """
+    Removes from the traces of the frames in `frame_list` the properties which have
+    the same value in all the frames, so that the frames only hold the properties
+    which change from frame to frame. The traces of the first frame, which are
+    the traces of the figure, keep all their properties and are replaced in the
+    frame by copies.
+
+    The traces of the frames are matched with the traces of the figure by position,
+    as they are by `Plotly.animate`, which leaves the properties that are missing
+    from a frame unchanged.
+    """
+    frame_list[0]["data"] = [type(trace)(trace) for trace in frame_list[0]["data"]]
+    for i in range(len(frame_list[0]["data"])):
+        traces = [frame["data"][i] for frame in frame_list if len(frame["data"]) > i]
+        invariant = _invariant_props([trace._props for trace in traces])
+        invariant.pop("type", None)
+        if invariant:
+            for trace in traces:
+                # The traces don't belong to a figure yet, so their properties
+                # can be removed from their own dicts without revalidating them
+                _remove_props(trace._props, invariant)
+
+
+def _invariant_props(props_list):
+    """
+    Returns a dict with a None value for each of the properties which have the same
+    value in all the dicts of properties in `props_list`, nested like the properties
+    """
+    invariant = {}
+    for key, val in props_list[0].items():
+        others = [props.get(key) for props in props_list[1:]]
+        if isinstance(val, dict):
+            if all(isinstance(other, dict) for other in others):
+                nested = _invariant_props([val] + others)
+                if nested:
+                    invariant[key] = nested
+        elif all(_props_equal(val, other) for other in others):
+            invariant[key] = None
+    return invariant
+
+
+def _remove_props(props, invariant):
+    for key, nested in invariant.items():
+        if nested is None:
+            del props[key]
+        else:
+            _remove_props(props[key], nested)
+            if not props[key]:
+                del props[key]
+
+
+def _props_equal(a, b):
+    if a is b:
+        return True
+    if type(a) is not type(b):
+        return False
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(_props_equal(x, y) for x, y in zip(a, b))
+    if isinstance(a, dict):
+        return a.keys() == b.keys() and all(_props_equal(a[k], b[k]) for k in a)
+    if hasattr(a, "dtype"):
+        import numpy as np
+
+        return a.dtype == b.dtype and np.array_equal(a, b)
+    return a == b
+
+
 def make_trace_spec(args, constructor, attrs, trace_patch):
     if constructor in [go.Scatter, go.Scatterpolar]:
         if "render_mode" in args and (
@@ -1024,38 +1276,44 @@ def apply_default_cascade(args):
 
     # if colors not set explicitly or in px.defaults, defer to a template
     # if the template doesn't have one, we set some final fallback defaults
+    template_defaults = pio.templates._get_flat_defaults(args["template"])
     if "color_continuous_scale" in args:
-        if (
-            args["color_continuous_scale"] is None
-            and args["template"].layout.colorscale.sequential
+        if args["color_continuous_scale"] is None and template_defaults.get(
+            "layout.colorscale.sequential"
         ):
             args["color_continuous_scale"] = [
-                x[1] for x in args["template"].layout.colorscale.sequential
+                x[1] for x in template_defaults["layout.colorscale.sequential"]
             ]
         if args["color_continuous_scale"] is None:
             args["color_continuous_scale"] = sequential.Viridis
 
     if "color_discrete_sequence" in args:
-        if args["color_discrete_sequence"] is None and args["template"].layout.colorway:
-            args["color_discrete_sequence"] = args["template"].layout.colorway
+        if args["color_discrete_sequence"] is None and template_defaults.get(
+            "layout.colorway"
+        ):
+            args["color_discrete_sequence"] = template_defaults["layout.colorway"]
         if args["color_discrete_sequence"] is None:
             args["color_discrete_sequence"] = qualitative.D3
 
     # if symbol_sequence/line_dash_sequence not set explicitly or in px.defaults,
     # see if we can defer to template. If not, set reasonable defaults
     if "symbol_sequence" in args:
-        if args["symbol_sequence"] is None and args["template"].data.scatter:
-            args["symbol_sequence"] = [
-                scatter.marker.symbol for scatter in args["template"].data.scatter
-            ]
+        if args["symbol_sequence"] is None and template_defaults.get(
+            "data.scatter.marker.symbol"
+        ):
+            args["symbol_sequence"] = list(
+                template_defaults["data.scatter.marker.symbol"]
+            )
         if not args["symbol_sequence"] or not any(args["symbol_sequence"]):
             args["symbol_sequence"] = ["circle", "diamond", "square", "x", "cross"]
 
     if "line_dash_sequence" in args:
-        if args["line_dash_sequence"] is None and args["template"].data.scatter:
-            args["line_dash_sequence"] = [
-                scatter.line.dash for scatter in args["template"].data.scatter
-            ]
+        if args["line_dash_sequence"] is None and template_defaults.get(
+            "data.scatter.line.dash"
+        ):
+            args["line_dash_sequence"] = list(
+                template_defaults["data.scatter.line.dash"]
+            )
         if not args["line_dash_sequence"] or not any(args["line_dash_sequence"]):
             args["line_dash_sequence"] = [
                 "solid",
@@ -1067,10 +1325,12 @@ def apply_default_cascade(args):
             ]
 
     if "pattern_shape_sequence" in args:
-        if args["pattern_shape_sequence"] is None and args["template"].data.bar:
-            args["pattern_shape_sequence"] = [
-                bar.marker.pattern.shape for bar in args["template"].data.bar
-            ]
+        if args["pattern_shape_sequence"] is None and template_defaults.get(
+            "data.bar.marker.pattern.shape"
+        ):
+            args["pattern_shape_sequence"] = list(
+                template_defaults["data.bar.marker.pattern.shape"]
+            )
         if not args["pattern_shape_sequence"] or not any(
             args["pattern_shape_sequence"]
         ):
@@ -1160,6 +1420,116 @@ def _isinstance_listlike(x):
         return True
 
 
+def _get_necessary_columns(args, columns):
+    """Returns the columns of the data frame which are referenced by name in `args`,
+    in the order in which they appear in `columns`.
+    """
+    necessary_columns = {
+        i for i in args.values() if isinstance(i, str) and i in columns
+    }
+    for field in args:
+        if args[field] is not None and field in array_attrables:
+            necessary_columns.update(i for i in args[field] if i in columns)
+    return [c for c in columns if c in necessary_columns]
+
+
+def _aggregate_histogram(args, schema):
+    """Aggregates the lazy frame in `args["data_frame"]` by the columns which are
+    binned or grouped into traces, so that a histogram can be drawn from one row per
+    group rather than from every row, and rewrites `args` accordingly.
+
+    Only histograms whose `histfunc` can be computed from partial aggregates (count,
+    sum, min and max) of columns of the data frame, and whose binned axis is
+    categorical or has a given `nbins`, are aggregated. The `histfunc`
+    which plotly.js applies to the aggregated rows is stored in
+    `args["trace_histfunc"]`.
+
+    Returns the aggregated lazy frame, or None if the histogram cannot be drawn from
+    aggregated rows.
+    """
+    histfunc = args["histfunc"] or "count"
+    if (
+        histfunc not in ["count", "sum", "min", "max"]
+        or (args["x"] is None and args["y"] is None)
+        or args["marginal"] is not None
+        or args["hover_name"] is not None
+        or args["hover_data"]
+        or args["animation_group"] is not None
+    ):
+        return None
+
+    grouped_fields = [
+        "color",
+        "pattern_shape",
+        "facet_row",
+        "facet_col",
+        "animation_frame",
+    ]
+    referenced = [
+        args[field] for field in ["x", "y"] + grouped_fields if args[field] is not None
+    ]
+    if not all(isinstance(c, str) and c in schema for c in referenced):
+        # values were given as arrays which must be aligned with the rows
+        return None
+
+    x, y = args["x"], args["y"]
+    orientation = args["orientation"]
+    if x is not None and y is not None:
+        if orientation is None:
+            x_is_continuous = schema[x].is_numeric()
+            y_is_continuous = schema[y].is_numeric()
+            orientation = "h" if x_is_continuous and not y_is_continuous else "v"
+        if args["histfunc"] is None:
+            histfunc = "sum"
+    elif histfunc == "count":
+        orientation = "h" if x is None else "v"
+    else:
+        return None
+
+    value_letter = "x" if orientation == "h" else "y"
+    value_col = args[value_letter]
+    group_fields = ["y" if value_letter == "x" else "x"] + grouped_fields
+    group_cols = list(
+        dict.fromkeys(args[field] for field in group_fields if args[field] is not None)
+    )
+    if histfunc != "count" and value_col in group_cols:
+        return None
+
+    # plotly.js chooses the size of automatic bins of numeric and date axes from the
+    # values it is given, so their bins would change if it was given the distinct
+    # values instead of every row. Their number of bins is capped by `nbins`, which
+    # depends on the range of the values only.
+    binned_dtype = schema[group_cols[0]]
+    is_categorical = any(
+        binned_dtype == dtype for dtype in [nw.String, nw.Categorical, nw.Enum]
+    )
+    if args["nbins"] is None and not is_categorical:
+        return None
+
+    order_name = _generate_temporary_column_name(8, list(schema))
+    if histfunc == "count":
+        value_col = _escape_col_name(list(schema), "count", [])
+        aggregation = nw.len().alias(value_col)
+    else:
+        aggregation = getattr(nw.col(value_col), histfunc)()
+
+    # Aggregated rows are sorted by their first appearance in the data frame, which
+    # is the order in which px would have found the groups in the original rows.
+    df = (
+        args["data_frame"]
+        .with_row_index(order_name)
+        .group_by(group_cols)
+        .agg(nw.col(order_name).min(), aggregation)
+        .sort(order_name)
+        .select(group_cols + [value_col])
+    )
+    args[value_letter] = value_col
+    args["orientation"] = orientation
+    args["histfunc"] = histfunc
+    args["trace_histfunc"] = "sum" if histfunc == "count" else histfunc
+    return df
+
+
 def _escape_col_name(columns, col_name, extra):
     if columns is None:
         return col_name
@@ -1490,6 +1860,11 @@ def build_dataframe(args, constructor):
     # True if Ibis, DuckDB, Vaex, or implements __dataframe__
     needs_interchanging = False
 
+    # Flag that indicates if data_frame is a lazy frame (e.g. Polars LazyFrame), which
+    # is only collected once the columns (and possibly aggregations) to be plotted are
+    # known.
+    is_lazy = False
+
     # If data_frame is provided, we parse it into a narwhals DataFrame, while accounting
     # for compatibility with pandas specific paths (e.g. Index/MultiIndex case).
     if df_provided:
@@ -1532,6 +1907,15 @@ def build_dataframe(args, constructor):
             args["data_frame"] = series.to_frame()
             columns = args["data_frame"].columns
 
+        # data_frame is any lazy frame object natively supported via Narwhals.
+        elif isinstance(
+            data_frame := nw.from_native(args["data_frame"], pass_through=True),
+            nw.LazyFrame,
+        ):
+            args["data_frame"] = data_frame
+            is_lazy = True
+            columns = data_frame.collect_schema().names()
+
         # data_frame is PySpark: it does not support interchange protocol and it is not
         # integrated in Narwhals. We use its native method to convert it to pandas.
         elif hasattr(args["data_frame"], "toPandas"):
@@ -1577,12 +1961,12 @@ def build_dataframe(args, constructor):
     df_input: nw.DataFrame | None = args["data_frame"]
     index = (
         nw.maybe_get_index(df_input)
-        if df_provided and not needs_interchanging
+        if df_provided and not needs_interchanging and not is_lazy
         else None
     )
     native_namespace = (
         nw.get_native_namespace(df_input)
-        if df_provided and not needs_interchanging
+        if df_provided and not needs_interchanging and not is_lazy
         else None
     )
 
@@ -1672,19 +2056,29 @@ def build_dataframe(args, constructor):
             # but interchange-only objects (e.g. DuckDB) don't typically have a concept
             # of self-standing Series. It's more important to perform project pushdown
             # here seeing as we're materialising to an (eager) PyArrow table.
-            necessary_columns = {
-                i for i in args.values() if isinstance(i, str) and i in columns
-            }
-            for field in args:
-                if args[field] is not None and field in array_attrables:
-                    necessary_columns.update(i for i in args[field] if i in columns)
-            columns = list(necessary_columns)
+            columns = _get_necessary_columns(args, columns)
             args["data_frame"] = nw.from_native(
                 args["data_frame"].select(columns).to_arrow(), eager_only=True
             )
         import pyarrow as pa
 
         native_namespace = pa
+
+    # If the data_frame is lazy, we push the selection of the columns to be plotted
+    # (and, for histograms, the aggregation of their values) down to the backend, so
+    # that only the data which ends up in the figure is collected.
+    if is_lazy:
+        if not wide_mode:
+            schema = args["data_frame"].collect_schema()
+            columns = _get_necessary_columns(args, columns)
+            args["data_frame"] = args["data_frame"].select(columns)
+            if constructor == go.Histogram:
+                aggregated = _aggregate_histogram(args, schema)
+                if aggregated is not None:
+                    args["data_frame"] = aggregated
+                    columns = aggregated.collect_schema().names()
+        args["data_frame"] = args["data_frame"].collect()
+        native_namespace = nw.get_native_namespace(args["data_frame"])
     missing_bar_dim = None
     if (
         constructor in [go.Scatter, go.Bar, go.Funnel] + hist2d_types
@@ -1903,10 +2297,20 @@ def _check_dataframe_all_leaves(df: nw.DataFrame) -> None:
 def process_dataframe_hierarchy(args):
     """
     Build dataframe for sunburst, treemap, or icicle when the path argument is provided.
+
+    The rows are aggregated once by the full path, and the nodes of each level are
+    then rolled up from these leaves, which are usually much fewer than the rows.
     """
     df: nw.DataFrame = args["data_frame"]
     path = args["path"][::-1]
-    _check_dataframe_all_leaves(df[path[::-1]])
+    max_children = args.get("max_children")
+    if max_children is not None and (
+        not isinstance(max_children, int) or max_children < 1
+    ):
+        raise ValueError(
+            "`max_children` must be a positive integer. '%s' was provided."
+            % (max_children,)
+        )
     discrete_color = not _is_continuous(df, args["color"]) if args["color"] else False
 
     df = df.lazy()
@@ -1918,7 +2322,10 @@ def process_dataframe_hierarchy(args):
     )
     path = new_path
     # ------------ Define aggregation functions --------------------------------
+    # agg_f aggregates the rows into the leaves, and rollup_f aggregates the
+    # leaves into the nodes of the upper levels
     agg_f = {}
+    rollup_f = {}
     if args["values"]:
         try:
             df = df.with_columns(nw.col(args["values"]).cast(nw.Float64()))
@@ -1948,13 +2355,20 @@ def process_dataframe_hierarchy(args):
     # Since count_colname is always in agg_f, it can be used later to normalize color
     # in the continuous case after some gymnastic
     agg_f[count_colname] = nw.sum(count_colname)
+    rollup_f[count_colname] = nw.sum(count_colname)
 
     discrete_aggs = []
     continuous_aggs = []
 
-    n_unique_token = _generate_temporary_column_name(
+    token = _generate_temporary_column_name(
         n_bytes=16, columns=df.collect_schema().names()
     )
+    min_token, n_unique_token, null_token, len_token = (
+        token + "_min",
+        token + "_n_unique",
+        token + "_null",
+        token,
+    )
 
     # In theory, for discrete columns aggregation, we should have a way to do
     # `.agg(nw.col(x).unique())` in group_by and successively unpack/parse it as:
@@ -1973,31 +2387,44 @@ def process_dataframe_hierarchy(args):
     # df.groupby(path[i:]).agg(...)
     # ```
     # However this is not possible, therefore the following workaround is provided.
-    # We make two aggregations for the same column:
-    # - take the max value
-    # - take the number of unique values
-    # Finally, after the group by statement, it is unpacked via:
+    # The rows are aggregated into the leaves with:
+    # - the max value
+    # - the number of unique values (missing values included)
+    # - the number of missing values
+    # and the leaves are rolled up into their ancestors with:
+    # - the max and the min of the max values of the leaves
+    # - the max of the numbers of unique values of the leaves
+    # - the sum of the numbers of missing values
+    # A node has a unique value if all of its leaves have a unique value, which
+    # is the same for all of them (or missing for all of them). Finally, after the
+    # group by statements, it is unpacked via:
     # ```
-    # (nw.when(nw.col(col_n_unique) == 1)
-    # .then(nw.col(col_max_value))  # which is the unique value
+    # (nw.when((nw.col(col_n_unique) == 1)
+    #          & (((nw.col(col_n_null) == 0) & (nw.col(col_max) == nw.col(col_min)))
+    #             | (nw.col(col_n_null) == nw.col(n_rows))))
+    # .then(nw.col(col_max))  # which is the unique value
     # .otherwise(nw.lit("(?)"))
     # )
     # ```
+    def add_discrete_agg(col):
+        discrete_aggs.append(col)
+        agg_f[col] = nw.col(col).max()
+        agg_f[f"{col}{n_unique_token}"] = nw.col(col).n_unique()
+        agg_f[f"{col}{null_token}"] = nw.sum(f"{col}{null_token}")
+        rollup_f[col] = nw.col(col).max()
+        rollup_f[f"{col}{min_token}"] = nw.col(f"{col}{min_token}").min()
+        rollup_f[f"{col}{n_unique_token}"] = nw.col(f"{col}{n_unique_token}").max()
+        rollup_f[f"{col}{null_token}"] = nw.sum(f"{col}{null_token}")
 
     if args["color"]:
         if discrete_color:
-            discrete_aggs.append(args["color"])
-            agg_f[args["color"]] = nw.col(args["color"]).max()
-            agg_f[f'{args["color"]}{n_unique_token}'] = (
-                nw.col(args["color"])
-                .n_unique()
-                .alias(f'{args["color"]}{n_unique_token}')
-            )
+            add_discrete_agg(args["color"])
         else:
             # This first needs to be multiplied by `count_colname`
             continuous_aggs.append(args["color"])
 
             agg_f[args["color"]] = nw.sum(args["color"])
+            rollup_f[args["color"]] = nw.sum(args["color"])
 
     #  Other columns (for color, hover_data, custom_data etc.)
     cols = list(set(df.collect_schema().names()).difference(path))
@@ -2005,23 +2432,24 @@ def process_dataframe_hierarchy(args):
 
     for col in cols:  # for hover_data, custom_data etc.
         if col not in agg_f:
-            # Similar trick as above
-            discrete_aggs.append(col)
-            agg_f[col] = nw.col(col).max()
-            agg_f[f"{col}{n_unique_token}"] = (
-                nw.col(col).n_unique().alias(f"{col}{n_unique_token}")
-            )
+            add_discrete_agg(col)
+    agg_f[len_token] = nw.len()
+    rollup_f[len_token] = nw.sum(len_token)
+    df = df.with_columns(
+        nw.col(col).is_null().cast(nw.Int64()).alias(f"{col}{null_token}")
+        for col in discrete_aggs
+    )
     # Avoid collisions with reserved names - columns in the path have been copied already
     cols = list(set(cols) - set(["labels", "parent", "id"]))
+    state_cols = [c for c in rollup_f if c not in ["labels", "parent", "id"]]
     # ----------------------------------------------------------------------------
-    all_trees = []
 
     if args["color"] and not discrete_color:
         df = df.with_columns(
             (nw.col(args["color"]) * nw.col(count_colname)).alias(args["color"])
         )
 
-    def post_agg(dframe: nw.LazyFrame, continuous_aggs, discrete_aggs) -> nw.LazyFrame:
+    def post_agg(dframe: nw.DataFrame, continuous_aggs, discrete_aggs) -> nw.DataFrame:
         """
         - continuous_aggs is either [] or [args["color"]]
         - discrete_aggs is either [args["color"], <rest_of_cols>] or [<rest_of cols>]
@@ -2030,21 +2458,82 @@ def process_dataframe_hierarchy(args):
             *[nw.col(col) / nw.col(count_colname) for col in continuous_aggs],
             *[
                 (
-                    nw.when(nw.col(f"{col}{n_unique_token}") == 1)
+                    nw.when(
+                        (nw.col(f"{col}{n_unique_token}") == 1)
+                        & (
+                            (
+                                (nw.col(f"{col}{null_token}") == 0)
+                                & (
+                                    nw.col(col) == nw.col(f"{col}{min_token}")
+                                ).fill_null(False)
+                            )
+                            | (nw.col(f"{col}{null_token}") == nw.col(len_token))
+                        )
+                    )
                     .then(nw.col(col))
                     .otherwise(nw.lit("(?)"))
                     .alias(col)
                 )
                 for col in discrete_aggs
             ],
-        ).drop([f"{col}{n_unique_token}" for col in discrete_aggs])
+        )
 
-    for i, level in enumerate(path):
-        dfg = (
-            df.group_by(path[i:], drop_null_keys=True)
-            .agg(**agg_f)
-            .pipe(post_agg, continuous_aggs, discrete_aggs)
+    def cap_children(df_tree: nw.DataFrame) -> nw.DataFrame:
+        """
+        Keeps the `max_children` nodes with the largest values of each parent, and
+        rolls up the other ones into a single "(other)" node
+        """
+        import numpy as np
+
+        df_tree = nw.maybe_reset_index(
+            df_tree.sort(["parent", count_colname], descending=[False, True])
+        )
+        parents = df_tree.get_column("parent").to_numpy()
+        positions = np.arange(len(parents))
+        is_first = np.ones(len(parents), dtype=bool)
+        is_first[1:] = parents[1:] != parents[:-1]
+        rank = positions - np.maximum.accumulate(np.where(is_first, positions, 0))
+        is_kept = nw.new_series(
+            name=token,
+            values=rank < max_children,
+            dtype=nw.Boolean(),
+            native_namespace=nw.get_native_namespace(df_tree),
         )
+        others = df_tree.filter(~is_kept)
+        df_tree = df_tree.filter(is_kept).select("labels", "parent", "id", *state_cols)
+        if len(others) == 0:
+            return df_tree
+        others = (
+            others.group_by("parent")
+            .agg(**{col: rollup_f[col] for col in state_cols})
+            .with_columns(labels=nw.lit("(other)"))
+            .with_columns(
+                id=nw.concat_str(
+                    [nw.col("parent"), nw.col("labels")], separator="/"
+                ).str.replace("^/", "")
+            )
+            .select("labels", "parent", "id", *state_cols)
+        )
+        return nw.concat([df_tree, others], how="vertical")
+
+    leaves = (
+        df.group_by(path, drop_null_keys=False)
+        .agg(**agg_f)
+        .collect()
+        .with_columns(nw.col(col).alias(f"{col}{min_token}") for col in discrete_aggs)
+    )
+    # The leaves have the unique paths of the rows
+    _check_dataframe_all_leaves(leaves.select(path[::-1]))
+
+    all_trees = []
+    parent_ids = None
+    # From the root to the leaves, so that the children of the nodes rolled up
+    # into "(other)" can be dropped
+    for i in range(len(path) - 1, -1, -1):
+        level = path[i]
+        dfg = leaves.filter(~nw.col(level).is_null())
+        if i > 0:
+            dfg = dfg.group_by(path[i:]).agg(**rollup_f)
 
         # Path label massaging
         df_tree = dfg.with_columns(
@@ -2083,9 +2572,19 @@ def process_dataframe_hierarchy(args):
             parent=nw.col("parent").str.replace("/?$", "").str.replace("^/?", "")
         )
 
-        all_trees.append(df_tree.select(*["labels", "parent", "id", *cols]))
+        if max_children is not None:
+            if parent_ids is not None:
+                df_tree = df_tree.filter(nw.col("parent").is_in(parent_ids))
+            df_tree = cap_children(df_tree)
+            parent_ids = df_tree.get_column("id").to_list()
 
-    df_all_trees = nw.maybe_reset_index(nw.concat(all_trees, how="vertical").collect())
+        all_trees.append(
+            df_tree.pipe(post_agg, continuous_aggs, discrete_aggs).select(
+                *["labels", "parent", "id", *cols]
+            )
+        )
+
+    df_all_trees = nw.maybe_reset_index(nw.concat(all_trees[::-1], how="vertical"))
 
     # we want to make sure than (?) is the first color of the sequence
     if args["color"] and discrete_color:
@@ -2257,6 +2756,9 @@ def infer_config(args, constructor, trace_patch, layout_patch):
         if constructor == go.Histogram:
             if has_x and has_y and args["histfunc"] is None:
                 args["histfunc"] = trace_patch["histfunc"] = "sum"
+            if "trace_histfunc" in args:
+                # the data frame was aggregated in build_dataframe
+                trace_patch["histfunc"] = args["trace_histfunc"]
 
             orientation = args["orientation"]
             nbins = args["nbins"]
@@ -2381,6 +2883,17 @@ def infer_config(args, constructor, trace_patch, layout_patch):
     if "trendline_options" in args and args["trendline_options"] is None:
         args["trendline_options"] = dict()
 
+    if args.get("frame_encoding") not in [None, "full", "delta"]:
+        raise ValueError(
+            "`frame_encoding` must be one of None, 'full' or 'delta'. "
+            + "'%s' was provided." % args["frame_encoding"]
+        )
+
+    if args.get("downsample") is not None:
+        if args.get("max_points") is None:
+            args["max_points"] = 10000
+        validate_downsample_args(args["max_points"], args["downsample"])
+
     if "ecdfnorm" in args:
         if args.get("ecdfnorm", None) not in [None, "percent", "probability"]:
             raise ValueError(
@@ -2409,7 +2922,11 @@ def get_groups_and_orders(args, grouper):
 
     `groups` is the dicts of groups, ordered by the order above. Its keys are
     tuples like [("value1", ""), ("value2", "")] where each tuple contains the name
-    of a single dimension-group
+    of a single dimension-group, and its values are the slices of the rows of `df`
+    in each group
+
+    `df` is the data frame, with its rows sorted by group so that each group is a
+    contiguous slice of rows
     """
     orders = {} if "category_orders" not in args else args["category_orders"].copy()
     df: nw.DataFrame = args["data_frame"]
@@ -2435,21 +2952,13 @@ def get_groups_and_orders(args, grouper):
 
     if len(single_group_name) == len(grouper):
         # we have a single group, so we can skip all group-by operations!
-        groups = {tuple(single_group_name): df}
+        groups = {tuple(single_group_name): slice(None)}
     else:
         required_grouper = [group for group in orders if group in grouper]
-        grouped = dict(df.group_by(required_grouper, drop_null_keys=True).__iter__())
-
-        sorted_group_names = sorted(
-            grouped.keys(),
-            key=lambda values: [
-                orders[group].index(value) if value in orders[group] else -1
-                for group, value in zip(required_grouper, values)
-            ],
-        )
+        df, group_slices = _sort_groups(df, required_grouper, orders)
 
         # calculate the full group_names by inserting "" in the tuple index for one_group groups
-        full_sorted_group_names = [
+        groups = {
             tuple(
                 [
                     ""
@@ -2457,14 +2966,60 @@ def get_groups_and_orders(args, grouper):
                     else sub_group_names[required_grouper.index(col)]
                     for col in grouper
                 ]
-            )
-            for sub_group_names in sorted_group_names
-        ]
-
-        groups = {
-            sf: grouped[s] for sf, s in zip(full_sorted_group_names, sorted_group_names)
+            ): rows
+            for sub_group_names, rows in group_slices.items()
         }
-    return groups, orders
+    return df, groups, orders
+
+
+def _sort_groups(df, grouper, orders):
+    """
+    Sorts the rows of `df` by group, in the order of the values of the `grouper`
+    columns in `orders`, so that each group is a contiguous slice of rows. Rows
+    within a group keep their order, and rows with null values in any of the
+    `grouper` columns are dropped.
+
+    Returns the sorted data frame and a dict from group names (tuples of the values
+    of the `grouper` columns) to slices of its rows, ordered like the groups.
+    """
+    import numpy as np
+
+    df = df.drop_nulls(subset=grouper)
+    codes = []
+    values_by_code = []
+    for col in grouper:
+        # code the values of each column by their position in orders
+        positions = {}
+        for i, value in enumerate(orders[col]):
+            positions.setdefault(value, i)
+        series = df.get_column(col)
+        uniques = series.unique(maintain_order=True).to_list()
+        uniques_positions = [positions[value] for value in uniques]
+        codes.append(
+            series.replace_strict(
+                uniques, uniques_positions, return_dtype=nw.Int64
+            ).to_numpy()
+        )
+        values_by_code.append(dict(zip(uniques_positions, uniques)))
+
+    if len(df) == 0:
+        return df, {}
+
+    # np.lexsort is stable, and sorts by its last key first
+    order = np.lexsort(codes[::-1])
+    df = df[order]
+    codes = np.stack(codes)[:, order]
+    starts = np.flatnonzero(np.any(codes[:, 1:] != codes[:, :-1], axis=0)) + 1
+    starts = [0] + starts.tolist()
+    ends = starts[1:] + [len(order)]
+
+    group_slices = {}
+    for start, end in zip(starts, ends):
+        group_name = tuple(
+            values[code] for values, code in zip(values_by_code, codes[:, start])
+        )
+        group_slices[group_name] = slice(start, end)
+    return df, group_slices
 
 
 def make_figure(args, constructor, trace_patch=None, layout_patch=None):
@@ -2489,7 +3044,7 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
         args, constructor, trace_patch, layout_patch
     )
     grouper = [x.grouper or one_group for x in grouped_mappings] or [one_group]
-    groups, orders = get_groups_and_orders(args, grouper)
+    df, groups, orders = get_groups_and_orders(args, grouper)
 
     col_labels = []
     row_labels = []
@@ -2518,7 +3073,13 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
     trendline_rows = []
     trace_name_labels = None
     facet_col_wrap = args.get("facet_col_wrap", 0)
-    for group_name, group in groups.items():
+    # the columns of all the groups are sliced from the same arrays, unless the
+    # groups are transformed below
+    column_arrays = ColumnArrays(df) if "ecdfmode" not in args else None
+    # the properties mapped from the values of each group's grouping columns
+    mapping_updates = {}
+    for group_name, rows in groups.items():
+        group = df[rows]
         mapping_labels = OrderedDict()
         trace_name_labels = OrderedDict()
         frame_name = ""
@@ -2536,9 +3097,10 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
             trace_names_by_frame[frame_name] = set()
         trace_names = trace_names_by_frame[frame_name]
 
-        for trace_spec in trace_specs:
-            # Create the trace
-            trace = trace_spec.constructor(name=trace_name)
+        for spec_index, trace_spec in enumerate(trace_specs):
+            # The properties of the trace are collected as a list of updates, which
+            # are merged and validated at once when the trace is constructed
+            trace_updates = [dict(name=trace_name)]
             if trace_spec.constructor not in [
                 go.Parcats,
                 go.Parcoords,
@@ -2552,9 +3114,11 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
                 go.Treemap,
                 go.Icicle,
             ]:
-                trace.update(
-                    legendgroup=trace_name,
-                    showlegend=(trace_name != "" and trace_name not in trace_names),
+                trace_updates.append(
+                    dict(
+                        legendgroup=trace_name,
+                        showlegend=(trace_name != "" and trace_name not in trace_names),
+                    )
                 )
 
             # Set 'offsetgroup' only in group barmode (or if no barmode is set)
@@ -2562,50 +3126,26 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
             if trace_spec.constructor in [go.Bar, go.Box, go.Violin, go.Histogram] and (
                 barmode == "group" or barmode is None
             ):
-                trace.update(alignmentgroup=True, offsetgroup=trace_name)
+                trace_updates.append(dict(alignmentgroup=True, offsetgroup=trace_name))
             trace_names.add(trace_name)
 
             # Init subplot row/col
-            trace._subplot_row = 1
-            trace._subplot_col = 1
+            subplot_row = 1
+            subplot_col = 1
 
             for i, m in enumerate(grouped_mappings):
                 val = group_name[i]
-                try:
-                    m.updater(trace, m.val_map[val])  # covers most cases
-                except ValueError:
-                    # this catches some odd cases like marginals
-                    if (
-                        trace_spec != trace_specs[0]
-                        and (
-                            trace_spec.constructor in [go.Violin, go.Box]
-                            and m.variable in ["symbol", "pattern", "dash"]
-                        )
-                        or (
-                            trace_spec.constructor in [go.Histogram]
-                            and m.variable in ["symbol", "dash"]
-                        )
-                    ):
-                        pass
-                    elif (
-                        trace_spec != trace_specs[0]
-                        and trace_spec.constructor in [go.Histogram]
-                        and m.variable == "color"
-                    ):
-                        trace.update(marker=dict(color=m.val_map[val]))
-                    elif (
-                        trace_spec.constructor
-                        in [go.Choropleth, go.Choroplethmap, go.Choroplethmapbox]
-                        and m.variable == "color"
-                    ):
-                        trace.update(
-                            z=[1] * len(group),
-                            colorscale=[m.val_map[val]] * 2,
-                            showscale=False,
-                            showlegend=True,
-                        )
+                key = (spec_index, i, val)
+                if key not in mapping_updates:
+                    update, cacheable = make_mapping_update(
+                        trace_spec, trace_specs, m, val, len(group)
+                    )
+                    if not cacheable:
+                        trace_updates.append(update)
                     else:
-                        raise
+                        mapping_updates[key] = update
+                if key in mapping_updates:
+                    trace_updates.append(mapping_updates[key])
 
                 # Find row for trace, handling facet_row and marginal_x
                 if m.facet == "row":
@@ -2632,16 +3172,17 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
                         col = 1
 
                 if row > 1:
-                    trace._subplot_row = row
+                    subplot_row = row
 
                 if col > 1:
-                    trace._subplot_col = col
+                    subplot_col = col
             if (
                 trace_specs[0].constructor == go.Histogram2dContour
                 and trace_spec.constructor == go.Box
-                and trace.line.color
             ):
-                trace.update(marker=dict(color=trace.line.color))
+                line_color = merge_trace_updates(trace_updates).get("line", {})
+                if line_color.get("color"):
+                    trace_updates.append(dict(marker=dict(color=line_color["color"])))
 
             if "ecdfmode" in args:
                 base = args["x"] if args["orientation"] == "v" else args["y"]
@@ -2664,9 +3205,19 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
                     group = group.with_columns((nw.col(var) / group_sum) * 100.0)
 
             patch, fit_results = make_trace_kwargs(
-                args, trace_spec, group, mapping_labels.copy(), sizeref
+                args,
+                trace_spec,
+                group,
+                mapping_labels.copy(),
+                sizeref,
+                column_arrays.slice(rows) if column_arrays is not None else None,
             )
-            trace.update(patch)
+            trace_updates.append(patch)
+
+            # Create the trace
+            trace = trace_spec.constructor(merge_trace_updates(trace_updates))
+            trace._subplot_row = subplot_row
+            trace._subplot_col = subplot_col
             if fit_results is not None:
                 trendline_rows.append(mapping_labels.copy())
                 trendline_rows[-1]["px_fit_results"] = fit_results
@@ -2705,16 +3256,17 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
     layout_patch["legend"] = dict(tracegroupgap=0)
     if trace_name_labels:
         layout_patch["legend"]["title_text"] = ", ".join(trace_name_labels)
+    template_defaults = pio.templates._get_flat_defaults(args["template"])
     if args["title"]:
         layout_patch["title_text"] = args["title"]
-    elif args["template"].layout.margin.t is None:
+    elif template_defaults.get("layout.margin.t") is None:
         layout_patch["margin"] = {"t": 60}
     if args["subtitle"]:
         layout_patch["title_subtitle_text"] = args["subtitle"]
     if (
         "size" in args
         and args["size"]
-        and args["template"].layout.legend.itemsizing is None
+        and template_defaults.get("layout.legend.itemsizing") is None
     ):
         layout_patch["legend"]["itemsizing"] = "constant"
 
@@ -2747,13 +3299,25 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
                 trace._subplot_col,
             )
 
+    # Downsample the traces of every frame before the figure takes the ones
+    # of the first frame
+    if args.get("downsample") is not None:
+        for frame in frame_list:
+            for trace in frame["data"]:
+                downsample_trace(trace, args["max_points"], args["downsample"])
+
     # Add traces, layout and frames to figure
-    fig.add_traces(frame_list[0]["data"] if len(frame_list) > 0 else [])
+    # The traces were built for this figure, which takes ownership of them
+    fig._add_traces(frame_list[0]["data"] if len(frame_list) > 0 else [], adopt=True)
     fig.update_layout(layout_patch)
     if "template" in args and args["template"] is not None:
-        fig.update_layout(template=args["template"], overwrite=True)
+        # Share the (already validated) template instead of copying it
+        fig._share_layout_template(args["template"])
     for f in frame_list:
         f["name"] = str(f["name"])
+
+    if args.get("frame_encoding") == "delta" and len(frames) > 1:
+        encode_frame_deltas(frame_list)
     fig.frames = frame_list if len(frames) > 1 else []
 
     if args.get("trendline") and args.get("trendline_scope", "trace") == "overall":
@@ -2777,16 +3341,7 @@ def make_figure(args, constructor, trace_patch=None, layout_patch=None):
         if fit_results is not None:
             trendline_rows.append(dict(px_fit_results=fit_results))
 
-    if trendline_rows:
-        try:
-            import pandas as pd
-
-            fig._px_trendlines = pd.DataFrame(trendline_rows)
-        except ImportError:
-            msg = "Trendlines require pandas to be installed."
-            raise NotImplementedError(msg)
-    else:
-        fig._px_trendlines = []
+    fig._px_trendlines = trendline_rows
 
     configure_axes(args, constructor, fig, orders)
     configure_animation_controls(args, constructor, fig)
@@ -264,6 +264,13 @@ docs = dict(
         colref_desc,
         "Values from this column or array_like are used to provide object-constancy across animation frames: rows with matching `animation_group`s will be treated as if they describe the same object in each frame.",
     ],
+    frame_encoding=[
+        "str",
+        "One of `'full'` or `'delta'`, default `'full'`",
+        "Controls how the traces of animation frames are stored in `fig.frames`.",
+        "With `'full'`, every frame holds all the properties of its traces.",
+        "With `'delta'`, properties which have the same value in every frame (e.g. `hovertemplate`, marker settings or `x` arrays shared by all the frames) are only stored in the traces of the figure, and the frames only hold the properties which change from frame to frame, which makes animations with many frames smaller and faster to serialize.",
+    ],
     symbol_sequence=[
         "list of str",
         "Strings should define valid plotly.js symbols.",
@@ -438,6 +445,17 @@ docs = dict(
         "`'webgl'` is likely necessary for acceptable performance above 1000 points but rasterizes part of the output. ",
         "`'auto'` uses heuristics to choose the mode.",
     ],
+    downsample=[
+        "str",
+        "One of `'lttb'` or `'minmax'` (default `None`)",
+        "If set, the traces with more than `max_points` points are downsampled to at most `max_points` points which preserve their shape:",
+        "`'lttb'` keeps the points selected by the Largest-Triangle-Three-Buckets algorithm, and `'minmax'` keeps the points with the minimum and maximum values of consecutive buckets of points.",
+        "The number of points of each trace before it was downsampled is recorded in its `meta.downsample.original_points`.",
+    ],
+    max_points=[
+        "int (default `10000`)",
+        "Maximum number of points of each trace when `downsample` is set.",
+    ],
     direction=[
         "str",
         "One of '`counterclockwise'` or `'clockwise'`. Default is `'clockwise'`",
@@ -587,6 +605,13 @@ docs = dict(
         "Sets the number of rendered sectors from any given `level`. Set `maxdepth` to -1 to render all the"
         "levels in the hierarchy.",
     ],
+    max_children=[
+        "int",
+        "Positive integer",
+        "Only used when `path` is provided.",
+        "If set, only the `max_children` children with the largest values are kept under each parent,"
+        "the others being merged into a single `'(other)'` child.",
+    ],
     ecdfnorm=[
         "string or `None` (default `'probability'`)",
         "One of `'probability'` or `'percent'`",
@@ -1,4 +1,5 @@
 import plotly.graph_objs as go
+import plotly.io as pio
 from _plotly_utils.basevalidators import ColorscaleValidator
 from ._core import apply_default_cascade, init_figure, configure_animation_controls
 from .imshow_utils import rescale_intensity, _integer_ranges, _integer_types
@@ -553,7 +554,10 @@ def imshow(
             layout[attr_name] = args[attr_name]
     if args["title"]:
         layout["title_text"] = args["title"]
-    elif args["template"].layout.margin.t is None:
+    elif (
+        pio.templates._get_flat_defaults(args["template"]).get("layout.margin.t")
+        is None
+    ):
         layout["margin"] = {"t": 60}
 
     frame_list = []
@@ -601,5 +605,5 @@ def imshow(
     if labels["y"]:
         fig.update_yaxes(title_text=labels["y"], col=1)
     configure_animation_controls(args, go.Image, fig)
-    fig.update_layout(template=args["template"], overwrite=True)
+    fig._share_layout_template(args["template"])
     return fig
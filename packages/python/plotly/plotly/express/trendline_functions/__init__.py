@@ -14,11 +14,13 @@ __all__ = ["ols", "lowess", "rolling", "ewm", "expanding"]
 def ols(trendline_options, x_raw, x, y, x_label, y_label, non_missing):
     """Ordinary Least Squares (OLS) trendline function
 
-    Requires `statsmodels` to be installed.
-
     This trendline function causes fit results to be stored within the figure,
-    accessible via the `plotly.express.get_trendline_results` function. The fit results
-    are the output of the `statsmodels.api.OLS` function.
+    accessible via the `plotly.express.get_trendline_results` function. By default the
+    fit is computed with `numpy` and the fit results are lightweight objects exposing
+    `params`, `rsquared`, `nobs` and `fittedvalues`; any other attribute (e.g.
+    `summary()` or `pvalues`) is looked up on the equivalent `statsmodels.api.OLS`
+    results object, which is only computed on first access and therefore requires
+    `statsmodels` to be installed.
 
     Valid keys for the `trendline_options` dict are:
 
@@ -28,10 +30,13 @@ def ols(trendline_options, x_raw, x, y, x_label, y_label, non_missing):
     - `log_x` and `log_y` (`bool`, default `False`): if `True` the OLS is computed with
     respect to the base 10 logarithm of the input. Note that this means no zeros can
     be present in the input.
+
+    - `engine` (`str`, default `"numpy"`): if `"statsmodels"`, the fit is computed
+    with `statsmodels.api.OLS` directly and the fit results are `statsmodels` objects.
     """
     import numpy as np
 
-    valid_options = ["add_constant", "log_x", "log_y"]
+    valid_options = ["add_constant", "log_x", "log_y", "engine"]
     for k in trendline_options.keys():
         if k not in valid_options:
             raise ValueError(
@@ -39,11 +44,10 @@ def ols(trendline_options, x_raw, x, y, x_label, y_label, non_missing):
                 % (", ".join(valid_options), k)
             )
 
-    import statsmodels.api as sm
-
     add_constant = trendline_options.get("add_constant", True)
     log_x = trendline_options.get("log_x", False)
     log_y = trendline_options.get("log_y", False)
+    engine = _validate_engine("OLS", trendline_options)
 
     if log_y:
         if np.any(y <= 0):
@@ -59,9 +63,14 @@ def ols(trendline_options, x_raw, x, y, x_label, y_label, non_missing):
             )
         x = np.log10(x)
         x_label = "log10(%s)" % x_label
-    if add_constant:
-        x = sm.add_constant(x)
-    fit_results = sm.OLS(y, x, missing="drop").fit()
+    if engine == "statsmodels":
+        import statsmodels.api as sm
+
+        if add_constant:
+            x = sm.add_constant(x)
+        fit_results = sm.OLS(y, x, missing="drop").fit()
+    else:
+        fit_results = OLSResults(y, x, add_constant=add_constant)
     y_out = fit_results.predict()
     if log_y:
         y_out = np.power(10, y_out)
@@ -84,15 +93,21 @@ def ols(trendline_options, x_raw, x, y, x_label, y_label, non_missing):
 def lowess(trendline_options, x_raw, x, y, x_label, y_label, non_missing):
     """LOcally WEighted Scatterplot Smoothing (LOWESS) trendline function
 
-    Requires `statsmodels` to be installed.
+    By default the smoothing is computed with a vectorized `numpy` implementation of
+    the same algorithm as `statsmodels.api.nonparametric.lowess` (local linear fits
+    with tricube weights and 3 robustifying iterations).
 
     Valid keys for the `trendline_options` dict are:
 
     - `frac` (`float`, default `0.6666666`): the `frac` parameter from the
     `statsmodels.api.nonparametric.lowess` function
+
+    - `engine` (`str`, default `"numpy"`): if `"statsmodels"`, the smoothing is
+    computed with `statsmodels.api.nonparametric.lowess`, which requires `statsmodels`
+    to be installed.
     """
 
-    valid_options = ["frac"]
+    valid_options = ["frac", "engine"]
     for k in trendline_options.keys():
         if k not in valid_options:
             raise ValueError(
@@ -100,14 +115,204 @@ def lowess(trendline_options, x_raw, x, y, x_label, y_label, non_missing):
                 % (", ".join(valid_options), k)
             )
 
-    import statsmodels.api as sm
-
     frac = trendline_options.get("frac", 0.6666666)
-    y_out = sm.nonparametric.lowess(y, x, missing="drop", frac=frac)[:, 1]
+    engine = _validate_engine("LOWESS", trendline_options)
+    if engine == "statsmodels":
+        import statsmodels.api as sm
+
+        y_out = sm.nonparametric.lowess(y, x, missing="drop", frac=frac)[:, 1]
+    else:
+        y_out = _lowess(y, x, frac=frac)
     hover_header = "<b>LOWESS trendline</b><br><br>"
     return y_out, hover_header, None
 
 
+def _validate_engine(name, trendline_options):
+    engine = trendline_options.get("engine", "numpy")
+    if engine not in ("numpy", "statsmodels"):
+        raise ValueError(
+            "%s trendline_options 'engine' must be one of [numpy, statsmodels] "
+            "but got '%s'" % (name, engine)
+        )
+    return engine
+
+
+class OLSResults(object):
+    """
+    Results of an Ordinary Least Squares fit computed with `numpy`.
+
+    The attributes needed to draw and annotate a trendline (`params`,
+    `rsquared`, `nobs`, `fittedvalues` and `predict()`) are computed directly.
+    Any other attribute is delegated to the results of the equivalent
+    `statsmodels.api.OLS(...).fit()` call, which is computed (and
+    `statsmodels` imported) the first time such an attribute is accessed.
+    """
+
+    def __init__(self, y, x, add_constant=True):
+        import numpy as np
+
+        y = np.asarray(y, dtype="float64")
+        x = np.asarray(x, dtype="float64")
+        mask = ~(np.isnan(y) | np.isnan(x))
+        y = y[mask]
+        x = x[mask]
+
+        # Like statsmodels.api.add_constant, don't add a constant column when
+        # x is already a non-zero constant
+        has_constant = len(x) > 0 and np.ptp(x) == 0 and np.all(x != 0)
+        if add_constant and not has_constant:
+            exog = np.column_stack([np.ones_like(x), x])
+            has_constant = True
+        else:
+            exog = x[:, np.newaxis]
+
+        self._endog = y
+        self._exog = exog
+        self._add_constant = add_constant
+        self._statsmodels_results = None
+
+        # adding 0.0 turns -0.0 into 0.0 for display in the hover header
+        self.params = np.linalg.lstsq(exog, y, rcond=None)[0] + 0.0
+        self.fittedvalues = exog @ self.params
+        self.nobs = float(len(y))
+
+        ssr = np.sum((y - self.fittedvalues) ** 2)
+        if has_constant:
+            tss = np.sum((y - np.mean(y)) ** 2)
+        else:
+            tss = np.sum(y**2)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.rsquared = 1 - ssr / tss
+
+    def predict(self, exog=None):
+        """
+        Return the fitted values at the rows of `exog`, which defaults to the
+        design matrix the model was fitted on.
+        """
+        if exog is None:
+            return self.fittedvalues
+        return exog @ self.params
+
+    def _get_statsmodels_results(self):
+        if self._statsmodels_results is None:
+            import statsmodels.api as sm
+
+            self._statsmodels_results = sm.OLS(self._endog, self._exog).fit()
+        return self._statsmodels_results
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self._get_statsmodels_results(), name)
+
+    def __repr__(self):
+        return "OLSResults(params=%s, rsquared=%s)" % (
+            list(self.params),
+            self.rsquared,
+        )
+
+
+class _Reiterable(object):
+    def __init__(self, generator_function):
+        self._generator_function = generator_function
+
+    def __iter__(self):
+        return self._generator_function()
+
+
+def _lowess(y, x, frac=2.0 / 3.0, it=3, chunk_size=2**16, cache_size=2**24):
+    """
+    Vectorized numpy port of the statsmodels LOWESS algorithm (with `delta=0`).
+
+    `x` must be sorted in increasing order. Missing values are dropped and the
+    smoothed values of the remaining points are returned, in order. Neighborhoods
+    are processed `chunk_size` elements at a time to stay cache-friendly, and
+    their distance weights are kept across iterations when there are at most
+    `cache_size` of them.
+    """
+    import numpy as np
+
+    y = np.asarray(y, dtype="float64")
+    x = np.asarray(x, dtype="float64")
+    mask = ~(np.isnan(y) | np.isnan(x))
+    y = y[mask]
+    x = x[mask]
+
+    n = len(x)
+    if not 0 <= frac <= 1:
+        raise ValueError("Lowess `frac` must be in the range [0,1]!")
+    if n == 0:
+        return y
+    k = min(max(int(frac * n + 1e-10), 2), n)
+
+    # The k-nearest-neighbors window of x[i] starts at the first index l such
+    # that x[i] <= (x[l] + x[l + k]) / 2, which is a binary search since the
+    # window midpoints are sorted
+    left = np.searchsorted(x[: n - k] + x[k:], 2 * x, side="left")
+    left = np.minimum(left, n - k)
+    radius = np.maximum(x - x[left], x[left + k - 1] - x)
+
+    # Tied x values share the fit of the first point of the tie
+    first_of_tie = np.searchsorted(x, x, side="left")
+
+    offsets = np.arange(k)
+    rows_per_chunk = max(1, chunk_size // k)
+
+    def neighborhoods():
+        # yields the neighborhood of each point (in chunks of rows), with
+        # coordinates relative to that point, which keeps the weighted moments
+        # below free of cancellation errors, and the tricube distance weights
+        for start in range(0, n, rows_per_chunk):
+            stop = min(start + rows_per_chunk, n)
+            window = left[start:stop, np.newaxis] + offsets
+            d = x[window] - x[start:stop, np.newaxis]
+            with np.errstate(divide="ignore", invalid="ignore"):
+                tricube = np.abs(d) / radius[start:stop, np.newaxis]
+            tricube **= 3
+            np.subtract(1, tricube, out=tricube)
+            tricube **= 3
+            yield start, stop, window, d, tricube
+
+    # The distance weights are the same for all iterations, so they are only
+    # computed once unless that would take too much memory
+    if n * k <= cache_size:
+        neighborhoods = list(neighborhoods())
+    else:
+        neighborhoods = _Reiterable(neighborhoods)
+
+    resid_weights = np.ones(n)
+    y_fit = np.empty(n)
+    for iteration in range(it + 1):
+        for start, stop, window, d, tricube in neighborhoods:
+            if iteration:
+                weights = tricube * resid_weights[window]
+            else:
+                weights = tricube
+            y_j = y[window]
+            weights_d = weights * d
+            reg_ok = np.count_nonzero(weights > 1e-12, axis=1) >= 2
+            with np.errstate(divide="ignore", invalid="ignore"):
+                sum_weights = np.sum(weights, axis=1)
+                mean_d = np.sum(weights_d, axis=1) / sum_weights
+                mean_y = np.einsum("ij,ij->i", weights, y_j) / sum_weights
+                mean_dy = np.einsum("ij,ij->i", weights_d, y_j) / sum_weights
+                sqdev_d = np.einsum("ij,ij->i", weights_d, d) / sum_weights
+            sqdev_d = np.fmax(sqdev_d - mean_d**2, 1e-12)
+            chunk_fit = mean_y - mean_d * (mean_dy - mean_d * mean_y) / sqdev_d
+            y_fit[start:stop] = np.where(reg_ok, chunk_fit, y[start:stop])
+        y_fit = y_fit[first_of_tie]
+
+        std_resid = np.abs(y - y_fit)
+        median = np.median(std_resid)
+        if median == 0:
+            std_resid = (std_resid > 0).astype("float64")
+        else:
+            std_resid /= 6.0 * median
+        resid_weights = (1 - np.minimum(std_resid, 1) ** 2) ** 2
+
+    return y_fit
+
+
 def _pandas(mode, trendline_options, x_raw, y, non_missing):
     import numpy as np
 
@@ -54,6 +54,7 @@ def create_annotated_heatmap(
     font_colors=None,
     showscale=False,
     reversescale=False,
+    text_mode="auto",
     **kwargs,
 ):
     """
@@ -79,6 +80,14 @@ def create_annotated_heatmap(
         depending on the heatmap's colorscale.
     :param (bool) showscale: Display colorscale. Default = False
     :param (bool) reversescale: Reverse colorscale. Default = False
+    :param (str) text_mode: 'annotations' to add a layout annotation for each
+        cell, 'trace' to render the text of the cells with the text and
+        texttemplate of the heatmap (and with a scatter trace in 'text' mode
+        for the cells with max_text_color), which is much faster to build and render
+        for large matrices, or 'auto' to use 'trace' for matrices of more than
+        1000 cells. 'auto' uses annotations when text, texttemplate or
+        textfont is passed through kwargs, and 'trace' cannot be combined with
+        them. Default = 'auto'
     :param kwargs: kwargs passed through plotly.graph_objs.Heatmap.
         These kwargs describe other attributes about the annotated Heatmap
         trace such as the colorscale. For more information on valid kwargs
@@ -105,9 +114,24 @@ def create_annotated_heatmap(
     colorscale_validator = ColorscaleValidator()
     colorscale = colorscale_validator.validate_coerce(colorscale)
 
-    annotations = _AnnotatedHeatmap(
+    annotated_heatmap = _AnnotatedHeatmap(
         z, x, y, annotation_text, colorscale, font_colors, reversescale, **kwargs
-    ).make_annotations()
+    )
+    use_text_trace = utils.use_text_trace(text_mode, sum(len(row) for row in z))
+    # The text trace is drawn with the text, texttemplate and textfont of the
+    # heatmap, so it cannot be used when the caller passed their own
+    text_kwargs = sorted(set(kwargs).intersection(("text", "texttemplate", "textfont")))
+    if use_text_trace and text_kwargs:
+        if text_mode == "trace":
+            raise exceptions.PlotlyError(
+                "text_mode='trace' cannot be used with the {} argument(s), "
+                "use text_mode='annotations' instead".format(", ".join(text_kwargs))
+            )
+        use_text_trace = False
+    if use_text_trace:
+        annotations = []
+    else:
+        annotations = annotated_heatmap.make_annotations()
 
     if x or y:
         trace = dict(
@@ -142,7 +166,10 @@ def create_annotated_heatmap(
             yaxis=dict(ticks="", ticksuffix="  ", showticklabels=False),
         )
 
-    data = [trace]
+    if use_text_trace:
+        data = annotated_heatmap.make_text_traces(trace)
+    else:
+        data = [trace]
 
     return graph_objs.Figure(data=data, layout=layout)
 
@@ -307,3 +334,55 @@ class _AnnotatedHeatmap(object):
                     )
                 )
         return annotations
+
+    def make_text_traces(self, trace):
+        """
+        Get the heatmap traces rendering the text of each cell
+
+        The text of the cells with values < zmid is rendered by the text and
+        texttemplate of `trace` with min_text_color, and the text of the other
+        cells by a scatter trace in 'text' mode with max_text_color.
+
+        :rtype (list[dict]) traces: `trace` with the text of its cells, and the
+            scatter trace if the two text colors differ
+        """
+        min_text_color, max_text_color = _AnnotatedHeatmap.get_text_color(self)
+        text = np.array(
+            [[str(val) for val in row] for row in self.annotation_text], dtype=object
+        )
+        if min_text_color == max_text_color:
+            return [
+                dict(
+                    trace,
+                    text=text.tolist(),
+                    texttemplate="%{text}",
+                    textfont=dict(color=min_text_color),
+                )
+            ]
+
+        is_min = np.array(self.z, dtype=float) < self.zmid
+        rows, columns = np.nonzero(~is_min)
+        x = np.array(self.x, dtype=object)[columns]
+        y = np.array(self.y, dtype=object)[rows]
+        max_text_trace = dict(
+            type="scatter",
+            mode="text",
+            x=x.tolist(),
+            y=y.tolist(),
+            text=text[rows, columns].tolist(),
+            textfont=dict(color=max_text_color),
+            hoverinfo="skip",
+            showlegend=False,
+        )
+        for axis in ["xaxis", "yaxis"]:
+            if trace.get(axis) is not None:
+                max_text_trace[axis] = trace[axis]
+        return [
+            dict(
+                trace,
+                text=np.where(is_min, text, "").tolist(),
+                texttemplate="%{text}",
+                textfont=dict(color=min_text_color),
+            ),
+            max_text_trace,
+        ]
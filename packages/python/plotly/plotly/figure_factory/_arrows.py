@@ -0,0 +1,57 @@
+"""
+Vectorized geometry of the arrows drawn by create_quiver and create_streamline
+
+All the functions take numpy arrays with one value per arrow and return the
+coordinates of all the arrows as flat arrays, in which the points of each
+arrow are followed by a NaN so that they can be drawn by a single trace in
+`'lines'` mode.
+"""
+from plotly import optional_imports
+
+np = optional_imports.get_module("numpy")
+
+
+def separate_segments(*coords):
+    """
+    Returns the flat array of the points of `coords` (arrays of the same
+    length), taken in turn for each index and followed by a NaN
+
+    >>> separate_segments(np.array([0, 1]), np.array([2, 3]))
+    array([ 0.,  2., nan,  1.,  3., nan])
+    """
+    points = np.full((len(coords[0]), len(coords) + 1), np.nan)
+    for i, coord in enumerate(coords):
+        points[:, i] = coord
+    return points.ravel()
+
+
+def arrowheads(end_x, end_y, dir_x, dir_y, length, angle, scaleratio=1):
+    """
+    Returns the x and y coordinates of the arrowheads pointing to the `end_x`
+    and `end_y` points, in the direction of the `dir_x` and `dir_y` vectors
+
+    Each arrowhead is made of two sides of `length` at `angle` radians from
+    the direction of its arrow, its x coordinates being multiplied by
+    `scaleratio` (the ratio between the scales of the y and x axes).
+
+    :rtype (ndarray, ndarray): x and y coordinates of the first side, the end
+        point and the second side of each arrowhead, followed by a NaN
+    """
+    direction = np.arctan2(dir_y, dir_x)
+    points_x, points_y = [], []
+    for side_angle in (direction + angle, direction - angle):
+        points_x.append(end_x - length * np.cos(side_angle) * scaleratio)
+        points_y.append(end_y - length * np.sin(side_angle))
+    return (
+        separate_segments(points_x[0], end_x, points_x[1]),
+        separate_segments(points_y[0], end_y, points_y[1]),
+    )
+
+
+def nan_to_none(coords):
+    """
+    Returns the list of the values of `coords` with NaNs replaced by None
+    """
+    values = coords.astype(object)
+    values[np.isnan(coords)] = None
+    return values.tolist()
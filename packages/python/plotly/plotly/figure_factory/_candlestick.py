@@ -1,11 +1,18 @@
+from plotly import optional_imports
 from plotly.figure_factory import utils
 from plotly.figure_factory._ohlc import (
     _DEFAULT_INCREASING_COLOR,
     _DEFAULT_DECREASING_COLOR,
+    _as_price_arrays,
+    _as_x_array,
+    _is_typed,
+    _to_list,
     validate_ohlc,
 )
 from plotly.graph_objs import graph_objs
 
+np = optional_imports.get_module("numpy")
+
 
 def make_increasing_candle(open, high, low, close, dates, **kwargs):
     """
@@ -100,6 +107,9 @@ def create_candlestick(open, high, low, close, dates=None, direction="both", **k
     **deprecated**, use instead the plotly.graph_objects trace
     :class:`plotly.graph_objects.Candlestick`
 
+    When the values are numpy arrays or pandas Series rather than lists, the
+    returned traces hold typed arrays instead of lists.
+
     :param (list) open: opening values
     :param (list) high: high values
     :param (list) low: low values
@@ -218,15 +228,28 @@ class _Candlestick(object):
     """
 
     def __init__(self, open, high, low, close, dates, **kwargs):
-        self.open = open
-        self.high = high
-        self.low = low
-        self.close = close
-        if dates is not None:
-            self.x = dates
-        else:
-            self.x = [x for x in range(len(self.open))]
-        self.get_candle_increase()
+        self.typed = _is_typed(open, high, low, close)
+        self.open, self.high, self.low, self.close = _as_price_arrays(
+            open, high, low, close
+        )
+        self.x = _as_x_array(dates, len(self.open), self.typed)
+
+    def get_candles(self, mask):
+        """
+        Get the x and y values of the box trace drawing the candlesticks
+        selected by `mask`, each candlestick being made of six points
+
+        :rtype (list|ndarray, list|ndarray): the x-values and the y-values of
+            the trace
+        """
+        x = np.repeat(self.x[mask], 6)
+        y = np.stack(
+            [self.low, self.open, self.close, self.close, self.close, self.high],
+            axis=1,
+        )[mask].ravel()
+        if self.typed:
+            return x, y
+        return _to_list(x), _to_list(y)
 
     def get_candle_increase(self):
         """
@@ -235,22 +258,7 @@ class _Candlestick(object):
         The data is increasing when close value > open value
         and decreasing when the close value <= open value.
         """
-        increase_y = []
-        increase_x = []
-        for index in range(len(self.open)):
-            if self.close[index] > self.open[index]:
-                increase_y.append(self.low[index])
-                increase_y.append(self.open[index])
-                increase_y.append(self.close[index])
-                increase_y.append(self.close[index])
-                increase_y.append(self.close[index])
-                increase_y.append(self.high[index])
-                increase_x.append(self.x[index])
-
-        increase_x = [[x, x, x, x, x, x] for x in increase_x]
-        increase_x = utils.flatten(increase_x)
-
-        return increase_x, increase_y
+        return self.get_candles(self.close > self.open)
 
     def get_candle_decrease(self):
         """
@@ -259,19 +267,4 @@ class _Candlestick(object):
         The data is increasing when close value > open value
         and decreasing when the close value <= open value.
         """
-        decrease_y = []
-        decrease_x = []
-        for index in range(len(self.open)):
-            if self.close[index] <= self.open[index]:
-                decrease_y.append(self.low[index])
-                decrease_y.append(self.open[index])
-                decrease_y.append(self.close[index])
-                decrease_y.append(self.close[index])
-                decrease_y.append(self.close[index])
-                decrease_y.append(self.high[index])
-                decrease_x.append(self.x[index])
-
-        decrease_x = [[x, x, x, x, x, x] for x in decrease_x]
-        decrease_x = utils.flatten(decrease_x)
-
-        return decrease_x, decrease_y
+        return self.get_candles(self.close <= self.open)
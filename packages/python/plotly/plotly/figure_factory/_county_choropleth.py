@@ -1,3 +1,4 @@
+import importlib.metadata
 import io
 import numpy as np
 import os
@@ -5,13 +6,13 @@ import pandas as pd
 import warnings
 
 from math import log, floor
-from numbers import Number
 
 from plotly import optional_imports
 import plotly.colors as clrs
 from plotly.figure_factory import utils
 from plotly.exceptions import PlotlyError
 import plotly.graph_objs as go
+from plotly.files import PLOTLY_DIR, ensure_writable_plotly_dir
 
 pd.options.mode.chained_assignment = None
 
@@ -262,6 +263,116 @@ state_to_st_dict = {
 USA_XRANGE = [-125.0, -65.0]
 USA_YRANGE = [25.0, 49.0]
 
+# Parsed county and state data and simplified geometries, shared by all the
+# create_choropleth calls of the process
+_geometry_cache = {}
+
+
+def _get_us_counties_df():
+    """
+    Returns the county and state dataframes of _create_us_counties_df(),
+    which are read from the shapefiles once per process
+    """
+    if "dataframes" not in _geometry_cache:
+        _geometry_cache["dataframes"] = _create_us_counties_df(
+            st_to_state_name_dict, state_to_st_dict
+        )
+    return _geometry_cache["dataframes"]
+
+
+def _flatten_shapes(geometries, tolerance, shape_gap=False):
+    """
+    Simplifies the polygons of `geometries` and flattens their exterior rings
+    into coordinate arrays
+
+    Each ring is followed by a NaN, as well as each MultiPolygon if
+    `shape_gap` is True. The coordinates of the i-th geometry are
+    x[offsets[i]:offsets[i + 1]], and the centroids of its polygons
+    centroid_x[centroid_offsets[i]:centroid_offsets[i + 1]].
+
+    :rtype (dict): the x, y, offsets, centroid_x, centroid_y and
+        centroid_offsets arrays
+    """
+    x, y, offsets = [], [], [0]
+    centroid_x, centroid_y, centroid_offsets = [], [], [0]
+    n_points = n_centroids = 0
+    for geometry in geometries:
+        if geometry.geom_type == "Polygon":
+            polygons = [geometry]
+        elif geometry.geom_type == "MultiPolygon":
+            polygons = list(geometry.geoms)
+        else:
+            polygons = []
+        for polygon in polygons:
+            ring = np.asarray(polygon.simplify(tolerance).exterior.coords)
+            ring = ring.reshape(-1, 2)[:, :2]
+            x.extend([ring[:, 0], [np.nan]])
+            y.extend([ring[:, 1], [np.nan]])
+            n_points += len(ring) + 1
+            centroid = polygon.centroid
+            centroid_x.append(centroid.x)
+            centroid_y.append(centroid.y)
+            n_centroids += 1
+        if shape_gap and geometry.geom_type == "MultiPolygon":
+            x.append([np.nan])
+            y.append([np.nan])
+            n_points += 1
+        offsets.append(n_points)
+        centroid_offsets.append(n_centroids)
+    return dict(
+        x=np.concatenate(x) if x else np.empty(0),
+        y=np.concatenate(y) if y else np.empty(0),
+        offsets=np.array(offsets),
+        centroid_x=np.array(centroid_x, dtype=float),
+        centroid_y=np.array(centroid_y, dtype=float),
+        centroid_offsets=np.array(centroid_offsets),
+    )
+
+
+def _get_shapes(kind, tolerance, disk_cache=False):
+    """
+    Returns the flattened geometries of the US 'counties' or 'states'
+    simplified with `tolerance`, along with their names (and FIPS for the
+    counties), as a dict of arrays (see _flatten_shapes)
+
+    They are computed once per process and tolerance and, if `disk_cache` is
+    True, stored in and read from the ~/.plotly directory.
+    """
+    key = (kind, float(tolerance))
+    if key in _geometry_cache:
+        return _geometry_cache[key]
+
+    try:
+        geo_version = importlib.metadata.version("plotly-geo")
+    except importlib.metadata.PackageNotFoundError:
+        geo_version = "unknown"
+    path = os.path.join(
+        PLOTLY_DIR,
+        "geometry",
+        "us_{}_{}_{!r}.npz".format(kind, geo_version, float(tolerance)),
+    )
+    if disk_cache and os.path.exists(path):
+        with np.load(path, allow_pickle=False) as data:
+            shapes = dict(data)
+    else:
+        df, df_state = _get_us_counties_df()
+        if kind == "counties":
+            shapes = _flatten_shapes(df["geometry"], tolerance)
+            shapes["fips"] = df["FIPS"].to_numpy()
+            shapes["county_name"] = df["COUNTY_NAME"].to_numpy(dtype=str)
+            shapes["state_name"] = df["STATE_NAME"].to_numpy(dtype=str)
+        else:
+            shapes = _flatten_shapes(df_state["geometry"], tolerance, shape_gap=True)
+            shapes["state_name"] = df_state["STATE_NAME"].to_numpy(dtype=str)
+        if disk_cache and ensure_writable_plotly_dir():
+            try:
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                np.savez(path, **shapes)
+            except OSError:
+                warnings.warn("Could not write the geometry cache file " + path)
+    _geometry_cache[key] = shapes
+    return shapes
+
 
 def _human_format(number):
     units = ["", "K", "M", "G", "T", "P"]
@@ -311,86 +422,14 @@ def _intervals_as_labels(array_of_intervals, round_legend_values, exponent_forma
     return string_intervals
 
 
-def _calculations(
-    df,
-    fips,
-    values,
-    index,
-    f,
-    simplify_county,
-    level,
-    x_centroids,
-    y_centroids,
-    centroid_text,
-    x_traces,
-    y_traces,
-    fips_polygon_map,
-):
-    # 0-pad FIPS code to ensure exactly 5 digits
-    padded_f = str(f).zfill(5)
-    if fips_polygon_map[f].type == "Polygon":
-        x = fips_polygon_map[f].simplify(simplify_county).exterior.xy[0].tolist()
-        y = fips_polygon_map[f].simplify(simplify_county).exterior.xy[1].tolist()
-
-        x_c, y_c = fips_polygon_map[f].centroid.xy
-        county_name_str = str(df[df["FIPS"] == f]["COUNTY_NAME"].iloc[0])
-        state_name_str = str(df[df["FIPS"] == f]["STATE_NAME"].iloc[0])
-
-        t_c = (
-            "County: "
-            + county_name_str
-            + "<br>"
-            + "State: "
-            + state_name_str
-            + "<br>"
-            + "FIPS: "
-            + padded_f
-            + "<br>Value: "
-            + str(values[index])
-        )
-
-        x_centroids.append(x_c[0])
-        y_centroids.append(y_c[0])
-        centroid_text.append(t_c)
-
-        x_traces[level] = x_traces[level] + x + [np.nan]
-        y_traces[level] = y_traces[level] + y + [np.nan]
-    elif fips_polygon_map[f].type == "MultiPolygon":
-        x = [
-            poly.simplify(simplify_county).exterior.xy[0].tolist()
-            for poly in fips_polygon_map[f].geoms
-        ]
-        y = [
-            poly.simplify(simplify_county).exterior.xy[1].tolist()
-            for poly in fips_polygon_map[f].geoms
-        ]
-
-        x_c = [poly.centroid.xy[0].tolist() for poly in fips_polygon_map[f].geoms]
-        y_c = [poly.centroid.xy[1].tolist() for poly in fips_polygon_map[f].geoms]
-
-        county_name_str = str(df[df["FIPS"] == f]["COUNTY_NAME"].iloc[0])
-        state_name_str = str(df[df["FIPS"] == f]["STATE_NAME"].iloc[0])
-        text = (
-            "County: "
-            + county_name_str
-            + "<br>"
-            + "State: "
-            + state_name_str
-            + "<br>"
-            + "FIPS: "
-            + padded_f
-            + "<br>Value: "
-            + str(values[index])
-        )
-        t_c = [text for poly in fips_polygon_map[f].geoms]
-        x_centroids = x_c + x_centroids
-        y_centroids = y_c + y_centroids
-        centroid_text = t_c + centroid_text
-        for x_y_idx in range(len(x)):
-            x_traces[level] = x_traces[level] + x[x_y_idx] + [np.nan]
-            y_traces[level] = y_traces[level] + y[x_y_idx] + [np.nan]
-
-    return x_traces, y_traces, x_centroids, y_centroids, centroid_text
+def _gather(values, offsets, indices):
+    """
+    Returns the concatenation of the values[offsets[i]:offsets[i + 1]] slices
+    for the indices i of `indices`
+    """
+    if not len(indices):
+        return np.empty(0)
+    return np.concatenate([values[offsets[i] : offsets[i + 1]] for i in indices])
 
 
 def create_choropleth(
@@ -411,6 +450,7 @@ def create_choropleth(
     round_legend_values=False,
     exponent_format=False,
     legend_title="",
+    disk_cache=False,
     **layout_options,
 ):
     """
@@ -480,6 +520,11 @@ def create_choropleth(
         B number format. For example 4000.0 becomes 4.0K
         Default = False
     :param (str) legend_title: title that appears above the legend
+    :param (bool) disk_cache: if set to True, the simplified county and state
+        geometries are stored in the ~/.plotly directory and reused by later
+        Python sessions. Within a session they are always computed only once
+        per simplification factor.
+        Default = False
     :param **layout_options: a **kwargs argument for all layout parameters
 
 
@@ -641,9 +686,8 @@ $ conda install -c plotly plotly-geo
             "```"
         )
 
-    df, df_state = _create_us_counties_df(st_to_state_name_dict, state_to_st_dict)
-
-    fips_polygon_map = dict(zip(df["FIPS"].tolist(), df["geometry"].tolist()))
+    counties = _get_shapes("counties", simplify_county, disk_cache)
+    county_index = dict(zip(counties["fips"].tolist(), range(len(counties["fips"]))))
 
     if not state_outline:
         state_outline = {"color": "rgb(240, 240, 240)", "width": 1}
@@ -732,8 +776,7 @@ $ conda install -c plotly plotly-geo
         )
 
     color_lookup = dict(zip(LEVELS, colorscale))
-    x_traces = dict(zip(LEVELS, [[] for i in range(len(LEVELS))]))
-    y_traces = dict(zip(LEVELS, [[] for i in range(len(LEVELS))]))
+    level_counties = dict(zip(LEVELS, [[] for i in range(len(LEVELS))]))
 
     # scope
     if isinstance(scope, str):
@@ -750,7 +793,7 @@ $ conda install -c plotly plotly-geo
     ]
     for state in scope:
         if state.lower() == "usa":
-            scope_names = df["STATE_NAME"].unique()
+            scope_names = pd.unique(counties["state_name"])
             scope_names = list(scope_names)
             for ex_st in extra_states:
                 try:
@@ -761,76 +804,24 @@ $ conda install -c plotly plotly-geo
             if state in st_to_state_name_dict.keys():
                 state = st_to_state_name_dict[state]
             scope_names.append(state)
-    df_state = df_state[df_state["STATE_NAME"].isin(scope_names)]
 
     plot_data = []
-    x_centroids = []
-    y_centroids = []
-    centroid_text = []
+    hover_counties = []
     fips_not_in_shapefile = []
-    if not binning_endpoints:
-        for index, f in enumerate(fips):
-            level = values[index]
-            try:
-                fips_polygon_map[f].type
-
-                (
-                    x_traces,
-                    y_traces,
-                    x_centroids,
-                    y_centroids,
-                    centroid_text,
-                ) = _calculations(
-                    df,
-                    fips,
-                    values,
-                    index,
-                    f,
-                    simplify_county,
-                    level,
-                    x_centroids,
-                    y_centroids,
-                    centroid_text,
-                    x_traces,
-                    y_traces,
-                    fips_polygon_map,
-                )
-            except KeyError:
-                fips_not_in_shapefile.append(f)
-
-    else:
-        for index, f in enumerate(fips):
+    for index, f in enumerate(fips):
+        if binning_endpoints:
             for j, inter in enumerate(intervals):
                 if inter[0] < values[index] <= inter[1]:
                     break
             level = LEVELS[j]
+        else:
+            level = values[index]
 
-            try:
-                fips_polygon_map[f].type
-
-                (
-                    x_traces,
-                    y_traces,
-                    x_centroids,
-                    y_centroids,
-                    centroid_text,
-                ) = _calculations(
-                    df,
-                    fips,
-                    values,
-                    index,
-                    f,
-                    simplify_county,
-                    level,
-                    x_centroids,
-                    y_centroids,
-                    centroid_text,
-                    x_traces,
-                    y_traces,
-                    fips_polygon_map,
-                )
-            except KeyError:
-                fips_not_in_shapefile.append(f)
+        if f in county_index:
+            level_counties[level].append(county_index[f])
+            hover_counties.append((county_index[f], index))
+        else:
+            fips_not_in_shapefile.append(f)
 
     if len(fips_not_in_shapefile) > 0:
         msg = (
@@ -842,37 +833,12 @@ $ conda install -c plotly plotly-geo
         )
         warnings.warn(msg)
 
-    x_states = []
-    y_states = []
-    for index, row in df_state.iterrows():
-        if df_state["geometry"][index].type == "Polygon":
-            x = row.geometry.simplify(simplify_state).exterior.xy[0].tolist()
-            y = row.geometry.simplify(simplify_state).exterior.xy[1].tolist()
-            x_states = x_states + x
-            y_states = y_states + y
-        elif df_state["geometry"][index].type == "MultiPolygon":
-            x = [
-                poly.simplify(simplify_state).exterior.xy[0].tolist()
-                for poly in df_state["geometry"][index].geoms
-            ]
-            y = [
-                poly.simplify(simplify_state).exterior.xy[1].tolist()
-                for poly in df_state["geometry"][index].geoms
-            ]
-            for segment in range(len(x)):
-                x_states = x_states + x[segment]
-                y_states = y_states + y[segment]
-                x_states.append(np.nan)
-                y_states.append(np.nan)
-        x_states.append(np.nan)
-        y_states.append(np.nan)
-
     for lev in LEVELS:
         county_data = dict(
             type="scatter",
             mode="lines",
-            x=x_traces[lev],
-            y=y_traces[lev],
+            x=_gather(counties["x"], counties["offsets"], level_counties[lev]),
+            y=_gather(counties["y"], counties["offsets"], level_counties[lev]),
             line=county_outline,
             fill="toself",
             fillcolor=color_lookup[lev],
@@ -882,6 +848,25 @@ $ conda install -c plotly plotly-geo
         plot_data.append(county_data)
 
     if show_hover:
+        indices = [county for county, index in hover_counties]
+        offsets = counties["centroid_offsets"]
+        x_centroids = _gather(counties["centroid_x"], offsets, indices)
+        y_centroids = _gather(counties["centroid_y"], offsets, indices)
+        centroid_text = []
+        for county, index in hover_counties:
+            text = (
+                "County: "
+                + str(counties["county_name"][county])
+                + "<br>"
+                + "State: "
+                + str(counties["state_name"][county])
+                + "<br>"
+                + "FIPS: "
+                + str(counties["fips"][county]).zfill(5)
+                + "<br>Value: "
+                + str(values[index])
+            )
+            centroid_text.extend([text] * (offsets[county + 1] - offsets[county]))
         hover_points = dict(
             type="scatter",
             showlegend=False,
@@ -902,6 +887,10 @@ $ conda install -c plotly plotly-geo
         plot_data.append(hover_points)
 
     if show_state_data:
+        states = _get_shapes("states", simplify_state, disk_cache)
+        indices = np.flatnonzero(np.isin(states["state_name"], list(scope_names)))
+        x_states = _gather(states["x"], states["offsets"], indices)
+        y_states = _gather(states["y"], states["offsets"], indices)
         state_data = dict(
             type="scatter",
             legendgroup="States",
@@ -959,25 +948,16 @@ $ conda install -c plotly plotly-geo
         yaxis_range_low = 25.0
         yaxis_range_high = 49.0
     else:
-        xaxis_range_low = float("inf")
-        xaxis_range_high = float("-inf")
-        yaxis_range_low = float("inf")
-        yaxis_range_high = float("-inf")
-        for trace in fig["data"]:
-            if all(isinstance(n, Number) for n in trace["x"]):
-                calc_x_min = min(trace["x"] or [float("inf")])
-                calc_x_max = max(trace["x"] or [float("-inf")])
-                if calc_x_min < xaxis_range_low:
-                    xaxis_range_low = calc_x_min
-                if calc_x_max > xaxis_range_high:
-                    xaxis_range_high = calc_x_max
-            if all(isinstance(n, Number) for n in trace["y"]):
-                calc_y_min = min(trace["y"] or [float("inf")])
-                calc_y_max = max(trace["y"] or [float("-inf")])
-                if calc_y_min < yaxis_range_low:
-                    yaxis_range_low = calc_y_min
-                if calc_y_max > yaxis_range_high:
-                    yaxis_range_high = calc_y_max
+        x_values, y_values = [
+            np.concatenate(
+                [np.asarray(trace[axis], dtype=float) for trace in fig["data"]]
+            )
+            for axis in ["x", "y"]
+        ]
+        xaxis_range_low = float(np.nanmin(np.append(x_values, np.inf)))
+        xaxis_range_high = float(np.nanmax(np.append(x_values, -np.inf)))
+        yaxis_range_low = float(np.nanmin(np.append(y_values, np.inf)))
+        yaxis_range_high = float(np.nanmax(np.append(y_values, -np.inf)))
 
     # camera zoom
     fig["layout"]["xaxis"]["range"] = [xaxis_range_low, xaxis_range_high]
@@ -1,5 +1,6 @@
 from plotly import exceptions, optional_imports
 from plotly.figure_factory import utils
+from plotly.figure_factory._kde import gaussian_kdes, rug_indices
 from plotly.graph_objs import graph_objs
 
 # Optional imports, may be None for users that only use our core functionality.
@@ -58,6 +59,8 @@ def create_distplot(
     show_hist=True,
     show_curve=True,
     show_rug=True,
+    max_rug_points=None,
+    max_workers=None,
 ):
     """
     Function that creates a distplot similar to seaborn.distplot;
@@ -89,6 +92,12 @@ def create_distplot(
     :param (bool) show_rug: Add rug to distplot? Default = True
     :param (list[str]) colors: Colors for traces.
     :param (list[list]) rug_text: Hovertext values for rug_plot,
+    :param (int) max_rug_points: Largest number of points of each rug plot.
+        Larger data sets are sub-sampled to points evenly spread over their
+        quantiles. Default = None (all the points are drawn)
+    :param (int) max_workers: Number of threads computing the kernel
+        density estimations of the data sets concurrently. Default = None
+        (computed one after the other)
     :return (dict): Representation of a distplot figure.
 
     Example 1: Simple distplot of 1 data set
@@ -181,67 +190,32 @@ def create_distplot(
     if isinstance(bin_size, (float, int)):
         bin_size = [bin_size] * len(hist_data)
 
+    distplot = _Distplot(
+        hist_data,
+        histnorm,
+        group_labels,
+        bin_size,
+        curve_type,
+        colors,
+        rug_text,
+        show_hist,
+        show_curve,
+        max_rug_points=max_rug_points,
+        max_workers=max_workers,
+    )
+
     data = []
     if show_hist:
-
-        hist = _Distplot(
-            hist_data,
-            histnorm,
-            group_labels,
-            bin_size,
-            curve_type,
-            colors,
-            rug_text,
-            show_hist,
-            show_curve,
-        ).make_hist()
-
-        data.append(hist)
+        data.append(distplot.make_hist())
 
     if show_curve:
-
         if curve_type == "normal":
-            curve = _Distplot(
-                hist_data,
-                histnorm,
-                group_labels,
-                bin_size,
-                curve_type,
-                colors,
-                rug_text,
-                show_hist,
-                show_curve,
-            ).make_normal()
+            data.append(distplot.make_normal())
         else:
-            curve = _Distplot(
-                hist_data,
-                histnorm,
-                group_labels,
-                bin_size,
-                curve_type,
-                colors,
-                rug_text,
-                show_hist,
-                show_curve,
-            ).make_kde()
-
-        data.append(curve)
+            data.append(distplot.make_kde())
 
     if show_rug:
-
-        rug = _Distplot(
-            hist_data,
-            histnorm,
-            group_labels,
-            bin_size,
-            curve_type,
-            colors,
-            rug_text,
-            show_hist,
-            show_curve,
-        ).make_rug()
-
-        data.append(rug)
+        data.append(distplot.make_rug())
         layout = graph_objs.Layout(
             barmode="overlay",
             hovermode="closest",
@@ -279,6 +253,8 @@ class _Distplot(object):
         rug_text,
         show_hist,
         show_curve,
+        max_rug_points=None,
+        max_workers=None,
     ):
         self.hist_data = hist_data
         self.histnorm = histnorm
@@ -286,6 +262,8 @@ class _Distplot(object):
         self.bin_size = bin_size
         self.show_hist = show_hist
         self.show_curve = show_curve
+        self.max_rug_points = max_rug_points
+        self.max_workers = max_workers
         self.trace_number = len(hist_data)
         if rug_text:
             self.rug_text = rug_text
@@ -313,8 +291,8 @@ class _Distplot(object):
         self.curve_y = [None] * self.trace_number
 
         for trace in self.hist_data:
-            self.start.append(min(trace) * 1.0)
-            self.end.append(max(trace) * 1.0)
+            self.start.append(float(np.min(trace)))
+            self.end.append(float(np.max(trace)))
 
     def make_hist(self):
         """
@@ -358,10 +336,9 @@ class _Distplot(object):
                 self.start[index] + x * (self.end[index] - self.start[index]) / 500
                 for x in range(500)
             ]
-            self.curve_y[index] = scipy_stats.gaussian_kde(self.hist_data[index])(
-                self.curve_x[index]
-            )
+        self.curve_y = gaussian_kdes(self.hist_data, self.curve_x, self.max_workers)
 
+        for index in range(self.trace_number):
             if self.histnorm == ALTERNATIVE_HISTNORM:
                 self.curve_y[index] *= self.bin_size[index]
 
@@ -428,18 +405,25 @@ class _Distplot(object):
         """
         rug = [None] * self.trace_number
         for index in range(self.trace_number):
+            x = self.hist_data[index]
+            text = self.rug_text[index]
+            indices = rug_indices(x, self.max_rug_points)
+            if indices is not None:
+                x = np.asarray(x)[indices]
+                if text is not None and not isinstance(text, str):
+                    text = np.asarray(text, dtype=object)[indices].tolist()
 
             rug[index] = dict(
                 type="scatter",
-                x=self.hist_data[index],
-                y=([self.group_labels[index]] * len(self.hist_data[index])),
+                x=x,
+                y=([self.group_labels[index]] * len(x)),
                 xaxis="x1",
                 yaxis="y2",
                 mode="markers",
                 name=self.group_labels[index],
                 legendgroup=self.group_labels[index],
                 showlegend=(False if self.show_hist or self.show_curve else True),
-                text=self.rug_text[index],
+                text=text,
                 marker=dict(
                     color=self.colors[index % len(self.colors)], symbol="line-ns-open"
                 ),
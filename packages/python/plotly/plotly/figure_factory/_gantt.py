@@ -7,6 +7,7 @@ import plotly.colors as clrs
 from plotly.figure_factory import utils
 import plotly.graph_objects as go
 
+np = optional_imports.get_module("numpy")
 pd = optional_imports.get_module("pandas")
 
 REQUIRED_GANTT_KEYS = ["Task", "Start", "Finish"]
@@ -39,15 +40,7 @@ def validate_gantt(df):
                     "following keys: {0}".format(", ".join(REQUIRED_GANTT_KEYS))
                 )
 
-        num_of_rows = len(df.index)
-        chart = []
-        for index in range(num_of_rows):
-            task_dict = {}
-            for key in df:
-                task_dict[key] = df.iloc[index][key]
-            chart.append(task_dict)
-
-        return chart
+        return df.to_dict("records")
 
     # validate if df is a list
     if not isinstance(df, list):
@@ -65,6 +58,147 @@ def validate_gantt(df):
     return df
 
 
+def _object_array(values):
+    """
+    Returns the values as a 1D numpy array of the Python objects themselves
+    """
+    array = np.empty(len(values), dtype=object)
+    array[:] = list(values)
+    return array
+
+
+def _get_task_rows(chart, task_names, group_tasks):
+    """
+    Returns the names of the rows of the chart, from bottom to top, and the
+    row of each task
+
+    Each task has its own row, unless group_tasks is True, in which case the
+    tasks with the same name share a row and the names which appear first
+    are shown at the top.
+    """
+    names = [task["Task"] for task in chart]
+    if not group_tasks:
+        task_names.extend(names)
+        return task_names, np.arange(len(names))
+
+    seen = set(task_names)
+    for tn in names:
+        if tn not in seen:
+            seen.add(tn)
+            task_names.append(tn)
+    task_names.reverse()
+    rows = {}
+    for row, tn in enumerate(task_names):
+        rows.setdefault(tn, row)
+    return task_names, np.array([rows[tn] for tn in names], dtype=int)
+
+
+def _make_task_traces(
+    chart,
+    rows,
+    fillcolors,
+    names,
+    bar_width,
+    scatter_data_template,
+    marker_data_template,
+):
+    """
+    Returns the traces of the tasks, one filled scatter trace drawing the bars
+    and one marker trace holding the start and end points of the tasks (with
+    their descriptions as hover text) per fill color
+
+    :param (list) chart: list of task dictionaries
+    :param (ndarray) rows: the row of each task
+    :param (list) fillcolors: the fill color of each task
+    :param (list|None) names: the name of each task's trace, the name of the
+        last task of each color being used
+    :rtype (dict, dict): scatter_data_dict and marker_data_dict, the scatter
+        and marker traces keyed by fill color
+    """
+    x0 = _object_array([task["Start"] for task in chart])
+    x1 = _object_array([task["Finish"] for task in chart])
+    text = _object_array([task.get("Description") for task in chart])
+    y0 = _object_array((rows - bar_width).tolist())
+    y1 = _object_array((rows + bar_width).tolist())
+
+    color_tasks = {}
+    for index, color_id in enumerate(fillcolors):
+        color_tasks.setdefault(color_id, []).append(index)
+
+    scatter_data_dict = dict()
+    marker_data_dict = dict()
+    for color_id, indices in color_tasks.items():
+        indices = np.array(indices)
+
+        # each bar is drawn as a rectangle, and a gap repeating the x value
+        # of the previous point separates it from the previous bar
+        xs = np.empty((len(indices), 5), dtype=object)
+        ys = np.empty((len(indices), 5), dtype=object)
+        xs[1:, 0] = x0[indices[:-1]]
+        for column, (x, y) in enumerate([(x0, y0), (x1, y0), (x1, y1), (x0, y1)]):
+            xs[:, column + 1] = x[indices]
+            ys[:, column + 1] = y[indices]
+
+        scatter_data_dict[color_id] = copy.deepcopy(scatter_data_template)
+        scatter_data_dict[color_id]["x"] = xs.ravel()[1:].tolist()
+        scatter_data_dict[color_id]["y"] = ys.ravel()[1:].tolist()
+        scatter_data_dict[color_id]["fillcolor"] = color_id
+        scatter_data_dict[color_id]["legendgroup"] = color_id
+        if names is not None:
+            scatter_data_dict[color_id]["name"] = names[indices[-1]]
+
+        # dummy markers showing the start and end of each interval
+        marker_data_dict[color_id] = copy.deepcopy(marker_data_template)
+        marker_data_dict[color_id]["x"] = (
+            np.stack([x0[indices], x1[indices]], axis=1).ravel().tolist()
+        )
+        marker_data_dict[color_id]["y"] = np.repeat(rows[indices], 2).tolist()
+        marker_data_dict[color_id]["text"] = np.repeat(text[indices], 2).tolist()
+        marker_data_dict[color_id]["marker"]["color"] = color_id
+        marker_data_dict[color_id]["legendgroup"] = color_id
+
+    return scatter_data_dict, marker_data_dict
+
+
+def _gantt_layout(title, showlegend, height, width, showgrid_x, showgrid_y, task_names):
+    """
+    Returns the layout of the gantt chart
+    """
+    return dict(
+        title=title,
+        showlegend=showlegend,
+        height=height,
+        width=width,
+        shapes=[],
+        hovermode="closest",
+        yaxis=dict(
+            showgrid=showgrid_y,
+            ticktext=task_names,
+            tickvals=list(range(len(task_names))),
+            range=[-1, len(task_names) + 1],
+            autorange=False,
+            zeroline=False,
+        ),
+        xaxis=dict(
+            showgrid=showgrid_x,
+            zeroline=False,
+            rangeselector=dict(
+                buttons=list(
+                    [
+                        dict(count=7, label="1w", step="day", stepmode="backward"),
+                        dict(count=1, label="1m", step="month", stepmode="backward"),
+                        dict(count=6, label="6m", step="month", stepmode="backward"),
+                        dict(count=1, label="YTD", step="year", stepmode="todate"),
+                        dict(count=1, label="1y", step="year", stepmode="backward"),
+                        dict(step="all"),
+                    ]
+                )
+            ),
+            type="date",
+        ),
+    )
+
+
 def gantt(
     chart,
     colors,
@@ -84,26 +218,8 @@ def gantt(
     """
     Refer to create_gantt() for docstring
     """
-    if tasks is None:
-        tasks = []
     if task_names is None:
         task_names = []
-    if data is None:
-        data = []
-
-    for index in range(len(chart)):
-        task = dict(
-            x0=chart[index]["Start"],
-            x1=chart[index]["Finish"],
-            name=chart[index]["Task"],
-        )
-        if "Description" in chart[index]:
-            task["description"] = chart[index]["Description"]
-        tasks.append(task)
-
-    # create a scatter trace for every task group
-    scatter_data_dict = dict()
-    marker_data_dict = dict()
 
     if show_hover_fill:
         hoverinfo = "name"
@@ -128,126 +244,32 @@ def gantt(
         "showlegend": False,
     }
 
-    # create the list of task names
-    for index in range(len(tasks)):
-        tn = tasks[index]["name"]
-        # Is added to task_names if group_tasks is set to False,
-        # or if the option is used (True) it only adds them if the
-        # name is not already in the list
-        if not group_tasks or tn not in task_names:
-            task_names.append(tn)
-    # Guarantees that for grouped tasks the tasks that are inserted first
-    # are shown at the top
-    if group_tasks:
-        task_names.reverse()
-
-    color_index = 0
-    for index in range(len(tasks)):
-        tn = tasks[index]["name"]
-        del tasks[index]["name"]
-
-        # If group_tasks is True, all tasks with the same name belong
-        # to the same row.
-        groupID = index
-        if group_tasks:
-            groupID = task_names.index(tn)
-        tasks[index]["y0"] = groupID - bar_width
-        tasks[index]["y1"] = groupID + bar_width
-
-        # check if colors need to be looped
-        if color_index >= len(colors):
-            color_index = 0
-        tasks[index]["fillcolor"] = colors[color_index]
-        color_id = tasks[index]["fillcolor"]
-
-        if color_id not in scatter_data_dict:
-            scatter_data_dict[color_id] = copy.deepcopy(scatter_data_template)
-
-        scatter_data_dict[color_id]["fillcolor"] = color_id
-        scatter_data_dict[color_id]["name"] = str(tn)
-        scatter_data_dict[color_id]["legendgroup"] = color_id
-
-        # if there are already values append the gap
-        if len(scatter_data_dict[color_id]["x"]) > 0:
-            # a gap on the scatterplot separates the rectangles from each other
-            scatter_data_dict[color_id]["x"].append(
-                scatter_data_dict[color_id]["x"][-1]
-            )
-            scatter_data_dict[color_id]["y"].append(None)
-
-        xs, ys = _get_corner_points(
-            tasks[index]["x0"],
-            tasks[index]["y0"],
-            tasks[index]["x1"],
-            tasks[index]["y1"],
-        )
-
-        scatter_data_dict[color_id]["x"] += xs
-        scatter_data_dict[color_id]["y"] += ys
-
-        # append dummy markers for showing start and end of interval
-        if color_id not in marker_data_dict:
-            marker_data_dict[color_id] = copy.deepcopy(marker_data_template)
-            marker_data_dict[color_id]["marker"]["color"] = color_id
-            marker_data_dict[color_id]["legendgroup"] = color_id
+    task_names, rows = _get_task_rows(chart, task_names, group_tasks)
 
-        marker_data_dict[color_id]["x"].append(tasks[index]["x0"])
-        marker_data_dict[color_id]["x"].append(tasks[index]["x1"])
-        marker_data_dict[color_id]["y"].append(groupID)
-        marker_data_dict[color_id]["y"].append(groupID)
+    # loop over the colors
+    fillcolors = [colors[index % len(colors)] for index in range(len(chart))]
+    names = [str(task["Task"]) for task in chart]
 
-        if "description" in tasks[index]:
-            marker_data_dict[color_id]["text"].append(tasks[index]["description"])
-            marker_data_dict[color_id]["text"].append(tasks[index]["description"])
-            del tasks[index]["description"]
-        else:
-            marker_data_dict[color_id]["text"].append(None)
-            marker_data_dict[color_id]["text"].append(None)
-
-        color_index += 1
+    # create a scatter trace for every task group
+    scatter_data_dict, marker_data_dict = _make_task_traces(
+        chart,
+        rows,
+        fillcolors,
+        names,
+        bar_width,
+        scatter_data_template,
+        marker_data_template,
+    )
 
     showlegend = show_colorbar
 
-    layout = dict(
-        title=title,
-        showlegend=showlegend,
-        height=height,
-        width=width,
-        shapes=[],
-        hovermode="closest",
-        yaxis=dict(
-            showgrid=showgrid_y,
-            ticktext=task_names,
-            tickvals=list(range(len(task_names))),
-            range=[-1, len(task_names) + 1],
-            autorange=False,
-            zeroline=False,
-        ),
-        xaxis=dict(
-            showgrid=showgrid_x,
-            zeroline=False,
-            rangeselector=dict(
-                buttons=list(
-                    [
-                        dict(count=7, label="1w", step="day", stepmode="backward"),
-                        dict(count=1, label="1m", step="month", stepmode="backward"),
-                        dict(count=6, label="6m", step="month", stepmode="backward"),
-                        dict(count=1, label="YTD", step="year", stepmode="todate"),
-                        dict(count=1, label="1y", step="year", stepmode="backward"),
-                        dict(step="all"),
-                    ]
-                )
-            ),
-            type="date",
-        ),
+    layout = _gantt_layout(
+        title, showlegend, height, width, showgrid_x, showgrid_y, task_names
     )
 
     data = [scatter_data_dict[k] for k in sorted(scatter_data_dict)]
     data += [marker_data_dict[k] for k in sorted(marker_data_dict)]
 
-    # fig = dict(
-    #     data=data, layout=layout
-    # )
     fig = go.Figure(data=data, layout=layout)
     return fig
 
@@ -272,29 +294,10 @@ def gantt_colorscale(
     """
     Refer to FigureFactory.create_gantt() for docstring
     """
-    if tasks is None:
-        tasks = []
     if task_names is None:
         task_names = []
-    if data is None:
-        data = []
     showlegend = False
 
-    for index in range(len(chart)):
-        task = dict(
-            x0=chart[index]["Start"],
-            x1=chart[index]["Finish"],
-            name=chart[index]["Task"],
-        )
-        if "Description" in chart[index]:
-            task["description"] = chart[index]["Description"]
-        tasks.append(task)
-
-    # create a scatter trace for every task group
-    scatter_data_dict = dict()
-    # create scatter traces for the start- and endpoints
-    marker_data_dict = dict()
-
     if show_hover_fill:
         hoverinfo = "name"
     else:
@@ -321,12 +324,9 @@ def gantt_colorscale(
         "legendgroup": "",
     }
 
-    index_vals = []
-    for row in range(len(tasks)):
-        if chart[row][index_col] not in index_vals:
-            index_vals.append(chart[row][index_col])
-
-    index_vals.sort()
+    index_vals = [task[index_col] for task in chart]
+    names = [str(index_val) for index_val in index_vals]
+    scatter_data_dict, marker_data_dict = {}, {}
 
     # compute the color for task based on indexing column
     if isinstance(chart[0][index_col], Number):
@@ -339,95 +339,43 @@ def gantt_colorscale(
                 "bounds on the colormap."
             )
 
-        # create the list of task names
-        for index in range(len(tasks)):
-            tn = tasks[index]["name"]
-            # Is added to task_names if group_tasks is set to False,
-            # or if the option is used (True) it only adds them if the
-            # name is not already in the list
-            if not group_tasks or tn not in task_names:
-                task_names.append(tn)
-        # Guarantees that for grouped tasks the tasks that are inserted
-        # first are shown at the top
-        if group_tasks:
-            task_names.reverse()
-
-        for index in range(len(tasks)):
-            tn = tasks[index]["name"]
-            del tasks[index]["name"]
-
-            # If group_tasks is True, all tasks with the same name belong
-            # to the same row.
-            groupID = index
-            if group_tasks:
-                groupID = task_names.index(tn)
-            tasks[index]["y0"] = groupID - bar_width
-            tasks[index]["y1"] = groupID + bar_width
-
-            # unlabel color
-            colors = clrs.color_parser(colors, clrs.unlabel_rgb)
-            lowcolor = colors[0]
-            highcolor = colors[1]
-
-            intermed = (chart[index][index_col]) / 100.0
-            intermed_color = clrs.find_intermediate_color(lowcolor, highcolor, intermed)
-            intermed_color = clrs.color_parser(intermed_color, clrs.label_rgb)
-            tasks[index]["fillcolor"] = intermed_color
-            color_id = tasks[index]["fillcolor"]
-
-            if color_id not in scatter_data_dict:
-                scatter_data_dict[color_id] = copy.deepcopy(scatter_data_template)
-
-            scatter_data_dict[color_id]["fillcolor"] = color_id
-            scatter_data_dict[color_id]["name"] = str(chart[index][index_col])
-            scatter_data_dict[color_id]["legendgroup"] = color_id
-
-            # relabel colors with 'rgb'
-            colors = clrs.color_parser(colors, clrs.label_rgb)
-
-            # if there are already values append the gap
-            if len(scatter_data_dict[color_id]["x"]) > 0:
-                # a gap on the scatterplot separates the rectangles from each other
-                scatter_data_dict[color_id]["x"].append(
-                    scatter_data_dict[color_id]["x"][-1]
-                )
-                scatter_data_dict[color_id]["y"].append(None)
+        task_names, rows = _get_task_rows(chart, task_names, group_tasks)
 
-            xs, ys = _get_corner_points(
-                tasks[index]["x0"],
-                tasks[index]["y0"],
-                tasks[index]["x1"],
-                tasks[index]["y1"],
-            )
-
-            scatter_data_dict[color_id]["x"] += xs
-            scatter_data_dict[color_id]["y"] += ys
+        # unlabel color
+        lowcolor, highcolor = clrs.color_parser(colors[:2], clrs.unlabel_rgb)
 
-            # append dummy markers for showing start and end of interval
-            if color_id not in marker_data_dict:
-                marker_data_dict[color_id] = copy.deepcopy(marker_data_template)
-                marker_data_dict[color_id]["marker"]["color"] = color_id
-                marker_data_dict[color_id]["legendgroup"] = color_id
-
-            marker_data_dict[color_id]["x"].append(tasks[index]["x0"])
-            marker_data_dict[color_id]["x"].append(tasks[index]["x1"])
-            marker_data_dict[color_id]["y"].append(groupID)
-            marker_data_dict[color_id]["y"].append(groupID)
+        # the color of each distinct index value is computed once
+        intermed_colors = {}
+        for index_val in index_vals:
+            if index_val not in intermed_colors:
+                intermed = index_val / 100.0
+                intermed_color = clrs.find_intermediate_color(
+                    lowcolor, highcolor, intermed
+                )
+                intermed_colors[index_val] = clrs.color_parser(
+                    intermed_color, clrs.label_rgb
+                )
+        fillcolors = [intermed_colors[index_val] for index_val in index_vals]
 
-            if "description" in tasks[index]:
-                marker_data_dict[color_id]["text"].append(tasks[index]["description"])
-                marker_data_dict[color_id]["text"].append(tasks[index]["description"])
-                del tasks[index]["description"]
-            else:
-                marker_data_dict[color_id]["text"].append(None)
-                marker_data_dict[color_id]["text"].append(None)
+        scatter_data_dict, marker_data_dict = _make_task_traces(
+            chart,
+            rows,
+            fillcolors,
+            names,
+            bar_width,
+            scatter_data_template,
+            marker_data_template,
+        )
 
         # add colorbar to one of the traces randomly just for display
         if show_colorbar is True:
             k = list(marker_data_dict.keys())[0]
             marker_data_dict[k]["marker"].update(
                 dict(
-                    colorscale=[[0, colors[0]], [1, colors[1]]],
+                    colorscale=[
+                        [0, clrs.label_rgb(lowcolor)],
+                        [1, clrs.label_rgb(highcolor)],
+                    ],
                     showscale=True,
                     cmax=100,
                     cmin=0,
@@ -435,14 +383,9 @@ def gantt_colorscale(
             )
 
     if isinstance(chart[0][index_col], str):
-        index_vals = []
-        for row in range(len(tasks)):
-            if chart[row][index_col] not in index_vals:
-                index_vals.append(chart[row][index_col])
-
-        index_vals.sort()
+        unique_index_vals = sorted(set(index_vals))
 
-        if len(colors) < len(index_vals):
+        if len(colors) < len(unique_index_vals):
             raise exceptions.PlotlyError(
                 "Error. The number of colors in 'colors' must be no less "
                 "than the number of unique index values in your group "
@@ -451,145 +394,34 @@ def gantt_colorscale(
 
         # make a dictionary assignment to each index value
         index_vals_dict = {}
-        # define color index
-        c_index = 0
-        for key in index_vals:
-            if c_index > len(colors) - 1:
-                c_index = 0
-            index_vals_dict[key] = colors[c_index]
-            c_index += 1
-
-        # create the list of task names
-        for index in range(len(tasks)):
-            tn = tasks[index]["name"]
-            # Is added to task_names if group_tasks is set to False,
-            # or if the option is used (True) it only adds them if the
-            # name is not already in the list
-            if not group_tasks or tn not in task_names:
-                task_names.append(tn)
-        # Guarantees that for grouped tasks the tasks that are inserted
-        # first are shown at the top
-        if group_tasks:
-            task_names.reverse()
-
-        for index in range(len(tasks)):
-            tn = tasks[index]["name"]
-            del tasks[index]["name"]
-
-            # If group_tasks is True, all tasks with the same name belong
-            # to the same row.
-            groupID = index
-            if group_tasks:
-                groupID = task_names.index(tn)
-            tasks[index]["y0"] = groupID - bar_width
-            tasks[index]["y1"] = groupID + bar_width
-
-            tasks[index]["fillcolor"] = index_vals_dict[chart[index][index_col]]
-            color_id = tasks[index]["fillcolor"]
-
-            if color_id not in scatter_data_dict:
-                scatter_data_dict[color_id] = copy.deepcopy(scatter_data_template)
-
-            scatter_data_dict[color_id]["fillcolor"] = color_id
-            scatter_data_dict[color_id]["legendgroup"] = color_id
-            scatter_data_dict[color_id]["name"] = str(chart[index][index_col])
-
-            # relabel colors with 'rgb'
-            colors = clrs.color_parser(colors, clrs.label_rgb)
-
-            # if there are already values append the gap
-            if len(scatter_data_dict[color_id]["x"]) > 0:
-                # a gap on the scatterplot separates the rectangles from each other
-                scatter_data_dict[color_id]["x"].append(
-                    scatter_data_dict[color_id]["x"][-1]
-                )
-                scatter_data_dict[color_id]["y"].append(None)
-
-            xs, ys = _get_corner_points(
-                tasks[index]["x0"],
-                tasks[index]["y0"],
-                tasks[index]["x1"],
-                tasks[index]["y1"],
-            )
-
-            scatter_data_dict[color_id]["x"] += xs
-            scatter_data_dict[color_id]["y"] += ys
-
-            # append dummy markers for showing start and end of interval
-            if color_id not in marker_data_dict:
-                marker_data_dict[color_id] = copy.deepcopy(marker_data_template)
-                marker_data_dict[color_id]["marker"]["color"] = color_id
-                marker_data_dict[color_id]["legendgroup"] = color_id
+        for c_index, key in enumerate(unique_index_vals):
+            index_vals_dict[key] = colors[c_index % len(colors)]
 
-            marker_data_dict[color_id]["x"].append(tasks[index]["x0"])
-            marker_data_dict[color_id]["x"].append(tasks[index]["x1"])
-            marker_data_dict[color_id]["y"].append(groupID)
-            marker_data_dict[color_id]["y"].append(groupID)
+        task_names, rows = _get_task_rows(chart, task_names, group_tasks)
+        fillcolors = [index_vals_dict[index_val] for index_val in index_vals]
 
-            if "description" in tasks[index]:
-                marker_data_dict[color_id]["text"].append(tasks[index]["description"])
-                marker_data_dict[color_id]["text"].append(tasks[index]["description"])
-                del tasks[index]["description"]
-            else:
-                marker_data_dict[color_id]["text"].append(None)
-                marker_data_dict[color_id]["text"].append(None)
+        scatter_data_dict, marker_data_dict = _make_task_traces(
+            chart,
+            rows,
+            fillcolors,
+            names,
+            bar_width,
+            scatter_data_template,
+            marker_data_template,
+        )
 
         if show_colorbar is True:
             showlegend = True
             for k in scatter_data_dict:
                 scatter_data_dict[k]["showlegend"] = showlegend
-    # add colorbar to one of the traces randomly just for display
-    # if show_colorbar is True:
-    #     k = list(marker_data_dict.keys())[0]
-    #     marker_data_dict[k]["marker"].update(
-    #         dict(
-    #             colorscale=[[0, colors[0]], [1, colors[1]]],
-    #             showscale=True,
-    #             cmax=100,
-    #             cmin=0,
-    #         )
-    #     )
-
-    layout = dict(
-        title=title,
-        showlegend=showlegend,
-        height=height,
-        width=width,
-        shapes=[],
-        hovermode="closest",
-        yaxis=dict(
-            showgrid=showgrid_y,
-            ticktext=task_names,
-            tickvals=list(range(len(task_names))),
-            range=[-1, len(task_names) + 1],
-            autorange=False,
-            zeroline=False,
-        ),
-        xaxis=dict(
-            showgrid=showgrid_x,
-            zeroline=False,
-            rangeselector=dict(
-                buttons=list(
-                    [
-                        dict(count=7, label="1w", step="day", stepmode="backward"),
-                        dict(count=1, label="1m", step="month", stepmode="backward"),
-                        dict(count=6, label="6m", step="month", stepmode="backward"),
-                        dict(count=1, label="YTD", step="year", stepmode="todate"),
-                        dict(count=1, label="1y", step="year", stepmode="backward"),
-                        dict(step="all"),
-                    ]
-                )
-            ),
-            type="date",
-        ),
+
+    layout = _gantt_layout(
+        title, showlegend, height, width, showgrid_x, showgrid_y, task_names
     )
 
     data = [scatter_data_dict[k] for k in sorted(scatter_data_dict)]
     data += [marker_data_dict[k] for k in sorted(marker_data_dict)]
 
-    # fig = dict(
-    #     data=data, layout=layout
-    # )
     fig = go.Figure(data=data, layout=layout)
     return fig
 
@@ -615,29 +447,10 @@ def gantt_dict(
     Refer to FigureFactory.create_gantt() for docstring
     """
 
-    if tasks is None:
-        tasks = []
     if task_names is None:
         task_names = []
-    if data is None:
-        data = []
     showlegend = False
 
-    for index in range(len(chart)):
-        task = dict(
-            x0=chart[index]["Start"],
-            x1=chart[index]["Finish"],
-            name=chart[index]["Task"],
-        )
-        if "Description" in chart[index]:
-            task["description"] = chart[index]["Description"]
-        tasks.append(task)
-
-    # create a scatter trace for every task group
-    scatter_data_dict = dict()
-    # create scatter traces for the start- and endpoints
-    marker_data_dict = dict()
-
     if show_hover_fill:
         hoverinfo = "name"
     else:
@@ -662,138 +475,43 @@ def gantt_dict(
         "showlegend": False,
     }
 
-    index_vals = []
-    for row in range(len(tasks)):
-        if chart[row][index_col] not in index_vals:
-            index_vals.append(chart[row][index_col])
-
-    index_vals.sort()
+    index_vals = [task[index_col] for task in chart]
+    unique_index_vals = sorted(set(index_vals))
 
     # verify each value in index column appears in colors dictionary
-    for key in index_vals:
+    for key in unique_index_vals:
         if key not in colors:
             raise exceptions.PlotlyError(
                 "If you are using colors as a dictionary, all of its "
                 "keys must be all the values in the index column."
             )
 
-    # create the list of task names
-    for index in range(len(tasks)):
-        tn = tasks[index]["name"]
-        # Is added to task_names if group_tasks is set to False,
-        # or if the option is used (True) it only adds them if the
-        # name is not already in the list
-        if not group_tasks or tn not in task_names:
-            task_names.append(tn)
-    # Guarantees that for grouped tasks the tasks that are inserted first
-    # are shown at the top
-    if group_tasks:
-        task_names.reverse()
-
-    for index in range(len(tasks)):
-        tn = tasks[index]["name"]
-        del tasks[index]["name"]
-
-        # If group_tasks is True, all tasks with the same name belong
-        # to the same row.
-        groupID = index
-        if group_tasks:
-            groupID = task_names.index(tn)
-        tasks[index]["y0"] = groupID - bar_width
-        tasks[index]["y1"] = groupID + bar_width
-
-        tasks[index]["fillcolor"] = colors[chart[index][index_col]]
-        color_id = tasks[index]["fillcolor"]
-
-        if color_id not in scatter_data_dict:
-            scatter_data_dict[color_id] = copy.deepcopy(scatter_data_template)
-
-        scatter_data_dict[color_id]["legendgroup"] = color_id
-        scatter_data_dict[color_id]["fillcolor"] = color_id
-
-        # if there are already values append the gap
-        if len(scatter_data_dict[color_id]["x"]) > 0:
-            # a gap on the scatterplot separates the rectangles from each other
-            scatter_data_dict[color_id]["x"].append(
-                scatter_data_dict[color_id]["x"][-1]
-            )
-            scatter_data_dict[color_id]["y"].append(None)
-
-        xs, ys = _get_corner_points(
-            tasks[index]["x0"],
-            tasks[index]["y0"],
-            tasks[index]["x1"],
-            tasks[index]["y1"],
-        )
-
-        scatter_data_dict[color_id]["x"] += xs
-        scatter_data_dict[color_id]["y"] += ys
-
-        # append dummy markers for showing start and end of interval
-        if color_id not in marker_data_dict:
-            marker_data_dict[color_id] = copy.deepcopy(marker_data_template)
-            marker_data_dict[color_id]["marker"]["color"] = color_id
-            marker_data_dict[color_id]["legendgroup"] = color_id
-
-        marker_data_dict[color_id]["x"].append(tasks[index]["x0"])
-        marker_data_dict[color_id]["x"].append(tasks[index]["x1"])
-        marker_data_dict[color_id]["y"].append(groupID)
-        marker_data_dict[color_id]["y"].append(groupID)
-
-        if "description" in tasks[index]:
-            marker_data_dict[color_id]["text"].append(tasks[index]["description"])
-            marker_data_dict[color_id]["text"].append(tasks[index]["description"])
-            del tasks[index]["description"]
-        else:
-            marker_data_dict[color_id]["text"].append(None)
-            marker_data_dict[color_id]["text"].append(None)
+    task_names, rows = _get_task_rows(chart, task_names, group_tasks)
+    fillcolors = [colors[index_val] for index_val in index_vals]
+
+    scatter_data_dict, marker_data_dict = _make_task_traces(
+        chart,
+        rows,
+        fillcolors,
+        None,
+        bar_width,
+        scatter_data_template,
+        marker_data_template,
+    )
 
     if show_colorbar is True:
         showlegend = True
 
-    for index_value in index_vals:
+    for index_value in unique_index_vals:
         scatter_data_dict[colors[index_value]]["name"] = str(index_value)
 
-    layout = dict(
-        title=title,
-        showlegend=showlegend,
-        height=height,
-        width=width,
-        shapes=[],
-        hovermode="closest",
-        yaxis=dict(
-            showgrid=showgrid_y,
-            ticktext=task_names,
-            tickvals=list(range(len(task_names))),
-            range=[-1, len(task_names) + 1],
-            autorange=False,
-            zeroline=False,
-        ),
-        xaxis=dict(
-            showgrid=showgrid_x,
-            zeroline=False,
-            rangeselector=dict(
-                buttons=list(
-                    [
-                        dict(count=7, label="1w", step="day", stepmode="backward"),
-                        dict(count=1, label="1m", step="month", stepmode="backward"),
-                        dict(count=6, label="6m", step="month", stepmode="backward"),
-                        dict(count=1, label="YTD", step="year", stepmode="todate"),
-                        dict(count=1, label="1y", step="year", stepmode="backward"),
-                        dict(step="all"),
-                    ]
-                )
-            ),
-            type="date",
-        ),
+    layout = _gantt_layout(
+        title, showlegend, height, width, showgrid_x, showgrid_y, task_names
     )
 
     data = [scatter_data_dict[k] for k in sorted(scatter_data_dict)]
     data += [marker_data_dict[k] for k in sorted(marker_data_dict)]
 
-    # fig = dict(
-    #      data=data, layout=layout
-    # )
     fig = go.Figure(data=data, layout=layout)
     return fig
 
@@ -54,10 +54,9 @@ def _getBoundsZoomLevel(lon_min, lon_max, lat_min, lat_max, mapDim):
     return min(latZoom, lngZoom, ZOOM_MAX)
 
 
-def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
+def _hexbin_lattice(x, y, x_range, y_range, nx):
     """
-    Computes the aggregation at hexagonal bin level.
-    Also defines the coordinates of the hexagons for plotting.
+    Assigns the points to the hexagons of a lattice covering the given ranges.
     The binning is inspired by matplotlib's implementation.
 
     Parameters
@@ -70,26 +69,20 @@ def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
         Min and max x (shape 2)
     y_range : np.ndarray
         Min and max y (shape 2)
-    color : np.ndarray
-        Metric to aggregate at hexagon level (shape N)
     nx : int
         Number of hexagons horizontally
-    agg_func : function
-        Numpy compatible aggregator, this function must take a one-dimensional
-        np.ndarray as input and output a scalar
-    min_count : int
-        Minimum number of points in the hexagon for the hexagon to be displayed
 
     Returns
     -------
     np.ndarray
-        X coordinates of each hexagon (shape M x 6)
-    np.ndarray
-        Y coordinates of each hexagon (shape M x 6)
-    np.ndarray
-        Centers of the hexagons (shape M x 2)
+        Index of the hexagon of each point, -1 for the points outside of the
+        lattice (shape N)
     np.ndarray
-        Aggregated value in each hexagon (shape M)
+        Centers of all the hexagons of the lattice (shape M x 2)
+    float
+        Width of the hexagons
+    float
+        Height of the hexagons times sqrt(3)
 
     """
     xmin = x_range.min()
@@ -134,61 +127,12 @@ def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
     d2 = (x - ix2 - 0.5) ** 2 + 3.0 * (y - iy2 - 0.5) ** 2
     bdist = d1 < d2
 
-    if color is None:
-        lattice1 = np.zeros((nx1, ny1))
-        lattice2 = np.zeros((nx2, ny2))
-        c1 = (0 <= ix1) & (ix1 < nx1) & (0 <= iy1) & (iy1 < ny1) & bdist
-        c2 = (0 <= ix2) & (ix2 < nx2) & (0 <= iy2) & (iy2 < ny2) & ~bdist
-        np.add.at(lattice1, (ix1[c1], iy1[c1]), 1)
-        np.add.at(lattice2, (ix2[c2], iy2[c2]), 1)
-        if min_count is not None:
-            lattice1[lattice1 < min_count] = np.nan
-            lattice2[lattice2 < min_count] = np.nan
-        accum = np.concatenate([lattice1.ravel(), lattice2.ravel()])
-        good_idxs = ~np.isnan(accum)
-    else:
-        if min_count is None:
-            min_count = 1
-
-        # create accumulation arrays
-        lattice1 = np.empty((nx1, ny1), dtype=object)
-        for i in range(nx1):
-            for j in range(ny1):
-                lattice1[i, j] = []
-        lattice2 = np.empty((nx2, ny2), dtype=object)
-        for i in range(nx2):
-            for j in range(ny2):
-                lattice2[i, j] = []
-
-        for i in range(len(x)):
-            if bdist[i]:
-                if 0 <= ix1[i] < nx1 and 0 <= iy1[i] < ny1:
-                    lattice1[ix1[i], iy1[i]].append(color[i])
-            else:
-                if 0 <= ix2[i] < nx2 and 0 <= iy2[i] < ny2:
-                    lattice2[ix2[i], iy2[i]].append(color[i])
-
-        for i in range(nx1):
-            for j in range(ny1):
-                vals = lattice1[i, j]
-                if len(vals) >= min_count:
-                    lattice1[i, j] = agg_func(vals)
-                else:
-                    lattice1[i, j] = np.nan
-        for i in range(nx2):
-            for j in range(ny2):
-                vals = lattice2[i, j]
-                if len(vals) >= min_count:
-                    lattice2[i, j] = agg_func(vals)
-                else:
-                    lattice2[i, j] = np.nan
-
-        accum = np.hstack(
-            (lattice1.astype(float).ravel(), lattice2.astype(float).ravel())
-        )
-        good_idxs = ~np.isnan(accum)
-
-    agreggated_value = accum[good_idxs]
+    # The hexagons of the first lattice come before those of the second one
+    ids = np.full(len(x), -1)
+    c1 = (0 <= ix1) & (ix1 < nx1) & (0 <= iy1) & (iy1 < ny1) & bdist
+    c2 = (0 <= ix2) & (ix2 < nx2) & (0 <= iy2) & (iy2 < ny2) & ~bdist
+    ids[c1] = ix1[c1] * ny1 + iy1[c1]
+    ids[c2] = nx1 * ny1 + ix2[c2] * ny2 + iy2[c2]
 
     centers = np.zeros((n, 2), float)
     centers[: nx1 * ny1, 0] = np.repeat(np.arange(nx1), ny1)
@@ -199,25 +143,166 @@ def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
     centers[:, 1] *= dy
     centers[:, 0] += xmin
     centers[:, 1] += ymin
-    centers = centers[good_idxs]
 
-    # Define normalised regular hexagon coordinates
-    hx = [0, 0.5, 0.5, 0, -0.5, -0.5]
-    hy = [
-        -0.5 / np.cos(np.pi / 6),
-        -0.5 * np.tan(np.pi / 6),
-        0.5 * np.tan(np.pi / 6),
-        0.5 / np.cos(np.pi / 6),
-        0.5 * np.tan(np.pi / 6),
-        -0.5 * np.tan(np.pi / 6),
-    ]
+    return ids, centers, dx, dy
+
+
+def _aggregate_hexbin(ids, n, color, agg_func, min_count, frames=None, n_frames=1):
+    """
+    Aggregates the points of each hexagon, in each frame at once.
+
+    Parameters
+    ----------
+    ids : np.ndarray
+        Index of the hexagon of each point, -1 for the points outside of the
+        lattice (shape N)
+    n : int
+        Number of hexagons of the lattice
+    color : np.ndarray
+        Metric to aggregate at hexagon level (shape N), or None to count the
+        points
+    agg_func : function
+        Numpy compatible aggregator, this function must take a one-dimensional
+        np.ndarray as input and output a scalar. np.sum, np.mean, np.min and
+        np.max are computed for all the hexagons at once.
+    min_count : int
+        Minimum number of points in the hexagon for the hexagon to be displayed
+    frames : np.ndarray
+        Index of the frame of each point, -1 for the points in no frame
+        (shape N), or None if all the points are in a single frame
+    n_frames : int
+        Number of frames
+
+    Returns
+    -------
+    np.ndarray
+        Aggregated value in each hexagon of each frame, NaN for the hexagons
+        not displayed (shape n_frames x n)
+
+    """
+    inside = ids >= 0
+    keys = ids
+    if frames is not None:
+        inside &= frames >= 0
+        keys = frames * n + ids
+    keys = keys[inside]
+    size = n_frames * n
+    counts = np.bincount(keys, minlength=size)
+
+    if color is None:
+        accum = counts.astype(float)
+        if min_count is not None:
+            accum[counts < min_count] = np.nan
+        return accum.reshape(n_frames, n)
+
+    if min_count is None:
+        min_count = 1
+    color = np.asarray(color)[inside]
+
+    if agg_func in (np.sum, sum):
+        accum = np.bincount(keys, weights=color, minlength=size)
+    elif agg_func is np.mean:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            accum = np.bincount(keys, weights=color, minlength=size) / counts
+    else:
+        # Sort the values by hexagon, so that those of each hexagon are
+        # contiguous
+        color = color[np.argsort(keys, kind="stable")]
+        stops = np.cumsum(counts)
+        accum = np.full(size, np.nan)
+        if agg_func in (np.min, np.max, min, max):
+            reduce = np.minimum if agg_func in (np.min, min) else np.maximum
+            nonempty = counts > 0
+            if nonempty.any():
+                accum[nonempty] = reduce.reduceat(
+                    color.astype(float), (stops - counts)[nonempty]
+                )
+        else:
+            for i in np.flatnonzero(counts >= min_count):
+                accum[i] = agg_func(color[stops[i] - counts[i] : stops[i]])
 
-    # Number of hexagons needed
-    m = len(centers)
+    accum = accum.astype(float)
+    accum[counts < min_count] = np.nan
+    return accum.reshape(n_frames, n)
+
+
+def _hexagons_coordinates(centers, dx, dy):
+    """
+    Returns the x and y coordinates of the vertices of the hexagons of the
+    given centers (shape M x 6 each)
+    """
+    # Define normalised regular hexagon coordinates
+    hx = np.array([0, 0.5, 0.5, 0, -0.5, -0.5])
+    hy = np.array(
+        [
+            -0.5 / np.cos(np.pi / 6),
+            -0.5 * np.tan(np.pi / 6),
+            0.5 * np.tan(np.pi / 6),
+            0.5 / np.cos(np.pi / 6),
+            0.5 * np.tan(np.pi / 6),
+            -0.5 * np.tan(np.pi / 6),
+        ]
+    )
 
     # Coordinates for all hexagonal patches
-    hxs = np.array([hx] * m) * dx + np.vstack(centers[:, 0])
-    hys = np.array([hy] * m) * dy / np.sqrt(3) + np.vstack(centers[:, 1])
+    hxs = hx * dx + centers[:, [0]]
+    hys = hy * dy / np.sqrt(3) + centers[:, [1]]
+    return hxs, hys
+
+
+def _hexagons_ids(centers):
+    """
+    Returns the unique id of each hexagon, based on its center (shape M)
+    """
+    centers = centers.astype(str)
+    return np.char.add(np.char.add(centers[:, 0], ","), centers[:, 1])
+
+
+def _compute_hexbin(x, y, x_range, y_range, color, nx, agg_func, min_count):
+    """
+    Computes the aggregation at hexagonal bin level.
+    Also defines the coordinates of the hexagons for plotting.
+    The binning is inspired by matplotlib's implementation.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Array of x values (shape N)
+    y : np.ndarray
+        Array of y values (shape N)
+    x_range : np.ndarray
+        Min and max x (shape 2)
+    y_range : np.ndarray
+        Min and max y (shape 2)
+    color : np.ndarray
+        Metric to aggregate at hexagon level (shape N)
+    nx : int
+        Number of hexagons horizontally
+    agg_func : function
+        Numpy compatible aggregator, this function must take a one-dimensional
+        np.ndarray as input and output a scalar
+    min_count : int
+        Minimum number of points in the hexagon for the hexagon to be displayed
+
+    Returns
+    -------
+    np.ndarray
+        X coordinates of each hexagon (shape M x 6)
+    np.ndarray
+        Y coordinates of each hexagon (shape M x 6)
+    np.ndarray
+        Centers of the hexagons (shape M x 2)
+    np.ndarray
+        Aggregated value in each hexagon (shape M)
+
+    """
+    ids, centers, dx, dy = _hexbin_lattice(x, y, x_range, y_range, nx)
+    accum = _aggregate_hexbin(ids, len(centers), color, agg_func, min_count)[0]
+    good_idxs = ~np.isnan(accum)
+
+    agreggated_value = accum[good_idxs]
+    centers = centers[good_idxs]
+    hxs, hys = _hexagons_coordinates(centers, dx, dy)
 
     return hxs, hys, centers, agreggated_value
 
@@ -301,24 +386,61 @@ def _compute_wgs84_hexbin(
     return hexagons_lats, hexagons_lons, hexagons_ids, agreggated_value
 
 
+def _frame_codes(frame):
+    """
+    Returns the index of the frame of each row, -1 for the rows without a
+    frame, and the values of the frames in order of appearance.
+
+    Parameters
+    ----------
+    frame : nw.Series
+        Animation frame of each row
+
+    Returns
+    -------
+    np.ndarray
+        Index of the frame of each row (shape N)
+    np.ndarray
+        Value of each frame (shape F)
+
+    """
+    values = frame.to_numpy()
+    valid = ~frame.is_null().to_numpy()
+    codes = np.full(len(values), -1)
+    try:
+        keys, first, inverse = np.unique(
+            values[valid], return_index=True, return_inverse=True
+        )
+    except TypeError:
+        # Values which cannot be sorted are numbered in Python
+        numbers = {}
+        codes[valid] = [numbers.setdefault(v, len(numbers)) for v in values[valid]]
+        return codes, np.array(list(numbers), dtype=object)
+    order = np.argsort(first)
+    ranks = np.empty(len(order), int)
+    ranks[order] = np.arange(len(order))
+    codes[valid] = ranks[inverse.ravel()]
+    return codes, keys[order]
+
+
 def _hexagons_to_geojson(hexagons_lats, hexagons_lons, ids=None):
     """
     Creates a geojson of hexagonal features based on the outputs of
     _compute_wgs84_hexbin
     """
-    features = []
     if ids is None:
-        ids = np.arange(len(hexagons_lats))
-    for lat, lon, idx in zip(hexagons_lats, hexagons_lons, ids):
-        points = np.array([lon, lat]).T.tolist()
-        points.append(points[0])
-        features.append(
-            dict(
-                type="Feature",
-                id=idx,
-                geometry=dict(type="Polygon", coordinates=[points]),
-            )
+        ids = range(len(hexagons_lats))
+    # Close the polygons by repeating their first vertex
+    points = np.stack([hexagons_lons, hexagons_lats], axis=-1)
+    points = np.concatenate([points, points[:, :1]], axis=1).tolist()
+    features = [
+        dict(
+            type="Feature",
+            id=idx,
+            geometry=dict(type="Polygon", coordinates=[polygon]),
         )
+        for polygon, idx in zip(points, ids)
+    ]
     return dict(type="FeatureCollection", features=features)
 
 
@@ -376,19 +498,24 @@ def create_hexbin_mapbox(
         .squeeze()
     )
 
-    hexagons_lats, hexagons_lons, hexagons_ids, count = _compute_wgs84_hexbin(
-        lat=args["data_frame"].get_column(args["lat"]).to_numpy(),
-        lon=args["data_frame"].get_column(args["lon"]).to_numpy(),
-        lat_range=lat_range,
-        lon_range=lon_range,
-        color=None,
-        nx=nx_hexagon,
-        agg_func=agg_func,
-        min_count=min_count,
-        native_namespace=native_namespace,
+    # Assign all the points to their hexagon once, for the geojson and all
+    # the frames
+    x, y = _project_latlon_to_wgs84(
+        args["data_frame"].get_column(args["lat"]).to_numpy(),
+        args["data_frame"].get_column(args["lon"]).to_numpy(),
     )
+    x_range, y_range = _project_latlon_to_wgs84(lat_range, lon_range)
+    ids, centers, dx, dy = _hexbin_lattice(x, y, x_range, y_range, nx_hexagon)
+    hexagons_ids = _hexagons_ids(centers)
 
-    geojson = _hexagons_to_geojson(hexagons_lats, hexagons_lons, hexagons_ids)
+    count = _aggregate_hexbin(ids, len(centers), None, agg_func, min_count)[0]
+    shown = ~np.isnan(count)
+    hexagons_lats, hexagons_lons = _project_wgs84_to_latlon(
+        *_hexagons_coordinates(centers[shown], dx, dy)
+    )
+    geojson = _hexagons_to_geojson(
+        hexagons_lats, hexagons_lons, hexagons_ids[shown].tolist()
+    )
 
     if zoom is None:
         if height is None and width is None:
@@ -407,48 +534,43 @@ def create_hexbin_mapbox(
         center = dict(lat=lat_range.mean(), lon=lon_range.mean())
 
     if args["animation_frame"] is not None:
-        groups = dict(
-            args["data_frame"]
-            .group_by(args["animation_frame"], drop_null_keys=True)
-            .__iter__()
+        frames, frame_keys = _frame_codes(
+            args["data_frame"].get_column(args["animation_frame"])
         )
     else:
-        groups = {(0,): args["data_frame"]}
-
-    agg_data_frame_list = []
-    for key, df in groups.items():
-        _, _, hexagons_ids, aggregated_value = _compute_wgs84_hexbin(
-            lat=df.get_column(args["lat"]).to_numpy(),
-            lon=df.get_column(args["lon"]).to_numpy(),
-            lat_range=lat_range,
-            lon_range=lon_range,
-            color=df.get_column(args["color"]).to_numpy() if args["color"] else None,
-            nx=nx_hexagon,
-            agg_func=agg_func,
-            min_count=min_count,
-            native_namespace=native_namespace,
-        )
-        agg_data_frame_list.append(
-            nw.from_dict(
-                {
-                    "frame": [key[0]] * len(hexagons_ids),
-                    "locations": hexagons_ids,
-                    "color": aggregated_value,
-                },
-                native_namespace=native_namespace,
-            )
-        )
-
-    agg_data_frame = nw.concat(agg_data_frame_list, how="vertical").with_columns(
-        color=nw.col("color").cast(nw.Int64)
+        frames, frame_keys = None, np.array([0])
+
+    aggregated_values = _aggregate_hexbin(
+        ids,
+        len(centers),
+        (
+            args["data_frame"].get_column(args["color"]).to_numpy()
+            if args["color"]
+            else None
+        ),
+        agg_func,
+        min_count,
+        frames,
+        len(frame_keys),
     )
+    frame_index, hexagon_index = np.nonzero(~np.isnan(aggregated_values))
+    agg_data_frame = nw.from_dict(
+        {
+            "frame": frame_keys[frame_index],
+            "locations": hexagons_ids[hexagon_index],
+            "color": aggregated_values[frame_index, hexagon_index],
+        },
+        native_namespace=native_namespace,
+    ).with_columns(color=nw.col("color").cast(nw.Int64))
 
     if range_color is None:
         range_color = [agg_data_frame["color"].min(), agg_data_frame["color"].max()]
 
+    # The frames of animations leave out the geojson shared by all of them,
+    # which is only set on the traces of the figure
     fig = choropleth_mapbox(
         data_frame=agg_data_frame.to_native(),
-        geojson=geojson,
+        geojson=geojson if args["animation_frame"] is None else None,
         locations="locations",
         color="color",
         hover_data={"color": True, "locations": False, "frame": False},
@@ -468,6 +590,8 @@ def create_hexbin_mapbox(
         width=width,
         height=height,
     )
+    if args["animation_frame"] is not None:
+        fig.update_traces(geojson=geojson)
 
     if show_original_data:
         original_fig = scatter_mapbox(
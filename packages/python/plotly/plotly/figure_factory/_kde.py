@@ -0,0 +1,111 @@
+"""
+Gaussian kernel density estimation for create_distplot and create_violin
+
+The estimates match those of `scipy.stats.gaussian_kde` with its default
+bandwidth (Scott's rule). They are computed exactly for small inputs, and
+for large inputs by binning the samples on a fine regular grid and
+convolving the bin counts with the kernel through an FFT, so that the cost
+grows linearly with the number of samples.
+"""
+from concurrent.futures import ThreadPoolExecutor
+from math import pi, sqrt
+
+from plotly import exceptions, optional_imports
+
+np = optional_imports.get_module("numpy")
+
+# Largest number of (sample, grid point) pairs evaluated exactly
+_MAX_EXACT_SIZE = 2**20
+
+# Number of bins of the binned estimate
+_BINS = 2**14
+
+
+def scott_bandwidth(values):
+    """
+    Returns the standard deviation of the Gaussian kernel used by
+    `scipy.stats.gaussian_kde` with the default bandwidth (Scott's rule),
+    the sample standard deviation times n ** (-1 / 5)
+
+    :raises: (PlotlyError) If there are less than two distinct values
+    """
+    bandwidth = np.std(values, ddof=1) * len(values) ** -0.2 if len(values) > 1 else 0
+    if not bandwidth > 0:
+        raise exceptions.PlotlyError(
+            "A kernel density estimate requires at least two distinct values."
+        )
+    return bandwidth
+
+
+def gaussian_kde(values, grid):
+    """
+    Returns the Gaussian kernel density estimate of the `values` samples at
+    the `grid` points, with the bandwidth of `scott_bandwidth`
+
+    :param (array) values: the samples
+    :param (array) grid: the points where the density is evaluated
+    :rtype (ndarray): the density at each point of `grid`
+    """
+    values = np.asarray(values, dtype=float).ravel()
+    grid = np.asarray(grid, dtype=float)
+    bandwidth = scott_bandwidth(values)
+    norm = len(values) * bandwidth * sqrt(2 * pi)
+
+    low = min(values.min(), grid.min())
+    high = max(values.max(), grid.max())
+    step = (high - low) / (_BINS - 1)
+
+    # The binned estimate is only accurate with several bins per bandwidth,
+    # which may not be the case for data with far outliers
+    if len(values) * len(grid) <= _MAX_EXACT_SIZE or step > bandwidth / 4:
+        density = np.empty(len(grid))
+        chunk = max(1, _MAX_EXACT_SIZE // len(values))
+        for start in range(0, len(grid), chunk):
+            z = (grid[start : start + chunk, np.newaxis] - values) / bandwidth
+            density[start : start + chunk] = np.exp(-0.5 * z**2).sum(axis=1)
+        return density / norm
+
+    # Share each sample between its two nearest bins (linear binning)
+    position = (values - low) / step
+    left = np.clip(np.floor(position).astype(int), 0, _BINS - 2)
+    right_weight = position - left
+    counts = np.bincount(left, 1 - right_weight, _BINS) + np.bincount(
+        left + 1, right_weight, _BINS
+    )
+
+    # Convolve the counts with the kernel sampled at all the bin offsets,
+    # zero-padding them so that the FFT convolution does not wrap around
+    offsets = np.arange(1 - _BINS, _BINS) * step
+    kernel = np.exp(-0.5 * (offsets / bandwidth) ** 2)
+    size = 1 << int(3 * _BINS - 2).bit_length()
+    density = np.fft.irfft(np.fft.rfft(counts, size) * np.fft.rfft(kernel, size), size)
+    density = np.maximum(density[_BINS - 1 : 2 * _BINS - 1], 0) / norm
+    return np.interp(grid, low + step * np.arange(_BINS), density)
+
+
+def gaussian_kdes(datasets, grids, max_workers=None):
+    """
+    Returns the list of the `gaussian_kde` estimates of each dataset of
+    `datasets` at the points of the corresponding grid of `grids`
+
+    :param (int|None) max_workers: if greater than 1, the estimates are
+        computed by a pool of `max_workers` threads (numpy releases the GIL
+        while computing them)
+    """
+    if max_workers is not None and max_workers > 1 and len(datasets) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(gaussian_kde, datasets, grids))
+    return [gaussian_kde(values, grid) for values, grid in zip(datasets, grids)]
+
+
+def rug_indices(values, max_points):
+    """
+    Returns the sorted indices of at most `max_points` of the `values`,
+    evenly spread over their quantiles, or None when there are no more than
+    `max_points` values
+    """
+    if max_points is None or len(values) <= max_points:
+        return None
+    order = np.argsort(np.asarray(values, dtype=float), kind="stable")
+    positions = np.linspace(0, len(order) - 1, max_points).round().astype(int)
+    return np.sort(order[positions])
@@ -1,6 +1,9 @@
-from plotly import exceptions
+from plotly import exceptions, optional_imports
 from plotly.graph_objs import graph_objs
 from plotly.figure_factory import utils
+from plotly.figure_factory._arrows import nan_to_none
+
+np = optional_imports.get_module("numpy")
 
 
 # Default colours for finance charts
@@ -13,7 +16,8 @@ def validate_ohlc(open, high, low, close, direction, **kwargs):
     ohlc and candlestick specific validations
 
     Specifically, this checks that the high value is the greatest value and
-    the low value is the lowest value in each unit.
+    the low value is the lowest value in each unit. Missing values (None or
+    NaN) are not checked.
 
     See FigureFactory.create_ohlc() or FigureFactory.create_candlestick()
     for params
@@ -24,29 +28,26 @@ def validate_ohlc(open, high, low, close, direction, **kwargs):
         unit.
     :raises: (PlotlyError) If direction is not 'increasing' or 'decreasing'
     """
-    for lst in [open, low, close]:
-        for index in range(len(high)):
-            if high[index] < lst[index]:
-                raise exceptions.PlotlyError(
-                    "Oops! Looks like some of "
-                    "your high values are less "
-                    "the corresponding open, "
-                    "low, or close values. "
-                    "Double check that your data "
-                    "is entered in O-H-L-C order"
-                )
-
-    for lst in [open, high, close]:
-        for index in range(len(low)):
-            if low[index] > lst[index]:
-                raise exceptions.PlotlyError(
-                    "Oops! Looks like some of "
-                    "your low values are greater "
-                    "than the corresponding high"
-                    ", open, or close values. "
-                    "Double check that your data "
-                    "is entered in O-H-L-C order"
-                )
+    open, high, low, close = _as_price_arrays(open, high, low, close)
+    if np.any((high < open) | (high < low) | (high < close)):
+        raise exceptions.PlotlyError(
+            "Oops! Looks like some of "
+            "your high values are less "
+            "the corresponding open, "
+            "low, or close values. "
+            "Double check that your data "
+            "is entered in O-H-L-C order"
+        )
+
+    if np.any((low > open) | (low > high) | (low > close)):
+        raise exceptions.PlotlyError(
+            "Oops! Looks like some of "
+            "your low values are greater "
+            "than the corresponding high"
+            ", open, or close values. "
+            "Double check that your data "
+            "is entered in O-H-L-C order"
+        )
 
     direction_opts = ("increasing", "decreasing", "both")
     if direction not in direction_opts:
@@ -135,6 +136,9 @@ def create_ohlc(open, high, low, close, dates=None, direction="both", **kwargs):
     **deprecated**, use instead the plotly.graph_objects trace
     :class:`plotly.graph_objects.Ohlc`
 
+    When the values are numpy arrays or pandas Series rather than lists, the
+    returned traces hold typed arrays instead of lists.
+
     :param (list) open: opening values
     :param (list) high: high values
     :param (list) low: low values
@@ -187,31 +191,90 @@ def create_ohlc(open, high, low, close, dates=None, direction="both", **kwargs):
     return graph_objs.Figure(data=data, layout=layout)
 
 
+def _as_price_arrays(*prices):
+    """
+    Returns the price lists as float arrays, with NaN for missing values
+    """
+    return [np.asarray(price, dtype=float) for price in prices]
+
+
+def _as_x_array(dates, n, typed):
+    """
+    Returns the x coordinates of the `n` units: the indices of the units if
+    `dates` is None, the dates as a datetime64 array when typed arrays are
+    built and they can be converted to one, or else an object array of the
+    dates themselves
+    """
+    if dates is None:
+        return np.arange(n)
+    if not typed:
+        # Keep the date objects, repeated values then share the same object
+        x = np.empty(n, dtype=object)
+        x[:] = list(dates)
+        return x
+    x = np.asarray(dates)
+    if x.dtype == object:
+        try:
+            x = x.astype("datetime64[us]")
+        except (TypeError, ValueError):
+            pass
+    elif x.dtype.kind == "M":
+        # Use at least microseconds so that branch lengths are not rounded
+        x = x.astype(np.result_type(x.dtype, np.dtype("datetime64[us]")))
+    return x
+
+
+def _is_typed(*prices):
+    """
+    Returns whether the traces should hold typed arrays, which is the case
+    when the prices are not given as plain lists (e.g. numpy arrays or
+    pandas Series)
+    """
+    return not all(isinstance(price, (list, tuple)) for price in prices)
+
+
+def _to_list(values):
+    """
+    Returns the list of `values`, with None for the NaN gaps
+    """
+    if values.dtype.kind == "f":
+        return nan_to_none(values)
+    return values.tolist()
+
+
+def _gap(dtype):
+    """
+    Returns the value separating the units of a trace of the given dtype
+    """
+    if dtype.kind in "mM":
+        return dtype.type("NaT")
+    if dtype.kind == "O":
+        return None
+    return np.nan
+
+
 class _OHLC(object):
     """
     Refer to FigureFactory.create_ohlc_increase() for docstring.
     """
 
     def __init__(self, open, high, low, close, dates, **kwargs):
-        self.open = open
-        self.high = high
-        self.low = low
-        self.close = close
-        self.empty = [None] * len(open)
+        self.typed = _is_typed(open, high, low, close)
+        self.open, self.high, self.low, self.close = _as_price_arrays(
+            open, high, low, close
+        )
         self.dates = dates
+        self.x = _as_x_array(dates, len(self.open), self.typed)
 
         self.all_x = []
         self.all_y = []
-        self.increase_x = []
-        self.increase_y = []
-        self.decrease_x = []
-        self.decrease_y = []
         self.get_all_xy()
-        self.separate_increase_decrease()
+        self.increase = self.close > self.open
+        self.decrease = ~self.increase & ~np.isnan(self.close)
 
     def get_all_xy(self):
         """
-        Zip data to create OHLC shape
+        Get the columns of the OHLC shape
 
         OHLC shape: low to high vertical bar with
         horizontal branches for open and close values.
@@ -220,76 +283,62 @@ class _OHLC(object):
         If no date data was provided, the x-axis is a list of integers and the
         length of the open and close branches is .2.
         """
-        self.all_y = list(
-            zip(
-                self.open,
-                self.open,
-                self.high,
-                self.low,
-                self.close,
-                self.close,
-                self.empty,
-            )
-        )
+        self.all_y = [
+            self.open,
+            self.open,
+            self.high,
+            self.low,
+            self.close,
+            self.close,
+        ]
         if self.dates is not None:
-            date_dif = []
-            for i in range(len(self.dates) - 1):
-                date_dif.append(self.dates[i + 1] - self.dates[i])
-            date_dif_min = (min(date_dif)) / 5
-            self.all_x = [
-                [x - date_dif_min, x, x, x, x, x + date_dif_min, None]
-                for x in self.dates
-            ]
+            date_dif_min = np.diff(self.x).min() / 5
         else:
-            self.all_x = [
-                [x - 0.2, x, x, x, x, x + 0.2, None] for x in range(len(self.open))
-            ]
+            date_dif_min = 0.2
+        x = self.x
+        self.all_x = [x - date_dif_min, x, x, x, x, x + date_dif_min]
 
-    def separate_increase_decrease(self):
+    def get_segments(self, mask):
         """
-        Separate data into two groups: increase and decrease
+        Get the x and y values and the hovertext of the units selected by
+        `mask`, the values of each unit being followed by a gap
 
-        (1) Increase, where close > open and
-        (2) Decrease, where close <= open
+        :rtype (list|ndarray, list|ndarray, tuple|ndarray): the x-values,
+            the y-values and the hovertext of the trace
         """
-        for index in range(len(self.open)):
-            if self.close[index] is None:
-                pass
-            elif self.close[index] > self.open[index]:
-                self.increase_x.append(self.all_x[index])
-                self.increase_y.append(self.all_y[index])
-            else:
-                self.decrease_x.append(self.all_x[index])
-                self.decrease_y.append(self.all_y[index])
+        segments = []
+        for columns in (self.all_x, self.all_y):
+            columns = [column[mask] for column in columns]
+            values = np.empty(
+                (len(columns[0]), len(columns) + 1), dtype=np.result_type(*columns)
+            )
+            values[:, :-1] = np.stack(columns, axis=1)
+            values[:, -1] = _gap(values.dtype)
+            values = values.ravel()
+            segments.append(values if self.typed else _to_list(values))
+        text = ("Open", "Open", "High", "Low", "Close", "Close", "")
+        if self.typed:
+            text = np.tile(np.array(text), np.count_nonzero(mask))
+        else:
+            text = text * int(np.count_nonzero(mask))
+        return segments[0], segments[1], text
 
     def get_increase(self):
         """
-        Flatten increase data and get increase text
+        Get the increase data, where close > open
 
         :rtype (list, list, list): flat_increase_x: x-values for the increasing
             trace, flat_increase_y: y=values for the increasing trace and
             text_increase: hovertext for the increasing trace
         """
-        flat_increase_x = utils.flatten(self.increase_x)
-        flat_increase_y = utils.flatten(self.increase_y)
-        text_increase = ("Open", "Open", "High", "Low", "Close", "Close", "") * (
-            len(self.increase_x)
-        )
-
-        return flat_increase_x, flat_increase_y, text_increase
+        return self.get_segments(self.increase)
 
     def get_decrease(self):
         """
-        Flatten decrease data and get decrease text
+        Get the decrease data, where close <= open
 
         :rtype (list, list, list): flat_decrease_x: x-values for the decreasing
             trace, flat_decrease_y: y=values for the decreasing trace and
             text_decrease: hovertext for the decreasing trace
         """
-        flat_decrease_x = utils.flatten(self.decrease_x)
-        flat_decrease_y = utils.flatten(self.decrease_y)
-        text_decrease = ("Open", "Open", "High", "Low", "Close", "Close", "") * (
-            len(self.decrease_x)
-        )
-
-        return flat_decrease_x, flat_decrease_y, text_decrease
+        return self.get_segments(self.decrease)
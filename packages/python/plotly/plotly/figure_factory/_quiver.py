@@ -1,8 +1,8 @@
 import math
 
-from plotly import exceptions
+from plotly import exceptions, optional_imports
 from plotly.graph_objs import graph_objs
-from plotly.figure_factory import utils
+from plotly.figure_factory import _arrows, utils
 
 
 def create_quiver(
@@ -128,39 +128,17 @@ class _Quiver(object):
     """
 
     def __init__(self, x, y, u, v, scale, arrow_scale, angle, scaleratio=1, **kwargs):
-        try:
-            x = utils.flatten(x)
-        except exceptions.PlotlyError:
-            pass
-
-        try:
-            y = utils.flatten(y)
-        except exceptions.PlotlyError:
-            pass
-
-        try:
-            u = utils.flatten(u)
-        except exceptions.PlotlyError:
-            pass
-
-        try:
-            v = utils.flatten(v)
-        except exceptions.PlotlyError:
-            pass
-
-        self.x = x
-        self.y = y
-        self.u = u
-        self.v = v
+        self.x = _as_float_array(x)
+        self.y = _as_float_array(y)
+        self.u = _as_float_array(u)
+        self.v = _as_float_array(v)
         self.scale = scale
         self.scaleratio = scaleratio
         self.arrow_scale = arrow_scale
         self.angle = angle
-        self.end_x = []
-        self.end_y = []
         self.scale_uv()
-        barb_x, barb_y = self.get_barbs()
-        arrow_x, arrow_y = self.get_quiver_arrows()
+        self.end_x = self.x + self.u
+        self.end_y = self.y + self.v
 
     def scale_uv(self):
         """
@@ -170,96 +148,55 @@ class _Quiver(object):
         endpoints of the arrows so a smaller scale value will
         result in less overlap of arrows.
         """
-        self.u = [i * self.scale * self.scaleratio for i in self.u]
-        self.v = [i * self.scale for i in self.v]
+        self.u = self.u * self.scale * self.scaleratio
+        self.v = self.v * self.scale
 
     def get_barbs(self):
         """
         Creates x and y startpoint and endpoint pairs
 
-        After finding the endpoint of each barb this zips startpoint and
-        endpoint pairs to create 2 lists: x_values for barbs and y values
-        for barbs
-
         :rtype: (list, list) barb_x, barb_y: list of startpoint and endpoint
             x_value pairs separated by a None to create the barb of the arrow,
             and list of startpoint and endpoint y_value pairs separated by a
             None to create the barb of the arrow.
         """
-        self.end_x = [i + j for i, j in zip(self.x, self.u)]
-        self.end_y = [i + j for i, j in zip(self.y, self.v)]
-        empty = [None] * len(self.x)
-        barb_x = utils.flatten(zip(self.x, self.end_x, empty))
-        barb_y = utils.flatten(zip(self.y, self.end_y, empty))
-        return barb_x, barb_y
+        barb_x = _arrows.separate_segments(self.x, self.end_x)
+        barb_y = _arrows.separate_segments(self.y, self.end_y)
+        return _arrows.nan_to_none(barb_x), _arrows.nan_to_none(barb_y)
 
     def get_quiver_arrows(self):
         """
         Creates lists of x and y values to plot the arrows
 
-        Gets length of each barb then calculates the length of each side of
-        the arrow. Gets angle of barb and applies angle to each side of the
-        arrowhead. Next uses arrow_scale to scale the length of arrowhead and
-        creates x and y values for arrowhead point1 and point2. Finally x and y
-        values for point1, endpoint and point2s for each arrowhead are
-        separated by a None and zipped to create lists of x and y values for
-        the arrows.
+        The arrowhead of each barb is made of two sides of arrow_scale times
+        the length of the barb, at angle radians from the barb. The lengths and
+        angles are computed in the scale of the y-axis, so that the arrowheads
+        keep their shape when scaleratio is set.
 
         :rtype: (list, list) arrow_x, arrow_y: list of point1, endpoint, point2
             x_values separated by a None to create the arrowhead and list of
             point1, endpoint, point2 y_values separated by a None to create
             the barb of the arrow.
         """
-        dif_x = [i - j for i, j in zip(self.end_x, self.x)]
-        dif_y = [i - j for i, j in zip(self.end_y, self.y)]
-
-        # Get barb lengths(default arrow length = 30% barb length)
-        barb_len = [None] * len(self.x)
-        for index in range(len(barb_len)):
-            barb_len[index] = math.hypot(dif_x[index] / self.scaleratio, dif_y[index])
-
-        # Make arrow lengths
-        arrow_len = [None] * len(self.x)
-        arrow_len = [i * self.arrow_scale for i in barb_len]
-
-        # Get barb angles
-        barb_ang = [None] * len(self.x)
-        for index in range(len(barb_ang)):
-            barb_ang[index] = math.atan2(dif_y[index], dif_x[index] / self.scaleratio)
-
-        # Set angles to create arrow
-        ang1 = [i + self.angle for i in barb_ang]
-        ang2 = [i - self.angle for i in barb_ang]
-
-        cos_ang1 = [None] * len(ang1)
-        for index in range(len(ang1)):
-            cos_ang1[index] = math.cos(ang1[index])
-        seg1_x = [i * j for i, j in zip(arrow_len, cos_ang1)]
-
-        sin_ang1 = [None] * len(ang1)
-        for index in range(len(ang1)):
-            sin_ang1[index] = math.sin(ang1[index])
-        seg1_y = [i * j for i, j in zip(arrow_len, sin_ang1)]
-
-        cos_ang2 = [None] * len(ang2)
-        for index in range(len(ang2)):
-            cos_ang2[index] = math.cos(ang2[index])
-        seg2_x = [i * j for i, j in zip(arrow_len, cos_ang2)]
-
-        sin_ang2 = [None] * len(ang2)
-        for index in range(len(ang2)):
-            sin_ang2[index] = math.sin(ang2[index])
-        seg2_y = [i * j for i, j in zip(arrow_len, sin_ang2)]
-
-        # Set coordinates to create arrow
-        for index in range(len(self.end_x)):
-            point1_x = [i - j * self.scaleratio for i, j in zip(self.end_x, seg1_x)]
-            point1_y = [i - j for i, j in zip(self.end_y, seg1_y)]
-            point2_x = [i - j * self.scaleratio for i, j in zip(self.end_x, seg2_x)]
-            point2_y = [i - j for i, j in zip(self.end_y, seg2_y)]
-
-        # Combine lists to create arrow
-        empty = [None] * len(self.end_x)
-        arrow_x = utils.flatten(zip(point1_x, self.end_x, point2_x, empty))
-        arrow_y = utils.flatten(zip(point1_y, self.end_y, point2_y, empty))
-        return arrow_x, arrow_y
+        np = optional_imports.get_module("numpy")
+        dif_x = self.u / self.scaleratio
+        dif_y = self.v
+        arrow_x, arrow_y = _arrows.arrowheads(
+            self.end_x,
+            self.end_y,
+            dif_x,
+            dif_y,
+            np.hypot(dif_x, dif_y) * self.arrow_scale,
+            self.angle,
+            self.scaleratio,
+        )
+        return _arrows.nan_to_none(arrow_x), _arrows.nan_to_none(arrow_y)
+
+
+def _as_float_array(values):
+    np = optional_imports.get_module("numpy")
+    try:
+        values = utils.flatten(values)
+    except exceptions.PlotlyError:
+        pass
+    return np.asarray(values, dtype=float).ravel()
@@ -1,7 +1,8 @@
+import itertools
 import math
 
 from plotly import exceptions, optional_imports
-from plotly.figure_factory import utils
+from plotly.figure_factory import _arrows, utils
 from plotly.graph_objs import graph_objs
 
 np = optional_imports.get_module("numpy")
@@ -112,12 +113,9 @@ def create_streamline(
     validate_streamline(x, y)
     utils.validate_positive_scalars(density=density, arrow_scale=arrow_scale)
 
-    streamline_x, streamline_y = _Streamline(
-        x, y, u, v, density, angle, arrow_scale
-    ).sum_streamlines()
-    arrow_x, arrow_y = _Streamline(
-        x, y, u, v, density, angle, arrow_scale
-    ).get_streamline_arrows()
+    streamline_obj = _Streamline(x, y, u, v, density, angle, arrow_scale)
+    streamline_x, streamline_y = streamline_obj.sum_streamlines()
+    arrow_x, arrow_y = streamline_obj.get_streamline_arrows()
 
     streamline = graph_objs.Scatter(
         x=streamline_x + arrow_x, y=streamline_y + arrow_y, mode="lines", **kwargs
@@ -164,8 +162,6 @@ class _Streamline(object):
         self.st_x = []
         self.st_y = []
         self.get_streamlines()
-        streamline_x, streamline_y = self.sum_streamlines()
-        arrows_x, arrows_y = self.get_streamline_arrows()
 
     def blank_pos(self, xi, yi):
         """
@@ -329,67 +325,21 @@ class _Streamline(object):
         :rtype (list, list) arrows_x: x-values to create arrowhead and
             arrows_y: y-values to create arrowhead
         """
-        arrow_end_x = np.empty((len(self.st_x)))
-        arrow_end_y = np.empty((len(self.st_y)))
-        arrow_start_x = np.empty((len(self.st_x)))
-        arrow_start_y = np.empty((len(self.st_y)))
-        for index in range(len(self.st_x)):
-            arrow_end_x[index] = self.st_x[index][int(len(self.st_x[index]) / 3)]
-            arrow_start_x[index] = self.st_x[index][
-                (int(len(self.st_x[index]) / 3)) - 1
-            ]
-            arrow_end_y[index] = self.st_y[index][int(len(self.st_y[index]) / 3)]
-            arrow_start_y[index] = self.st_y[index][
-                (int(len(self.st_y[index]) / 3)) - 1
-            ]
-
-        dif_x = arrow_end_x - arrow_start_x
-        dif_y = arrow_end_y - arrow_start_y
-
-        orig_err = np.geterr()
-        np.seterr(divide="ignore", invalid="ignore")
-        streamline_ang = np.arctan(dif_y / dif_x)
-        np.seterr(**orig_err)
-
-        ang1 = streamline_ang + (self.angle)
-        ang2 = streamline_ang - (self.angle)
-
-        seg1_x = np.cos(ang1) * self.arrow_scale
-        seg1_y = np.sin(ang1) * self.arrow_scale
-        seg2_x = np.cos(ang2) * self.arrow_scale
-        seg2_y = np.sin(ang2) * self.arrow_scale
-
-        point1_x = np.empty((len(dif_x)))
-        point1_y = np.empty((len(dif_y)))
-        point2_x = np.empty((len(dif_x)))
-        point2_y = np.empty((len(dif_y)))
-
-        for index in range(len(dif_x)):
-            if dif_x[index] >= 0:
-                point1_x[index] = arrow_end_x[index] - seg1_x[index]
-                point1_y[index] = arrow_end_y[index] - seg1_y[index]
-                point2_x[index] = arrow_end_x[index] - seg2_x[index]
-                point2_y[index] = arrow_end_y[index] - seg2_y[index]
-            else:
-                point1_x[index] = arrow_end_x[index] + seg1_x[index]
-                point1_y[index] = arrow_end_y[index] + seg1_y[index]
-                point2_x[index] = arrow_end_x[index] + seg2_x[index]
-                point2_y[index] = arrow_end_y[index] + seg2_y[index]
-
-        space = np.empty((len(point1_x)))
-        space[:] = np.nan
-
-        # Combine arrays into array
-        arrows_x = np.array([point1_x, arrow_end_x, point2_x, space])
-        arrows_x = arrows_x.flatten("F")
-        arrows_x = arrows_x.tolist()
-
-        # Combine arrays into array
-        arrows_y = np.array([point1_y, arrow_end_y, point2_y, space])
-        arrows_y = arrows_y.flatten("F")
-        arrows_y = arrows_y.tolist()
-
-        return arrows_x, arrows_y
+        thirds = [int(len(st_x) / 3) for st_x in self.st_x]
+        arrow_end_x = np.array([st_x[i] for st_x, i in zip(self.st_x, thirds)])
+        arrow_end_y = np.array([st_y[i] for st_y, i in zip(self.st_y, thirds)])
+        dif_x = arrow_end_x - [st_x[i - 1] for st_x, i in zip(self.st_x, thirds)]
+        dif_y = arrow_end_y - [st_y[i - 1] for st_y, i in zip(self.st_y, thirds)]
+
+        # Streamlines which don't move at their 1/3 mark have no direction
+        # and get no arrow
+        no_direction = (dif_x == 0) & (dif_y == 0)
+        dif_x[no_direction] = np.nan
+
+        arrows_x, arrows_y = _arrows.arrowheads(
+            arrow_end_x, arrow_end_y, dif_x, dif_y, self.arrow_scale, self.angle
+        )
+        return arrows_x.tolist(), arrows_y.tolist()
 
     def sum_streamlines(self):
         """
@@ -399,6 +349,6 @@ class _Streamline(object):
             combined into single list and streamline_y: all y values for each
             streamline combined into single list
         """
-        streamline_x = sum(self.st_x, [])
-        streamline_y = sum(self.st_y, [])
+        streamline_x = list(itertools.chain.from_iterable(self.st_x))
+        streamline_y = list(itertools.chain.from_iterable(self.st_y))
         return streamline_x, streamline_y
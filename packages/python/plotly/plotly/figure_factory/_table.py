@@ -1,6 +1,8 @@
 from plotly import exceptions, optional_imports
+from plotly.figure_factory import utils
 from plotly.graph_objs import graph_objs
 
+np = optional_imports.get_module("numpy")
 pd = optional_imports.get_module("pandas")
 
 
@@ -31,6 +33,7 @@ def create_table(
     annotation_offset=0.45,
     height_constant=30,
     hoverinfo="none",
+    text_mode="auto",
     **kwargs,
 ):
     """
@@ -53,6 +56,11 @@ def create_table(
     :param (bool) index: Create (header-colored) index column index from
         Pandas dataframe or list[0] for each list in text. Default=False.
     :param (string) index_title: Title for index column. Default=''.
+    :param (str) text_mode: 'annotations' to add a layout annotation for each
+        cell, 'trace' to render the text of the cells with a scatter trace in
+        'text' mode, which is much faster to build and render for large
+        tables, or 'auto' to use 'trace' for tables of more than 1000 cells.
+        Default='auto'.
     :param kwargs: kwargs passed through plotly.graph_objs.Heatmap.
         These kwargs describe other attributes about the annotated Heatmap
         trace such as the colorscale. For more information on valid kwargs
@@ -109,7 +117,7 @@ def create_table(
     )
 
     validate_table(table_text, font_colors)
-    table_matrix = _Table(
+    table = _Table(
         table_text,
         colorscale,
         font_colors,
@@ -117,16 +125,14 @@ def create_table(
         index_title,
         annotation_offset,
         **kwargs,
-    ).get_table_matrix()
-    annotations = _Table(
-        table_text,
-        colorscale,
-        font_colors,
-        index,
-        index_title,
-        annotation_offset,
-        **kwargs,
-    ).make_table_annotations()
+    )
+    table_matrix = table.get_table_matrix()
+    n_cells = sum(len(row) for row in table.table_text)
+    use_text_trace = utils.use_text_trace(text_mode, n_cells)
+    if use_text_trace:
+        annotations = []
+    else:
+        annotations = table.make_table_annotations()
 
     trace = dict(
         type="heatmap",
@@ -139,6 +145,8 @@ def create_table(
     )
 
     data = [trace]
+    if use_text_trace:
+        data.append(table.make_table_text_trace())
     layout = dict(
         annotations=annotations,
         height=len(table_matrix) * height_constant + 50,
@@ -161,6 +169,10 @@ def create_table(
             showticklabels=False,
         ),
     )
+    if use_text_trace:
+        # Keep the ranges of the heatmap, which the text would extend
+        layout["xaxis"]["range"] = [-0.5, len(table_matrix[0]) - 0.5]
+        layout["yaxis"]["range"] = [len(table_matrix) - 0.5, -0.5]
     return graph_objs.Figure(data=data, layout=layout)
 
 
@@ -279,3 +291,40 @@ class _Table(object):
                     )
                 )
         return annotations
+
+    def make_table_text_trace(self):
+        """
+        Generate a scatter trace in 'text' mode to fill in table text
+
+        The text of each cell is placed like its annotation would be, left
+        aligned at annotation_offset from the center of the cell.
+
+        :rtype (dict) trace: scatter trace with the text of each cell of the
+            table.
+        """
+        all_font_colors = _Table.get_table_font_color(self)
+        row_lengths = [len(row) for row in self.table_text]
+        rows = np.repeat(np.arange(len(self.table_text)), row_lengths)
+        columns = np.concatenate([np.arange(length) for length in row_lengths])
+        text = np.array(
+            [str(val) for row in self.table_text for val in row], dtype=object
+        )
+        # Bold text in header and index
+        is_bold = rows == 0
+        font_colors = np.array(all_font_colors, dtype=object)[rows]
+        if self.index:
+            is_bold |= columns == 0
+            # Match font color of index to font color of header
+            font_colors[columns == 0] = self.font_colors[0]
+        text[is_bold] = "<b>" + text[is_bold] + "</b>"
+        return dict(
+            type="scatter",
+            mode="text",
+            x=columns - self.annotation_offset,
+            y=rows,
+            text=text.tolist(),
+            textposition="middle right",
+            textfont=dict(color=font_colors.tolist()),
+            hoverinfo="skip",
+            showlegend=False,
+        )
@@ -2,12 +2,12 @@ from numbers import Number
 
 from plotly import exceptions, optional_imports
 import plotly.colors as clrs
+from plotly.figure_factory._kde import gaussian_kdes, rug_indices
 from plotly.graph_objs import graph_objs
 from plotly.subplots import make_subplots
 
 pd = optional_imports.get_module("pandas")
 np = optional_imports.get_module("numpy")
-scipy_stats = optional_imports.get_module("scipy.stats")
 
 
 def calc_stats(data):
@@ -154,26 +154,34 @@ def make_YAxis(yaxis_title):
     return yaxis
 
 
-def violinplot(vals, fillcolor="#1f77b4", rugplot=True):
+def violin_pdfs(groups, max_workers=None):
+    """
+    Returns the kernel density estimations of the groups of values of a
+    violin plot over the 100 points grids of `violinplot`.
+    """
+    grids = [np.linspace(np.min(vals), np.max(vals), 100) for vals in groups]
+    return gaussian_kdes(groups, grids, max_workers)
+
+
+def violinplot(vals, fillcolor="#1f77b4", rugplot=True, pdf=None, max_rug_points=None):
     """
     Refer to FigureFactory.create_violin() for docstring.
     """
     vals = np.asarray(vals, float)
     #  summary statistics
-    vals_min = calc_stats(vals)["min"]
-    vals_max = calc_stats(vals)["max"]
-    q1 = calc_stats(vals)["q1"]
-    q2 = calc_stats(vals)["q2"]
-    q3 = calc_stats(vals)["q3"]
-    d1 = calc_stats(vals)["d1"]
-    d2 = calc_stats(vals)["d2"]
-
-    # kernel density estimation of pdf
-    pdf = scipy_stats.gaussian_kde(vals)
+    stats = calc_stats(vals)
+    vals_min = stats["min"]
+    vals_max = stats["max"]
+    q1 = stats["q1"]
+    q2 = stats["q2"]
+    q3 = stats["q3"]
+    d1 = stats["d1"]
+    d2 = stats["d2"]
+
     # grid over the data interval
     xx = np.linspace(vals_min, vals_max, 100)
-    # evaluate the pdf at the grid xx
-    yy = pdf(xx)
+    # kernel density estimation of pdf at the grid xx
+    yy = violin_pdfs([vals])[0] if pdf is None else pdf
     max_pdf = np.max(yy)
     # distance from the violin plot to rugplot
     distance = (2.0 * max_pdf) / 10 if rugplot else 0
@@ -187,6 +195,9 @@ def violinplot(vals, fillcolor="#1f77b4", rugplot=True):
         make_median(q2),
     ]
     if rugplot:
+        indices = rug_indices(vals, max_rug_points)
+        if indices is not None:
+            vals = vals[indices]
         plot_data.append(
             make_violin_rugplot(vals, max_pdf, distance=distance, color=fillcolor)
         )
@@ -205,6 +216,8 @@ def violin_no_colorscale(
     height,
     width,
     title,
+    max_rug_points=None,
+    max_workers=None,
 ):
     """
     Refer to FigureFactory.create_violin() for docstring.
@@ -227,13 +240,18 @@ def violin_no_colorscale(
     fig = make_subplots(
         rows=1, cols=L, shared_yaxes=True, horizontal_spacing=0.025, print_grid=False
     )
+    groups = [np.asarray(gb.get_group(gr)[data_header], float) for gr in group_name]
+    pdfs = violin_pdfs(groups, max_workers)
     color_index = 0
     for k, gr in enumerate(group_name):
-        vals = np.asarray(gb.get_group(gr)[data_header], float)
         if color_index >= len(colors):
             color_index = 0
         plot_data, plot_xrange = violinplot(
-            vals, fillcolor=colors[color_index], rugplot=rugplot
+            groups[k],
+            fillcolor=colors[color_index],
+            rugplot=rugplot,
+            pdf=pdfs[k],
+            max_rug_points=max_rug_points,
         )
         layout = graph_objs.Layout()
 
@@ -272,6 +290,8 @@ def violin_colorscale(
     height,
     width,
     title,
+    max_rug_points=None,
+    max_workers=None,
 ):
     """
     Refer to FigureFactory.create_violin() for docstring.
@@ -316,15 +336,19 @@ def violin_colorscale(
     max_value = max(group_stats_values)
     min_value = min(group_stats_values)
 
+    groups = [np.asarray(gb.get_group(gr)[data_header], float) for gr in group_name]
+    pdfs = violin_pdfs(groups, max_workers)
     for k, gr in enumerate(group_name):
-        vals = np.asarray(gb.get_group(gr)[data_header], float)
-
         # find intermediate color from colorscale
         intermed = (group_stats[gr] - min_value) / (max_value - min_value)
         intermed_color = clrs.find_intermediate_color(lowcolor, highcolor, intermed)
 
         plot_data, plot_xrange = violinplot(
-            vals, fillcolor="rgb{}".format(intermed_color), rugplot=rugplot
+            groups[k],
+            fillcolor="rgb{}".format(intermed_color),
+            rugplot=rugplot,
+            pdf=pdfs[k],
+            max_rug_points=max_rug_points,
         )
         layout = graph_objs.Layout()
 
@@ -375,6 +399,8 @@ def violin_dict(
     height,
     width,
     title,
+    max_rug_points=None,
+    max_workers=None,
 ):
     """
     Refer to FigureFactory.create_violin() for docstring.
@@ -408,9 +434,16 @@ def violin_dict(
         rows=1, cols=L, shared_yaxes=True, horizontal_spacing=0.025, print_grid=False
     )
 
+    groups = [np.asarray(gb.get_group(gr)[data_header], float) for gr in group_name]
+    pdfs = violin_pdfs(groups, max_workers)
     for k, gr in enumerate(group_name):
-        vals = np.asarray(gb.get_group(gr)[data_header], float)
-        plot_data, plot_xrange = violinplot(vals, fillcolor=colors[gr], rugplot=rugplot)
+        plot_data, plot_xrange = violinplot(
+            groups[k],
+            fillcolor=colors[gr],
+            rugplot=rugplot,
+            pdf=pdfs[k],
+            max_rug_points=max_rug_points,
+        )
         layout = graph_objs.Layout()
 
         for item in plot_data:
@@ -447,6 +480,8 @@ def create_violin(
     height=450,
     width=600,
     title="Violin and Rug Plot",
+    max_rug_points=None,
+    max_workers=None,
 ):
     """
     **deprecated**, use instead the plotly.graph_objects trace
@@ -484,6 +519,12 @@ def create_violin(
     :param (float) height: the height of the violin plot.
     :param (float) width: the width of the violin plot.
     :param (str) title: the title of the violin plot.
+    :param (int) max_rug_points: the largest number of points of each
+        rugplot. Larger groups are sub-sampled to points evenly spread over
+        their quantiles. Default = None (all the points are drawn)
+    :param (int) max_workers: the number of threads computing the kernel
+        density estimations of the groups concurrently. Default = None
+        (computed one after the other)
 
     Example 1: Single Violin Plot
 
@@ -607,7 +648,10 @@ def create_violin(
 
         # call the plotting functions
         plot_data, plot_xrange = violinplot(
-            data, fillcolor=valid_colors[0], rugplot=rugplot
+            data,
+            fillcolor=valid_colors[0],
+            rugplot=rugplot,
+            max_rug_points=max_rug_points,
         )
 
         layout = graph_objs.Layout(
@@ -657,6 +701,8 @@ def create_violin(
                     height,
                     width,
                     title,
+                    max_rug_points,
+                    max_workers,
                 )
                 return fig
             else:
@@ -672,6 +718,8 @@ def create_violin(
                     height,
                     width,
                     title,
+                    max_rug_points,
+                    max_workers,
                 )
                 return fig
         else:
@@ -706,5 +754,7 @@ def create_violin(
                 height,
                 width,
                 title,
+                max_rug_points,
+                max_workers,
             )
             return fig
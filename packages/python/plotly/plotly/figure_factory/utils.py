@@ -110,6 +110,27 @@ def validate_positive_scalars(**kwargs):
             raise exceptions.PlotlyError("{} must be a number, got {}".format(key, val))
 
 
+# Number of cells above which the text of annotated heatmaps and tables is
+# rendered by traces instead of layout annotations when text_mode="auto"
+MAX_ANNOTATIONS = 1000
+
+
+def use_text_trace(text_mode, n_cells):
+    """
+    Returns whether the text of the `n_cells` cells of a figure is rendered
+    by traces, according to `text_mode`.
+
+    :raises: (PlotlyError) If text_mode is not 'auto', 'annotations' or
+        'trace'.
+    """
+    if text_mode not in ("auto", "annotations", "trace"):
+        raise exceptions.PlotlyError(
+            "text_mode must be one of 'auto', 'annotations' or 'trace', "
+            "got {!r}".format(text_mode)
+        )
+    return text_mode == "trace" or (text_mode == "auto" and n_cells > MAX_ANNOTATIONS)
+
+
 def flatten(array):
     """
     Uses list comprehension to flatten array
@@ -1,3 +1,4 @@
+import hashlib
 import uuid
 from pathlib import Path
 import webbrowser
@@ -35,6 +36,7 @@ def to_html(
     default_height="100%",
     validate=True,
     div_id=None,
+    include_template=True,
 ):
     """
     Convert a figure to an HTML string representation.
@@ -118,6 +120,24 @@ def to_html(
     div_id: str (default None)
         If provided, this is the value of the id attribute of the div tag. If None, the
         id attribute is a UUID.
+    include_template: bool or string (default True)
+        Specifies how the figure's template (layout.template) is included
+        in the output.
+
+        If True, the template is included in the figure's JSON
+        specification like any other layout property.
+
+        If 'shared', the template is included in a script that registers it
+        with the page, under a key computed from its contents, and the
+        figure references it by that key.
+
+        If False, the template is not included in the output, and the figure
+        references a template registered by an earlier figure on the same
+        page that was written with include_template='shared'. If there is
+        none, the figure is displayed without a template. This is useful
+        when many figures that share a template are placed in the same HTML
+        document, because the template is included only once per page
+        rather than once per figure.
 
     Returns
     -------
@@ -132,9 +152,52 @@ def to_html(
     # ## Generate div id ##
     plotdivid = div_id or str(uuid.uuid4())
 
+    # ## Extract template ##
+    layout_dict = fig_dict.get("layout", {})
+    template = layout_dict.get("template", None)
+    template_line = ""
+    if include_template is not True:
+        if include_template not in (False, "shared"):
+            raise ValueError(
+                """\
+Invalid value of type {typ} received as the include_template argument
+    Received value: {val}
+
+include_template may be specified as True, False, or 'shared'
+    """.format(
+                    typ=type(include_template), val=repr(include_template)
+                )
+            )
+
+        if template is not None:
+            # Serialize the template separately, without modifying the
+            # input figure dict
+            layout_dict = {k: v for k, v in layout_dict.items() if k != "template"}
+            fig_dict = dict(fig_dict, layout=layout_dict)
+            jtemplate = to_json_plotly(template)
+            template_key = hashlib.sha1(jtemplate.encode("utf-8")).hexdigest()
+            template_ref = "window.PLOTLYENV.TEMPLATES['{key}']".format(
+                key=template_key
+            )
+
+            template_line = """
+                    window.PLOTLYENV.TEMPLATES=window.PLOTLYENV.TEMPLATES || {};\
+"""
+            if include_template == "shared":
+                template_line += """\
+                    {ref}={ref} || {template};\
+""".format(
+                    ref=template_ref, template=jtemplate
+                )
+
     # ## Serialize figure ##
     jdata = to_json_plotly(fig_dict.get("data", []))
-    jlayout = to_json_plotly(fig_dict.get("layout", {}))
+    jlayout = to_json_plotly(layout_dict)
+    if template_line:
+        # Reference the template registered with the page
+        jlayout = "Object.assign({{template: {ref}}}, {layout})".format(
+            ref=template_ref, layout=jlayout
+        )
 
     if fig_dict.get("frames", None):
         jframes = to_json_plotly(fig_dict.get("frames", []))
@@ -148,8 +211,7 @@ def to_html(
     config.setdefault("responsive", True)
 
     # Get div width/height
-    layout_dict = fig_dict.get("layout", {})
-    template_dict = fig_dict.get("layout", {}).get("template", {}).get("layout", {})
+    template_dict = (template or {}).get("layout", {})
 
     div_width = layout_dict.get("width", template_dict.get("width", default_width))
     div_height = layout_dict.get("height", template_dict.get("height", default_height))
@@ -327,7 +389,7 @@ include_mathjax may be specified as False, 'cdn', or a string ending with '.js'
             <div id="{id}" class="plotly-graph-div" \
 style="height:{height}; width:{width};"></div>\
             <script type="text/javascript">\
-                window.PLOTLYENV=window.PLOTLYENV || {{}};{base_url_line}\
+                window.PLOTLYENV=window.PLOTLYENV || {{}};{base_url_line}{template_line}\
                 {script};\
             </script>\
         </div>""".format(
@@ -337,6 +399,7 @@ style="height:{height}; width:{width};"></div>\
         width=div_width,
         height=div_height,
         base_url_line=base_url_line,
+        template_line=template_line,
         script=script,
     ).strip()
 
@@ -369,6 +432,7 @@ def write_html(
     default_height="100%",
     auto_open=False,
     div_id=None,
+    include_template=True,
 ):
     """
     Write a figure to an HTML file representation
@@ -468,6 +532,24 @@ def write_html(
     div_id: str (default None)
         If provided, this is the value of the id attribute of the div tag. If None, the
         id attribute is a UUID.
+    include_template: bool or string (default True)
+        Specifies how the figure's template (layout.template) is included
+        in the output.
+
+        If True, the template is included in the figure's JSON
+        specification like any other layout property.
+
+        If 'shared', the template is included in a script that registers it
+        with the page, under a key computed from its contents, and the
+        figure references it by that key.
+
+        If False, the template is not included in the output, and the figure
+        references a template registered by an earlier figure on the same
+        page that was written with include_template='shared'. If there is
+        none, the figure is displayed without a template. This is useful
+        when many figures that share a template are placed in the same HTML
+        document, because the template is included only once per page
+        rather than once per figure.
 
     Returns
     -------
@@ -489,6 +571,7 @@ def write_html(
         default_height=default_height,
         validate=validate,
         div_id=div_id,
+        include_template=include_template,
     )
 
     # Check if file is a string
@@ -477,6 +477,10 @@ def read_json(file, output_type="Figure", skip_invalid=False, engine=None):
     )
 
 
+# Types of the scalar values which are serialized as they are
+_json_scalar_types = frozenset([int, float, str, bool, type(None)])
+
+
 def clean_to_json_compatible(obj, **kwargs):
     # Try handling value as a scalar value that we have a conversion for.
     # Return immediately if we know we've hit a primitive value
@@ -523,7 +527,12 @@ def clean_to_json_compatible(obj, **kwargs):
                 return obj.tolist()
             elif obj.dtype.kind == "O":
                 # Treat object array as a lists, continue processing
-                obj = obj.tolist()
+                values = obj.tolist()
+                if _json_scalar_types.issuperset(map(type, obj.ravel().tolist())):
+                    # e.g. customdata of numbers and strings, which doesn't need
+                    # to be processed element by element
+                    return values
+                obj = values
         elif isinstance(obj, np.datetime64):
             return str(obj)
 
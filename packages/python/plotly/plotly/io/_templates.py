@@ -50,6 +50,11 @@ class TemplatesConfig(object):
         self._validator = None
         self._default = None
 
+        # Cache of templates merged from names joined on '+' characters.
+        # Maps the joined names to a tuple of the templates that were merged,
+        # snapshots of their properties and the merged template
+        self._merged_templates = {}
+
     # ### Magic methods ###
     # Make this act as a dict of templates
     def __len__(self):
@@ -67,6 +72,36 @@ class TemplatesConfig(object):
         else:
             template_names = [item]
 
+        templates = self._get_templates(template_names)
+        if len(templates) < 2:
+            return self.merge_templates(*templates)
+
+        # Reuse the merged template as long as neither it nor the templates it
+        # was merged from have been replaced or modified
+        cached = self._merged_templates.get(item, None)
+        if cached is not None:
+            cached_templates, snapshots, merged = cached
+            if all(
+                template is cached_template
+                for template, cached_template in zip(templates, cached_templates)
+            ) and all(
+                self._props_unchanged(template, snapshot)
+                for template, snapshot in zip(templates + [merged], snapshots)
+            ):
+                return merged
+
+        merged = self.merge_templates(*templates)
+        snapshots = [
+            self._get_shared_props(template) for template in templates + [merged]
+        ]
+        self._merged_templates[item] = (templates, snapshots, merged)
+        return merged
+
+    def _get_templates(self, template_names):
+        """
+        Return the registered templates with the specified names, loading
+        built-in templates from package_data on first use
+        """
         templates = []
         for template_name in template_names:
             template = self._templates[template_name]
@@ -89,19 +124,103 @@ class TemplatesConfig(object):
                     self._templates[template_name] = template
             templates.append(self._templates[template_name])
 
-        return self.merge_templates(*templates)
+        return templates
 
     def __setitem__(self, key, value):
         self._templates[key] = self._validate(value)
+        self._merged_templates.clear()
 
     def __delitem__(self, key):
         # Remove template
         del self._templates[key]
+        self._merged_templates.clear()
 
         # Check if we need to remove it as the default
         if self._default == key:
             self._default = None
 
+    def _get_shared_props(self, template):
+        """
+        Return a snapshot of a template object's properties that figures
+        may share by reference. Figures must not modify the snapshot. It is
+        cached on the template object, and taken again if the template
+        has been modified since.
+
+        Parameters
+        ----------
+        template: Template
+
+        Returns
+        -------
+        dict
+        """
+        shared_props = getattr(template, "_shared_props", None)
+        if shared_props is not None and self._props_unchanged(template, shared_props):
+            return shared_props
+
+        shared_props = template.to_plotly_json()
+        template._shared_props = shared_props
+        return shared_props
+
+    @staticmethod
+    def _props_unchanged(template, props):
+        """
+        Return whether a template's properties are equal to a snapshot of
+        them taken with _get_shared_props
+        """
+        try:
+            return template._props == props
+        except ValueError:
+            # Template contains arrays that can't be compared
+            return False
+
+    def _get_flat_defaults(self, template):
+        """
+        Return the defaults of a template as a flat dict from property path
+        strings to values, so that looking up a default is a dict access
+        rather than a walk of the template object.
+
+        Layout defaults are keyed by their path in the template
+        (e.g. 'layout.xaxis.showgrid'). Trace defaults are keyed by trace
+        type and property path (e.g. 'data.scatter.marker.symbol'), and
+        their value is a tuple with one element for each of the template's
+        traces of that type, which is None for traces that don't specify
+        the property.
+
+        The flat defaults are cached on the template object and computed
+        again if the template has been modified since.
+
+        Parameters
+        ----------
+        template: Template
+
+        Returns
+        -------
+        dict
+        """
+        shared_props = self._get_shared_props(template)
+        cached = getattr(template, "_flat_defaults", None)
+        if cached is not None and cached[0] is shared_props:
+            return cached[1]
+
+        flat_defaults = {}
+        _flatten_defaults(template.layout, "layout.", flat_defaults)
+        for trace_type in template.data._props or {}:
+            trace_defaults = []
+            for trace in template.data[trace_type]:
+                trace_flat = {}
+                _flatten_defaults(trace, "", trace_flat)
+                trace_defaults.append(trace_flat)
+
+            prefix = "data." + trace_type + "."
+            for path in set().union(*trace_defaults):
+                flat_defaults[prefix + path] = tuple(
+                    trace_flat.get(path, None) for trace_flat in trace_defaults
+                )
+
+        template._flat_defaults = (shared_props, flat_defaults)
+        return flat_defaults
+
     def _validate(self, value):
         if not self._validator:
             from plotly.validators.layout import TemplateValidator
@@ -275,6 +394,35 @@ del TemplatesConfig
 
 # Template utilities
 # ------------------
+def _flatten_defaults(obj, prefix, flat_defaults):
+    """
+    Add the values of the properties set on a graph object, and on its
+    compound properties, to a dict keyed by property path strings
+
+    Parameters
+    ----------
+    obj: plotly.basedatatypes.BasePlotlyType
+    prefix: str
+        Prefix for the property path strings of obj
+    flat_defaults: dict
+        Dict to add the values to
+    """
+    from plotly.basedatatypes import BasePlotlyType
+
+    props = obj._props or {}
+    for prop in props:
+        if prop not in obj:
+            # Unknown property in a template that wasn't validated
+            flat_defaults[prefix + prop] = props[prop]
+            continue
+
+        val = obj[prop]
+        if isinstance(val, BasePlotlyType):
+            _flatten_defaults(val, prefix + prop + ".", flat_defaults)
+        else:
+            flat_defaults[prefix + prop] = val
+
+
 def walk_push_to_template(fig_obj, template_obj, skip):
     """
     Move style properties from fig_obj to template_obj.
@@ -0,0 +1,118 @@
+from unittest import TestCase
+from unittest.mock import MagicMock
+import pytest
+
+import plotly.graph_objs as go
+
+
+class TestExtendTracesMessage(TestCase):
+    def setUp(self):
+        self.figure = go.Figure(
+            data=[
+                go.Scatter(x=[1, 2], y=[3, 4], text=["a", "b"]),
+                go.Bar(y=[5, 6, 7]),
+            ]
+        )
+
+        # Mock out the message method
+        self.figure._send_extendTraces_msg = MagicMock()
+
+    def test_extend_traces(self):
+        self.figure.extend_traces({"x": [[3, 4]], "y": [[5, 6]]}, 0)
+
+        self.assertEqual(self.figure.data[0].x, (1, 2, 3, 4))
+        self.assertEqual(self.figure.data[0].y, (3, 4, 5, 6))
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"x": [[3, 4]], "y": [[5, 6]]}, [0], max_points=None, prepend=False
+        )
+
+    def test_extend_multiple_traces(self):
+        self.figure.extend_traces({"y": [[5], [8, 9]]}, [0, 1])
+
+        self.assertEqual(self.figure.data[0].y, (3, 4, 5))
+        self.assertEqual(self.figure.data[1].y, (5, 6, 7, 8, 9))
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"y": [[5], [8, 9]]}, [0, 1], max_points=None, prepend=False
+        )
+
+    def test_extend_traces_max_points(self):
+        self.figure.extend_traces({"y": [[5], [8, 9]]}, [0, 1], max_points=3)
+
+        self.assertEqual(self.figure.data[0].y, (3, 4, 5))
+        self.assertEqual(self.figure.data[1].y, (7, 8, 9))
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"y": [[5], [8, 9]]}, [0, 1], max_points={"y": [3, 3]}, prepend=False
+        )
+
+    def test_extend_traces_max_points_per_trace(self):
+        self.figure.extend_traces(
+            {"y": [[5], [8, 9]]}, [0, 1], max_points={"y": [None, 2]}
+        )
+
+        self.assertEqual(self.figure.data[0].y, (3, 4, 5))
+        self.assertEqual(self.figure.data[1].y, (8, 9))
+
+    def test_extend_nested_and_missing_properties(self):
+        self.figure.extend_traces({"marker.color": [["red", "blue"]]}, 0)
+        self.figure.extend_traces({"marker.color": [["green"]]}, 0)
+
+        self.assertEqual(self.figure.data[0].marker.color, ("red", "blue", "green"))
+
+    def test_prepend_traces(self):
+        self.figure.prepend_traces(
+            {"y": [[1, 2]], "text": [["y", "z"]]}, 0, max_points={"y": 3}
+        )
+
+        self.assertEqual(self.figure.data[0].y, (1, 2, 3))
+        self.assertEqual(self.figure.data[0].text, ("y", "z", "a", "b"))
+        self.figure._send_extendTraces_msg.assert_called_once_with(
+            {"y": [[1, 2]], "text": [["y", "z"]]},
+            [0],
+            max_points={"y": [3], "text": [None]},
+            prepend=True,
+        )
+
+    def test_extend_traces_on_change(self):
+        callback = MagicMock()
+        self.figure.data[0].on_change(callback, "y")
+        self.figure.extend_traces({"y": [[5]]}, 0)
+
+        callback.assert_called_once_with(self.figure.data[0], (3, 4, 5))
+
+    def test_extend_traces_validates_new_values(self):
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"y": [5]}, 0)
+
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"mode": [["lines"]]}, 0)
+
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"bogus": [[1]]}, 0)
+
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"y": [[1], [2]]}, 0)
+
+        with pytest.raises(ValueError):
+            self.figure.extend_traces({"y": [[1]]}, 2)
+
+        self.assertEqual(self.figure.data[0].y, (3, 4))
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+
+    def test_extend_traces_is_atomic(self):
+        # The second trace's value of a later key is invalid, so no key is applied
+        with pytest.raises(ValueError):
+            self.figure.extend_traces(
+                {"x": [[3], [1]], "y": [[5], [8]], "text": [["c"], "bogus"]},
+                [0, 1],
+            )
+
+        self.assertEqual(self.figure.data[0].x, (1, 2))
+        self.assertEqual(self.figure.data[0].y, (3, 4))
+        self.assertEqual(self.figure.data[1].y, (5, 6, 7))
+        self.assertEqual(self.figure.data[0].text, ("a", "b"))
+        self.assertFalse(self.figure._send_extendTraces_msg.called)
+
+    def test_extend_traces_in_batch_update(self):
+        with pytest.raises(ValueError):
+            with self.figure.batch_update():
+                self.figure.extend_traces({"y": [[5]]}, 0)
@@ -88,3 +88,56 @@ class TestBatchUpdateMessage(TestCase):
             relayout_data={"xaxis.range": [10, 20]},
             trace_indexes=[0, 1],
         )
+
+    def test_batch_update_applies_edits_in_path_order(self):
+        with self.figure.batch_update():
+            self.figure.data[0].marker.size = 10
+            self.figure.data[0].marker = {"color": "red"}
+            self.figure.data[1].marker.opacity = 0.5
+
+        # Parent properties are applied before nested ones, and traces
+        # whose edits don't change the figure are not sent
+        self.assertEqual(self.figure.data[0].marker.color, "red")
+        self.assertEqual(self.figure.data[0].marker.size, 10)
+
+        call_kwargs = self.figure._send_update_msg.call_args[1]
+        self.assertEqual(list(call_kwargs["restyle_data"]), ["marker", "marker.size"])
+        self.assertEqual(call_kwargs["restyle_data"]["marker.size"], [10])
+        self.assertEqual(call_kwargs["trace_indexes"], [0])
+
+    def test_batch_update_callbacks_only_for_edited_traces(self):
+        fn0 = MagicMock()
+        fn1 = MagicMock()
+        self.figure.data[0].on_change(fn0, "marker.color")
+        self.figure.data[1].on_change(fn1, "marker.color")
+
+        with self.figure.batch_update():
+            self.figure.data[0].marker.color = "blue"
+            self.figure.data[1].marker.opacity = 0.2
+
+        fn0.assert_called_once_with(self.figure.data[0], "blue")
+        self.assertFalse(fn1.called)
+
+
+class TestBatchUpdateManyTraces(TestCase):
+    def test_batch_update_many_traces(self):
+        n = 2000
+        figure = go.Figure(data=[go.Scatter(y=[i]) for i in range(n)])
+        figure._send_update_msg = MagicMock()
+
+        with figure.batch_update():
+            for i, trace in enumerate(figure.data):
+                trace.name = "trace %d" % i
+                if i % 2:
+                    trace.marker.color = "red"
+
+        self.assertEqual(figure.data[-1].name, "trace %d" % (n - 1))
+        self.assertEqual(figure.data[-1].marker.color, "red")
+        self.assertIsNone(figure.data[0].marker.color)
+
+        call_kwargs = figure._send_update_msg.call_args[1]
+        self.assertEqual(call_kwargs["trace_indexes"], list(range(n)))
+        self.assertEqual(call_kwargs["restyle_data"]["name"][5], "trace 5")
+        self.assertEqual(
+            call_kwargs["restyle_data"]["marker.color"][:2], [Undefined, "red"]
+        )
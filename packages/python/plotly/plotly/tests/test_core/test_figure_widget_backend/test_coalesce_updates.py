@@ -0,0 +1,167 @@
+import asyncio
+import threading
+import time
+from unittest import TestCase
+
+import plotly.graph_objs as go
+import pytest
+
+try:
+    go.FigureWidget()
+    figure_widget_available = True
+except ImportError:
+    figure_widget_available = False
+
+
+@pytest.mark.skipif(not figure_widget_available, reason="requires anywidget")
+class TestCoalesceUpdates(TestCase):
+    def setUp(self):
+        self.figure = go.FigureWidget(
+            data=[go.Scatter(y=[3, 2, 1]), go.Bar(y=[1, 2, 3])]
+        )
+        self.messages = []
+        self.figure.observe(
+            lambda change: change["new"]
+            and self.messages.append((change["name"], change["new"])),
+            names=[
+                "_py2js_restyle",
+                "_py2js_relayout",
+                "_py2js_update",
+                "_py2js_addTraces",
+                "_py2js_extendTraces",
+            ],
+        )
+
+    def test_updates_sent_individually_by_default(self):
+        self.figure.data[0].y = [1, 2, 3]
+        self.figure.layout.title.text = "A"
+        self.assertEqual(
+            [name for name, _ in self.messages], ["_py2js_restyle", "_py2js_relayout"]
+        )
+
+    def test_extend_traces_sends_delta(self):
+        self.figure.extend_traces({"y": [[0, -1]]}, 0, max_points=4)
+
+        self.assertEqual(self.figure.data[0].y, (2, 1, 0, -1))
+        self.assertEqual(len(self.messages), 1)
+        name, msg = self.messages[0]
+        self.assertEqual(name, "_py2js_extendTraces")
+        self.assertEqual(msg["extend_data"], {"y": [[0, -1]]})
+        self.assertEqual(msg["extend_traces"], [0])
+        self.assertEqual(msg["max_points"], {"y": [4]})
+        self.assertFalse(msg["prepend"])
+
+    def test_extend_traces_flushes_pending_updates(self):
+        self.figure.coalesce_updates(60)
+        self.figure.data[0].y = [5, 6]
+        self.figure.extend_traces({"y": [[7]]}, 0)
+
+        self.assertEqual(
+            [name for name, _ in self.messages],
+            ["_py2js_update", "_py2js_extendTraces"],
+        )
+        self.assertEqual(self.figure.data[0].y, (5, 6, 7))
+
+    def test_coalesce_into_single_update(self):
+        self.figure.coalesce_updates(60)
+        for i in range(10):
+            self.figure.data[0].y = [i, i + 1]
+            self.figure.data[1].marker.color = "rgb(%d, 0, 0)" % i
+            self.figure.layout.title.text = str(i)
+
+        # properties are updated right away, messages are buffered
+        self.assertEqual(self.figure.data[0].y, (9, 10))
+        self.assertEqual(self.messages, [])
+
+        self.figure.flush_updates()
+        self.assertEqual(len(self.messages), 1)
+        name, msg = self.messages[0]
+        self.assertEqual(name, "_py2js_update")
+        self.assertEqual(msg["style_traces"], [0, 1])
+        self.assertEqual(msg["style_data"]["y"][0], [9, 10])
+        self.assertEqual(msg["style_data"]["marker.color"][1], "rgb(9, 0, 0)")
+        self.assertEqual(msg["layout_data"], {"title.text": "9"})
+
+        stats = self.figure.coalesce_stats
+        self.assertEqual(stats["messages_buffered"], 30)
+        self.assertEqual(stats["messages_sent"], 1)
+        self.assertEqual(stats["messages_saved"], 29)
+        self.assertEqual(stats["edits_merged"], 27)
+
+    def test_parent_update_replaces_child_updates(self):
+        self.figure.coalesce_updates(60)
+        self.figure.data[1].marker.color = "green"
+        self.figure.data[0].marker = dict(size=3)
+        self.figure.data[0].marker.color = "red"
+        self.figure.layout.xaxis.range = [0, 1]
+        self.figure.layout.xaxis = dict(title=dict(text="X"))
+        self.figure.flush_updates()
+
+        _, msg = self.messages[0]
+        # parents are applied before children
+        self.assertEqual(list(msg["style_data"]), ["marker", "marker.color"])
+        self.assertEqual(msg["layout_data"], {"xaxis": {"title": {"text": "X"}}})
+
+    def test_flush_before_add_traces(self):
+        self.figure.coalesce_updates(60)
+        self.figure.data[0].y = [0]
+        self.figure.add_scatter(y=[1])
+        self.assertEqual(
+            [name for name, _ in self.messages], ["_py2js_update", "_py2js_addTraces"]
+        )
+
+    def test_disable_flushes(self):
+        self.figure.coalesce_updates(60)
+        self.figure.data[0].y = [0]
+        self.figure.coalesce_updates(None)
+        self.assertEqual(len(self.messages), 1)
+        self.figure.data[0].y = [1]
+        self.assertEqual(self.messages[-1][0], "_py2js_restyle")
+
+    def test_flush_on_event_loop(self):
+        async def run():
+            self.figure.coalesce_updates(0.01)
+            self.figure.data[0].y = [0]
+            self.figure.data[0].y = [1]
+            self.assertEqual(self.messages, [])
+            await asyncio.sleep(0.05)
+
+        asyncio.run(run())
+        self.assertEqual(len(self.messages), 1)
+        self.assertEqual(self.messages[0][1]["style_data"], {"y": [[1]]})
+
+    def test_write_during_timed_flush(self):
+        flushing = threading.Event()
+        release = threading.Event()
+
+        def block_first_message(change):
+            if not flushing.is_set():
+                flushing.set()
+                release.wait(5)
+
+        self.figure.observe(block_first_message, names=["_py2js_update"])
+        self.figure.coalesce_updates(0.01)
+        self.figure.data[0].y = [1]
+
+        # A timer thread flushes the first update, while another thread writes
+        self.assertTrue(flushing.wait(5))
+        writer = threading.Thread(target=setattr, args=(self.figure.data[0], "y", [2]))
+        writer.start()
+        time.sleep(0.05)
+        self.assertTrue(writer.is_alive())
+        self.assertEqual(len(self.messages), 1)
+
+        release.set()
+        writer.join(5)
+        self.figure.flush_updates()
+        self.assertEqual(
+            [name for name, _ in self.messages], ["_py2js_update", "_py2js_update"]
+        )
+        self.assertEqual(
+            [msg["style_data"] for _, msg in self.messages],
+            [{"y": [[1]]}, {"y": [[2]]}],
+        )
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            self.figure.coalesce_updates(-1)
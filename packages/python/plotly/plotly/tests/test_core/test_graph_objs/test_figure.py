@@ -217,3 +217,83 @@ def test_set_subplots():
     # Test that calling on a figure that already has subplots throws an error.
     with pytest.raises(ValueError, match=r"^This figure already has subplots\.$"):
         fig1.set_subplots(2, 3)
+
+
+def test_key_path_parsing_is_memoized():
+    from plotly.basedatatypes import _str_to_dict_path_full
+
+    assert _str_to_dict_path_full.cache_info().maxsize is not None
+    path, idcs = _str_to_dict_path_full("marker.colorbar.title_font[0].size")
+    assert path == ("marker", "colorbar", "title", "font", 0, "size")
+    assert _str_to_dict_path_full("marker.colorbar.title_font[0].size")[0] is path
+    assert isinstance(idcs, tuple)
+
+
+def test_traces_are_copied_by_default():
+    # A trace object reused for several traces
+    trace = go.Scatter(meta=dict(source="sensor"))
+    fig = go.Figure()
+    for i in range(3):
+        trace.name = "series %d" % i
+        trace.y = [i, i + 1]
+        fig.add_trace(trace)
+    assert [t.name for t in fig.data] == ["series 0", "series 1", "series 2"]
+    assert [t.y for t in fig.data] == [(0, 1), (1, 2), (2, 3)]
+    assert trace.parent is None
+
+    # Later changes to the trace object don't change the figure
+    scatter = go.Scatter(y=[1], meta=dict(source="sensor"))
+    fig = go.Figure(scatter)
+    scatter.y = [5]
+    scatter.meta["source"] = "model"
+    assert fig.data[0] is not scatter
+    assert fig.data[0].y == (1,)
+    assert fig.data[0].meta == dict(source="sensor")
+
+
+def test_orphan_traces_are_adopted():
+    scatter = go.Scatter(y=[2, 1, 3], marker_color="green")
+    props = scatter._props
+    fig = go.Figure(data=[scatter, scatter], _adopt=True)
+
+    # The first occurrence is adopted as-is, the second is copied
+    assert fig.data[0] is scatter
+    assert fig.data[1] is not scatter
+    assert fig._data[0] is props
+    assert scatter.parent is fig
+    assert scatter._orphan_props == {}
+    assert fig.data[1].to_plotly_json() == scatter.to_plotly_json()
+
+    # Traces that belong to another figure are copied
+    fig2 = go.Figure()
+    fig2._add_traces([scatter], adopt=True)
+    assert fig2.data[0] is not scatter
+    assert scatter.parent is fig
+
+    # Removed traces become orphans that can be adopted again
+    fig.data = fig.data[1:]
+    assert scatter.parent is None
+    fig2._add_traces([scatter], adopt=True)
+    assert fig2.data[1] is scatter
+    assert fig2.data[1].marker.color == "green"
+
+
+def test_unvalidated_traces_are_not_adopted():
+    scatter = go.Scatter(y=[2, 1, 3], _validate=False)
+    fig = go.Figure(data=scatter, _adopt=True)
+    assert fig.data[0] is not scatter
+
+    # Unless the figure itself skips validation, though the properties of
+    # unvalidated traces are still copied
+    props = scatter._props
+    fig = go.Figure(data=scatter, _validate=False, _adopt=True)
+    assert fig.data[0] is scatter
+    assert fig._data[0] is not props
+    assert fig.data[0].y == (2, 1, 3)
+
+
+def test_frame_traces_are_not_adopted():
+    scatter = go.Scatter(y=[2, 1, 3])
+    frame = go.Frame(data=[scatter])
+    assert frame.data[0] is not scatter
+    assert scatter.parent is None
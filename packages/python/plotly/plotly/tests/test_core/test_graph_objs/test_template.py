@@ -179,6 +179,42 @@ class TemplateTest(TestCase):
         fig = go.Figure()
         self.assertEqual(fig.layout.template, template)
 
+    def test_default_template_is_shared(self):
+        pio.templates.default = "test_template"
+        fig1 = go.Figure()
+        fig2 = go.Figure()
+        self.assertIs(fig1._layout["template"], fig2._layout["template"])
+        self.assertEqual(
+            fig1.to_dict()["layout"]["template"],
+            {"layout": {"font": {"family": "Rockwell"}}},
+        )
+
+    def test_shared_template_copy_on_write(self):
+        pio.templates.default = "test_template"
+        figs = [go.Figure() for _ in range(5)]
+
+        figs[0].layout.template.layout.font.size = 20
+        figs[1].update_layout(template_layout_font_color="green")
+        figs[2].plotly_relayout({"template.layout.font.family": "Arial"})
+        with figs[3].batch_update():
+            figs[3].layout.template.layout.title.text = "Title"
+
+        self.assertEqual(figs[0].layout.template.layout.font.size, 20)
+        self.assertEqual(figs[1].layout.template.layout.font.color, "green")
+        self.assertEqual(figs[2].layout.template.layout.font.family, "Arial")
+        self.assertEqual(figs[3].layout.template.layout.title.text, "Title")
+        for fig in [go.Figure(), figs[4]]:
+            self.assertEqual(fig.layout.template, pio.templates["test_template"])
+
+    def test_shared_template_after_template_modification(self):
+        pio.templates.default = "test_template"
+        fig1 = go.Figure()
+        pio.templates["test_template"].layout.font.size = 20
+        fig2 = go.Figure()
+
+        self.assertIsNone(fig1.layout.template.layout.font.size)
+        self.assertEqual(fig2.layout.template.layout.font.size, 20)
+
 
 class TestToTemplated(TestCaseNoTemplate):
     def test_move_layout_nested_properties(self):
@@ -521,6 +557,46 @@ class TestMergeTemplates(TestCase):
         expected = self.expected1_2
         self.assertEqual(result, expected)
 
+    def test_flaglist_string_getitem_is_cached(self):
+        result = pio.templates["template1+template2"]
+        self.assertIs(pio.templates["template1+template2"], result)
+
+        # Modifying one of the merged templates invalidates the merge
+        pio.templates["template1"].layout.font.family = "Arial"
+        result2 = pio.templates["template1+template2"]
+        self.assertIsNot(result2, result)
+        self.assertEqual(result2.layout.font.family, "Arial")
+
+        # As does modifying the merged template
+        result2.layout.font.family = "Courier"
+        result3 = pio.templates["template1+template2"]
+        self.assertEqual(result3.layout.font.family, "Arial")
+
+        # Or registering a template
+        pio.templates["template2"] = {}
+        self.assertEqual(pio.templates["template1+template2"].layout.font.size, 20)
+
+    def test_flat_defaults(self):
+        defaults = pio.templates._get_flat_defaults(
+            pio.templates["template1+template2"]
+        )
+        self.assertEqual(defaults["layout.font.size"], 14)
+        self.assertEqual(defaults["layout.font.family"], "Rockwell")
+        self.assertEqual(defaults["layout.paper_bgcolor"], "green")
+        self.assertEqual(defaults["data.scatter.line.dash"], ("solid", "dot") * 3)
+        self.assertEqual(defaults["data.bar.marker.opacity"], (0.7, 0.4))
+        self.assertEqual(defaults["data.scattergl.hoverinfo"], ("x+y",))
+        self.assertNotIn("data.bar.marker.color", defaults)
+
+        # Flat defaults are cached until the template is modified
+        template = pio.templates["template1"]
+        defaults = pio.templates._get_flat_defaults(template)
+        self.assertIs(pio.templates._get_flat_defaults(template), defaults)
+
+        template.layout.font.size = 8
+        defaults = pio.templates._get_flat_defaults(template)
+        self.assertEqual(defaults["layout.font.size"], 8)
+
     def test_update_template_with_flaglist(self):
         fig = go.Figure()
         fig.update(layout_template="template1+template2")
@@ -2026,3 +2026,39 @@ def test_make_subplots_spacing_error():
         ValueError, match="^Vertical spacing must be between 0 and 1\.$"
     ):
         fig = subplots.make_subplots(1, 1, vertical_spacing=1.01)
+
+
+def test_make_subplots_large_grid():
+    fig = subplots.make_subplots(100, 100, shared_xaxes=True, shared_yaxes=True)
+    assert fig.layout.xaxis10000.anchor == "y10000"
+    assert fig.layout.xaxis100.matches == "x10000"
+    assert fig.layout.xaxis100.showticklabels is False
+    assert fig.layout.yaxis10000.matches == "y9901"
+    assert fig.layout["yaxis10000"].showticklabels is False
+    assert fig.layout.xaxis.domain == (0.0, 0.008020000000000001)
+
+    # Generated axes behave like validated ones
+    fig.layout.xaxis5000.range = [0, 1]
+    with pytest.raises(ValueError):
+        fig.layout.xaxis5000.type = "not a valid axis type"
+
+    fig.add_scatter(x=[1], y=[2], row=100, col=100)
+    assert fig.data[0].xaxis == "x10000"
+
+    # grid string is built on first use
+    assert fig._grid_str.startswith("This is the format of your plot grid:")
+    assert "(100,100) x10000,y10000" in fig._grid_str
+
+
+def test_make_subplots_passed_figure_matches_new_figure():
+    kwargs = dict(
+        rows=3,
+        cols=2,
+        shared_xaxes="all",
+        specs=[[{"secondary_y": True}, {}], [{"type": "scene"}, {}], [{}, None]],
+        subplot_titles=["a", "b", "c", "d", "e"],
+    )
+    fig1 = subplots.make_subplots(**kwargs)
+    fig2 = subplots.make_subplots(figure=Figure(), **kwargs)
+    assert fig1.to_plotly_json() == fig2.to_plotly_json()
+    assert fig1._grid_str == fig2._grid_str
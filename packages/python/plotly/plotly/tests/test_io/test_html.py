@@ -45,3 +45,26 @@ def test_html_deterministic(fig1):
     assert pio.to_html(fig1, include_plotlyjs="cdn", div_id=div_id) == pio.to_html(
         fig1, include_plotlyjs="cdn", div_id=div_id
     )
+
+
+def test_include_template(fig1):
+    template_json = '"font":{"color":"#2a3f5f"}'
+    html = pio.to_html(fig1, include_plotlyjs=False)
+    assert html.count(template_json) == 1
+    assert "PLOTLYENV.TEMPLATES" not in html
+
+    html_shared = pio.to_html(fig1, include_plotlyjs=False, include_template="shared")
+    html_ref = pio.to_html(fig1, include_plotlyjs=False, include_template=False)
+    assert html_shared.count(template_json) == 1
+    assert template_json not in html_ref
+
+    # Both figures reference the template registered by the first one
+    template_ref = html_shared.split("Object.assign({template: ")[1].split("}")[0]
+    assert template_ref.startswith("window.PLOTLYENV.TEMPLATES[")
+    assert template_ref in html_ref
+
+    # The figure is not modified
+    assert "template" in fig1.to_dict()["layout"]
+
+    with pytest.raises(ValueError):
+        pio.to_html(fig1, include_template="bogus")
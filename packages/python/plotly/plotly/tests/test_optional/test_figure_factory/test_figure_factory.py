@@ -1,4 +1,7 @@
 from unittest import TestCase
+import base64
+import math
+import os
 from plotly import optional_imports
 from plotly.graph_objs import graph_objs as go
 from plotly.exceptions import PlotlyError
@@ -625,6 +628,34 @@ class TestDistplot(NumpyTestUtilsMixin, TestCaseNoTemplate):
             }
             self.assert_fig_equal(dp["data"][1], expected_dp_data_hist_2)
 
+    def test_distplot_large_data(self):
+
+        # check: the kde curves of large data sets match scipy, and the rug
+        # plots are sub-sampled to max_rug_points along with their text
+        from scipy.stats import gaussian_kde
+
+        np.random.seed(0)
+        hist_data = [np.random.randn(50000), np.random.rand(20000) * 10]
+        rug_text = [["a{}".format(i) for i in range(50000)], None]
+        dp = ff.create_distplot(
+            hist_data,
+            ["normal", "uniform"],
+            rug_text=rug_text,
+            max_rug_points=1000,
+            max_workers=2,
+        )
+
+        for i, values in enumerate(hist_data):
+            curve, rug = dp.data[2 + i], dp.data[4 + i]
+            self.assertTrue(np.allclose(curve.y, gaussian_kde(values)(curve.x)))
+            self.assertEqual(len(rug.x), 1000)
+            self.assertEqual(len(rug.y), 1000)
+            self.assertEqual((min(rug.x), max(rug.x)), (values.min(), values.max()))
+
+        indices = [int(text[1:]) for text in dp.data[4].text]
+        self.assertEqual(indices, sorted(indices))
+        self.assertTrue(np.array_equal(dp.data[4].x, hist_data[0][indices]))
+
 
 class TestStreamline(TestCaseNoTemplate):
     def test_wrong_arrow_scale(self):
@@ -2159,6 +2190,39 @@ class TestGantt(NumpyTestUtilsMixin, TestCaseNoTemplate):
         self.assert_fig_equal(test_gantt_chart["data"][2], exp_gantt_chart["data"][2])
         self.assert_fig_equal(test_gantt_chart["data"][3], exp_gantt_chart["data"][3])
 
+    def test_many_grouped_tasks(self):
+
+        # one bar trace and one marker trace per color, whose points are the
+        # corners of the bars separated by gaps and the task endpoints
+        n = 3000
+        start = pd.Timestamp("2020-01-01") + pd.to_timedelta(np.arange(n) % 97, "D")
+        df = pd.DataFrame(
+            dict(
+                Task=["Job %d" % (i % 50) for i in range(n)],
+                Start=start,
+                Finish=start + pd.Timedelta("2D"),
+                Resource=["abc"[i % 3] for i in range(n)],
+                Description=["task %d" % i for i in range(n)],
+            )
+        )
+        fig = ff.create_gantt(df, index_col="Resource", group_tasks=True)
+
+        self.assertEqual(len(fig.data), 6)
+        self.assertEqual(list(fig.layout.yaxis.ticktext)[-1], "Job 0")
+        bars = [trace for trace in fig.data if trace.name == "a"][0]
+        markers = [
+            trace
+            for trace in fig.data
+            if trace.mode == "markers" and trace.legendgroup == bars.legendgroup
+        ][0]
+        self.assertEqual(len(bars.x), 5 * n // 3 - 1)
+        self.assertEqual(bars.y[:5], (48.8, 48.8, 49.2, 49.2, None))
+        self.assertEqual(bars.x[4], bars.x[0])
+        self.assertEqual(len(markers.x), 2 * n // 3)
+        self.assertEqual(markers.y[:4], (49, 49, 46, 46))
+        self.assertEqual(markers.text[:4], ("task 0", "task 0", "task 3", "task 3"))
+        self.assertEqual(list(markers.x[:2]), [df.Start[0], df.Finish[0]])
+
 
 class TestViolin(NumpyTestUtilsMixin, TestCaseNoTemplate):
     def test_colors_validation(self):
@@ -3080,6 +3144,36 @@ class TestViolin(NumpyTestUtilsMixin, TestCaseNoTemplate):
 
         self.assert_fig_equal(test_violin["layout"], exp_violin["layout"])
 
+    def test_violin_large_groups(self):
+
+        # check: the densities of large groups match scipy, and the rugplots
+        # are sub-sampled to max_rug_points
+        from scipy.stats import gaussian_kde
+
+        np.random.seed(0)
+        df = pd.DataFrame(
+            dict(
+                Score=np.r_[np.random.randn(20000), np.random.rand(30000) * 4],
+                Group=["A"] * 20000 + ["B"] * 30000,
+            )
+        )
+        fig = ff.create_violin(
+            df,
+            data_header="Score",
+            group_header="Group",
+            max_rug_points=500,
+            max_workers=2,
+        )
+
+        for i, group in enumerate(["A", "B"]):
+            vals = df.Score[df.Group == group].values
+            half_violin, rugplot = fig.data[6 * i + 1], fig.data[6 * i + 5]
+            self.assertTrue(
+                np.allclose(half_violin.x, gaussian_kde(vals)(half_violin.y))
+            )
+            self.assertEqual(len(rugplot.y), 500)
+            self.assertEqual((min(rugplot.y), max(rugplot.y)), (vals.min(), vals.max()))
+
 
 class TestFacetGrid(NumpyTestUtilsMixin, TestCaseNoTemplate):
     def test_data_must_be_dataframe(self):
@@ -4114,29 +4208,25 @@ class TestChoropleth(NumpyTestUtilsMixin, TestCaseNoTemplate):
             fig = ff.create_choropleth(fips=fips, values=values, simplify_county=1)
 
             exp_fig_head = (
-                -88.053375,
+                -88.04504299999999,
                 -88.02916499999999,
                 -88.02432999999999,
                 -88.04504299999999,
-                -88.053375,
                 np_nan(),
-                -88.211209,
+                -88.209559,
                 -88.209999,
                 -88.208733,
                 -88.209559,
-                -88.211209,
                 np_nan(),
-                -88.22511999999999,
+                -88.22465299999999,
                 -88.22128099999999,
                 -88.218694,
                 -88.22465299999999,
-                -88.22511999999999,
                 np_nan(),
-                -88.264659,
+                -88.255659,
                 -88.25782699999999,
                 -88.25947,
                 -88.255659,
-                -88.264659,
                 np_nan(),
                 -88.327302,
                 -88.20146799999999,
@@ -4148,11 +4238,10 @@ class TestChoropleth(NumpyTestUtilsMixin, TestCaseNoTemplate):
                 -88.149812,
                 -88.327302,
                 np_nan(),
-                -88.346745,
+                -88.346823,
                 -88.341235,
                 -88.33288999999999,
                 -88.346823,
-                -88.346745,
                 np_nan(),
                 -88.473227,
                 -88.097888,
@@ -4164,9 +4253,51 @@ class TestChoropleth(NumpyTestUtilsMixin, TestCaseNoTemplate):
                 -85.142567,
                 -85.113329,
                 -85.10533699999999,
+                -84.96302999999999,
+                -85.007103,
+                -84.88907999999999,
+                -85.061144,
+                -85.04930999999999,
             )
 
-            self.assertEqual(fig["data"][2]["x"][:50], exp_fig_head)
+            np.testing.assert_allclose(fig.data[2].x[:50], exp_fig_head, equal_nan=True)
+
+        def test_geometry_cache(self):
+            import tempfile
+            from unittest import mock
+            from plotly.figure_factory import _county_choropleth
+
+            kwargs = dict(fips=[1001, 6037], values=[1, 2], simplify_county=0.5)
+            fig = ff.create_choropleth(**kwargs)
+            counties = _county_choropleth._get_shapes("counties", 0.5)
+            self.assertIs(_county_choropleth._get_shapes("counties", 0.5), counties)
+            self.assertEqual(len(counties["offsets"]), len(counties["fips"]) + 1)
+
+            with tempfile.TemporaryDirectory() as plotly_dir, mock.patch.object(
+                _county_choropleth, "PLOTLY_DIR", plotly_dir
+            ):
+                for key in [("counties", 0.5), ("states", 0.02)]:
+                    _county_choropleth._geometry_cache.pop(key)
+                ff.create_choropleth(disk_cache=True, **kwargs)
+                self.assertEqual(
+                    len(os.listdir(os.path.join(plotly_dir, "geometry"))), 2
+                )
+
+                # the geometries are read back without parsing the shapefiles
+                for key in [("counties", 0.5), ("states", 0.02)]:
+                    _county_choropleth._geometry_cache.pop(key)
+                with mock.patch.object(
+                    _county_choropleth,
+                    "_get_us_counties_df",
+                    side_effect=AssertionError,
+                ):
+                    cached_fig = ff.create_choropleth(disk_cache=True, **kwargs)
+
+            self.assertEqual(len(cached_fig.data), len(fig.data))
+            for trace, cached_trace in zip(fig.data, cached_fig.data):
+                np.testing.assert_array_equal(trace.x, cached_trace.x)
+                np.testing.assert_array_equal(trace.y, cached_trace.y)
+                self.assertEqual(trace.text, cached_trace.text)
 
 
 class TestQuiver(TestCaseNoTemplate):
@@ -4211,6 +4342,43 @@ class TestQuiver(TestCaseNoTemplate):
 
         self.assertEqual(fig_head, exp_fig_head)
 
+    def test_many_arrows(self):
+        # Compare the arrowheads with the ones computed arrow by arrow
+        x, y = np.meshgrid(np.linspace(-3, 3, 40), np.linspace(-3, 3, 50))
+        u = np.cos(x) * y
+        v = np.sin(x) * y
+        scale, arrow_scale, angle, scaleratio = 0.2, 0.3, math.pi / 6, 2
+        fig = ff.create_quiver(
+            x, y, u, v, scale, arrow_scale, angle, scaleratio=scaleratio
+        )
+        n = x.size
+        self.assertEqual(len(fig.data[0].x), 7 * n)
+        barbs = np.array(fig.data[0].x[: 3 * n]).reshape(n, 3)
+        self.assertTrue(all(value is None for value in barbs[:, 2]))
+        arrows_x = np.array(fig.data[0].x[3 * n :]).reshape(n, 4)
+        arrows_y = np.array(fig.data[0].y[3 * n :]).reshape(n, 4)
+
+        for i in [0, 1, 777, n - 1]:
+            x0, y0 = x.flat[i], y.flat[i]
+            dx, dy = u.flat[i] * scale, v.flat[i] * scale
+            length = math.hypot(dx, dy) * arrow_scale
+            barb_angle = math.atan2(dy, dx)
+            end_x, end_y = x0 + dx * scaleratio, y0 + dy
+            self.assertEqual(list(barbs[i]), [x0, end_x, None])
+            expected_x = [
+                end_x - length * math.cos(barb_angle + angle) * scaleratio,
+                end_x,
+                end_x - length * math.cos(barb_angle - angle) * scaleratio,
+            ]
+            expected_y = [
+                end_y - length * math.sin(barb_angle + angle),
+                end_y,
+                end_y - length * math.sin(barb_angle - angle),
+            ]
+            np.testing.assert_allclose(list(arrows_x[i, :3]), expected_x)
+            np.testing.assert_allclose(list(arrows_y[i, :3]), expected_y)
+            self.assertIsNone(arrows_x[i, 3])
+
 
 class TestTernarycontour(NumpyTestUtilsMixin, TestCaseNoTemplate):
     def test_wrong_coordinates(self):
@@ -4544,3 +4712,54 @@ class TestHexbinMapbox(NumpyTestUtilsMixin, TestCaseNoTemplate):
         assert len(fig6.frames) == n_frames
         assert len(fig7.frames) == n_frames
         assert fig6.data[0].geojson == fig1.data[0].geojson
+
+    def test_animation_aggregation(self):
+        np.random.seed(0)
+        N = 10000
+        df = pd.DataFrame(
+            dict(
+                lat=np.random.randn(N),
+                lon=np.random.randn(N),
+                metric=np.random.randint(0, 10, N),
+                frame=np.random.choice(["b", "a", "c"], N),
+            )
+        )
+        kwargs = dict(
+            data_frame=df,
+            lat="lat",
+            lon="lon",
+            color="metric",
+            nx_hexagon=10,
+            animation_frame="frame",
+        )
+
+        # the vectorized aggregations match calling agg_func on each hexagon
+        # (the frames are compared as dicts, with their typed arrays encoded)
+        for agg_func in [np.sum, np.max]:
+            frames1 = ff.create_hexbin_mapbox(agg_func=agg_func, **kwargs).to_dict()[
+                "frames"
+            ]
+            frames2 = ff.create_hexbin_mapbox(
+                agg_func=lambda v: agg_func(v), **kwargs
+            ).to_dict()["frames"]
+            assert [f["name"] for f in frames1] == list(df.frame.unique())
+            for frame1, frame2 in zip(frames1, frames2):
+                trace1, trace2 = frame1["data"][0], frame2["data"][0]
+                assert list(trace1["locations"]) == list(trace2["locations"])
+                assert trace1["z"] == trace2["z"]
+
+        # the hexagons of the frames share the geojson of all the points
+        fig = ff.create_hexbin_mapbox(agg_func=np.sum, min_count=0, **kwargs)
+        counts = ff.create_hexbin_mapbox(
+            data_frame=df, lat="lat", lon="lon", nx_hexagon=10
+        )
+        ids = [feature["id"] for feature in fig.data[0].geojson["features"]]
+        assert list(counts.data[0].locations) == ids
+        for frame in fig.to_dict()["frames"]:
+            trace = frame["data"][0]
+            z = np.frombuffer(
+                base64.b64decode(trace["z"]["bdata"]), trace["z"]["dtype"]
+            )
+            assert "geojson" not in trace
+            assert list(trace["locations"]) == ids
+            assert z.sum() == df.metric[df.frame == frame["name"]].sum()
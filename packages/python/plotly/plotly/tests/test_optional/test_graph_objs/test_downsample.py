@@ -0,0 +1,156 @@
+import numpy as np
+import pytest
+
+import plotly.graph_objects as go
+from plotly._downsample import lttb_indices, minmax_indices
+
+
+def reference_lttb(x, y, n_out):
+    # Straightforward implementation of the algorithm, bucket by bucket
+    n = len(y)
+    edges = [int(e) for e in np.linspace(1, n - 1, n_out - 1)]
+    indices = [0]
+    for i in range(n_out - 2):
+        if i + 2 < len(edges):
+            next_bucket = range(edges[i + 1], edges[i + 2])
+            cx = sum(x[j] for j in next_bucket) / len(next_bucket)
+            cy = sum(y[j] for j in next_bucket) / len(next_bucket)
+        else:
+            cx, cy = x[-1], y[-1]
+        a = indices[-1]
+        areas = [
+            abs((x[a] - cx) * (y[j] - y[a]) - (x[a] - x[j]) * (cy - y[a]))
+            for j in range(edges[i], edges[i + 1])
+        ]
+        indices.append(edges[i] + areas.index(max(areas)))
+    return indices + [n - 1]
+
+
+@pytest.mark.parametrize("n, n_out", [(100, 10), (1001, 50), (37, 36)])
+def test_lttb_indices(n, n_out):
+    rng = np.random.default_rng(n)
+    x = np.sort(rng.random(n))
+    y = np.cumsum(rng.normal(size=n))
+    indices = lttb_indices(x, y, n_out)
+    assert indices.tolist() == reference_lttb(x, y, n_out)
+
+
+def test_minmax_indices():
+    rng = np.random.default_rng(0)
+    y = rng.normal(size=10000)
+    indices = minmax_indices(y, 100)
+    assert len(indices) <= 100
+    assert indices[0] == 0 and indices[-1] == 9999
+    assert np.all(np.diff(indices) > 0)
+    assert y.argmin() in indices
+    assert y.argmax() in indices
+
+
+def test_minmax_indices_keep_gaps():
+    y = np.arange(1000.0)
+    y[500:520] = np.nan
+    indices = minmax_indices(y, 20)
+    assert np.isnan(y[indices]).any()
+    assert np.isnan(y[indices]).sum() == 1
+
+
+def test_downsample_point_arrays():
+    n = 1000
+    x = np.arange(n) * 2
+    y = np.sin(np.arange(n) / 50)
+    fig = go.Figure(
+        go.Scatter(
+            x=x,
+            y=y,
+            text=["point %d" % i for i in range(n)],
+            customdata=np.stack([x, x * 3], axis=1),
+            marker=dict(color=x, size=10, line=dict(width=np.ones(n))),
+            name="sine",
+        )
+    )
+    fig.downsample(max_points=100)
+    trace = fig.data[0]
+    assert len(trace.x) == 100
+    indices = trace.x // 2
+    np.testing.assert_array_equal(trace.y, y[indices])
+    assert list(trace.text) == ["point %d" % i for i in indices]
+    np.testing.assert_array_equal(trace.customdata[:, 1], trace.x * 3)
+    np.testing.assert_array_equal(trace.marker.color, trace.x)
+    assert len(trace.marker.line.width) == 100
+    assert trace.marker.size == 10
+    assert trace.name == "sine"
+    assert trace.meta == {"downsample": {"method": "lttb", "original_points": n}}
+
+    # downsampling again keeps the original number of points
+    fig.downsample(max_points=50, method="minmax")
+    assert len(fig.data[0].x) <= 50
+    assert fig.data[0].meta == {
+        "downsample": {"method": "minmax", "original_points": n}
+    }
+
+
+def test_downsample_selection():
+    n = 100
+    fig = go.Figure(
+        [
+            go.Scattergl(y=np.arange(n), x0=10, dx=0.5, meta=dict(source="a")),
+            go.Scatter(y=np.arange(n), meta="info"),
+            go.Scatter(y=np.arange(n), stackgroup="one"),
+            go.Scatter(y=np.arange(10)),
+            go.Scatter(y=["a", "b"] * (n // 2)),
+            go.Bar(y=np.arange(n)),
+        ]
+    )
+    fig.downsample(max_points=20, method="minmax")
+    trace = fig.data[0]
+    assert len(trace.y) == 20
+    np.testing.assert_array_equal(trace.x, 10 + 0.5 * trace.y)
+    assert trace.meta == {
+        "source": "a",
+        "downsample": {"method": "minmax", "original_points": n},
+    }
+    assert len(fig.data[1].y) == 20
+    assert fig.data[1].meta == "info"
+    for trace, length in zip(fig.data[2:], [n, 10, n, n]):
+        assert len(trace.y) == length
+        assert trace.meta is None
+
+
+def test_downsample_dates_and_selectedpoints():
+    n = 1000
+    x = np.datetime64("2020-01-01") + np.arange(n) * np.timedelta64(1, "h")
+    fig = go.Figure(go.Scatter(x=x, y=np.arange(n) % 7, selectedpoints=[0, 1, 999]))
+    fig.downsample(max_points=100)
+    trace = fig.data[0]
+    assert len(trace.x) == 100
+    assert trace.x[0] == x[0] and trace.x[-1] == x[-1]
+    assert list(trace.selectedpoints) == [0, 99]
+
+
+def test_downsample_selector():
+    fig = go.Figure([go.Scatter(y=np.arange(100)), go.Scatter(y=np.arange(100))])
+    fig.downsample(max_points=10, selector=1)
+    assert [len(trace.y) for trace in fig.data] == [100, 10]
+
+
+@pytest.mark.parametrize(
+    "kwargs", [dict(method="mean"), dict(max_points=3), dict(max_points=10.0)]
+)
+def test_downsample_invalid(kwargs):
+    fig = go.Figure(go.Scatter(y=np.arange(100)))
+    with pytest.raises(ValueError):
+        fig.downsample(**kwargs)
+
+
+def test_downsample_requires_numpy(monkeypatch):
+    import plotly.optional_imports
+
+    real_get_module = plotly.optional_imports.get_module
+    monkeypatch.setattr(
+        plotly.optional_imports,
+        "get_module",
+        lambda name, **kwargs: None if name == "numpy" else real_get_module(name),
+    )
+    fig = go.Figure(go.Scatter(y=[1, 2, 3]))
+    with pytest.raises(ImportError, match="numpy"):
+        fig.downsample()
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+import plotly.graph_objects as go
+from _plotly_utils.utils import RingBuffer
+
+
+def test_ring_buffer_extend_and_prepend():
+    buf = RingBuffer(np.array([1, 2, 3]))
+    buf.extend(np.arange(4, 40))
+    buf.prepend([-1, 0])
+    np.testing.assert_array_equal(buf.values, np.r_[-1, 0, 1:40])
+    assert not buf.values.flags.writeable
+
+
+def test_ring_buffer_max_points():
+    buf = RingBuffer(np.arange(5.0))
+    for i in range(100):
+        buf.extend([5.0 + i], max_points=5)
+    np.testing.assert_array_equal(buf.values, np.arange(100.0, 105.0))
+
+    buf.prepend(np.arange(3.0), max_points=4)
+    np.testing.assert_array_equal(buf.values, [0.0, 1.0, 2.0, 100.0])
+
+    buf.extend(np.arange(10.0), max_points=3)
+    np.testing.assert_array_equal(buf.values, [7.0, 8.0, 9.0])
+
+
+def test_ring_buffer_views_are_snapshots():
+    buf = RingBuffer(np.arange(4))
+    buf.extend([4, 5], max_points=3)
+    snapshot = buf.values
+    buf.prepend([10, 11, 12, 13])
+    buf.extend([20], max_points=2)
+    np.testing.assert_array_equal(snapshot, [3, 4, 5])
+    np.testing.assert_array_equal(buf.values, [5, 20])
+
+
+def test_ring_buffer_upcasts():
+    buf = RingBuffer(np.arange(3))
+    buf.extend(np.array([0.5]))
+    assert buf.dtype == np.float64
+    np.testing.assert_array_equal(buf.values, [0, 1, 2, 0.5])
+
+
+def test_ring_buffer_rejects_nd_values():
+    with pytest.raises(ValueError):
+        RingBuffer(np.zeros((2, 2)))
+
+
+def test_extend_traces_numpy():
+    fig = go.Figure(go.Scatter(x=np.arange(3), y=np.arange(3.0)))
+    fig.extend_traces({"x": [np.arange(3, 6)], "y": [[3.0, 4.0, 5.0]]}, 0)
+
+    np.testing.assert_array_equal(fig.data[0].x, np.arange(6))
+    np.testing.assert_array_equal(fig.data[0].y, np.arange(6.0))
+    assert not fig.data[0].x.flags.writeable
+
+    # Repeated extends keep using the same buffer
+    buffer = fig.data[0]._array_buffers["x"]
+    for i in range(6, 100):
+        fig.extend_traces({"x": [[i]]}, 0, max_points=50)
+    assert fig.data[0]._array_buffers["x"] is buffer
+    np.testing.assert_array_equal(fig.data[0].x, np.arange(50, 100))
+    assert fig.to_dict()["data"][0]["x"]["dtype"] == "i1"
+
+
+def test_extend_traces_after_reassignment():
+    fig = go.Figure(go.Scatter(y=np.arange(3.0)))
+    fig.extend_traces({"y": [[3.0]]}, 0)
+    fig.data[0].y = np.array([10.0, 11.0])
+    fig.extend_traces({"y": [[12.0]]}, 0)
+
+    np.testing.assert_array_equal(fig.data[0].y, [10.0, 11.0, 12.0])
@@ -1,5 +1,6 @@
 import plotly.express as px
 import plotly.io as pio
+import plotly.graph_objects as go
 import narwhals.stable.v1 as nw
 import numpy as np
 import pytest
@@ -310,6 +311,76 @@ def test_category_order_with_category_as_x(backend):
         assert set(trace["x"]) == {"Thur", "Fri", "Sat", "Sun"}
 
 
+def test_groups_keep_row_order(constructor):
+    # Groups are ordered by category_orders then by first appearance, rows with
+    # missing group values are dropped and each group keeps the order of its rows
+    data = dict(
+        x=[1, 2, 3, 4, 5, 6, 7, 8],
+        y=[8, 7, 6, 5, 4, 3, 2, 1],
+        c=["b", "a", None, "c", "a", "b", "c", "a"],
+        d=["u", "v", "u", "v", "u", "v", "v", "u"],
+    )
+    fig = px.scatter(
+        constructor(data),
+        x="x",
+        y="y",
+        color="c",
+        symbol="d",
+        category_orders=dict(c=["c", "a"]),
+    )
+    assert [trace.name for trace in fig.data] == [
+        "c, v",
+        "a, u",
+        "a, v",
+        "b, u",
+        "b, v",
+    ]
+    assert [list(trace.x) for trace in fig.data] == [[4, 7], [5, 8], [2], [1], [6]]
+    assert [list(trace.y) for trace in fig.data] == [[5, 2], [4, 1], [7], [8], [3]]
+    colors = fig.layout.template.layout.colorway
+    assert [trace.marker.color for trace in fig.data] == [
+        colors[0],
+        colors[1],
+        colors[1],
+        colors[2],
+        colors[2],
+    ]
+    assert [trace.marker.symbol for trace in fig.data] == [
+        "diamond",
+        "circle",
+        "diamond",
+        "circle",
+        "diamond",
+    ]
+    assert [trace.showlegend for trace in fig.data] == [True] * 5
+
+
+def test_many_groups(backend):
+    df = nw.from_native(px.data.gapminder(return_type=backend), eager_only=True)
+    fig = px.line(
+        df.to_native(),
+        x="year",
+        y="lifeExp",
+        color="continent",
+        line_group="country",
+        facet_col="continent",
+        hover_name="country",
+    )
+    continents = df.get_column("continent").unique(maintain_order=True).to_list()
+    countries = df.get_column("country").unique(maintain_order=True).to_list()
+    assert len(fig.data) == len(countries)
+    for trace in fig.data:
+        rows = df.filter(nw.col("country") == trace.hovertext[0])
+        continent = rows.get_column("continent").item(0)
+        assert trace.name == trace.legendgroup == continent
+        assert trace.xaxis == "x" + (
+            str(continents.index(continent) + 1) if continent != continents[0] else ""
+        )
+        assert list(trace.x) == rows.get_column("year").to_list()
+        assert list(trace.y) == rows.get_column("lifeExp").to_list()
+    assert [trace.name for trace in fig.data if trace.showlegend] == continents
+
+
 def test_permissive_defaults():
     msg = "'PxDefaults' object has no attribute 'should_not_work'"
     with pytest.raises(AttributeError, match=msg):
@@ -360,3 +431,96 @@ def test_render_mode(backend):
     )
     assert fig.data[0].type == "histogram2dcontour"
     assert fig.data[1].type == "scatter"
+
+
+@pytest.mark.parametrize("fn", [px.scatter, px.bar])
+def test_frame_encoding_delta(backend, fn):
+    df = nw.from_native(px.data.gapminder(return_type=backend))
+    df = df.filter(nw.col("continent").is_in(["Europe", "Oceania"]))
+    kwargs = dict(
+        x="country",
+        y="lifeExp",
+        color="continent",
+        animation_frame="year",
+        animation_group="country",
+        hover_data=["pop"],
+    )
+    full = fn(df.to_native(), **kwargs)
+    delta = fn(df.to_native(), frame_encoding="delta", **kwargs)
+    assert delta.data == full.data
+    assert delta.layout == full.layout
+    assert [f.name for f in delta.frames] == [f.name for f in full.frames]
+
+    # properties which are the same in every frame are only stored in the traces
+    # (the frames are compared as dicts, as `Frame.data` is overwritten in
+    # test_frames.py)
+    delta_frames = [frame.to_plotly_json() for frame in delta.frames]
+    full_frames = [frame.to_plotly_json() for frame in full.frames]
+    for frame in delta_frames:
+        for trace in frame["data"]:
+            assert "x" not in trace
+            assert "legendgroup" not in trace
+            assert "color" not in trace.get("marker", {})
+            assert "y" in trace
+            assert "hovertemplate" in trace
+
+    # applying the frames in turn to the traces gives the full frames
+    traces = list(delta.data)
+    for delta_frame, full_frame in zip(delta_frames, full_frames):
+        for i, trace in enumerate(delta_frame["data"]):
+            traces[i] = go.Figure(traces[i]).update_traces(trace).data[0]
+            assert traces[i] == go.Figure(full_frame["data"][i]).data[0]
+
+
+def test_frame_encoding_invalid():
+    with pytest.raises(ValueError, match="`frame_encoding` must be one of"):
+        px.scatter(x=[1, 2], y=[1, 2], animation_frame=[1, 2], frame_encoding="x")
+
+
+def test_downsample(backend):
+    df = nw.from_native(px.data.stocks(return_type=backend))
+    n = len(df)
+    fig = px.line(
+        df.to_native(),
+        x="date",
+        y=["GOOG", "AAPL"],
+        hover_data=["AMZN"],
+        downsample="minmax",
+        max_points=20,
+    )
+    for trace in fig.data:
+        assert len(trace.x) == len(trace.y) == len(trace.customdata) <= 20
+        assert trace.meta == {"downsample": {"method": "minmax", "original_points": n}}
+        column = df.get_column(trace.name).to_numpy()
+        assert trace.y.max() == column.max()
+        assert trace.y.min() == column.min()
+
+    fig = px.scatter(df.to_native(), x="date", y="GOOG", downsample="lttb")
+    assert len(fig.data[0].x) == n
+    assert fig.data[0].meta is None
+
+    with pytest.raises(ValueError, match="max_points"):
+        px.scatter(df.to_native(), x="date", y="GOOG", downsample="lttb", max_points=1)
+
+
+def test_downsample_copied_traces(monkeypatch):
+    # the traces of the figure are downsampled even when they are copied from
+    # the first frame instead of adopted
+    add_traces = go.Figure._add_traces
+
+    def copy_traces(self, data, rows=None, cols=None, adopt=False, **kwargs):
+        return add_traces(self, data, rows=rows, cols=cols, adopt=False, **kwargs)
+
+    monkeypatch.setattr(go.Figure, "_add_traces", copy_traces)
+    x = np.arange(200)
+    fig = px.scatter(
+        x=np.concatenate([x, x]),
+        y=np.concatenate([x, -x]),
+        animation_frame=np.repeat([0, 1], 200),
+        downsample="lttb",
+        max_points=20,
+    )
+    assert len(fig.data[0].x) == 20
+    assert fig.data[0].meta["downsample"]["original_points"] == 200
+    for frame in fig.to_plotly_json()["frames"]:
+        assert frame["data"][0]["meta"] == fig.data[0].meta
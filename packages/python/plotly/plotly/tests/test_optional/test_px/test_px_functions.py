@@ -561,3 +561,49 @@ def test_timeline(constructor):
     msg = "Both x_start and x_end must refer to data convertible to datetimes."
     with pytest.raises(TypeError, match=msg):
         px.timeline(df, x_start="Start", x_end=["a", "b", "c"], y="Task", color="Task")
+
+
+def test_sunburst_treemap_max_children(constructor):
+    data = dict(
+        regions=["North"] * 5 + ["South"] * 2,
+        vendors=["A", "B", "C", "D", "E", "F", "G"],
+        sectors=["Tech", "Tech", "Finance", "Finance", "Tech", "Finance", "Tech"],
+        values=[5, 4, 3, 2, 1, 7, 6],
+    )
+    path = ["regions", "vendors"]
+    fig = px.treemap(
+        constructor(data), path=path, values="values", color="sectors", max_children=2
+    )
+    trace = fig.data[0]
+    nodes = sorted(zip(trace.ids, trace.labels, trace.parents, trace.values))
+    assert nodes == [
+        ("North", "North", "", 15),
+        ("North/(other)", "(other)", "North", 6),
+        ("North/A", "A", "North", 5),
+        ("North/B", "B", "North", 4),
+        ("South", "South", "", 13),
+        ("South/F", "F", "South", 7),
+        ("South/G", "G", "South", 6),
+    ]
+    colors = dict(zip(trace.ids, trace.marker.colors))
+    # C, D and E have different sectors
+    assert colors["North/(other)"] == colors["North"]
+    assert colors["North/A"] == colors["South/G"]
+
+    # The children of the nodes merged into "(other)" are dropped
+    fig = px.sunburst(
+        constructor(data), path=["sectors", *path], values="values", max_children=1
+    )
+    trace = fig.data[0]
+    nodes = sorted(zip(trace.ids, trace.parents, trace.values))
+    assert nodes == [
+        ("(other)", "", 12),
+        ("Tech", "", 16),
+        ("Tech/(other)", "Tech", 6),
+        ("Tech/North", "Tech", 10),
+        ("Tech/North/(other)", "Tech/North", 5),
+        ("Tech/North/A", "Tech/North", 5),
+    ]
+
+    with pytest.raises(ValueError, match="`max_children` must be a positive integer"):
+        px.icicle(constructor(data), path=path, max_children=0)
@@ -194,3 +194,74 @@ def test_date_in_hover(constructor):
     assert nw.to_py_scalar(fig.data[0].customdata[0][0]) == nw.to_py_scalar(
         df.item(row=0, column="date")
     ).replace(tzinfo=None)
+
+
+def test_numeric_hover_data_is_typed(constructor):
+    data = {
+        "x": [1.0, 2.0, 3.0],
+        "small": [1, 2, 300],
+        "negative": [-1, 0, 1],
+        "ratio": np.array([0.5, 0.25, 0.125], dtype="float32"),
+        "large": [1, 2, 2**40],
+    }
+    df = constructor(data)
+    fig = px.scatter(df, x="x", y="x", hover_data=["small"])
+    assert fig.data[0].customdata.dtype == np.uint16
+    fig = px.scatter(df, x="x", y="x", hover_data=["small", "negative"])
+    assert fig.data[0].customdata.dtype == np.int32
+    assert fig.data[0].to_plotly_json()["customdata"].tolist() == [
+        [1, -1],
+        [2, 0],
+        [300, 1],
+    ]
+    assert "bdata" in fig.to_dict()["data"][0]["customdata"]
+
+    fig = px.scatter(df, x="x", y="x", hover_data=["small", "ratio"])
+    assert fig.data[0].customdata.dtype == np.float32
+    fig = px.scatter(df, x="x", y="x", hover_data=["large", "ratio"])
+    assert fig.data[0].customdata.dtype == np.float64
+
+
+def test_missing_float_hover_data_is_typed(constructor):
+    df = constructor({"x": [1.0, 2.0, 3.0], "f": [1.5, None, 3.0], "n": [1, 2, 3]})
+    fig = px.scatter(df, x="x", y="x", hover_data=["f", "n"])
+    customdata = fig.data[0].customdata
+    assert customdata.dtype == np.float64
+    assert np.isnan(customdata[1, 0])
+    assert customdata[[0, 2]].tolist() == [[1.5, 1], [3.0, 3]]
+    assert fig.to_dict()["data"][0]["customdata"]["dtype"] == "f8"
+
+    # integer columns with missing values are not narrowed
+    df = constructor({"x": [1.0, 2.0, 3.0], "n": [1, None, 3]})
+    fig = px.scatter(df, x="x", y="x", hover_data=["n"])
+    assert fig.data[0].customdata[[0, 2], 0].tolist() == [1, 3]
+
+
+def test_mixed_hover_data(constructor):
+    df = nw.from_native(
+        constructor(
+            {
+                "x": [1.0, 2.0],
+                "n": [1, 2],
+                "s": ["a", "b"],
+                "b": [True, False],
+                "date": ["2015-04-04", "2015-04-05"],
+            }
+        )
+    ).with_columns(date=nw.col("date").str.to_datetime(format="%Y-%m-%d"))
+    fig = px.scatter(df.to_native(), x="x", y="x", hover_data=["n", "s", "b", "date"])
+    customdata = fig.data[0].customdata
+    assert customdata.dtype == object
+    assert customdata[:, :3].tolist() == [[1, "a", True], [2, "b", False]]
+    assert [type(v) for v in customdata[0, :3]] == [int, str, bool]
+    assert nw.to_py_scalar(customdata[1, 3]) == nw.to_py_scalar(
+        df.item(row=1, column="date")
+    )
+    assert fig.to_dict()["data"][0]["customdata"][:, :3].tolist() == [
+        [1, "a", True],
+        [2, "b", False],
+    ]
+
+    # numbers and dates
+    fig = px.scatter(df.to_native(), x="x", y="x", hover_data=["n", "date"])
+    assert fig.data[0].customdata[:, 0].tolist() == [1, 2]
@@ -391,6 +391,101 @@ def test_build_df_with_hover_data_from_vaex_and_polars(test_lib, hover_data):
     )
 
 
+def test_build_df_from_polars_lazyframe():
+    import polars as pl
+
+    iris = px.data.iris()
+    args = dict(
+        data_frame=pl.from_pandas(iris).lazy(),
+        x="petal_width",
+        y="sepal_length",
+        color="species",
+    )
+    out = build_dataframe(args, go.Scatter)
+    # only the referenced columns are collected
+    assert sorted(out["data_frame"].columns) == [
+        "petal_width",
+        "sepal_length",
+        "species",
+    ]
+    assert_frame_equal(iris[out["data_frame"].columns], out["data_frame"].to_pandas())
+
+
+@pytest.mark.parametrize(
+    "x,y,histfunc,trace_histfunc,label",
+    [
+        ("day", None, None, "sum", "count"),
+        (None, "day", "count", "sum", "count"),
+        ("day", "total_bill", None, "sum", "sum of total_bill"),
+        ("total_bill", "day", "max", "max", "max of total_bill"),
+    ],
+)
+def test_histogram_lazyframe_aggregation(x, y, histfunc, trace_histfunc, label):
+    import polars as pl
+
+    tips = px.data.tips()
+    kwargs = dict(x=x, y=y, histfunc=histfunc, color="sex")
+    fig = px.histogram(pl.from_pandas(tips).lazy(), **kwargs)
+    expected = px.histogram(tips, **kwargs)
+
+    value_letter = "x" if expected.data[0].orientation == "h" else "y"
+    key_letter = "y" if value_letter == "x" else "x"
+    key = kwargs[key_letter]
+    value = kwargs[value_letter]
+    assert fig.layout[value_letter + "axis"].title.text == label
+    assert len(fig.data) == len(expected.data)
+    for trace, expected_trace in zip(fig.data, expected.data):
+        assert trace.name == expected_trace.name
+        assert trace.orientation == expected_trace.orientation
+        assert trace.hovertemplate == expected_trace.hovertemplate
+        assert trace.histfunc == trace_histfunc
+
+        # one aggregated row per distinct value of the binned column
+        groups = tips[tips.sex == trace.name].groupby(key)
+        if value is None:
+            aggregates = groups.size()
+        else:
+            aggregates = groups[value].agg(histfunc or "sum")
+        assert dict(zip(trace[key_letter], trace[value_letter])) == pytest.approx(
+            aggregates.to_dict()
+        )
+
+
+def test_histogram_lazyframe_not_aggregated():
+    import polars as pl
+
+    tips = px.data.tips()
+    lazy = pl.from_pandas(tips).lazy()
+    for kwargs in [
+        dict(x="day", y="total_bill", histfunc="avg"),
+        dict(x="total_bill", marginal="rug"),
+        dict(x="day", hover_data=["tip"]),
+    ]:
+        fig = px.histogram(lazy, **kwargs)
+        expected = px.histogram(tips, **kwargs)
+        assert fig.data[0].histfunc == expected.data[0].histfunc
+        assert len(fig.data[0].x) == len(tips)
+
+
+def test_histogram_lazyframe_numeric_bins():
+    import polars as pl
+
+    ages = pd.DataFrame(dict(age=np.random.default_rng(0).integers(0, 101, 20000)))
+    lazy = pl.from_pandas(ages).lazy()
+
+    # plotly.js sizes automatic bins from every value of the binned axis
+    fig = px.histogram(lazy, x="age")
+    assert fig.data[0].histfunc is None
+    assert len(fig.data[0].x) == len(ages)
+
+    # with nbins, the bins only depend on the range of the values
+    fig = px.histogram(lazy, x="age", nbins=20)
+    assert fig.data[0].histfunc == "sum"
+    assert fig.data[0].nbinsx == 20
+    assert len(fig.data[0].x) == ages.age.nunique()
+    assert sum(fig.data[0].y) == len(ages)
+
+
 def test_timezones(constructor):
     df = nw.from_native(
         constructor({"date": ["2015-04-04 19:31:30+01:00"], "value": [3]})
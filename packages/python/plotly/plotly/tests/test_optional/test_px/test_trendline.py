@@ -265,3 +265,46 @@ def test_overall_trendline(backend):
     params3 = results3["px_fit_results"].iloc[0].params
 
     assert np.all(np.array_equal(params1, params3))
+
+
+@pytest.mark.parametrize(
+    "mode,options",
+    [
+        ("ols", None),
+        ("ols", dict(add_constant=False)),
+        ("ols", dict(log_x=True, log_y=True)),
+        ("lowess", None),
+        ("lowess", dict(frac=0.3)),
+    ],
+)
+def test_trendline_engines_match(backend, mode, options):
+    df = px.data.tips(return_type=backend)
+    options = options or dict()
+    fig_numpy = px.scatter(
+        df, x="total_bill", y="tip", trendline=mode, trendline_options=options
+    )
+    fig_statsmodels = px.scatter(
+        df,
+        x="total_bill",
+        y="tip",
+        trendline=mode,
+        trendline_options=dict(options, engine="statsmodels"),
+    )
+    assert np.allclose(fig_numpy.data[1].y, fig_statsmodels.data[1].y)
+    assert fig_numpy.data[1].hovertemplate == fig_statsmodels.data[1].hovertemplate
+    if mode == "ols":
+        result_numpy = px.get_trendline_results(fig_numpy).px_fit_results.iloc[0]
+        result_statsmodels = px.get_trendline_results(
+            fig_statsmodels
+        ).px_fit_results.iloc[0]
+        assert np.allclose(result_numpy.params, result_statsmodels.params)
+        assert np.isclose(result_numpy.rsquared, result_statsmodels.rsquared)
+        # attributes that aren't computed natively are delegated to statsmodels
+        assert np.allclose(result_numpy.bse, result_statsmodels.bse)
+
+
+def test_trendline_invalid_engine():
+    with pytest.raises(ValueError, match="'engine' must be one of"):
+        px.scatter(
+            x=[0, 1], y=[0, 1], trendline="ols", trendline_options=dict(engine="R")
+        )
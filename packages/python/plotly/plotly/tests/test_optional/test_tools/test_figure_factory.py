@@ -775,6 +775,55 @@ class TestFinanceCharts(TestCaseNoTemplate, NumpyTestUtilsMixin):
         self.assert_fig_equal(candle["data"][1], exp_candle["data"][1])
         self.assert_fig_equal(candle["layout"], exp_candle["layout"])
 
+    def test_typed_arrays(self):
+
+        # numpy prices give typed arrays with NaN and NaT gaps, holding the
+        # same values as the lists with None gaps made from plain lists
+        import numpy as np
+
+        rng = np.random.default_rng(0)
+        n = 1000
+        open_data = 30 + rng.random(n)
+        close_data = open_data + rng.normal(size=n)
+        close_data[10] = np.nan
+        high_data = np.fmax(open_data, close_data) + rng.random(n)
+        low_data = np.fmin(open_data, close_data) - rng.random(n)
+        dates = np.datetime64("2020-01-01") + np.arange(n) * np.timedelta64(1, "m")
+        prices = [open_data, high_data, low_data, close_data]
+        price_lists = [[None if np.isnan(v) else v for v in p] for p in prices]
+
+        for create in [ff.create_ohlc, ff.create_candlestick]:
+            for x in [None, dates]:
+                fig = create(*prices, dates=x)
+                fig_lists = create(
+                    *price_lists, dates=None if x is None else x.tolist()
+                )
+                self.assertEqual(len(fig.data), 2)
+                for trace, trace_lists in zip(fig.data, fig_lists.data):
+                    self.assertIsInstance(trace.y, np.ndarray)
+                    self.assertEqual(trace.y.dtype, np.float64)
+                    self.assertEqual(
+                        [None if v != v else v for v in trace.y.tolist()],
+                        list(trace_lists.y),
+                    )
+                    x_lists = list(trace_lists.x)
+                    if x is not None:
+                        x_lists = [
+                            np.datetime64("NaT") if v is None else np.datetime64(v)
+                            for v in x_lists
+                        ]
+                        np.testing.assert_array_equal(trace.x, x_lists)
+                    else:
+                        self.assertEqual(
+                            [None if v != v else v for v in trace.x.tolist()],
+                            x_lists,
+                        )
+            # the unit without close value is left out
+            n_points = 7 if create is ff.create_ohlc else 6
+            self.assertEqual(
+                sum(len(trace.y) for trace in fig.data), (n - 1) * n_points
+            )
+
 
 class TestAnnotatedHeatmap(TestCaseNoTemplate, NumpyTestUtilsMixin):
     def test_unequal_z_text_size(self):
@@ -1202,6 +1251,90 @@ class TestAnnotatedHeatmap(TestCaseNoTemplate, NumpyTestUtilsMixin):
         # Perform comparison
         self.assert_fig_equal(fig, expected)
 
+    def test_annotated_heatmap_text_trace(self):
+        # the text of the cells is rendered by the traces with the same
+        # text and colors as the annotations
+        z = [[0.1, 0.0, 0.9, 0.5], [0.0, 1.0, 0.1, 0.7], [0.3, 0.6, 0.2, 0.0]]
+        x = ["a", "b", "c", "d"]
+        y = ["e", "f", "g"]
+        text = [["t%d%d" % (i, j) for j in range(4)] for i in range(3)]
+        kwargs = dict(x=x, y=y, annotation_text=text, colorscale="Greens")
+        annotations = ff.create_annotated_heatmap(z, **kwargs).layout.annotations
+        fig = ff.create_annotated_heatmap(z, text_mode="trace", **kwargs)
+
+        self.assertEqual(fig.layout.annotations, ())
+        self.assertEqual(len(fig.data), 2)
+        heatmap, scatter = fig.data
+        self.assertEqual(scatter.type, "scatter")
+        self.assertEqual(scatter.mode, "text")
+        self.assertEqual(scatter.hoverinfo, "skip")
+        scatter_text = {
+            (xi, yi): t for xi, yi, t in zip(scatter.x, scatter.y, scatter.text)
+        }
+        for annotation in annotations:
+            i, j = y.index(annotation.y), x.index(annotation.x)
+            if annotation.font.color == heatmap.textfont.color:
+                self.assertEqual(heatmap.text[i][j], annotation.text)
+                self.assertNotIn((annotation.x, annotation.y), scatter_text)
+            else:
+                self.assertEqual(heatmap.text[i][j], "")
+                self.assertEqual(
+                    scatter_text[annotation.x, annotation.y], annotation.text
+                )
+                self.assertEqual(scatter.textfont.color, annotation.font.color)
+        self.assertEqual(heatmap.texttemplate, "%{text}")
+
+        # the scatter trace stays on the axes of the heatmap, and doesn't
+        # depend on its coloraxis
+        fig = ff.create_annotated_heatmap(
+            z, text_mode="trace", coloraxis="coloraxis", xaxis="x2", yaxis="y2"
+        )
+        self.assertEqual(fig.data[0].coloraxis, "coloraxis")
+        self.assertEqual(fig.data[1].type, "scatter")
+        self.assertEqual((fig.data[1].xaxis, fig.data[1].yaxis), ("x2", "y2"))
+        self.assertEqual(fig.data[1].x, (2, 3, 1, 3, 1))
+        self.assertEqual(fig.data[1].y, (0, 0, 1, 1, 2))
+
+        # a single trace when the text has a single color
+        fig = ff.create_annotated_heatmap(z, font_colors=["red"], text_mode="trace")
+        self.assertEqual(len(fig.data), 1)
+        self.assertEqual(fig.data[0].text[1][1], "1.0")
+        self.assertEqual(fig.data[0].textfont.color, "red")
+
+        # text traces are used for large matrices by default
+        fig = ff.create_annotated_heatmap([list(range(40))] * 30)
+        self.assertEqual(fig.layout.annotations, ())
+        self.assertEqual(len(fig.data), 2)
+
+        self.assertRaises(
+            PlotlyError, ff.create_annotated_heatmap, z, text_mode="texttemplate"
+        )
+
+    def test_annotated_heatmap_text_trace_keeps_text_kwargs(self):
+        # a custom hover text passed through kwargs is kept, with the cells
+        # annotated by layout annotations
+        big_z = [list(range(40))] * 30
+        hover = [["hover %d" % v for v in row] for row in big_z]
+        fig = ff.create_annotated_heatmap(big_z, text=hover, hoverinfo="text")
+        self.assertEqual(len(fig.data), 1)
+        self.assertEqual(fig.data[0].text[0][1], "hover 1")
+        self.assertEqual(len(fig.layout.annotations), 1200)
+
+        z = [[0.1, 0.0], [0.9, 0.5]]
+        hover = [["a", "b"], ["c", "d"]]
+        for kwargs in [
+            dict(text=hover),
+            dict(texttemplate="%{z}"),
+            dict(textfont=dict(size=20)),
+        ]:
+            self.assertRaises(
+                PlotlyError,
+                ff.create_annotated_heatmap,
+                z,
+                text_mode="trace",
+                **kwargs,
+            )
+
 
 class TestTable(TestCaseNoTemplate, NumpyTestUtilsMixin):
     def test_fontcolor_input(self):
@@ -1553,6 +1686,34 @@ class TestTable(TestCaseNoTemplate, NumpyTestUtilsMixin):
 
         self.assert_fig_equal(index_table["layout"], exp_index_table["layout"])
 
+    def test_table_text_trace(self):
+        # the text of the cells is rendered by a scatter trace with the same
+        # positions, text and colors as the annotations
+        text = [
+            ["Country", "Year", "Population"],
+            ["US", 2000, 282200000],
+            ["Canada", 2000, 27790000],
+            ["US", 2010, 309000000],
+        ]
+        font_colors = ["#ffffff", "#000000", "#ff0000", "#00ff00"]
+        for index in [False, True]:
+            kwargs = dict(index=index, font_colors=font_colors)
+            annotations = ff.create_table(text, **kwargs).layout.annotations
+            fig = ff.create_table(text, text_mode="trace", **kwargs)
+
+            self.assertEqual(fig.layout.annotations, ())
+            self.assertEqual(fig.layout.xaxis.range, (-0.5, 2.5))
+            self.assertEqual(fig.layout.yaxis.range, (3.5, -0.5))
+            trace = fig.data[1]
+            self.assertEqual(trace.mode, "text")
+            self.assertEqual(trace.textposition, "middle right")
+            self.assertEqual(len(trace.text), len(annotations))
+            for i, annotation in enumerate(annotations):
+                self.assertEqual(trace.x[i], annotation.x)
+                self.assertEqual(trace.y[i], annotation.y)
+                self.assertEqual(trace.text[i], annotation.text)
+                self.assertEqual(trace.textfont.color[i], annotation.font.color)
+
 
 class TestGantt(TestCaseNoTemplate, NumpyTestUtilsMixin):
     def test_validate_gantt(self):